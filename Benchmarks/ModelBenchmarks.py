@@ -0,0 +1,368 @@
+"""
+MEDISYNC - Model Benchmarks
+
+Times every model entry point the dashboards and screens depend on (KPI counts and
+details, *Tables queries, ReportsModel reports, notification feeds and searches,
+complete_expired_prescriptions and each role dashboard's _loadData) against one or more
+data sets, headless. Each case runs a warm-up call and then --rounds timed calls with the
+in-process caches cleared; the median, spread, statements per call and rows returned are
+recorded.
+
+Results are compared with the JSON baseline for the data set in Benchmarks/baselines/,
+and the run fails when a case's median is more than --threshold slower than its baseline
+(and at least --min-delta-ms slower, to ignore timer noise). --save-baseline records the
+current results as the new baseline.
+
+Usage (from the project root):
+    python Benchmarks/ModelBenchmarks.py                          # current database, label "current"
+    python Benchmarks/ModelBenchmarks.py --load small medium      # REPLACES the data with each preset
+    python Benchmarks/ModelBenchmarks.py --load small --save-baseline
+    python Benchmarks/ModelBenchmarks.py --filter Reports --rounds 10 --output results.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from Utilities.DatabaseConnection import getConnection
+from Utilities.QueryInstrumentation import QueryStats
+from Model.SessionManager import SessionManager
+
+BASELINE_DIR = os.path.join(PROJECT_ROOT, "Benchmarks", "baselines")
+
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 2.0
+SEED = 42
+
+
+# ======================================================
+# FIXTURES
+# ======================================================
+
+def loadFixtures():
+    """
+    Picks the busiest user of each role and representative ids from the loaded data,
+    so per-user queries run against the largest realistic workload.
+    """
+    conn = getConnection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        users = {}
+        for role, workload in (
+            ("Doctor", "SELECT COUNT(*) FROM prescriptions pr WHERE pr.doctor_id = u.user_id"),
+            ("Nurse", "SELECT COUNT(*) FROM patients p WHERE p.nurse_id = u.user_id AND p.status = 'Active'"),
+            ("Pharmacist", "SELECT COUNT(*) FROM prescription_verification v WHERE v.pharmacist_id = u.user_id"),
+            ("Admin", "SELECT 0"),
+        ):
+            cursor.execute(f"""
+                SELECT u.user_id, u.username, u.first_name, u.last_name, u.role, ({workload}) AS workload
+                FROM users u
+                WHERE u.role = %s AND u.status = 'Active'
+                ORDER BY workload DESC, u.user_id
+                LIMIT 1
+            """, (role,))
+            user = cursor.fetchone()
+            if user is None:
+                raise RuntimeError(f"No active {role} in the database (load a data set with --load)")
+            users[role] = user
+
+        cursor.execute("""
+            SELECT p.patient_id, p.patient_last_name, pr.prescription_id, m.generic_name, m.brand_name
+            FROM prescriptions pr
+            JOIN patients p ON pr.patient_id = p.patient_id
+            JOIN medicines m ON pr.medicine_id = m.medicine_id
+            WHERE p.nurse_id = %s
+            ORDER BY pr.status = 'Active' DESC, pr.prescription_id DESC
+            LIMIT 1
+        """, (users["Nurse"]["user_id"],))
+        sample = cursor.fetchone() or {}
+        return {"users": users, **sample}
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def resetCaches():
+    """Clears the in-process caches so every round measures the database path"""
+    from Model.Cache.ReportCache import ReportCache
+    from Model.Cache.ReferenceDataCache import ReferenceDataCache
+    from Model.Cache.FormularyIndex import FormularyIndex
+    ReportCache.clear()
+    ReferenceDataCache.invalidate()
+    FormularyIndex.invalidate()
+
+
+# ======================================================
+# CASES
+# ======================================================
+
+def buildCases(fixtures):
+    """Returns [(name, role, callable)]; role is the user logged in while the case runs"""
+    from Model.KPIs.AdminKPIs import AdminKPIs, AdminKPIDetails
+    from Model.KPIs.DoctorKPIs import DoctorKPIs, DoctorKPIDetails
+    from Model.KPIs.NurseKPIs import NurseKPIs, NurseKPIDetails
+    from Model.KPIs.PharmacistKPIs import PharmacistKPIs, PharmacistKPIDetails
+    from Model.Tables.AdminTables import AdminTables
+    from Model.Tables.DoctorTables import DoctorTables
+    from Model.Tables.NurseTables import NurseTables
+    from Model.Tables.PharmacistTables import PharmacistTables
+    from Model.Transactions.ReportsModel import ReportsModel
+    from Model.Cache.TableVersions import TableVersions
+    from Model.Notifications.NotificationsModel import NotificationsModel
+    from Model.Tasks.PrescriptionCompletionTask import complete_expired_prescriptions
+    from Controller.Admin.AdminDashboardController import AdminDashboardController
+    from Controller.Doctor.DoctorDashboardController import DoctorDashboardController
+    from Controller.Nurse.NurseDashboardController import NurseDashboardController
+    from Controller.Pharmacist.PharmacistDashboardController import PharmacistDashboardController
+
+    users = fixtures["users"]
+    doctor_id = users["Doctor"]["user_id"]
+    nurse_id = users["Nurse"]["user_id"]
+    pharmacist_id = users["Pharmacist"]["user_id"]
+    patient_id = fixtures.get("patient_id")
+    search_text = (fixtures.get("patient_last_name") or "san")[:3]
+    month_ago, today = date.today() - timedelta(days=30), date.today()
+    year_ago = today - timedelta(days=365)
+
+    cases = []
+
+    def add(name, role, func):
+        cases.append((name, role, func))
+
+    # KPI counts and drill-down details
+    for role, kpis, details, keys in (
+        ("Admin", AdminKPIs, AdminKPIDetails, ("active_users", "active_patients", "active_prescriptions",
+                                               "pending_prescriptions", "missed_medications")),
+        ("Doctor", DoctorKPIs, DoctorKPIDetails, ("active_patients", "active_prescriptions", "urgent")),
+        ("Nurse", NurseKPIs, NurseKPIDetails, ("assigned_patients", "due_medications", "urgent")),
+        ("Pharmacist", PharmacistKPIs, PharmacistKPIDetails, ("active_prescriptions", "pending_verification",
+                                                              "controlled_substances")),
+    ):
+        for attribute in sorted(vars(kpis)):
+            if attribute.endswith("Count"):
+                add(f"{kpis.__name__}.{attribute}", role, getattr(kpis, attribute))
+        for key in keys:
+            add(f"{details.__name__}.get_details[{key}]", role, lambda d=details, k=key: d.get_details(k))
+
+    # *Tables queries
+    add("AdminTables.getTodaysActivitySummary", "Admin", AdminTables.getTodaysActivitySummary)
+    add("DoctorTables.getPatientHistory", "Doctor", DoctorTables.getPatientHistory)
+    add("DoctorTables.getPendingPrescriptions", "Doctor", DoctorTables.getPendingPrescriptions)
+    add("DoctorTables.getPatientsByDoctor", "Doctor", DoctorTables.getPatientsByDoctor)
+    add("DoctorTables.searchPatientsByDoctor", "Doctor", lambda: DoctorTables.searchPatientsByDoctor(search_text))
+    add("DoctorTables.searchMedicines", "Doctor", lambda: DoctorTables.searchMedicines("mor"))
+    add("DoctorTables.getAllMedicines", "Doctor", DoctorTables.getAllMedicines)
+    add("DoctorTables.getFormularyVersion", "Doctor", DoctorTables.getFormularyVersion)
+    add("DoctorTables.searchPrescriptionsByDoctor", "Doctor",
+        lambda: DoctorTables.searchPrescriptionsByDoctor(doctor_id, search_text))
+    add("DoctorTables.getAllPrescriptionsByDoctor", "Doctor",
+        lambda: DoctorTables.getAllPrescriptionsByDoctor(doctor_id))
+    if fixtures.get("prescription_id"):
+        add("DoctorTables.getPrescriptionById", "Doctor",
+            lambda: DoctorTables.getPrescriptionById(fixtures["prescription_id"]))
+    add("NurseTables.getCompletedMedicationsToday", "Nurse", NurseTables.getCompletedMedicationsToday)
+    add("NurseTables.getMedicationPreparationStatus", "Nurse", NurseTables.getMedicationPreparationStatus)
+    add("NurseTables.getAssignedPatients", "Nurse", NurseTables.getAssignedPatients)
+    add("NurseTables.searchAssignedPatients", "Nurse", lambda: NurseTables.searchAssignedPatients(search_text))
+    add("NurseTables.getDueDoses", "Nurse", NurseTables.getDueDoses)
+    if patient_id:
+        add("NurseTables.getActivePrescriptionsForPatient", "Nurse",
+            lambda: NurseTables.getActivePrescriptionsForPatient(patient_id, fixtures["generic_name"],
+                                                                 fixtures["brand_name"]))
+    add("PharmacistTables.getExpiringMedications", "Pharmacist", PharmacistTables.getExpiringMedications)
+    add("PharmacistTables.getMedicationsToPrepare", "Pharmacist", PharmacistTables.getMedicationsToPrepare)
+
+    # Reports: last 30 days and last year
+    for label, from_date in (("30d", month_ago), ("1y", year_ago)):
+        add(f"ReportsModel.getPrescriptionRecords[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getPrescriptionRecords(f, today))
+        add(f"ReportsModel.getMedicationPreparationRecords[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getMedicationPreparationRecords(f, today))
+        add(f"ReportsModel.getMedicationVerificationRecords[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getMedicationVerificationRecords(f, today))
+        add(f"ReportsModel.getNurseAdministrationLog[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getNurseAdministrationLog(f, today))
+        add(f"ReportsModel.getControlledSubstancesActivity[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getControlledSubstancesActivity(f, today))
+        add(f"ReportsModel.getAdministrationSummary[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getAdministrationSummary(f, today))
+        add(f"ReportsModel.getVerificationSummary[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getVerificationSummary(f, today))
+        add(f"ReportsModel.getControlledDispensingSummary[{label}]", "Admin",
+            lambda f=from_date: ReportsModel.getControlledDispensingSummary(f, today))
+    add("ReportsModel.getMissedAdministrations", "Admin", ReportsModel.getMissedAdministrations)
+    if patient_id:
+        add("ReportsModel.getNurseAdministrationLog[patient]", "Admin",
+            lambda: ReportsModel.getNurseAdministrationLog(patient_id=patient_id))
+    add("ReportsModel.getPatientsList", "Admin", ReportsModel.getPatientsList)
+    add("TableVersions.getVersions", "Admin", lambda: TableVersions.getVersions(TableVersions.TABLES))
+
+    # Notification feeds and searches
+    for role, user_id in (("Doctor", doctor_id), ("Nurse", nurse_id), ("Pharmacist", pharmacist_id)):
+        add(f"NotificationsModel.getAllNotifications[{role}]", role,
+            lambda u=user_id: NotificationsModel.getAllNotifications(u))
+    add("NotificationsModel.getAllNotificationsForAdmin", "Admin", NotificationsModel.getAllNotificationsForAdmin)
+    add("NotificationsModel.getNotificationsByPriority[Urgent]", "Doctor",
+        lambda: NotificationsModel.getNotificationsByPriority(doctor_id, "Urgent"))
+    add("NotificationsModel.searchNotifications", "Doctor",
+        lambda: NotificationsModel.searchNotifications(doctor_id, search_text))
+
+    # Login-time task (the warm-up call does any pending work; timed rounds are the steady state)
+    add("complete_expired_prescriptions", "Admin", complete_expired_prescriptions)
+
+    # Full dashboard loads (constructing the controller runs _loadData; no window is opened)
+    add("AdminDashboardController._loadData", "Admin", AdminDashboardController)
+    add("DoctorDashboardController._loadData", "Doctor", DoctorDashboardController)
+    add("NurseDashboardController._loadData", "Nurse", NurseDashboardController)
+    add("PharmacistDashboardController._loadData", "Pharmacist", PharmacistDashboardController)
+
+    return cases
+
+
+# ======================================================
+# RUNNING
+# ======================================================
+
+def runCase(func, rounds):
+    """Runs one warm-up call and `rounds` timed calls. Returns the case's result dict."""
+    resetCaches()
+    result = func()
+    timings, statements = [], []
+    for _ in range(rounds):
+        resetCaches()
+        QueryStats.reset()
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+        statements.append(sum(e["calls"] for e in QueryStats.snapshot() if e["fingerprint"] != QueryStats.CONNECT))
+
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "stdev_ms": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0,
+        "statements": max(statements) if QueryStats.ENABLED else None,
+        "rows": len(result) if isinstance(result, (list, tuple, dict)) else None,
+    }
+
+
+def runSuite(label, rounds, name_filter=None):
+    """Runs every case against the current database. Returns the results document."""
+    fixtures = loadFixtures()
+    cases = buildCases(fixtures)
+    if name_filter:
+        cases = [case for case in cases if name_filter.lower() in case[0].lower()]
+
+    print(f"\n[{label}] {len(cases)} cases, {rounds} rounds each")
+    results = {}
+    try:
+        for name, role, func in cases:
+            SessionManager.setUser(dict(fixtures["users"][role]))
+            results[name] = runCase(func, rounds)
+            entry = results[name]
+            print(f"  {name:<62} {entry['median_ms']:>9.2f} ms  "
+                  f"(±{entry['stdev_ms']:.2f}, {entry['statements']} stmts, {entry['rows']} rows)")
+    finally:
+        SessionManager.clear()
+        QueryStats.reset()
+
+    return {
+        "dataset": label,
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        "rounds": rounds,
+        "python": sys.version.split()[0],
+        "cases": results,
+    }
+
+
+def compareWithBaseline(document, baseline, threshold, min_delta_ms):
+    """Returns the list of regression messages (empty when every case is within budget)"""
+    regressions = []
+    for name, entry in document["cases"].items():
+        previous = baseline["cases"].get(name)
+        if previous is None:
+            continue
+        delta = entry["median_ms"] - previous["median_ms"]
+        if delta > min_delta_ms and entry["median_ms"] > previous["median_ms"] * (1 + threshold):
+            regressions.append(f"{name}: {previous['median_ms']:.2f} -> {entry['median_ms']:.2f} ms "
+                               f"(+{delta / max(previous['median_ms'], 1e-9):.0%})")
+        elif (entry["statements"] or 0) > (previous.get("statements") or 0) and previous.get("statements"):
+            print(f"  note: {name} now runs {entry['statements']} statements (baseline {previous['statements']})")
+    return regressions
+
+
+def baselinePath(label):
+    return os.path.join(BASELINE_DIR, f"model_{label}.json")
+
+
+def main():
+    from Benchmarks.SyntheticData import SIZES
+
+    parser = argparse.ArgumentParser(description="Benchmark MEDISYNC model entry points.")
+    parser.add_argument("--load", nargs="+", choices=SIZES, default=None,
+                        help="Replace the database contents with each synthetic preset in turn and benchmark it")
+    parser.add_argument("--label", default="current", help="Baseline name when benchmarking the current data")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--filter", default=None, help="Only run cases whose name contains this text")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown of a case's median versus baseline (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--output", default=None, help="Also write all results to this JSON file")
+    args = parser.parse_args()
+
+    documents, failed = [], False
+    for label in args.load or [args.label]:
+        if args.load:
+            from Benchmarks.SyntheticData import loadDataset, rebuildDerivedData
+            config = SIZES[label]
+            as_of = date.today()
+            print(f"Loading synthetic '{label}' data set...")
+            counts, seconds = loadDataset(config, SEED, as_of, truncate=True)
+            print(f"  {sum(counts.values()):,} rows in {seconds:.1f} s")
+            rebuildDerivedData(as_of - timedelta(days=365 * config["years"] + 60), as_of)
+
+        try:
+            document = runSuite(label, args.rounds, args.filter)
+        except Exception as e:
+            print(f"[{label}] Cannot run benchmarks: {e}")
+            return 1
+        documents.append(document)
+
+        path = baselinePath(label)
+        if args.save_baseline:
+            os.makedirs(BASELINE_DIR, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(document, file, indent=1)
+            print(f"[{label}] Baseline saved to {os.path.relpath(path, PROJECT_ROOT)}")
+        elif os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                regressions = compareWithBaseline(document, json.load(file), args.threshold, args.min_delta_ms)
+            if regressions:
+                failed = True
+                print(f"[{label}] REGRESSIONS (> {args.threshold:.0%} slower than baseline):")
+                for message in regressions:
+                    print(f"  {message}")
+            else:
+                print(f"[{label}] Within {args.threshold:.0%} of baseline.")
+        else:
+            print(f"[{label}] No baseline yet (run with --save-baseline).")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(documents, file, indent=1)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
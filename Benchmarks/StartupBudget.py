@@ -0,0 +1,112 @@
+"""
+MEDISYNC - Startup Import Budget
+
+Measures what the login screen costs to import using `python -X importtime`
+and fails when it exceeds a fixed budget, or when a module that should be
+loaded lazily (matplotlib, role controllers) shows up on the startup path.
+
+Usage (from the project root):
+    python Benchmarks/StartupBudget.py
+    python Benchmarks/StartupBudget.py --budget-ms 1200 --runs 5 --top 20
+
+The budget can also be set with the MEDISYNC_STARTUP_BUDGET_MS environment variable.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Everything Main.py needs before the login window can be shown
+STARTUP_IMPORTS = (
+    "import PyQt6.QtWidgets; "
+    "import Model.Authentication.LoginModel; "
+    "import View.LoginGUI; "
+    "import Controller.Login.LoginController"
+)
+
+# Modules that must not be imported until the user actually needs them
+DEFERRED_MODULES = (
+    "matplotlib",
+    "Controller.Admin",
+    "Controller.Doctor",
+    "Controller.Nurse",
+    "Controller.Pharmacist",
+)
+
+DEFAULT_BUDGET_MS = 1000
+
+
+def measureStartup():
+    """
+    Runs the startup imports in a fresh interpreter.
+    Returns (total_ms, [(cumulative_us, module), ...]).
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env["QT_QPA_PLATFORM"] = env.get("QT_QPA_PLATFORM", "offscreen")
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_IMPORTS],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup imports failed:\n{result.stderr.strip()[-2000:]}")
+
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            total_us += int(self_us)
+            modules.append((int(cumulative_us), name.strip()))
+        except ValueError:
+            continue
+
+    return total_us / 1000.0, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check MEDISYNC cold-start import time against a budget.")
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.environ.get("MEDISYNC_STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS)))
+    parser.add_argument("--runs", type=int, default=3, help="Best of N runs is reported")
+    parser.add_argument("--top", type=int, default=15, help="Number of heaviest imports to list")
+    args = parser.parse_args()
+
+    best_ms, best_modules = None, []
+    for _ in range(max(args.runs, 1)):
+        total_ms, modules = measureStartup()
+        if best_ms is None or total_ms < best_ms:
+            best_ms, best_modules = total_ms, modules
+
+    print(f"Startup import time: {best_ms:.1f} ms (budget {args.budget_ms:.0f} ms, best of {args.runs})")
+    print(f"\nHeaviest imports (cumulative):")
+    for cumulative_us, name in sorted(best_modules, reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000.0:8.1f} ms  {name}")
+
+    failures = []
+    loaded = {name for _, name in best_modules}
+    for prefix in DEFERRED_MODULES:
+        eager = sorted(name for name in loaded if name == prefix or name.startswith(prefix + "."))
+        if eager:
+            failures.append(f"{prefix} is imported at startup ({', '.join(eager[:3])})")
+    if best_ms > args.budget_ms:
+        failures.append(f"startup import time {best_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\nOK: within startup budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
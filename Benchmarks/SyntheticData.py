@@ -0,0 +1,486 @@
+"""
+MEDISYNC - Synthetic Hospital Data
+
+Generates a deterministic, realistic data set for load testing: staff, a hospice
+formulary, patients admitted over several years, prescriptions with real frequencies
+and durations, pharmacist verifications, preparations, every scheduled medication
+administration and the notifications the application would have created for them.
+
+The same --seed, --size and --as-of always produce the same rows. Rows carry explicit
+ids and are bulk-loaded with executemany in batches (foreign key checks off during the
+load), or written as one CSV per table with --csv-dir for LOAD DATA INFILE.
+After a database load the patient search keys and daily rollups are rebuilt with the
+application's own rebuild paths.
+
+Usage (from the project root, into an empty database created from the schema):
+    python Benchmarks/SyntheticData.py --size medium
+    python Benchmarks/SyntheticData.py --size large --seed 7 --truncate
+    python Benchmarks/SyntheticData.py --size small --patients 2000 --years 3 --csv-dir /tmp/medisync_csv
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Hospital size presets
+SIZES = {
+    "small": {"doctors": 8, "nurses": 24, "pharmacists": 4, "admins": 2, "patients": 500, "years": 1, "medicines": 120},
+    "medium": {"doctors": 60, "nurses": 200, "pharmacists": 15, "admins": 5, "patients": 10000, "years": 2, "medicines": 600},
+    "large": {"doctors": 250, "nurses": 900, "pharmacists": 50, "admins": 10, "patients": 60000, "years": 3, "medicines": 1500},
+}
+
+# Insert order and column order of every generated table
+TABLES = {
+    "users": ("user_id", "first_name", "last_name", "role", "license_number", "username", "password",
+              "contact_number", "email_address", "status", "created_at"),
+    "medicines": ("medicine_id", "generic_name", "brand_name", "formulation", "strength", "description",
+                  "is_controlled"),
+    "patients": ("patient_id", "patient_first_name", "patient_last_name", "date_of_birth", "sex",
+                 "emergency_contact_name", "emergency_person_relationship", "emergency_contact_number",
+                 "room_number", "admission_date", "diagnosis", "doctor_id", "nurse_id", "added_by", "status",
+                 "created_at"),
+    "prescriptions": ("prescription_id", "patient_id", "doctor_id", "medicine_id", "dosage", "duration_start",
+                      "duration_end", "frequency", "special_instructions", "status", "created_at"),
+    "prescription_verification": ("verification_id", "prescription_id", "pharmacist_id", "medication_lot_number",
+                                  "quantity_dispensed", "expiry_date", "decision", "reason", "verified_at"),
+    "medicine_preparation": ("preparation_id", "prescription_id", "quantity_prepared", "lot_number", "status"),
+    "medication_administration": ("administration_id", "prescription_id", "nurse_id", "administration_time",
+                                  "patient_assessment", "adverse_reactions", "remarks", "status", "created_at"),
+    "notifications": ("notification_id", "user_id", "related_table", "related_id", "title", "message", "type",
+                      "created_at"),
+}
+
+# Derived tables, emptied by --truncate and rebuilt after a database load
+DERIVED_TABLES = ("patient_search_keys", "daily_administration_rollup", "daily_verification_rollup",
+                  "daily_controlled_dispensing_rollup")
+
+FIRST_NAMES = (
+    "Maria", "Jose", "Juan", "Ana", "Antonio", "Rosa", "Pedro", "Carmen", "Luis", "Elena", "Miguel", "Teresa",
+    "Ramon", "Lourdes", "Carlos", "Gloria", "Eduardo", "Josefina", "Fernando", "Corazon", "Ricardo", "Remedios",
+    "Roberto", "Leticia", "Manuel", "Felicidad", "Alfredo", "Milagros", "Ernesto", "Cristina", "James", "Mary",
+    "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William", "Elizabeth", "David", "Susan",
+    "Richard", "Margaret", "Joseph", "Dorothy", "Thomas", "Lisa", "Charles", "Nancy", "Grace", "Angelo",
+)
+LAST_NAMES = (
+    "Santos", "Reyes", "Cruz", "Bautista", "Ocampo", "Garcia", "Mendoza", "Torres", "Tomas", "Andrada",
+    "Castillo", "Flores", "Villanueva", "Ramos", "Castro", "Rivera", "Aquino", "Navarro", "Salazar", "Mercado",
+    "Aguilar", "Dela Cruz", "De Leon", "Lopez", "Gonzales", "Hernandez", "Perez", "Smith", "Johnson", "Williams",
+    "Brown", "Jones", "Miller", "Davis", "Wilson", "Anderson", "Taylor", "Thomas", "Moore", "Martin", "O'Brien",
+    "Luntayao", "Soriano", "Pascual", "Valdez", "Manalo", "Domingo", "Santiago", "Yap", "Tan", "Lim", "Chua",
+)
+
+# generic name -> (brand names, formulations, strengths, controlled)
+FORMULARY = {
+    "Morphine Sulfate": (("MS Contin", "Kadian", "Oramorph"), ("Tablet", "Oral Solution", "Injection"),
+                         ("5 mg", "10 mg", "15 mg", "30 mg"), True),
+    "Oxycodone": (("OxyContin", "Roxicodone"), ("Tablet", "Capsule"), ("5 mg", "10 mg", "20 mg"), True),
+    "Hydromorphone": (("Dilaudid", "Exalgo"), ("Tablet", "Injection"), ("2 mg", "4 mg", "8 mg"), True),
+    "Fentanyl": (("Duragesic", "Sublimaze"), ("Transdermal Patch", "Injection"), ("12 mcg/h", "25 mcg/h", "50 mcg/h"), True),
+    "Methadone": (("Dolophine", "Methadose"), ("Tablet", "Oral Solution"), ("5 mg", "10 mg"), True),
+    "Lorazepam": (("Ativan",), ("Tablet", "Injection"), ("0.5 mg", "1 mg", "2 mg"), True),
+    "Midazolam": (("Versed", "Dormicum"), ("Injection",), ("1 mg/mL", "5 mg/mL"), True),
+    "Diazepam": (("Valium",), ("Tablet", "Rectal Gel"), ("2 mg", "5 mg", "10 mg"), True),
+    "Haloperidol": (("Haldol",), ("Tablet", "Injection"), ("0.5 mg", "1 mg", "5 mg"), False),
+    "Metoclopramide": (("Reglan", "Plasil"), ("Tablet", "Injection"), ("10 mg",), False),
+    "Ondansetron": (("Zofran",), ("Tablet", "Orally Disintegrating Tablet", "Injection"), ("4 mg", "8 mg"), False),
+    "Dexamethasone": (("Decadron",), ("Tablet", "Injection"), ("0.5 mg", "4 mg", "8 mg"), False),
+    "Furosemide": (("Lasix",), ("Tablet", "Injection"), ("20 mg", "40 mg"), False),
+    "Glycopyrrolate": (("Robinul",), ("Tablet", "Injection"), ("1 mg", "0.2 mg/mL"), False),
+    "Hyoscine Butylbromide": (("Buscopan",), ("Tablet", "Injection"), ("10 mg", "20 mg/mL"), False),
+    "Paracetamol": (("Biogesic", "Tylenol", "Calpol"), ("Tablet", "Suppository", "Oral Suspension"), ("325 mg", "500 mg", "650 mg"), False),
+    "Ibuprofen": (("Advil", "Medicol"), ("Tablet", "Capsule"), ("200 mg", "400 mg"), False),
+    "Senna": (("Senokot",), ("Tablet",), ("8.6 mg", "17.2 mg"), False),
+    "Lactulose": (("Duphalac",), ("Oral Solution",), ("3.3 g/5 mL",), False),
+    "Bisacodyl": (("Dulcolax",), ("Tablet", "Suppository"), ("5 mg", "10 mg"), False),
+    "Omeprazole": (("Losec", "Prilosec"), ("Capsule",), ("20 mg", "40 mg"), False),
+    "Gabapentin": (("Neurontin",), ("Capsule", "Tablet"), ("100 mg", "300 mg"), False),
+    "Amitriptyline": (("Elavil",), ("Tablet",), ("10 mg", "25 mg"), False),
+    "Mirtazapine": (("Remeron",), ("Tablet",), ("15 mg", "30 mg"), False),
+    "Sertraline": (("Zoloft",), ("Tablet",), ("50 mg", "100 mg"), False),
+    "Prochlorperazine": (("Stemetil", "Compazine"), ("Tablet", "Injection"), ("5 mg", "12.5 mg/mL"), False),
+    "Levetiracetam": (("Keppra",), ("Tablet", "Injection"), ("250 mg", "500 mg"), False),
+    "Enoxaparin": (("Lovenox", "Clexane"), ("Injection",), ("40 mg/0.4 mL", "60 mg/0.6 mL"), False),
+    "Insulin Glargine": (("Lantus",), ("Injection",), ("100 units/mL",), False),
+    "Metformin": (("Glucophage",), ("Tablet",), ("500 mg", "850 mg"), False),
+    "Amlodipine": (("Norvasc",), ("Tablet",), ("5 mg", "10 mg"), False),
+    "Salbutamol": (("Ventolin",), ("Nebule", "Inhaler"), ("2.5 mg/2.5 mL", "100 mcg/dose"), False),
+    "Ceftriaxone": (("Rocephin",), ("Injection",), ("1 g", "2 g"), False),
+    "Amoxicillin": (("Amoxil",), ("Capsule", "Oral Suspension"), ("500 mg", "250 mg/5 mL"), False),
+}
+
+# frequency -> (weight, scheduled hours of the day); names match AdministrationModel.FREQUENCY_INTERVALS
+FREQUENCIES = {
+    "Once a day": (30, (9,)),
+    "Twice a day": (30, (9, 21)),
+    "Three times a day": (15, (8, 14, 20)),
+    "Every 6 hours": (15, (0, 6, 12, 18)),
+    "Every 8 hours": (10, (6, 14, 22)),
+}
+
+DIAGNOSES = (
+    "Metastatic lung cancer", "Pancreatic cancer", "End-stage heart failure", "End-stage renal disease",
+    "Advanced dementia", "COPD, end stage", "Metastatic breast cancer", "Colorectal cancer with liver metastases",
+    "Amyotrophic lateral sclerosis", "Hepatocellular carcinoma", "Glioblastoma", "Advanced Parkinson's disease",
+    "Ovarian cancer", "Prostate cancer with bone metastases", "Cirrhosis, decompensated", "Stroke, severe",
+)
+RELATIONSHIPS = ("Spouse", "Son", "Daughter", "Sibling", "Parent", "Grandchild", "Friend", "Guardian")
+DOSAGES = {
+    "Tablet": ("1 tablet", "2 tablets", "1/2 tablet"), "Capsule": ("1 capsule", "2 capsules"),
+    "Injection": ("1 mL", "0.5 mL", "2 mL"), "Oral Solution": ("5 mL", "10 mL"), "Oral Suspension": ("5 mL", "10 mL"),
+    "Transdermal Patch": ("1 patch",), "Suppository": ("1 suppository",), "Rectal Gel": ("1 applicator",),
+    "Orally Disintegrating Tablet": ("1 tablet",), "Nebule": ("1 nebule",), "Inhaler": ("2 puffs",),
+}
+INSTRUCTIONS = ("Give with food.", "Hold if respiratory rate below 12.", "Crush and mix with thickened fluids.",
+                "For breakthrough pain.", "Monitor for sedation.", "Give before meals.", "Rotate patch site.")
+ASSESSMENTS = (("Active", 45), ("Drowsy", 30), ("Sleeping", 15), ("Confused", 10))
+ADVERSE_REACTIONS = (("None", 90), ("Nausea", 3), ("Dizziness", 2), ("Confusion", 2), ("Vomiting", 1), ("Rash", 1),
+                     ("Respiratory Issues", 1))
+MISSED_RATE = 0.04
+
+
+# ======================================================
+# GENERATION
+# ======================================================
+
+def weightedChoice(rng, options):
+    """rng.choices over ((value, weight), ...) pairs"""
+    values, weights = zip(*options)
+    return rng.choices(values, weights)[0]
+
+
+def generateRows(config, seed, as_of):
+    """
+    Yields (table, row) for the whole data set. Reference data and prescriptions are kept in
+    memory; administrations and notifications are streamed so history size is unbounded.
+    """
+    rng = random.Random(seed)
+    now = datetime.combine(as_of, datetime.min.time()).replace(hour=23, minute=59)
+    history_start = as_of - timedelta(days=365 * config["years"])
+    notification_id = 0
+
+    def notification(user_id, related_table, related_id, title, message, kind, created_at):
+        nonlocal notification_id
+        notification_id += 1
+        return "notifications", (notification_id, user_id, related_table, related_id, title, message[:255], kind,
+                                 created_at)
+
+    # ---------- users ----------
+    staff = {"Admin": [], "Doctor": [], "Nurse": [], "Pharmacist": []}
+    names = {}
+    license_prefix = {"Doctor": "MD", "Nurse": "RN", "Pharmacist": "RPH", "Admin": None}
+    user_id = 0
+    for role, count in (("Admin", config["admins"]), ("Doctor", config["doctors"]),
+                        ("Nurse", config["nurses"]), ("Pharmacist", config["pharmacists"])):
+        for _ in range(count):
+            user_id += 1
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            username = f"{first}.{last.replace(' ', '').replace(chr(39), '')}{user_id}".lower()
+            prefix = license_prefix[role]
+            created = datetime.combine(history_start - timedelta(days=rng.randint(0, 365)), datetime.min.time()) \
+                + timedelta(hours=rng.randint(8, 17))
+            staff[role].append(user_id)
+            names[user_id] = f"{first} {last}"
+            yield "users", (user_id, first, last, role, f"{prefix}-{rng.randint(100000, 999999)}" if prefix else None,
+                            username, "password123", f"09{rng.randint(100000000, 999999999)}",
+                            f"{username}@medisync.example", "Active" if rng.random() > 0.03 else "Inactive", created)
+            yield notification(user_id, "users", user_id, "Welcome to MEDISYNC!",
+                               f"Hello {first} {last}, your account has been created successfully. "
+                               f"You can now log in with username: {username}.", "Info", created)
+
+    # ---------- medicines ----------
+    medicines = []
+    combos = [(generic, formulation, strength)
+              for generic, (_, formulations, strengths, _) in FORMULARY.items()
+              for formulation in formulations for strength in strengths]
+    for medicine_id in range(1, config["medicines"] + 1):
+        generic, formulation, strength = combos[(medicine_id - 1) % len(combos)]
+        brands, _, _, controlled = FORMULARY[generic]
+        brand = brands[(medicine_id - 1) // len(combos) % len(brands)]
+        generation = (medicine_id - 1) // (len(combos) * len(brands))
+        if generation:
+            brand = f"{brand} {['', 'Generics', 'Plus', 'Forte', 'Retard', 'SR', 'Novo', 'Pharma'][generation % 8]}".strip()
+        medicines.append((medicine_id, generic, brand, formulation, controlled))
+        yield "medicines", (medicine_id, generic, brand, formulation, strength,
+                            f"{generic} {strength} {formulation.lower()}", controlled)
+
+    # ---------- patients, prescriptions and their history ----------
+    prescription_id = verification_id = preparation_id = administration_id = 0
+    span_days = max((as_of - history_start).days, 1)
+    frequency_names = list(FREQUENCIES)
+    frequency_weights = [FREQUENCIES[name][0] for name in frequency_names]
+
+    for patient_id in range(1, config["patients"] + 1):
+        # Later admissions are more likely (growing hospital), stays are long-tailed
+        admitted_day = history_start + timedelta(days=int(span_days * rng.random() ** 0.7))
+        admitted_at = datetime.combine(admitted_day, datetime.min.time()) + timedelta(minutes=rng.randint(420, 1260))
+        stay_days = min(int(rng.lognormvariate(2.5, 0.8)) + 1, 180)
+        leaves_on = admitted_day + timedelta(days=stay_days)
+        if leaves_on < as_of:
+            status = "Deceased" if rng.random() < 0.55 else "Discharged"
+        else:
+            status, leaves_on = "Active", None
+
+        doctor_id, nurse_id = rng.choice(staff["Doctor"]), rng.choice(staff["Nurse"])
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        birth = admitted_day - timedelta(days=rng.randint(45 * 365, 98 * 365))
+        contact = f"{rng.choice(FIRST_NAMES)} {last}"
+        room = f"{rng.choice('ABCD')}-{rng.randint(1, 5)}{rng.randint(1, 40):02d}"
+        yield "patients", (patient_id, first, last, birth, rng.choice(("Male", "Female")), contact,
+                           rng.choice(RELATIONSHIPS), f"09{rng.randint(100000000, 999999999)}", room, admitted_at,
+                           rng.choice(DIAGNOSES), doctor_id, nurse_id, rng.choice(staff["Admin"]), status,
+                           admitted_at)
+
+        last_day = min(leaves_on or as_of, as_of)
+        for _ in range(rng.choices((1, 2, 3, 4, 5), (20, 35, 25, 15, 5))[0]):
+            prescription_id += 1
+            medicine_id, generic, brand, formulation, controlled = rng.choice(medicines)
+            frequency = rng.choices(frequency_names, frequency_weights)[0]
+            doses_per_day = len(FREQUENCIES[frequency][1])
+
+            start = admitted_day + timedelta(days=rng.randint(0, max((last_day - admitted_day).days, 0)))
+            end = start + timedelta(days=rng.choice((3, 5, 7, 7, 10, 14, 14, 21, 30)) - 1)
+            if leaves_on:
+                end = max(min(end, leaves_on), start)
+            created = datetime.combine(start, datetime.min.time()) - timedelta(minutes=rng.randint(30, 600))
+
+            roll = rng.random()
+            if roll < 0.03:
+                rx_status, decision = "Rejected", "Reject"
+            elif roll < 0.05:
+                rx_status, decision = "Modification Requested", "Request Modification"
+            elif end >= as_of and roll < 0.12:
+                rx_status, decision = "Pending Verification", None
+            else:
+                rx_status, decision = ("Completed" if end < as_of or leaves_on else "Active"), "Approve"
+
+            yield "prescriptions", (prescription_id, patient_id, doctor_id, medicine_id,
+                                    rng.choice(DOSAGES.get(formulation, ("1 dose",))), start, end, frequency,
+                                    rng.choice(INSTRUCTIONS) if rng.random() < 0.3 else None, rx_status, created)
+
+            if decision is None:
+                continue
+
+            # Verification (and the doctor's notification about it)
+            verification_id += 1
+            verified_at = created + timedelta(minutes=rng.randint(10, 240))
+            quantity = doses_per_day * ((end - start).days + 1)
+            lot = f"LOT-{start.year}{rng.randint(10000, 99999)}"
+            approved = decision == "Approve"
+            yield "prescription_verification", (
+                verification_id, prescription_id, rng.choice(staff["Pharmacist"]),
+                lot if approved else None, quantity if approved else None,
+                start + timedelta(days=rng.randint(180, 720)) if approved else None, decision,
+                None if approved else rng.choice(("Dose exceeds guideline.", "Drug interaction.",
+                                                  "Allergy documented.", "Clarify route.")),
+                verified_at
+            )
+            status_text, kind = {"Approve": ("Approved", "Info"),
+                                 "Request Modification": ("Modification Requested", "Attention"),
+                                 "Reject": ("Rejected", "Urgent")}[decision]
+            yield notification(doctor_id, "prescription_verification", prescription_id,
+                               f"Prescription {status_text}",
+                               f"Prescription for {first} {last} - {brand} ({generic}) has been "
+                               f"{status_text.lower()} by {names[rng.choice(staff['Pharmacist'])]}", kind, verified_at)
+
+            if not approved:
+                continue
+
+            preparation_id += 1
+            running = rx_status == "Active"
+            yield "medicine_preparation", (preparation_id, prescription_id, quantity, lot,
+                                           "Prepared" if running and rng.random() < 0.5 else "To be Prepared")
+
+            # Every scheduled dose from start to end (or today)
+            hours = FREQUENCIES[frequency][1]
+            day = start
+            while day <= min(end, as_of):
+                for hour in hours:
+                    scheduled = datetime.combine(day, datetime.min.time()) + timedelta(hours=hour)
+                    missed = rng.random() < MISSED_RATE
+                    given = scheduled + timedelta(minutes=rng.randint(-20, 40) + (180 if missed else 0))
+                    if given > now:
+                        continue
+                    administration_id += 1
+                    giver = nurse_id if rng.random() < 0.8 else rng.choice(staff["Nurse"])
+                    status = "Missed" if missed else "Administered"
+                    yield "medication_administration", (
+                        administration_id, prescription_id, giver, given, weightedChoice(rng, ASSESSMENTS),
+                        weightedChoice(rng, ADVERSE_REACTIONS), None, status, given
+                    )
+                    yield notification(doctor_id, "medication_administration", prescription_id,
+                                       f"Medication {'Administered' if not missed else 'Missed (Late)'}",
+                                       f"{first} {last} - {generic} administered by {names[giver]}",
+                                       "Info" if not missed else "Attention", given)
+                day += timedelta(days=1)
+
+
+# ======================================================
+# SINKS
+# ======================================================
+
+class DatabaseSink:
+    """Bulk-loads rows with executemany, BATCH rows per statement batch and commit"""
+
+    def __init__(self, batch_size, truncate):
+        from Utilities.DatabaseConnection import getConnection
+        self.batch_size = batch_size
+        self.conn = getConnection()
+        self.cursor = self.conn.cursor()
+        self.buffers = {table: [] for table in TABLES}
+        self.queries = {
+            table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+            for table, columns in TABLES.items()
+        }
+
+        self.cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        self.cursor.execute("SET UNIQUE_CHECKS = 0")
+        if truncate:
+            for table in (*TABLES, *DERIVED_TABLES):
+                self.cursor.execute(f"TRUNCATE TABLE {table}")
+        else:
+            for table in TABLES:
+                self.cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {table})")
+                if self.cursor.fetchone()[0]:
+                    self.close()
+                    raise RuntimeError(f"Table {table} is not empty (use --truncate to replace existing data)")
+
+    def add(self, table, row):
+        buffer = self.buffers[table]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self._flush(table)
+
+    def _flush(self, table):
+        if self.buffers[table]:
+            self.cursor.executemany(self.queries[table], self.buffers[table])
+            self.conn.commit()
+            self.buffers[table] = []
+
+    def finish(self):
+        from Model.Cache.TableVersions import TableVersions
+        for table in TABLES:
+            self._flush(table)
+        # Running workstations must drop what they cached from the replaced tables
+        TableVersions.bump(self.conn, *(table for table in TableVersions.TABLES if table in TABLES))
+        self.conn.commit()
+        self.close()
+
+    def close(self):
+        self.cursor.execute("SET UNIQUE_CHECKS = 1")
+        self.cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        self.cursor.close()
+        self.conn.close()
+
+
+class CsvSink:
+    """Writes one CSV per table (header row, \\N for NULL) for LOAD DATA INFILE"""
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.files, self.writers = {}, {}
+        for table, columns in TABLES.items():
+            file = open(os.path.join(directory, f"{table}.csv"), "w", newline="", encoding="utf-8")
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            self.files[table], self.writers[table] = file, writer
+
+    def add(self, table, row):
+        self.writers[table].writerow(["\\N" if value is None else int(value) if isinstance(value, bool) else value
+                                      for value in row])
+
+    def finish(self):
+        for file in self.files.values():
+            file.close()
+
+
+# ======================================================
+# MAIN
+# ======================================================
+
+def rebuildDerivedData(from_date, to_date):
+    """Rebuilds patient search keys and daily rollups with the application's rebuild paths"""
+    from Model.Search.PatientSearchIndex import PatientSearchIndex
+    from Model.Rollups.DailyRollups import DailyRollups
+
+    started = time.perf_counter()
+    indexed = PatientSearchIndex.rebuildAll()
+    print(f"  patient_search_keys: {indexed} patients indexed")
+    if DailyRollups.rebuildRange(from_date, to_date):
+        print(f"  daily rollups: rebuilt {from_date} .. {to_date}")
+    print(f"  derived data: {time.perf_counter() - started:.1f} s")
+
+
+def loadDataset(config, seed, as_of, batch_size=5000, truncate=False, csv_dir=None):
+    """
+    Generates the data set described by `config` into the database (or CSV files in csv_dir).
+    Returns ({table: rows}, seconds). Raises if the database tables are not empty and
+    truncate is False.
+    """
+    sink = CsvSink(csv_dir) if csv_dir else DatabaseSink(batch_size, truncate)
+    counts = {table: 0 for table in TABLES}
+    started = time.perf_counter()
+    try:
+        for table, row in generateRows(config, seed, as_of):
+            sink.add(table, row)
+            counts[table] += 1
+    finally:
+        sink.finish()
+    return counts, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic MEDISYNC data set.")
+    parser.add_argument("--size", choices=SIZES, default="small", help="Hospital size preset")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(),
+                        help="Last day of generated history (YYYY-MM-DD); fix it for reproducible runs")
+    for key in SIZES["small"]:
+        parser.add_argument(f"--{key}", type=int, default=None, help=f"Override the preset's {key}")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--csv-dir", default=None, help="Write CSV files here instead of loading the database")
+    parser.add_argument("--truncate", action="store_true", help="Empty the tables before loading")
+    args = parser.parse_args()
+
+    config = dict(SIZES[args.size])
+    for key in config:
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+    if min(config["doctors"], config["nurses"], config["pharmacists"], config["admins"]) < 1:
+        parser.error("every role needs at least one user")
+
+    print(f"Generating '{args.size}' hospital (seed {args.seed}, as of {args.as_of}): "
+          + ", ".join(f"{key}={value}" for key, value in config.items()))
+
+    try:
+        counts, seconds = loadDataset(config, args.seed, args.as_of, args.batch_size, args.truncate, args.csv_dir)
+    except Exception as e:
+        print(f"Cannot load data: {e}")
+        return 1
+
+    total = sum(counts.values())
+    for table, count in counts.items():
+        print(f"  {table:<28} {count:>12,}")
+    print(f"  {'total':<28} {total:>12,}  in {seconds:.1f} s ({total / max(seconds, 1e-9):,.0f} rows/s)")
+
+    if args.csv_dir:
+        print(f"\nCSV files written to {args.csv_dir}. Load each with, e.g.:\n"
+              f"  LOAD DATA LOCAL INFILE '{args.csv_dir}/patients.csv' INTO TABLE patients\n"
+              f"  FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' IGNORE 1 LINES (<columns from the header>);\n"
+              f"then run: python -m Model.Tasks.PatientSearchIndexTask and "
+              f"python -m Model.Tasks.DailyRollupTask {365 * config['years'] + 60}")
+    else:
+        rebuildDerivedData(args.as_of - timedelta(days=365 * config["years"] + 60), args.as_of)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
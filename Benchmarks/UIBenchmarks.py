@@ -0,0 +1,280 @@
+"""
+MEDISYNC - UI Render Benchmarks
+
+Builds the heaviest windows on the offscreen Qt platform with synthetic data of several
+sizes and measures, per window and size:
+    build_ms        constructing the window and filling it the way its controller does
+    first_paint_ms  showing it and rendering the first frame
+    scroll_*_ms     median / p95 / max frame time while stepping its list from top to bottom
+    widgets         QWidget objects in the window (table cells are counted separately as items)
+
+Card-based views (notifications, medications to prepare) create several widgets per row, so
+sizes above --max-card-rows are skipped for them and reported as such.
+
+Results are compared with Benchmarks/baselines/ui.json; the run fails when a case's build or
+first-paint time is more than --threshold slower than its baseline. No database is needed.
+
+Usage (from the project root):
+    python Benchmarks/UIBenchmarks.py
+    python Benchmarks/UIBenchmarks.py --rows 10 1000 50000 --max-card-rows 50000
+    python Benchmarks/UIBenchmarks.py --save-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget, QTableWidget
+
+from Benchmarks.SyntheticData import FIRST_NAMES, LAST_NAMES, FORMULARY, DIAGNOSES
+
+BASELINE_PATH = os.path.join(PROJECT_ROOT, "Benchmarks", "baselines", "ui.json")
+
+DEFAULT_ROWS = (10, 1000, 50000)
+DEFAULT_MAX_CARD_ROWS = 5000
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 5.0
+SCROLL_STEPS = 40
+SEED = 42
+
+USER_INFO, PRIORITIES = "Benchmark User", ("Urgent", "Attention", "Info")
+
+
+# ======================================================
+# SYNTHETIC ROWS
+# ======================================================
+
+def makeRows(kind, count, seed=SEED):
+    """Returns `count` dicts shaped like the model rows each window is filled with"""
+    rng = random.Random(f"{seed}-{kind}-{count}")
+    medicines = list(FORMULARY)
+    start = datetime(2026, 1, 1, 8, 0)
+
+    def name():
+        return rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+    rows = []
+    for index in range(1, count + 1):
+        first, last = name()
+        generic = rng.choice(medicines)
+        brand = rng.choice(FORMULARY[generic][0])
+        if kind == "patients":
+            rows.append({
+                "patient_id": index, "patient_first_name": first, "patient_last_name": last,
+                "sex": rng.choice(("Male", "Female")), "room_number": f"A-{rng.randint(100, 540)}",
+                "doctor_name": "Dr. " + " ".join(name()), "nurse_name": " ".join(name()),
+                "status": rng.choice(("Active", "Active", "Discharged", "Deceased")),
+                "diagnosis": rng.choice(DIAGNOSES),
+            })
+        elif kind == "prescription_records":
+            rows.append({
+                "id": index, "date": (start + timedelta(hours=index)).date().isoformat(),
+                "patient": f"{first} {last}", "medication": f"{brand} ({generic})", "dosage": "1 tablet",
+                "frequency": rng.choice(("Once a day", "Twice a day", "Every 8 hours")),
+                "prescribed_by": "Dr. " + " ".join(name()),
+                "status": rng.choice(("Active", "Completed", "Pending Verification")),
+            })
+        elif kind == "notifications":
+            rows.append({
+                "notification_id": index, "priority": rng.choice(PRIORITIES),
+                "title": rng.choice(("Medication Administered", "Prescription Approved", "New Prescription")),
+                "message": f"{first} {last} - {generic} administered by {' '.join(name())}",
+                "time": f"{rng.randint(1, 59)} minutes ago",
+            })
+        elif kind == "preparations":
+            rows.append({
+                "preparation_id": index, "prescription_id": index, "patient_first_name": first,
+                "patient_last_name": last, "brand_name": brand, "generic_name": generic,
+                "quantity_prepared": rng.randint(2, 90), "status": "To be Prepared",
+            })
+    return rows
+
+
+# ======================================================
+# CASES
+# ======================================================
+
+def buildAdminPatients(rows):
+    from View.AdminGUI.AdminPatientsWindow import AdminPatientsWindow
+    from Controller.Admin.AdminPatientsController import AdminPatientsController
+    window = AdminPatientsWindow(USER_INFO, "Admin")
+    AdminPatientsController._populatePatientsTable(SimpleNamespace(patientsWindow=window), rows)
+    return window, window.patientsTable
+
+
+def buildReports(rows):
+    from View.AdminGUI.ReportsWindow import ReportsWindow
+    window = ReportsWindow(USER_INFO, "Admin")
+    window.switchToTable(1)
+    window.populateTable(rows, ["ID", "Date", "Patient", "Medication", "Dosage", "Frequency",
+                                "Prescribed By", "Status"])
+    return window, window.tableStack.currentWidget()
+
+
+def notificationsCase(module, class_name, role):
+    def build(rows):
+        window_class = getattr(__import__(module, fromlist=[class_name]), class_name)
+        window = window_class(USER_INFO, role)
+        window.displayNotifications(rows)
+        return window, window.scrollArea
+    return build
+
+
+def buildPharmacistDashboard(rows):
+    from View.PharmacistGUI.PharmacistDashboardWindow import PharmacistDashboardWindow
+    window = PharmacistDashboardWindow(0, 0, 0, USER_INFO, "Pharmacist", [], rows)
+    return window, window.scrollArea
+
+
+# name -> (row kind, builds cards, build(rows) -> (window, scrollable))
+CASES = {
+    "AdminPatientsWindow": ("patients", False, buildAdminPatients),
+    "ReportsWindow.populateTable": ("prescription_records", False, buildReports),
+    "AdminNotificationsWindow.displayNotifications": (
+        "notifications", True, notificationsCase("View.AdminGUI.AdminNotificationsWindow", "AdminNotificationsWindow", "Admin")),
+    "DoctorNotificationsWindow.displayNotifications": (
+        "notifications", True, notificationsCase("View.DoctorGUI.DoctorNotificationsWindow", "DoctorNotificationsWindow", "Doctor")),
+    "NurseNotificationsWindow.displayNotifications": (
+        "notifications", True, notificationsCase("View.NurseGUI.NurseNotificationsWindow", "NurseNotificationsWindow", "Nurse")),
+    "PharmacistNotificationsWindow.displayNotifications": (
+        "notifications", True, notificationsCase("View.PharmacistGUI.PharmacistNotificationsWindow",
+                                                 "PharmacistNotificationsWindow", "Pharmacist")),
+    "PharmacistDashboardWindow.displayMedicationCards": ("preparations", True, buildPharmacistDashboard),
+}
+
+
+# ======================================================
+# MEASURING
+# ======================================================
+
+def measureScroll(app, scrollable):
+    """Steps the vertical scroll bar from top to bottom, painting each frame. Returns frame times (ms)."""
+    bar = scrollable.verticalScrollBar()
+    viewport = scrollable.viewport()
+    if bar.maximum() <= 0:
+        return []
+    frames = []
+    for step in range(1, SCROLL_STEPS + 1):
+        started = time.perf_counter()
+        bar.setValue(bar.maximum() * step // SCROLL_STEPS)
+        viewport.repaint()
+        app.processEvents()
+        frames.append((time.perf_counter() - started) * 1000)
+    return frames
+
+
+def runCase(app, build, rows):
+    gc.collect()
+    started = time.perf_counter()
+    window, scrollable = build(rows)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    window.show()
+    app.processEvents()
+    window.repaint()
+    first_paint_ms = (time.perf_counter() - started) * 1000
+
+    frames = sorted(measureScroll(app, scrollable))
+    items = 0
+    if isinstance(scrollable, QTableWidget):
+        items = scrollable.rowCount() * scrollable.columnCount()
+    widgets = len(window.findChildren(QWidget))
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+    return {
+        "build_ms": round(build_ms, 2),
+        "first_paint_ms": round(first_paint_ms, 2),
+        "scroll_median_ms": round(statistics.median(frames), 2) if frames else None,
+        "scroll_p95_ms": round(frames[min(len(frames) - 1, int(len(frames) * 0.95))], 2) if frames else None,
+        "scroll_max_ms": round(frames[-1], 2) if frames else None,
+        "widgets": widgets,
+        "items": items,
+    }
+
+
+def compareWithBaseline(results, baseline, threshold, min_delta_ms):
+    """Returns regression messages for build and first-paint times"""
+    regressions = []
+    for key, entry in results.items():
+        previous = baseline.get("cases", {}).get(key)
+        if not previous or "skipped" in entry or "skipped" in previous:
+            continue
+        for metric in ("build_ms", "first_paint_ms"):
+            before, after = previous[metric], entry[metric]
+            if after - before > min_delta_ms and after > before * (1 + threshold):
+                regressions.append(f"{key} {metric}: {before:.1f} -> {after:.1f} ms (+{(after - before) / max(before, 1e-9):.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MEDISYNC window construction and painting.")
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--max-card-rows", type=int, default=DEFAULT_MAX_CARD_ROWS,
+                        help="Largest size used for card-based views")
+    parser.add_argument("--filter", default=None, help="Only run cases whose name contains this text")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    from Utilities.AssetRegistry import AssetRegistry
+    AssetRegistry.preload()
+
+    results = {}
+    print(f"{'case':<52} {'rows':>6} {'build':>9} {'paint':>8} {'scroll p95':>11} {'widgets':>8} {'items':>8}")
+    for name, (kind, cards, build) in CASES.items():
+        if args.filter and args.filter.lower() not in name.lower():
+            continue
+        for count in args.rows:
+            key = f"{name}[{count}]"
+            if cards and count > args.max_card_rows:
+                results[key] = {"skipped": f"over --max-card-rows {args.max_card_rows}"}
+                print(f"{name:<52} {count:>6} {'skipped (card view, raise --max-card-rows)':>44}")
+                continue
+            entry = results[key] = runCase(app, build, makeRows(kind, count))
+            scroll = f"{entry['scroll_p95_ms']:.1f}" if entry["scroll_p95_ms"] is not None else "-"
+            print(f"{name:<52} {count:>6} {entry['build_ms']:>9.1f} {entry['first_paint_ms']:>8.1f} "
+                  f"{scroll:>11} {entry['widgets']:>8} {entry['items']:>8}")
+
+    document = {"recorded_at": datetime.now().isoformat(timespec="seconds"),
+                "platform": os.environ["QT_QPA_PLATFORM"], "cases": results}
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=1)
+        print(f"\nBaseline saved to {os.path.relpath(BASELINE_PATH, PROJECT_ROOT)}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("\nNo baseline yet (run with --save-baseline).")
+        return 0
+    with open(BASELINE_PATH, encoding="utf-8") as file:
+        regressions = compareWithBaseline(results, json.load(file), args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"\nREGRESSIONS (> {args.threshold:.0%} slower than baseline):")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"\nWithin {args.threshold:.0%} of baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
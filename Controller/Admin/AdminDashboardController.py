@@ -1,6 +1,8 @@
 from Model.KPIs.AdminKPIs import AdminKPIs
 from Model.Tables.AdminTables import AdminTables
 from Model.SessionManager import SessionManager
+from Model.Cache.DashboardSections import DashboardSections
+from Utilities.WindowRegistry import WindowRegistry
 from View.AdminGUI.AdminDashboardWindow import AdminDashboardWindow
 
 class AdminDashboardController:
@@ -9,6 +11,15 @@ class AdminDashboardController:
     Orchestrates data fetching, formatting, and navigation.
     """
 
+    # Section name -> KPI card label
+    KPI_LABELS = {
+        'activeUsers': "Active Users",
+        'activePatients': "Active Patients",
+        'activePrescriptions': "Active Prescriptions",
+        'pendingPrescriptions': "Pending Prescriptions",
+        'missedMedications': "Missed Medications",
+    }
+
     def __init__(self):
         self.loginController = None
         self.adminDashboard = None
@@ -16,18 +27,22 @@ class AdminDashboardController:
 
     def _loadData(self):
         """Fetch and prepare all required data"""
-        self.kpis = {
-            'activeUsers': self._safeKPI(AdminKPIs.activeUsersCount),
-            'activePatients': self._safeKPI(AdminKPIs.activePatientsCount),
-            'activePrescriptions': self._safeKPI(AdminKPIs.activePrescriptionsCount),
-            'pendingPrescriptions': self._safeKPI(AdminKPIs.pendingPrescriptionsCount),
-            'missedMedications': self._safeKPI(AdminKPIs.missedMedicationsCount)
-        }
+        # One section per KPI card and table, with the tables it is read from
+        # (None: depends on today's date or on notifications, so always re-queried)
+        self.sections = DashboardSections({
+            'activeUsers': (lambda: self._safeKPI(AdminKPIs.activeUsersCount), ("users",)),
+            'activePatients': (lambda: self._safeKPI(AdminKPIs.activePatientsCount), ("patients",)),
+            'activePrescriptions': (lambda: self._safeKPI(AdminKPIs.activePrescriptionsCount), ("prescriptions",)),
+            'pendingPrescriptions': (lambda: self._safeKPI(AdminKPIs.pendingPrescriptionsCount), ("prescriptions",)),
+            'missedMedications': (lambda: self._safeKPI(AdminKPIs.missedMedicationsCount), None),
+            'todaysActivity': (lambda: self._safeTable(AdminTables.getTodaysActivitySummary), None)
+        })
+        results = self.sections.load()
+        self.kpis = {name: results[name] for name in self.KPI_LABELS}
 
         self.user, self.userInfo, self.role = self._getCurrentUser()
-        self.todaysActivity = self._formatActivityData(
-            self._safeTable(AdminTables.getTodaysActivitySummary)
-        )
+        self.todaysActivity = self._formatActivityData(results['todaysActivity'])
+
     @staticmethod
     def _safeKPI(func):
         try: return func() or 0
@@ -77,6 +92,17 @@ class AdminDashboardController:
         self._connectNavigation()
         self.adminDashboard.show()
 
+    def reopen(self):
+        """Show the kept dashboard again, updating only the cards and tables whose data changed"""
+        for name, value in self.sections.refresh().items():
+            if name in self.KPI_LABELS:
+                self.kpis[name] = value
+                self.adminDashboard.setKPIValue(self.KPI_LABELS[name], value)
+            elif name == 'todaysActivity':
+                self.todaysActivity = self._formatActivityData(value)
+                self.adminDashboard.setActivityData(self.todaysActivity)
+        self.adminDashboard.show()
+
     def _connectNavigation(self):
         dashboard = self.adminDashboard
         dashboard.usersOption.mousePressEvent = lambda e: self.navigateToUsers()
@@ -88,33 +114,27 @@ class AdminDashboardController:
     def navigateToUsers(self):
         self._closeCurrent()
         from Controller.Admin.AdminUsersController import AdminUsersController
-        AdminUsersController().openUsersWindow()
+        WindowRegistry.open(AdminUsersController, "openUsersWindow")
 
     def navigateToPatients(self):
         self._closeCurrent()
         from Controller.Admin.AdminPatientsController import AdminPatientsController
-        AdminPatientsController().openPatientsWindow()
+        WindowRegistry.open(AdminPatientsController, "openPatientsWindow")
 
     def navigateToReports(self):
         self._closeCurrent()
         from Controller.Admin.ReportsController import ReportsController
-        ReportsController().openReportsWindow()
+        WindowRegistry.open(ReportsController, "openReportsWindow")
 
     def navigateToNotifications(self):
         self._closeCurrent()
         from Controller.Admin.AdminNotificationsController import AdminNotificationsController
-        AdminNotificationsController().openNotificationsWindow()
+        WindowRegistry.open(AdminNotificationsController, "openNotificationsWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
+        self.loginController = WindowRegistry.showLogin()
 
     def _closeCurrent(self):
         if self.adminDashboard:
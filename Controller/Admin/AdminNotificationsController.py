@@ -1,5 +1,6 @@
 from Model.Notifications.NotificationsModel import NotificationsModel
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.AdminGUI.AdminNotificationsWindow import AdminNotificationsWindow
 
 class AdminNotificationsController:
@@ -20,6 +21,11 @@ class AdminNotificationsController:
         self._connectSignals()
         self.notificationsWindow.show()
 
+    def reopen(self):
+        """Show the kept window again, re-running the current search/filter"""
+        self.searchNotifications()
+        self.notificationsWindow.show()
+
     def _connectSignals(self):
         w = self.notificationsWindow
 
@@ -105,30 +111,24 @@ class AdminNotificationsController:
     def navigateToDashboard(self):
         self._closeCurrent()
         from Controller.Admin.AdminDashboardController import AdminDashboardController
-        AdminDashboardController().openDashboard()
+        WindowRegistry.open(AdminDashboardController, "openDashboard")
 
     def navigateToUsers(self):
         self._closeCurrent()
         from Controller.Admin.AdminUsersController import AdminUsersController
-        AdminUsersController().openUsersWindow()
+        WindowRegistry.open(AdminUsersController, "openUsersWindow")
 
     def navigateToPatients(self):
         self._closeCurrent()
         from Controller.Admin.AdminPatientsController import AdminPatientsController
-        AdminPatientsController().openPatientsWindow()
+        WindowRegistry.open(AdminPatientsController, "openPatientsWindow")
 
     def navigateToReports(self):
         self._closeCurrent()
         from Controller.Admin.ReportsController import ReportsController
-        ReportsController().openReportsWindow()
+        WindowRegistry.open(ReportsController, "openReportsWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
\ No newline at end of file
+        self.loginController = WindowRegistry.showLogin()
\ No newline at end of file
@@ -1,8 +1,11 @@
 from Model.Transactions.PatientModel import PatientsModel
+from Model.Cache.ReferenceDataCache import ReferenceDataCache
 from Model.Notifications.NotificationsModel import NotificationsModel
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.AdminGUI.AdminPatientsWindow import AdminPatientsWindow, RegisterPatientPopup, EditPatientPopup, AddSuccessPopup
 from View.GeneralPopups.Dialogs import Dialogs
+from Utilities.LiveSearch import LiveSearch
 from PyQt6.QtWidgets import QTableWidgetItem
 from PyQt6.QtCore import Qt
 
@@ -41,6 +44,11 @@ class AdminPatientsController:
         self._connectSignals()
         self.patientsWindow.show()
 
+    def reopen(self):
+        """Show the kept window again with a refreshed patients table"""
+        self.searchPatients()
+        self.patientsWindow.show()
+
     def _populatePatientsTable(self, patients):
         """Fill patients table"""
         table = self.patientsWindow.patientsTable
@@ -71,6 +79,9 @@ class AdminPatientsController:
         w.logoutOption.mousePressEvent = lambda e: self.logout()
 
         w.searchButton.clicked.connect(self.searchPatients)
+        w.searchInput.returnPressed.connect(self.searchPatients)
+        # Indexed prefix/equality search: results for a longer query are not a substring-subset, so no local narrowing
+        self.patientSearch = LiveSearch(w.searchInput, self._fetchPatients, self._populatePatientsTable)
         w.registerButton.clicked.connect(self.showRegisterPatientPopup)
         w.editButton.clicked.connect(self.showEditPatientPopup)
         w.patientsTable.itemClicked.connect(self.onPatientSelected)
@@ -87,15 +98,17 @@ class AdminPatientsController:
 
     def searchPatients(self):
         """Search and update table"""
-        query = self.patientsWindow.searchInput.text().strip()
-        results = PatientsModel.searchPatients(query) if query else PatientsModel.getAllPatients()
-        self._populatePatientsTable(results)
+        self.patientSearch.refresh()
+
+    @staticmethod
+    def _fetchPatients(query):
+        """Runs on the live-search worker thread"""
+        return PatientsModel.searchPatients(query) if query else PatientsModel.getAllPatients()
 
     def showRegisterPatientPopup(self):
         """Open register popup"""
         self.registerPopup = RegisterPatientPopup()
-        doctors = PatientsModel.getDoctorsList()
-        nurses = PatientsModel.getNursesList()
+        doctors, nurses = ReferenceDataCache.getLists("doctors", "nurses")
         self.registerPopup.populateDoctors(doctors)
         self.registerPopup.populateNurses(nurses)
         self.registerPopup.submitButton.clicked.connect(self.registerPatient)
@@ -157,8 +170,7 @@ class AdminPatientsController:
             return
 
         self.editPopup = EditPatientPopup()
-        doctors = PatientsModel.getDoctorsList()
-        nurses = PatientsModel.getNursesList()
+        doctors, nurses = ReferenceDataCache.getLists("doctors", "nurses")
         self.editPopup.populateDoctors(doctors)
         self.editPopup.populateNurses(nurses)
         self.editPopup.populateForm(self.patientsWindow.selectedPatientData)
@@ -187,56 +199,38 @@ class AdminPatientsController:
         """Refresh table"""
         self.allPatients = PatientsModel.getAllPatients()
         self._populatePatientsTable(self.allPatients)
+        self.patientSearch.invalidate()
+        ReferenceDataCache.invalidate("patients")
 
     @staticmethod
     def _validatePatientData(data):
         """Validate form data"""
-        if not data['first_name'] or not data['last_name']:
-            return "First and last name required."
-        if not data['sex']:
-            return "Select sex."
-        if not data['room_number']:
-            return "Room number required."
-        if not data['diagnosis']:
-            return "Diagnosis required."
-        if not data['doctor_id']:
-            return "Select doctor."
-        if not data['nurse_id']:
-            return "Select nurse."
-        if 'status' in data and not data['status']:
-            return "Select status."
-        return None
+        return PatientsModel.validatePatientData(data)
 
     def navigateToDashboard(self):
         self._closeCurrent()
         from Controller.Admin.AdminDashboardController import AdminDashboardController
-        AdminDashboardController().openDashboard()
+        WindowRegistry.open(AdminDashboardController, "openDashboard")
 
     def navigateToUsers(self):
         self._closeCurrent()
         from Controller.Admin.AdminUsersController import AdminUsersController
-        AdminUsersController().openUsersWindow()
+        WindowRegistry.open(AdminUsersController, "openUsersWindow")
 
     def navigateToReports(self):
         self._closeCurrent()
         from Controller.Admin.ReportsController import ReportsController
-        ReportsController().openReportsWindow()
+        WindowRegistry.open(ReportsController, "openReportsWindow")
 
     def navigateToNotifications(self):
         self._closeCurrent()
         from Controller.Admin.AdminNotificationsController import AdminNotificationsController
-        AdminNotificationsController().openNotificationsWindow()
+        WindowRegistry.open(AdminNotificationsController, "openNotificationsWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
+        self.loginController = WindowRegistry.showLogin()
 
     def _closeCurrent(self):
         if self.patientsWindow:
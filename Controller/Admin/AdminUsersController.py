@@ -1,12 +1,14 @@
 from Model.Transactions.UserModel import UserModel
+from Model.Cache.ReferenceDataCache import ReferenceDataCache
 from Model.Notifications.NotificationsModel import NotificationsModel
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.AdminGUI.AdminUsersWindow import AdminUsersWindow, AddUserPopup, EditUserPopup
 from View.AdminGUI.AdminPatientsWindow import AddSuccessPopup
 from View.GeneralPopups.Dialogs import Dialogs
+from Utilities.LiveSearch import LiveSearch
 from PyQt6.QtWidgets import QTableWidgetItem
 from PyQt6.QtCore import Qt
-import re
 
 class AdminUsersController:
     """
@@ -43,6 +45,11 @@ class AdminUsersController:
         self._connectSignals()
         self.usersWindow.show()
 
+    def reopen(self):
+        """Show the kept window again with a refreshed users table"""
+        self.searchUsers()
+        self.usersWindow.show()
+
     def _populateUsersTable(self, users):
         """Populate the users table with data"""
         table = self.usersWindow.usersTable
@@ -74,6 +81,9 @@ class AdminUsersController:
 
         # Actions
         w.searchButton.clicked.connect(self.searchUsers)
+        w.searchInput.returnPressed.connect(self.searchUsers)
+        self.userSearch = LiveSearch(w.searchInput, self._fetchUsers, self._populateUsersTable,
+                                     fields=("username", "first_name", "last_name", "role"))
         w.addUserButton.clicked.connect(self.showAddUserPopup)
         w.editUserButton.clicked.connect(self.showEditUserPopup)
         w.usersTable.itemClicked.connect(self.onUserSelected)
@@ -90,9 +100,12 @@ class AdminUsersController:
 
     def searchUsers(self):
         """Search users by keyword and refresh table"""
-        query = self.usersWindow.searchInput.text().strip()
-        results = UserModel.searchUsers(query) if query else UserModel.getAllUsers()
-        self._populateUsersTable(results)
+        self.userSearch.refresh()
+
+    @staticmethod
+    def _fetchUsers(query):
+        """Runs on the live-search worker thread"""
+        return UserModel.searchUsers(query) if query else UserModel.getAllUsers()
 
     def showAddUserPopup(self):
         """Open the Add User popup"""
@@ -202,67 +215,38 @@ class AdminUsersController:
         """Refresh the users table with latest data"""
         self.allUsers = UserModel.getAllUsers()
         self._populateUsersTable(self.allUsers)
+        self.userSearch.invalidate()
+        ReferenceDataCache.invalidate("users")
 
     @staticmethod
     def _validateUserData(data, is_new=True):
         """Shared validation logic for Add/Edit user"""
-        if not data['username']:
-            return "Username is required."
-        if len(data['username']) < 3:
-            return "Username must be at least 3 characters long."
-        if not data['first_name'] or not data['last_name']:
-            return "First name and last name are required."
-        if not data['email']:
-            return "Email address is required."
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', data['email']):
-            return "Please enter a valid email address."
-        if not data['role']:
-            return "Please select a user role."
-        if data['contact'] and not re.match(r'^[\d\s\-]+$', data['contact']):
-            return "Contact number contains invalid characters."
-        if is_new:
-            if not data['password']:
-                return "Password is required for new users."
-            if len(data['password']) < 6:
-                return "Password must be at least 6 characters long."
-        else:
-            if data['password'] and len(data['password']) < 6:
-                return "New password must be at least 6 characters long."
-        if not is_new and not data.get('status'):
-            return "Please select user status (Active/Inactive)."
-
-        return None
+        return UserModel.validateUserData(data, is_new)
 
     def navigateToDashboard(self):
         self._closeCurrent()
         from Controller.Admin.AdminDashboardController import AdminDashboardController
-        AdminDashboardController().openDashboard()
+        WindowRegistry.open(AdminDashboardController, "openDashboard")
 
     def navigateToPatients(self):
         self._closeCurrent()
         from Controller.Admin.AdminPatientsController import AdminPatientsController
-        AdminPatientsController().openPatientsWindow()
+        WindowRegistry.open(AdminPatientsController, "openPatientsWindow")
 
     def navigateToReports(self):
         self._closeCurrent()
         from Controller.Admin.ReportsController import ReportsController
-        ReportsController().openReportsWindow()
+        WindowRegistry.open(ReportsController, "openReportsWindow")
 
     def navigateToNotifications(self):
         self._closeCurrent()
         from Controller.Admin.AdminNotificationsController import AdminNotificationsController
-        AdminNotificationsController().openNotificationsWindow()
+        WindowRegistry.open(AdminNotificationsController, "openNotificationsWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
+        self.loginController = WindowRegistry.showLogin()
 
     def _closeCurrent(self):
         """Safely close all open windows/popups"""
@@ -1,14 +1,19 @@
-from Model.Transactions.PatientModel import PatientsModel
 from Model.Transactions.ReportsModel import ReportsModel
+from Model.Cache.ReportCache import ReportCache
+from Model.Cache.ReferenceDataCache import ReferenceDataCache
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.AdminGUI.ReportsWindow import ReportsWindow, ReportSummaryWindow
 from View.GeneralPopups.Dialogs import Dialogs
 from PyQt6.QtWidgets import QFileDialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+from Utilities.LazyImport import lazyImport
 from datetime import datetime
 import os
 
+# matplotlib is only needed for PDF export; defer loading it until then
+plt = lazyImport("matplotlib.pyplot")
+backend_pdf = lazyImport("matplotlib.backends.backend_pdf")
+
 class ReportsController:
     """
     Controller for Admin Reports
@@ -18,14 +23,13 @@ class ReportsController:
         self.loginController = None
         self.reportsWindow = None
         self.summaryWindow = None
+        self.currentReportKey = None
         self._loadData()
 
     def _loadData(self):
         """Fetch current user and dropdown data"""
         self.user, self.userInfo, self.role = self._getCurrentUser()
-        self.patients = ReportsModel.getPatientsList()
-        self.doctors = PatientsModel.getDoctorsList()
-        self.nurses = PatientsModel.getNursesList()
+        self.patients, self.doctors, self.nurses = ReferenceDataCache.getLists("patients", "doctors", "nurses")
 
     @staticmethod
     def _getCurrentUser():
@@ -46,6 +50,18 @@ class ReportsController:
             print(f"Failed to open ReportsWindow: {e}")
             Dialogs.showErrorDialog("Window Error", f"Failed to open: {str(e)}")
 
+    def reopen(self):
+        """Shows the kept window again; dropdowns are refilled only if their lists changed"""
+        previous = (self.patients, self.doctors, self.nurses)
+        self._loadData()
+        if (self.patients, self.doctors, self.nurses) != previous:
+            w = self.reportsWindow
+            w.patientDropdown.clear()
+            w.doctorDropdown.clear()
+            w.nurseDropdown.clear()
+            w.populateDropdowns(self.patients, self.doctors, self.nurses)
+        self.reportsWindow.show()
+
     def _connectSignals(self):
         """Connect all UI interactions"""
         try:
@@ -84,13 +100,17 @@ class ReportsController:
                 Dialogs.showErrorDialog("Selection Required", "Please select a report type.")
                 return
 
-            from_date = self.reportsWindow.fromDateInput.date().toString('yyyy-MM-dd') if self.reportsWindow.fromDateInput.isEnabled() else None
-            to_date = self.reportsWindow.toDateInput.date().toString('yyyy-MM-dd') if self.reportsWindow.toDateInput.isEnabled() else None
-            patient_id = self.reportsWindow.patientDropdown.currentData() if self.reportsWindow.patientDropdown.isEnabled() else None
-            doctor_id = self.reportsWindow.doctorDropdown.currentData() if self.reportsWindow.doctorDropdown.isEnabled() else None
-            nurse_id = self.reportsWindow.nurseDropdown.currentData() if self.reportsWindow.nurseDropdown.isEnabled() else None
+            from_date, to_date, patient_id, doctor_id, nurse_id = self._getFilterValues()
 
-            data = self._fetchReportData(report_type, from_date, to_date, patient_id, doctor_id, nurse_id)
+            # Served from the report cache while the source tables are unchanged
+            key = ReportCache.makeKey(report_type, from_date, to_date, patient_id, doctor_id, nurse_id)
+            data = ReportCache.getReport(
+                key, lambda: self._fetchReportData(report_type, from_date, to_date, patient_id, doctor_id, nurse_id)
+            )
+            if data is None:
+                Dialogs.showErrorDialog("Report Error", "Failed to generate report. Please try again.")
+                return
+            self.currentReportKey = key
             self.reportsWindow.currentReportData = data
 
             index_map = {
@@ -111,6 +131,16 @@ class ReportsController:
             print(f"Failed to generate report: {e}")
             Dialogs.showErrorDialog("Report Error", f"Failed to generate report: {str(e)}")
 
+    def _getFilterValues(self):
+        """Returns (from_date, to_date, patient_id, doctor_id, nurse_id) for the enabled filters"""
+        w = self.reportsWindow
+        from_date = w.fromDateInput.date().toString('yyyy-MM-dd') if w.fromDateInput.isEnabled() else None
+        to_date = w.toDateInput.date().toString('yyyy-MM-dd') if w.toDateInput.isEnabled() else None
+        patient_id = w.patientDropdown.currentData() if w.patientDropdown.isEnabled() else None
+        doctor_id = w.doctorDropdown.currentData() if w.doctorDropdown.isEnabled() else None
+        nurse_id = w.nurseDropdown.currentData() if w.nurseDropdown.isEnabled() else None
+        return from_date, to_date, patient_id, doctor_id, nurse_id
+
     @staticmethod
     def _fetchReportData(report_type, from_date, to_date, patient_id, doctor_id, nurse_id):
         """Call correct model method"""
@@ -165,7 +195,7 @@ class ReportsController:
             if not data:
                 statistics = "No records found for the selected filters."
             else:
-                statistics = self._generateDetailedStatistics(report_type, data)
+                statistics = self._getStatistics(report_type, data)
 
             if self.summaryWindow is None:
                 self.summaryWindow = ReportSummaryWindow()
@@ -177,6 +207,19 @@ class ReportsController:
             print(f"Failed to view summary: {e}")
             Dialogs.showErrorDialog("Summary Error", f"Failed to view summary: {str(e)}")
 
+    def _getStatistics(self, report_type, data):
+        """Statistics for the current report, memoized on its report cache entry"""
+        key = self.currentReportKey
+        filters = key[1:] if key else self._getFilterValues()
+
+        def build():
+            return (self._generateDetailedStatistics(report_type, data)
+                    + self._generateRollupStatistics(report_type, *filters))
+
+        if not key or key[0] != report_type:
+            return build()
+        return ReportCache.getExtra(key, "statistics", build)
+
     @staticmethod
     def _generateDetailedStatistics(report_type: str, data: list) -> str:
         """Generate rich, human-readable statistics"""
@@ -234,6 +277,35 @@ class ReportsController:
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _generateRollupStatistics(report_type, from_date, to_date, patient_id, doctor_id, nurse_id) -> str:
+        """Per-staff totals for the date range, read from the daily rollup tables"""
+        lines = []
+
+        if report_type in ("Nurse Administration Log", "Missed Administrations"):
+            summary = ReportsModel.getAdministrationSummary(from_date, to_date, patient_id, nurse_id)
+            if summary:
+                lines.append("Totals per Nurse (Administered / Missed):")
+                for r in summary:
+                    lines.append(f" • {r['nurse']}: {int(r['administered'] or 0)} / {int(r['missed'] or 0)}")
+
+        elif report_type == "Medication Verification Records":
+            summary = ReportsModel.getVerificationSummary(from_date, to_date)
+            if summary:
+                lines.append("Decisions per Pharmacist (Approved / Modification / Rejected):")
+                for r in summary:
+                    lines.append(f" • {r['pharmacist']}: {int(r['approved'] or 0)} / "
+                                 f"{int(r['modification_requested'] or 0)} / {int(r['rejected'] or 0)}")
+
+        elif report_type == "Controlled Substances Activity":
+            summary = ReportsModel.getControlledDispensingSummary(from_date, to_date, doctor_id)
+            if summary:
+                lines.append("Dispensed per Medication (Dispenses / Quantity):")
+                for r in summary:
+                    lines.append(f" • {r['medication']}: {int(r['dispensed'] or 0)} / {int(r['quantity'] or 0)}")
+
+        return "\n\n" + "\n".join(lines) if lines else ""
+
     def saveAsPDF(self):
         """Export current report to PDF with header, logo, filters, and summary"""
         try:
@@ -259,7 +331,7 @@ class ReportsController:
             filters = self._getAppliedFilters()
 
             # Get statistics
-            statistics = self._generateDetailedStatistics(report_type, data)
+            statistics = self._getStatistics(report_type, data)
 
             # Generate PDF
             self._generatePDFReport(filename, report_type, data, filters, statistics)
@@ -320,7 +392,7 @@ class ReportsController:
         summary_height = 1.5
         total_height = header_height + logo_title_height + table_height + summary_height + 0.5
 
-        with PdfPages(filename) as pdf:
+        with backend_pdf.PdfPages(filename) as pdf:
             fig = plt.figure(figsize=(11, total_height))
 
             content_top = 0.95
@@ -398,7 +470,7 @@ class ReportsController:
             if self.reportsWindow:
                 self.reportsWindow.close()
             from Controller.Admin.AdminDashboardController import AdminDashboardController
-            AdminDashboardController().openDashboard()
+            WindowRegistry.open(AdminDashboardController, "openDashboard")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -408,7 +480,7 @@ class ReportsController:
             if self.reportsWindow:
                 self.reportsWindow.close()
             from Controller.Admin.AdminUsersController import AdminUsersController
-            AdminUsersController().openUsersWindow()
+            WindowRegistry.open(AdminUsersController, "openUsersWindow")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -418,7 +490,7 @@ class ReportsController:
             if self.reportsWindow:
                 self.reportsWindow.close()
             from Controller.Admin.AdminPatientsController import AdminPatientsController
-            AdminPatientsController().openPatientsWindow()
+            WindowRegistry.open(AdminPatientsController, "openPatientsWindow")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -428,7 +500,7 @@ class ReportsController:
             if self.reportsWindow:
                 self.reportsWindow.close()
             from Controller.Admin.AdminNotificationsController import AdminNotificationsController
-            AdminNotificationsController().openNotificationsWindow()
+            WindowRegistry.open(AdminNotificationsController, "openNotificationsWindow")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -440,12 +512,6 @@ class ReportsController:
                 self.reportsWindow.close()
             if self.summaryWindow:
                 self.summaryWindow.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI import Login
-            loginModel = LoginModel()
-            loginView = Login()
-            self.loginController = LoginController(loginModel, loginView)
-            loginView.show()
+            self.loginController = WindowRegistry.showLogin()
         except Exception as e:
             print(f"Failed to logout: {e}")
\ No newline at end of file
@@ -1,6 +1,8 @@
 from Model.KPIs.DoctorKPIs import DoctorKPIs
 from Model.Tables.DoctorTables import DoctorTables
 from Model.SessionManager import SessionManager
+from Model.Cache.DashboardSections import DashboardSections
+from Utilities.WindowRegistry import WindowRegistry
 from View.DoctorGUI.DoctorDashboardWindow import DoctorDashboardWindow
 
 class DoctorDashboardController:
@@ -9,6 +11,13 @@ class DoctorDashboardController:
     Orchestrates data fetching, formatting, and navigation.
     """
 
+    # Section name -> KPI card label
+    KPI_LABELS = {
+        'activePatients': "Active Patients",
+        'activePrescriptions': "Active Prescriptions",
+        'urgentCases': "Urgent",
+    }
+
     def __init__(self):
         self.loginController = None
         self.doctorDashboard = None
@@ -16,15 +25,23 @@ class DoctorDashboardController:
 
     def _loadData(self):
         """Fetch and prepare all required data"""
-        self.kpis = {
-            'activePatients': self._safeKPI(DoctorKPIs.activePatientsCount),
-            'activePrescriptions': self._safeKPI(DoctorKPIs.activePrescriptionsCount),
-            'urgentCases': self._safeKPI(DoctorKPIs.urgentCasesCount)
-        }
+        # One section per KPI card and table, with the tables it is read from
+        # (None: read from notifications, so always re-queried)
+        self.sections = DashboardSections({
+            'activePatients': (lambda: self._safeKPI(DoctorKPIs.activePatientsCount), ("patients",)),
+            'activePrescriptions': (lambda: self._safeKPI(DoctorKPIs.activePrescriptionsCount), ("prescriptions",)),
+            'urgentCases': (lambda: self._safeKPI(DoctorKPIs.urgentCasesCount), None),
+            'patientHistory': (lambda: self._safeTable(DoctorTables.getPatientHistory),
+                               ("patients", "prescriptions", "medicines")),
+            'pendingPrescriptions': (lambda: self._safeTable(DoctorTables.getPendingPrescriptions),
+                                     ("patients", "prescriptions", "medicines"))
+        })
+        results = self.sections.load()
+        self.kpis = {name: results[name] for name in self.KPI_LABELS}
 
         self.user, self.userInfo, self.role = self._getCurrentUser()
-        self.patientHistory = self._safeTable(DoctorTables.getPatientHistory)
-        self.pendingPrescriptions = self._safeTable(DoctorTables.getPendingPrescriptions)
+        self.patientHistory = results['patientHistory']
+        self.pendingPrescriptions = results['pendingPrescriptions']
 
     @staticmethod
     def _safeKPI(func):
@@ -56,6 +73,20 @@ class DoctorDashboardController:
         self._connectNavigation()
         self.doctorDashboard.show()
 
+    def reopen(self):
+        """Show the kept dashboard again, updating only the cards and tables whose data changed"""
+        for name, value in self.sections.refresh().items():
+            if name in self.KPI_LABELS:
+                self.kpis[name] = value
+                self.doctorDashboard.setKPIValue(self.KPI_LABELS[name], value)
+            elif name == 'patientHistory':
+                self.patientHistory = value
+                self.doctorDashboard.setPatientHistoryData(value)
+            elif name == 'pendingPrescriptions':
+                self.pendingPrescriptions = value
+                self.doctorDashboard.setPendingPrescriptionsData(value)
+        self.doctorDashboard.show()
+
     def _connectNavigation(self):
         dashboard = self.doctorDashboard
         dashboard.prescriptionOption.mousePressEvent = lambda e: self.navigateToPrescription()
@@ -65,23 +96,17 @@ class DoctorDashboardController:
     def navigateToPrescription(self):
         self._closeCurrent()
         from Controller.Doctor.PrescriptionController import PrescriptionController
-        PrescriptionController().openPrescriptionWindow()
+        WindowRegistry.open(PrescriptionController, "openPrescriptionWindow")
 
     def navigateToNotifications(self):
         self._closeCurrent()
         from Controller.Doctor.DoctorNotificationsController import DoctorNotificationsController
-        DoctorNotificationsController().openNotificationsWindow()
+        WindowRegistry.open(DoctorNotificationsController, "openNotificationsWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
+        self.loginController = WindowRegistry.showLogin()
 
     def _closeCurrent(self):
         if self.doctorDashboard:
@@ -1,5 +1,6 @@
 from Model.Notifications.NotificationsModel import NotificationsModel
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.DoctorGUI.DoctorNotificationsWindow import DoctorNotificationsWindow
 
 class DoctorNotificationsController:
@@ -19,6 +20,11 @@ class DoctorNotificationsController:
         self._connectSignals()
         self.notificationsWindow.show()
 
+    def reopen(self):
+        """Show the kept window again, re-running the current search/filter"""
+        self.searchNotifications()
+        self.notificationsWindow.show()
+
     def _connectSignals(self):
         w = self.notificationsWindow
 
@@ -74,20 +80,14 @@ class DoctorNotificationsController:
     def navigateToDashboard(self):
         self._closeCurrent()
         from Controller.Doctor.DoctorDashboardController import DoctorDashboardController
-        DoctorDashboardController().openDashboard()
+        WindowRegistry.open(DoctorDashboardController, "openDashboard")
 
     def navigateToPrescription(self):
         self._closeCurrent()
         from Controller.Doctor.PrescriptionController import PrescriptionController
-        PrescriptionController().openPrescriptionWindow()
+        WindowRegistry.open(PrescriptionController, "openPrescriptionWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
\ No newline at end of file
+        self.loginController = WindowRegistry.showLogin()
\ No newline at end of file
@@ -2,9 +2,13 @@ from PyQt6.QtWidgets import QTableWidgetItem
 from PyQt6.QtCore import QDate
 from Model.Transactions.PrescriptionModel import PrescriptionModel
 from Model.Tables.DoctorTables import DoctorTables
+from Model.Cache.FormularyIndex import FormularyIndex
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.DoctorGUI.PrescriptionWindow import PrescriptionWindow, PrescriptionSummaryPopup
 from View.GeneralPopups.Dialogs import Dialogs
+from Utilities.LiveSearch import LiveSearch
+from Utilities.UnitOfWork import UnitOfWork
 
 class PrescriptionController:
     """
@@ -45,6 +49,15 @@ class PrescriptionController:
             print(f"Failed to open PrescriptionWindow: {e}")
             Dialogs.showErrorDialog("Window Error", f"Failed to open: {str(e)}")
 
+    def reopen(self):
+        """Shows the kept window again, refreshing only the tables already searched"""
+        w = self.prescriptionWindow
+        if w.newPatientTable.rowCount():
+            self.searchPatients()
+        if w.editPrescriptionTable.rowCount():
+            self.searchPrescriptions()
+        w.show()
+
     def _connectSignals(self):
         """Connects all UI signals"""
         try:
@@ -73,6 +86,22 @@ class PrescriptionController:
             # Confirm button
             w.editConfirmButton.clicked.connect(self.updatePrescription)
 
+            # === TYPE-AHEAD ===
+            self.patientSearch = LiveSearch(
+                w.newPatientSearch, self._fetchPatients, self._populatePatientTable,
+                onError=lambda msg: Dialogs.showErrorDialog("Search Error", f"Failed to search patients: {msg}")
+            )
+            self.medicationSearch = LiveSearch(
+                w.newMedicationSearch, self._fetchMedications, self._populateMedicationTable,
+                onError=lambda msg: Dialogs.showErrorDialog("Search Error", f"Failed to search medications: {msg}"),
+                threaded=False  # in-memory formulary index
+            )
+            self.prescriptionSearch = LiveSearch(
+                w.editPrescriptionSearch, self._fetchPrescriptions, self._populatePrescriptionTable,
+                fields=("patient_first_name", "patient_last_name", "prescription_id"),
+                onError=lambda msg: Dialogs.showErrorDialog("Search Error", f"Failed to search prescriptions: {msg}")
+            )
+
             # === NAVIGATION ===
             w.dashboardOption.mousePressEvent = lambda er: self.navigateToDashboard()
             w.notificationsOption.mousePressEvent = lambda er: self.navigateToNotifications()
@@ -85,22 +114,16 @@ class PrescriptionController:
 
     def searchPatients(self):
         """Searches for patients"""
-        try:
-            query = self.prescriptionWindow.newPatientSearch.text().strip()
-
-            if query:
-                patients = DoctorTables.searchPatientsByDoctor(query) or []
-            else:
-                patients = DoctorTables.getPatientsByDoctor() or []
+        self.patientSearch.refresh()
 
-            if not isinstance(patients, list):
-                patients = []
-
-            self._populatePatientTable(patients)
-            print(f"✓ Patient search: {len(patients)} results")
-        except Exception as e:
-            print(f"Patient search failed: {e}")
-            Dialogs.showErrorDialog("Search Error", f"Failed to search patients: {str(e)}")
+    @staticmethod
+    def _fetchPatients(query):
+        """Runs on the live-search worker thread"""
+        if query:
+            patients = DoctorTables.searchPatientsByDoctor(query) or []
+        else:
+            patients = DoctorTables.getPatientsByDoctor() or []
+        return patients if isinstance(patients, list) else []
 
     def _populatePatientTable(self, patients):
         """Populates the patient table"""
@@ -152,22 +175,16 @@ class PrescriptionController:
 
     def searchMedications(self):
         """Searches for medications"""
-        try:
-            query = self.prescriptionWindow.newMedicationSearch.text().strip()
-
-            if query:
-                medications = DoctorTables.searchMedicines(query) or []
-            else:
-                medications = DoctorTables.getAllMedicines() or []
-
-            if not isinstance(medications, list):
-                medications = []
+        self.medicationSearch.searchNow()
 
-            self._populateMedicationTable(medications)
-            print(f"✓ Medication search: {len(medications)} results")
-        except Exception as e:
-            print(f"Medication search failed: {e}")
-            Dialogs.showErrorDialog("Search Error", f"Failed to search medications: {str(e)}")
+    @staticmethod
+    def _fetchMedications(query):
+        """In-memory formulary lookup (prefix, substring, then typo-tolerant matches)"""
+        if query:
+            medications = FormularyIndex.search(query) or []
+        else:
+            medications = FormularyIndex.getAll() or []
+        return medications if isinstance(medications, list) else []
 
     def _populateMedicationTable(self, medications):
         """Populates the medication table"""
@@ -255,20 +272,24 @@ class PrescriptionController:
     def _createPrescriptionFromData(self, data):
         """Creates a new prescription in the database"""
         try:
-            prescription_id = PrescriptionModel.createPrescription(
-                patient_id=self.selectedPatientId,
-                medicine_id=self.selectedMedicineId,
-                dosage=f"{data['amount']} {data['unit']}",
-                duration_start=data['start_date'],
-                duration_end=data['end_date'],
-                frequency=data['frequency'],
-                special_instructions=data['instructions'] if data['instructions'].strip() else None
-            )
+            # Prescription and its notifications are committed together or not at all
+            with UnitOfWork() as unit:
+                prescription_id = PrescriptionModel.createPrescription(
+                    patient_id=self.selectedPatientId,
+                    medicine_id=self.selectedMedicineId,
+                    dosage=f"{data['amount']} {data['unit']}",
+                    duration_start=data['start_date'],
+                    duration_end=data['end_date'],
+                    frequency=data['frequency'],
+                    special_instructions=data['instructions'] if data['instructions'].strip() else None
+                )
 
-            if prescription_id:
-                # Create notifications for pharmacists and assigned nurse
-                self._createNotificationsForPrescription(prescription_id)
+                if prescription_id:
+                    # Create notifications for pharmacists and assigned nurse
+                    if not self._createNotificationsForPrescription(prescription_id):
+                        unit.rollback()
 
+            if prescription_id and unit.committed:
                 print(f"✓ Prescription created successfully! ID: {prescription_id}")
                 Dialogs.showSuccessDialog("Success", "Prescription created successfully!")
 
@@ -284,14 +305,14 @@ class PrescriptionController:
             Dialogs.showErrorDialog("Creation Error", f"Failed to create prescription: {str(e)}")
 
     def _createNotificationsForPrescription(self, prescription_id):
-        """Creates notifications for pharmacists and assigned nurse"""
+        """Creates notifications for pharmacists and assigned nurse. Returns False if one could not be created"""
         try:
             # Get prescription details for notification message
             prescription_details = PrescriptionModel.getPrescriptionNotificationDetails(prescription_id)
 
             if not prescription_details:
                 print("Warning: Could not fetch prescription details for notification")
-                return
+                return False
 
             patient_name = f"{prescription_details.get('patient_first_name', '')} {prescription_details.get('patient_last_name', '')}"
             medication = f"{prescription_details.get('brand_name', '')} ({prescription_details.get('generic_name', '')})"
@@ -301,7 +322,7 @@ class PrescriptionController:
             pharmacist_ids = PrescriptionModel.getAllPharmacistIds()
 
             for pharmacist_id in pharmacist_ids:
-                PrescriptionModel.createNotification(
+                created = PrescriptionModel.createNotification(
                     user_id=pharmacist_id,
                     related_table='prescriptions',
                     related_id=prescription_id,
@@ -309,12 +330,14 @@ class PrescriptionController:
                     message=f'New prescription for {patient_name} - {medication} requires verification by {self.userInfo}',
                     notification_type='Attention'
                 )
+                if not created:
+                    return False
 
             print(f"✓ Notifications sent to {len(pharmacist_ids)} pharmacist(s)")
 
             # Notification for Assigned Nurse (if patient has assigned nurse)
             if nurse_id:
-                PrescriptionModel.createNotification(
+                created = PrescriptionModel.createNotification(
                     user_id=nurse_id,
                     related_table='prescriptions',
                     related_id=prescription_id,
@@ -322,37 +345,35 @@ class PrescriptionController:
                     message=f'New prescription created for your patient {patient_name} - {medication} by Dr. {self.userInfo}',
                     notification_type='Info'
                 )
+                if not created:
+                    return False
                 print(f"✓ Notification sent to assigned nurse (ID: {nurse_id})")
             else:
                 print("Note: No nurse assigned to this patient")
+            return True
 
         except Exception as e:
             print(f"Failed to create notifications: {e}")
+            return False
 
     # === PRESCRIPTION SEARCH (FOR EDITING) ===
 
     def searchPrescriptions(self):
         """Searches for prescriptions"""
-        try:
-            query = self.prescriptionWindow.editPrescriptionSearch.text().strip()
-
-            if not self.doctorId:
-                Dialogs.showErrorDialog("Error", "Doctor ID not found.")
-                return
-
-            if query:
-                prescriptions = DoctorTables.searchPrescriptionsByDoctor(self.doctorId, query) or []
-            else:
-                prescriptions = DoctorTables.getAllPrescriptionsByDoctor(self.doctorId) or []
-
-            if not isinstance(prescriptions, list):
-                prescriptions = []
-
-            self._populatePrescriptionTable(prescriptions)
-            print(f"✓ Prescription search: {len(prescriptions)} results")
-        except Exception as e:
-            print(f"Prescription search failed: {e}")
-            Dialogs.showErrorDialog("Search Error", f"Failed to search prescriptions: {str(e)}")
+        if not self.doctorId:
+            Dialogs.showErrorDialog("Error", "Doctor ID not found.")
+            return
+        self.prescriptionSearch.refresh()
+
+    def _fetchPrescriptions(self, query):
+        """Runs on the live-search worker thread"""
+        if not self.doctorId:
+            return []
+        if query:
+            prescriptions = DoctorTables.searchPrescriptionsByDoctor(self.doctorId, query) or []
+        else:
+            prescriptions = DoctorTables.getAllPrescriptionsByDoctor(self.doctorId) or []
+        return prescriptions if isinstance(prescriptions, list) else []
 
     def _populatePrescriptionTable(self, prescriptions):
         """Populates the prescription table"""
@@ -536,7 +557,7 @@ class PrescriptionController:
             if self.prescriptionWindow:
                 self.prescriptionWindow.close()
             from Controller.Doctor.DoctorDashboardController import DoctorDashboardController
-            DoctorDashboardController().openDashboard()
+            WindowRegistry.open(DoctorDashboardController, "openDashboard")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -546,7 +567,7 @@ class PrescriptionController:
             if self.prescriptionWindow:
                 self.prescriptionWindow.close()
             from Controller.Doctor.DoctorNotificationsController import DoctorNotificationsController
-            DoctorNotificationsController().openNotificationsWindow()
+            WindowRegistry.open(DoctorNotificationsController, "openNotificationsWindow")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -556,12 +577,6 @@ class PrescriptionController:
             SessionManager.clear()
             if self.prescriptionWindow:
                 self.prescriptionWindow.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI import Login
-            loginModel = LoginModel()
-            loginView = Login()
-            self.loginController = LoginController(loginModel, loginView)
-            loginView.show()
+            self.loginController = WindowRegistry.showLogin()
         except Exception as e:
             print(f"Failed to navigate: {e}")
\ No newline at end of file
@@ -1,11 +1,17 @@
-from Controller.Pharmacist.PharmacistDashboardController import PharmacistDashboardController
-from Controller.Doctor.DoctorDashboardController import DoctorDashboardController
-from Controller.Nurse.NurseDashboardController import NurseDashboardController
-from Controller.Admin.AdminDashboardController import AdminDashboardController
 from Model.Authentication.LoginModel import LoginModel
 from View.LoginGUI import Login, LoginErrorPopup, LoginSuccessPopup
 from Model.SessionManager import SessionManager
 from Model.Tasks.PrescriptionCompletionTask import complete_expired_prescriptions
+from Utilities.LazyImport import importAttribute
+from Utilities.WindowRegistry import WindowRegistry
+
+# Role dashboards are imported on demand so the login screen only loads the one that is used
+ROLE_DASHBOARD_CONTROLLERS = {
+    "Doctor": ("Controller.Doctor.DoctorDashboardController", "DoctorDashboardController"),
+    "Nurse": ("Controller.Nurse.NurseDashboardController", "NurseDashboardController"),
+    "Pharmacist": ("Controller.Pharmacist.PharmacistDashboardController", "PharmacistDashboardController"),
+    "Admin": ("Controller.Admin.AdminDashboardController", "AdminDashboardController"),
+}
 
 class LoginController:
     """
@@ -83,18 +89,20 @@ class LoginController:
     # REDIRECTION METHODS: Directs to the GUI for each role
     # ======================================================
 
+    @staticmethod
+    def _openDashboard(role):
+        """Imports the dashboard controller for the given role and opens it through the session's WindowRegistry"""
+        moduleName, className = ROLE_DASHBOARD_CONTROLLERS[role]
+        return WindowRegistry.open(importAttribute(moduleName, className), "openDashboard")
+
     def openDoctorDashboard(self):
-        self.doctorDashboardController = DoctorDashboardController()
-        self.doctorDashboardController.openDashboard()
+        self.doctorDashboardController = self._openDashboard("Doctor")
 
     def openNurseDashboard(self):
-        self.nurseDashboardController = NurseDashboardController()
-        self.nurseDashboardController.openDashboard()
+        self.nurseDashboardController = self._openDashboard("Nurse")
 
     def openPharmacistDashboard(self):
-        self.pharmacistDashboardController = PharmacistDashboardController()
-        self.pharmacistDashboardController.openDashboard()
+        self.pharmacistDashboardController = self._openDashboard("Pharmacist")
 
     def openAdminDashboard(self):
-        self.adminDashboardController = AdminDashboardController()
-        self.adminDashboardController.openDashboard()
\ No newline at end of file
+        self.adminDashboardController = self._openDashboard("Admin")
\ No newline at end of file
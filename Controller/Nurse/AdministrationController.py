@@ -2,8 +2,11 @@ from PyQt6.QtWidgets import QTableWidgetItem
 from Model.Transactions.AdministrationModel import AdministrationModel
 from Model.Tables.NurseTables import NurseTables
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.NurseGUI.AdministrationWindow import AdministrationWindow, RecordConfirmationPopup
 from View.GeneralPopups.Dialogs import Dialogs
+from Utilities.LiveSearch import LiveSearch
+from Utilities.UnitOfWork import UnitOfWork
 
 class AdministrationController:
     """
@@ -20,6 +23,7 @@ class AdministrationController:
         self.selectedPrescriptionId = None
         self.selectedPrescriptionData = None
         self.availablePrescriptions = []
+        self.roundDoses = []
 
         # Window Reference
         self.administerWindow = None
@@ -48,6 +52,11 @@ class AdministrationController:
             print(f"Failed to open AdministrationWindow: {e}")
             Dialogs.showErrorDialog("Window Error", f"Failed to open: {str(e)}")
 
+    def reopen(self):
+        """Shows the kept window again with a refreshed patient list"""
+        self.searchPatients()
+        self.administerWindow.show()
+
     def _connectSignals(self):
         """Connects all UI signals"""
         try:
@@ -55,10 +64,15 @@ class AdministrationController:
             self.administerWindow.patientSearchButton.clicked.connect(self.searchPatients)
             self.administerWindow.patientSearch.returnPressed.connect(self.searchPatients)
             self.administerWindow.patientsTable.itemSelectionChanged.connect(self.onPatientSelected)
+            self.patientSearch = LiveSearch(
+                self.administerWindow.patientSearch, self._fetchPatients, self._populatePatientTable,
+                onError=lambda msg: Dialogs.showErrorDialog("Search Error", f"Failed to search: {msg}")
+            )
             self.administerWindow.nextButton.clicked.connect(self.proceedToRecording)
 
             # Recording View
             self.administerWindow.recordButton.clicked.connect(self.recordAdministration)
+            self.administerWindow.roundRecordButton.clicked.connect(self.recordAdministration)
 
             # "Other" input toggle
             self.administerWindow.otherRadio.toggled.connect(self._toggleOtherInput)
@@ -87,6 +101,7 @@ class AdministrationController:
                 patients = []
 
             self._populatePatientTable(patients)
+            self.patientSearch.invalidate()
             print(f"✓ Loaded {len(patients)} assigned patients")
 
         except Exception as e:
@@ -95,23 +110,16 @@ class AdministrationController:
 
     def searchPatients(self):
         """Searches assigned patients"""
-        try:
-            query = self.administerWindow.patientSearch.text().strip()
-
-            if query:
-                patients = NurseTables.searchAssignedPatients(query) or []
-            else:
-                patients = NurseTables.getAssignedPatients() or []
-
-            if not isinstance(patients, list):
-                patients = []
-
-            self._populatePatientTable(patients)
-            print(f"✓ Search: {len(patients)} results")
-
-        except Exception as e:
-            print(f"Failed to search: {e}")
-            Dialogs.showErrorDialog("Search Error", f"Failed to search: {str(e)}")
+        self.patientSearch.refresh()
+
+    @staticmethod
+    def _fetchPatients(query):
+        """Runs on the live-search worker thread"""
+        if query:
+            patients = NurseTables.searchAssignedPatients(query) or []
+        else:
+            patients = NurseTables.getAssignedPatients() or []
+        return patients if isinstance(patients, list) else []
 
     def _populatePatientTable(self, patients):
         """Populates patient table with data"""
@@ -181,6 +189,11 @@ class AdministrationController:
     def proceedToRecording(self):
         """Validates and loads prescription for recording"""
         try:
+            self.roundDoses = []
+            if len(self.administerWindow.getSelectedRows()) > 1:
+                self._proceedToWardRound()
+                return
+
             if not self.selectedPatientId or not self.selectedPatientData:
                 Dialogs.showErrorDialog("Validation Error", "Please select a patient.")
                 return
@@ -209,11 +222,40 @@ class AdministrationController:
             print(f"Failed to proceed: {e}")
             Dialogs.showErrorDialog("Error", f"Failed to load prescription: {str(e)}")
 
+    def _proceedToWardRound(self):
+        """Resolves every selected row to its due dose with one query and shows the round summary"""
+        table = self.administerWindow.patientsTable
+
+        # Latest prescription per (patient, generic, brand), as in the single-patient flow
+        due = {}
+        for dose in NurseTables.getDueDoses() or []:
+            due.setdefault((str(dose['patient_id']), dose['generic_name'], dose['brand_name']), dose)
+
+        self.roundDoses, seen = [], set()
+        for row in self.administerWindow.getSelectedRows():
+            key = (table.item(row, 0).text(), table.item(row, 3).text(), table.item(row, 4).text())
+            dose = due.get(key)
+            if dose and dose['prescription_id'] not in seen:
+                seen.add(dose['prescription_id'])
+                self.roundDoses.append(dose)
+
+        if not self.roundDoses:
+            Dialogs.showErrorDialog("No Prescriptions", "None of the selected patients have doses due.")
+            return
+
+        self.administerWindow.loadRoundDoses(self.roundDoses)
+        self.administerWindow.stackedWidget.setCurrentIndex(2)
+        print(f"✓ Loaded ward round with {len(self.roundDoses)} doses")
+
     # === RECORD ADMINISTRATION ===
 
     def recordAdministration(self):
         """Records medication administration"""
         try:
+            if self.roundDoses:
+                self._recordWardRound()
+                return
+
             if not self.selectedPrescriptionId:
                 Dialogs.showErrorDialog("Error", "No prescription selected.")
                 return
@@ -232,21 +274,22 @@ class AdministrationController:
                 self.selectedPrescriptionId, frequency
             )
 
-            # Record in database
-            success = AdministrationModel.recordMedicationAdministration(
-                prescription_id=self.selectedPrescriptionId,
-                administration_time=data['administration_time'],
-                patient_assessment=data['patient_assessment'],
-                adverse_reactions=data['adverse_reactions'],
-                remarks=None,
-                status=status
-            )
-
-            if success:
-                # Create notification
-                self._createNotificationRecord(status)
-
-                # Write audit log
+            # Record in database, together with the doctor's notification
+            with UnitOfWork() as unit:
+                success = AdministrationModel.recordMedicationAdministration(
+                    prescription_id=self.selectedPrescriptionId,
+                    administration_time=data['administration_time'],
+                    patient_assessment=data['patient_assessment'],
+                    adverse_reactions=data['adverse_reactions'],
+                    remarks=None,
+                    status=status
+                )
+
+                if success and not self._createNotificationRecord(status):
+                    unit.rollback()
+
+            if success and unit.committed:
+                # Write audit log once the administration is committed
                 self._writeAuditLog(data, status)
 
                 print(f"✓ Medication administration recorded!")
@@ -258,13 +301,54 @@ class AdministrationController:
             print(f"Failed to record: {e}")
             Dialogs.showErrorDialog("Recording Error", f"Failed: {str(e)}")
 
+    def _recordWardRound(self):
+        """Records all doses of the ward round in one batched transaction"""
+        data = self.administerWindow.getRoundAdministrationData()
+
+        if not all(row['patient_assessment'] for row in data['doses']):
+            Dialogs.showErrorDialog("Validation Error", "Please select an assessment for every patient in the round.")
+            return
+
+        # Rows follow self.roundDoses; each dose keeps its own assessment and reactions
+        doses = [dict(dose, **row) for dose, row in zip(self.roundDoses, data['doses'])]
+
+        result = AdministrationModel.recordWardRound(
+            doses=doses,
+            administration_time=data['administration_time'],
+            nurse_name=self.userInfo
+        )
+
+        if result is None:
+            Dialogs.showErrorDialog("Recording Error", "Failed to record the ward round. No doses were saved.")
+            return
+
+        recorded, skipped = result
+        missed = sum(1 for _, status in recorded if status == 'Missed')
+        print(f"✓ Ward round recorded: {len(recorded)} doses ({missed} late), {len(skipped)} skipped")
+        self.roundDoses = []
+
+        if not recorded:
+            Dialogs.showErrorDialog("Nothing Recorded",
+                                    "None of the selected doses are due any more (already administered or reset).")
+            self.administerWindow.resetToPatientSelection()
+            self.loadAssignedPatients()
+            return
+
+        if skipped:
+            Dialogs.showErrorDialog(
+                "Doses Skipped",
+                f"{len(skipped)} doses were no longer due (already administered or reset) and were not recorded: "
+                + ", ".join(f"#{pid}" for pid in skipped)
+            )
+        self._showRecordConfirmation()
+
     def _createNotificationRecord(self, status):
-        """Creates notification for the administration"""
+        """Creates notification for the administration. Returns False if it could not be created"""
         try:
             # Get doctor ID from prescription
             doctor_id = self.selectedPrescriptionData.get('doctor_id')
             if not doctor_id:
-                return
+                return True
 
             patient_name = f"{self.selectedPatientData.get('patient_first_name', '')} {self.selectedPatientData.get('patient_last_name', '')}"
             medication = self.selectedPrescriptionData.get('generic_name', '')
@@ -273,19 +357,22 @@ class AdministrationController:
             message = f"{patient_name} - {medication} administered by {self.userInfo}"
             notification_type = 'Info' if status == 'Administered' else 'Attention'
 
-            AdministrationModel.createNotification(
+            if not AdministrationModel.createNotification(
                 user_id=doctor_id,
                 related_table='medication_administration',
                 related_id=self.selectedPrescriptionId,
                 title=title,
                 message=message,
                 notification_type=notification_type
-            )
+            ):
+                return False
 
             print(f"✓ Notification created")
+            return True
 
         except Exception as e:
             print(f"Failed to create notification: {e}")
+            return False
 
     def _writeAuditLog(self, data, status):
         """Writes audit log for the administration"""
@@ -339,7 +426,7 @@ class AdministrationController:
                 self.administerWindow.close()
 
             from Controller.Nurse.NurseDashboardController import NurseDashboardController
-            NurseDashboardController().openDashboard()
+            WindowRegistry.open(NurseDashboardController, "openDashboard")
 
         except Exception as e:
             print(f"Failed to navigate: {e}")
@@ -351,7 +438,7 @@ class AdministrationController:
                 self.administerWindow.close()
 
             from Controller.Nurse.NurseNotificationsController import NurseNotificationsController
-            NurseNotificationsController().openNotificationsWindow()
+            WindowRegistry.open(NurseNotificationsController, "openNotificationsWindow")
 
         except Exception as e:
             print(f"Failed to navigate: {e}")
@@ -364,14 +451,7 @@ class AdministrationController:
             if self.administerWindow:
                 self.administerWindow.close()
 
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI import Login
-
-            loginModel = LoginModel()
-            loginView = Login()
-            self.loginController = LoginController(loginModel, loginView)
-            loginView.show()
+            self.loginController = WindowRegistry.showLogin()
 
         except Exception as e:
             print(f"Failed to logout: {e}")
\ No newline at end of file
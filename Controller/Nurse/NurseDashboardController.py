@@ -1,6 +1,8 @@
 from Model.KPIs.NurseKPIs import NurseKPIs
 from Model.Tables.NurseTables import NurseTables
 from Model.SessionManager import SessionManager
+from Model.Cache.DashboardSections import DashboardSections
+from Utilities.WindowRegistry import WindowRegistry
 from View.NurseGUI.NurseDashboardWindow import NurseDashboardWindow
 
 class NurseDashboardController:
@@ -8,22 +10,36 @@ class NurseDashboardController:
     Controller for Nurse Dashboard
     """
 
+    # Section name -> KPI card label
+    KPI_LABELS = {
+        'assignedPatients': "Assigned Patients",
+        'dueMedications': "Due Medications",
+        'urgentMedications': "Urgent",
+    }
+
     def __init__(self):
         self.loginController = None
-        self.kpis = {
-            'assignedPatients': self._safeKPI(NurseKPIs.assignedPatientsCount),
-            'dueMedications': self._safeKPI(NurseKPIs.dueMedicationsCount),
-            'urgentMedications': self._safeKPI(NurseKPIs.urgentMedicationsCount)
-        }
+        self.nurseDashboard = None
+        self._loadData()
 
-        self.user, self.userInfo, self.role = self._getCurrentUser()
+    def _loadData(self):
+        """Fetch and prepare all required data"""
+        # One section per KPI card and table, with the tables it is read from
+        # (None: depends on today's date or on the daily rollup, so always re-queried)
+        self.sections = DashboardSections({
+            'assignedPatients': (lambda: self._safeKPI(NurseKPIs.assignedPatientsCount), ("patients",)),
+            'dueMedications': (lambda: self._safeKPI(NurseKPIs.dueMedicationsCount), None),
+            'urgentMedications': (lambda: self._safeKPI(NurseKPIs.urgentMedicationsCount), None),
+            'completedMedications': (lambda: self._safeTable(NurseTables.getCompletedMedicationsToday), None),
+            'preparationStatus': (lambda: self._safeTable(NurseTables.getMedicationPreparationStatus), None)
+        })
+        results = self.sections.load()
+        self.kpis = {name: results[name] for name in self.KPI_LABELS}
 
-        self.completedMedications = self._formatCompletedData(
-            self._safeTable(NurseTables.getCompletedMedicationsToday)
-        )
-        self.preparationStatus = self._safeTable(NurseTables.getMedicationPreparationStatus)
+        self.user, self.userInfo, self.role = self._getCurrentUser()
 
-        self.nurseDashboard = None
+        self.completedMedications = self._formatCompletedData(results['completedMedications'])
+        self.preparationStatus = results['preparationStatus']
 
     def openDashboard(self):
         """Launch the dashboard and connect navigation"""
@@ -39,6 +55,20 @@ class NurseDashboardController:
         self._connectNavigation()
         self.nurseDashboard.show()
 
+    def reopen(self):
+        """Show the kept dashboard again, updating only the cards and tables whose data changed"""
+        for name, value in self.sections.refresh().items():
+            if name in self.KPI_LABELS:
+                self.kpis[name] = value
+                self.nurseDashboard.setKPIValue(self.KPI_LABELS[name], value)
+            elif name == 'completedMedications':
+                self.completedMedications = self._formatCompletedData(value)
+                self.nurseDashboard.setCompletedMedicationsData(self.completedMedications)
+            elif name == 'preparationStatus':
+                self.preparationStatus = value
+                self.nurseDashboard.setPreparationStatusData(value)
+        self.nurseDashboard.show()
+
     def _connectNavigation(self):
         dashboard = self.nurseDashboard
         dashboard.administerOption.mousePressEvent = lambda e: self.navigateToAdminister()
@@ -82,23 +112,17 @@ class NurseDashboardController:
     def navigateToAdminister(self):
         self._closeCurrent()
         from Controller.Nurse.AdministrationController import AdministrationController
-        AdministrationController().openAdministrationWindow()
+        WindowRegistry.open(AdministrationController, "openAdministrationWindow")
 
     def navigateToNotifications(self):
         self._closeCurrent()
         from Controller.Nurse.NurseNotificationsController import NurseNotificationsController
-        NurseNotificationsController().openNotificationsWindow()
+        WindowRegistry.open(NurseNotificationsController, "openNotificationsWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
+        self.loginController = WindowRegistry.showLogin()
 
     def _closeCurrent(self):
         if self.nurseDashboard:
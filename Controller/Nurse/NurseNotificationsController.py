@@ -1,5 +1,6 @@
 from Model.Notifications.NotificationsModel import NotificationsModel
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.NurseGUI.NurseNotificationsWindow import NurseNotificationsWindow
 
 class NurseNotificationsController:
@@ -19,6 +20,11 @@ class NurseNotificationsController:
         self._connectSignals()
         self.notificationsWindow.show()
 
+    def reopen(self):
+        """Show the kept window again, re-running the current search/filter"""
+        self.searchNotifications()
+        self.notificationsWindow.show()
+
     def _connectSignals(self):
         w = self.notificationsWindow
 
@@ -71,22 +77,16 @@ class NurseNotificationsController:
         if self.notificationsWindow:
             self.notificationsWindow.close()
         from Controller.Nurse.NurseDashboardController import NurseDashboardController
-        NurseDashboardController().openDashboard()
+        WindowRegistry.open(NurseDashboardController, "openDashboard")
 
     def navigateToAdminister(self):
         if self.notificationsWindow:
             self.notificationsWindow.close()
         from Controller.Nurse.AdministrationController import AdministrationController
-        AdministrationController().openAdministrationWindow()
+        WindowRegistry.open(AdministrationController, "openAdministrationWindow")
 
     def logout(self):
         if self.notificationsWindow:
             self.notificationsWindow.close()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
\ No newline at end of file
+        self.loginController = WindowRegistry.showLogin()
\ No newline at end of file
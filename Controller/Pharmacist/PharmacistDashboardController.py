@@ -2,6 +2,8 @@ from PyQt6.QtWidgets import QPushButton
 from Model.KPIs.PharmacistKPIs import PharmacistKPIs
 from Model.Tables.PharmacistTables import PharmacistTables
 from Model.SessionManager import SessionManager
+from Model.Cache.DashboardSections import DashboardSections
+from Utilities.WindowRegistry import WindowRegistry
 from View.PharmacistGUI.PharmacistDashboardWindow import PharmacistDashboardWindow
 from View.GeneralPopups.Dialogs import Dialogs
 
@@ -10,6 +12,13 @@ class PharmacistDashboardController:
     Controller for Pharmacist Dashboard
     """
 
+    # Section name -> KPI card label
+    KPI_LABELS = {
+        'activePrescriptions': "Active Prescriptions",
+        'pendingVerification': "Pending Verification",
+        'controlledSubstances': "Controlled Substances",
+    }
+
     def __init__(self):
         self.pharmacistDashboard = None
         self.loginController = None
@@ -18,17 +27,25 @@ class PharmacistDashboardController:
     def _loadData(self):
         """Fetch and prepare all required data"""
 
-        self.kpis = {
-            'activePrescriptions': self._safeKPI(PharmacistKPIs.activePrescriptionsCount),
-            'pendingVerification': self._safeKPI(PharmacistKPIs.pendingVerificationCount),
-            'controlledSubstances': self._safeKPI(PharmacistKPIs.controlledSubstancesCount)
-        }
+        # One section per KPI card and table, with the tables it is read from
+        # (None: depends on today's date, so always re-queried)
+        self.sections = DashboardSections({
+            'activePrescriptions': (lambda: self._safeKPI(PharmacistKPIs.activePrescriptionsCount),
+                                    ("prescriptions",)),
+            'pendingVerification': (lambda: self._safeKPI(PharmacistKPIs.pendingVerificationCount),
+                                    ("prescriptions",)),
+            'controlledSubstances': (lambda: self._safeKPI(PharmacistKPIs.controlledSubstancesCount),
+                                     ("prescriptions", "medicines")),
+            'expiringMedications': (lambda: self._safeTable(PharmacistTables.getExpiringMedications), None),
+            'medicationsToPrep': (lambda: self._safeTable(PharmacistTables.getMedicationsToPrepare), None)
+        })
+        results = self.sections.load()
+        self.kpis = {name: results[name] for name in self.KPI_LABELS}
 
         self.user, self.userInfo, self.role = self._getCurrentUser()
 
-        raw_expiring = self._safeTable(PharmacistTables.getExpiringMedications)
-        self.expiringMedications = self._formatExpiringData(raw_expiring)
-        self.medicationsToPrep = self._safeTable(PharmacistTables.getMedicationsToPrepare)
+        self.expiringMedications = self._formatExpiringData(results['expiringMedications'])
+        self.medicationsToPrep = results['medicationsToPrep']
 
     @staticmethod
     def _safeKPI(func):
@@ -76,6 +93,21 @@ class PharmacistDashboardController:
         )
         self._connectNavigation()
         self._connectMedicationButtons()  # One-way only
+        self.pharmacistDashboard.prepareSelectedButton.clicked.connect(self.markSelectedAsPrepared)
+        self.pharmacistDashboard.show()
+
+    def reopen(self):
+        """Show the kept dashboard again, updating only the cards and tables whose data changed"""
+        for name, value in self.sections.refresh().items():
+            if name in self.KPI_LABELS:
+                self.kpis[name] = value
+                self.pharmacistDashboard.setKPIValue(self.KPI_LABELS[name], value)
+            elif name == 'expiringMedications':
+                self.expiringMedications = self._formatExpiringData(value)
+                self.pharmacistDashboard.setExpiringData(self.expiringMedications)
+            elif name == 'medicationsToPrep':
+                self.medicationsToPrep = value
+                self._connectMedicationButtons(self.pharmacistDashboard.updateMedicationCards(value))
         self.pharmacistDashboard.show()
 
     def _connectNavigation(self):
@@ -85,17 +117,11 @@ class PharmacistDashboardController:
         dashboard.notificationsOption.mousePressEvent = lambda e: self.navigateToNotifications()
         dashboard.logoutOption.mousePressEvent = lambda e: self.logout()
 
-    def _connectMedicationButtons(self):
-        """Connects 'To be Prepared' buttons."""
-        layout = self.pharmacistDashboard.scrollLayout
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if not item:
-                continue
-            card = item.widget()
-            if not card:
-                continue
-
+    def _connectMedicationButtons(self, cards=None):
+        """Connects 'To be Prepared' buttons (of `cards`, or of every card on the board)."""
+        if cards is None:
+            cards = list(self.pharmacistDashboard.medicationCards.values())
+        for card in cards:
             preparation_id = card.property("preparation_id")
             if not preparation_id:
                 continue
@@ -107,8 +133,42 @@ class PharmacistDashboardController:
                     lambda checked=False, pid=preparation_id, c=card: self.markAsPrepared(pid, c)
                 )
 
-    @staticmethod
-    def markAsPrepared(preparation_id, card):
+    def markSelectedAsPrepared(self):
+        """Marks every ticked card as Prepared with one bulk update and refreshes the board once"""
+        try:
+            dashboard = self.pharmacistDashboard
+            selected = dashboard.getSelectedPreparationIds()
+            if not selected:
+                Dialogs.showErrorDialog("No Selection", "Tick the medications to mark as prepared.")
+                return
+
+            outcomes = PharmacistTables.markMedicationsAsPrepared(selected)
+            if outcomes is None:
+                Dialogs.showErrorDialog("Error", "Failed to mark medications as prepared.\nNo changes were saved.")
+                return
+
+            # Cards of already-processed or missing preparations are stale too
+            dashboard.removeMedicationCards(outcomes.keys())
+            dashboard.selectAllCheck.setChecked(False)
+
+            self.medicationsToPrep = self.sections.data['medicationsToPrep'] = \
+                self._safeTable(PharmacistTables.getMedicationsToPrepare)
+            self._connectMedicationButtons(dashboard.updateMedicationCards(self.medicationsToPrep))
+
+            prepared = sum(1 for outcome in outcomes.values() if outcome == 'Prepared')
+            message = f"{prepared} medications marked as Prepared.\nReady for nurse administration."
+            skipped = {pid: outcome for pid, outcome in outcomes.items() if outcome != 'Prepared'}
+            if skipped:
+                message += "\n\nSkipped: " + ", ".join(f"#{pid} ({outcome.lower()})" for pid, outcome in skipped.items())
+            Dialogs.showSuccessDialog("Success", message)
+
+            print(f"Pharmacist bulk-marked preparations: {outcomes}")
+
+        except Exception as e:
+            print(f"Error in markSelectedAsPrepared: {e}")
+            Dialogs.showErrorDialog("Error", "An unexpected error occurred.")
+
+    def markAsPrepared(self, preparation_id, card):
         """Marks medication as Prepared and removes card permanently"""
         try:
             success = PharmacistTables.markMedicationAsPrepared(preparation_id)
@@ -117,7 +177,7 @@ class PharmacistDashboardController:
                 return
 
             # Remove card immediately — prevents any further clicks
-            card.deleteLater()
+            self.pharmacistDashboard.removeMedicationCards([preparation_id])
 
             Dialogs.showSuccessDialog(
                 "Success",
@@ -133,23 +193,17 @@ class PharmacistDashboardController:
     def navigateToVerification(self):
         self._closeCurrent()
         from Controller.Pharmacist.VerificationController import VerificationController
-        VerificationController().openVerificationWindow()
+        WindowRegistry.open(VerificationController, "openVerificationWindow")
 
     def navigateToNotifications(self):
         self._closeCurrent()
         from Controller.Pharmacist.PharmacistNotificationsController import PharmacistNotificationsController
-        PharmacistNotificationsController().openNotificationsWindow()
+        WindowRegistry.open(PharmacistNotificationsController, "openNotificationsWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
+        self.loginController = WindowRegistry.showLogin()
 
     def _closeCurrent(self):
         if self.pharmacistDashboard:
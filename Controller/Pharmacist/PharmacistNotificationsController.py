@@ -1,5 +1,6 @@
 from Model.Notifications.NotificationsModel import NotificationsModel
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.PharmacistGUI.PharmacistNotificationsWindow import PharmacistNotificationsWindow
 
 class PharmacistNotificationsController:
@@ -19,6 +20,11 @@ class PharmacistNotificationsController:
         self._connectSignals()
         self.notificationsWindow.show()
 
+    def reopen(self):
+        """Show the kept window again, re-running the current search/filter"""
+        self.searchNotifications()
+        self.notificationsWindow.show()
+
     def _connectSignals(self):
         w = self.notificationsWindow
 
@@ -74,20 +80,14 @@ class PharmacistNotificationsController:
     def navigateToDashboard(self):
         self._closeCurrent()
         from Controller.Pharmacist.PharmacistDashboardController import PharmacistDashboardController
-        PharmacistDashboardController().openDashboard()
+        WindowRegistry.open(PharmacistDashboardController, "openDashboard")
 
     def navigateToVerification(self):
         self._closeCurrent()
         from Controller.Pharmacist.VerificationController import VerificationController
-        VerificationController().openVerificationWindow()
+        WindowRegistry.open(VerificationController, "openVerificationWindow")
 
     def logout(self):
         self._closeCurrent()
         SessionManager.clear()
-        from Controller.Login.LoginController import LoginController
-        from Model.Authentication.LoginModel import LoginModel
-        from View.LoginGUI import Login
-        loginModel = LoginModel()
-        loginView = Login()
-        self.loginController = LoginController(loginModel, loginView)
-        loginView.show()
\ No newline at end of file
+        self.loginController = WindowRegistry.showLogin()
\ No newline at end of file
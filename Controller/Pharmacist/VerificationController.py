@@ -1,8 +1,11 @@
 from PyQt6.QtWidgets import QTableWidgetItem
 from Model.Transactions.VerificationModel import VerificationModel
 from Model.SessionManager import SessionManager
+from Utilities.WindowRegistry import WindowRegistry
 from View.PharmacistGUI.VerificationWindow import PharmacistVerificationWindow, VerificationSummaryPopup
 from View.GeneralPopups.Dialogs import Dialogs
+from Utilities.LiveSearch import LiveSearch
+from Utilities.UnitOfWork import UnitOfWork
 
 class VerificationController:
     """
@@ -15,6 +18,7 @@ class VerificationController:
 
         self.selectedPrescriptionId = None
         self.selectedPrescriptionData = None
+        self.selectedPrescriptionIds = []
         self.verificationWindow = None
 
     def _loadUserData(self):
@@ -38,6 +42,11 @@ class VerificationController:
             print(f"Failed to open VerificationWindow: {e}")
             Dialogs.showErrorDialog("Window Error", f"Failed to open: {str(e)}")
 
+    def reopen(self):
+        """Shows the kept window again with a refreshed pending list"""
+        self.searchPendingPrescriptions()
+        self.verificationWindow.show()
+
     def _connectSignals(self):
         """Connects all UI signals"""
         try:
@@ -46,6 +55,11 @@ class VerificationController:
             w.pendingSearchButton.clicked.connect(self.searchPendingPrescriptions)
             w.pendingSearch.returnPressed.connect(self.searchPendingPrescriptions)
             w.pendingTable.itemSelectionChanged.connect(self.onPrescriptionSelected)
+            self.pendingSearch = LiveSearch(
+                w.pendingSearch, self._fetchPendingPrescriptions, self._populatePrescriptionTable,
+                fields=("patient_first_name", "patient_last_name", "brand_name", "generic_name", "prescription_id"),
+                onError=lambda msg: Dialogs.showErrorDialog("Search Error", f"Failed to search: {msg}")
+            )
             w.confirmButton.clicked.connect(self.verifyPrescription)
 
             w.dashboardOption.mousePressEvent = lambda er: self.navigateToDashboard()
@@ -62,6 +76,7 @@ class VerificationController:
                 prescriptions = []
 
             self._populatePrescriptionTable(prescriptions)
+            self.pendingSearch.invalidate()
             print(f"✓ Loaded {len(prescriptions)} pending prescriptions")
         except Exception as e:
             print(f"Failed to load prescriptions: {e}")
@@ -69,22 +84,16 @@ class VerificationController:
 
     def searchPendingPrescriptions(self):
         """Searches pending prescriptions"""
-        try:
-            query = self.verificationWindow.pendingSearch.text().strip()
-
-            if query:
-                prescriptions = VerificationModel.searchPendingPrescriptions(query) or []
-            else:
-                prescriptions = VerificationModel.getPendingPrescriptions() or []
-
-            if not isinstance(prescriptions, list):
-                prescriptions = []
-
-            self._populatePrescriptionTable(prescriptions)
-            print(f"✓ Search: {len(prescriptions)} results")
-        except Exception as e:
-            print(f"Failed to search: {e}")
-            Dialogs.showErrorDialog("Search Error", f"Failed to search: {str(e)}")
+        self.pendingSearch.refresh()
+
+    @staticmethod
+    def _fetchPendingPrescriptions(query):
+        """Runs on the live-search worker thread"""
+        if query:
+            prescriptions = VerificationModel.searchPendingPrescriptions(query) or []
+        else:
+            prescriptions = VerificationModel.getPendingPrescriptions() or []
+        return prescriptions if isinstance(prescriptions, list) else []
 
     def _populatePrescriptionTable(self, prescriptions):
         """Populates the prescription table"""
@@ -114,8 +123,15 @@ class VerificationController:
         try:
             table = self.verificationWindow.pendingTable
             row = table.currentRow()
+            self.selectedPrescriptionIds = self.verificationWindow.getSelectedPrescriptionIds()
 
-            if row < 0:
+            if row < 0 or not self.selectedPrescriptionIds:
+                self.selectedPrescriptionId = None
+                self.selectedPrescriptionData = None
+                return
+
+            # Batch selection: details are read inside the batch transaction, not per click
+            if len(self.selectedPrescriptionIds) > 1:
                 self.selectedPrescriptionId = None
                 self.selectedPrescriptionData = None
                 return
@@ -135,7 +151,8 @@ class VerificationController:
     def verifyPrescription(self):
         """Prepares verification for review"""
         try:
-            if not self.selectedPrescriptionId or not self.selectedPrescriptionData:
+            batch = len(self.selectedPrescriptionIds) > 1
+            if not batch and (not self.selectedPrescriptionId or not self.selectedPrescriptionData):
                 Dialogs.showErrorDialog("Validation Error", "Please select a prescription to verify.")
                 return
 
@@ -168,7 +185,10 @@ class VerificationController:
                 Dialogs.showErrorDialog("Validation Error", "Please provide a reason for modification or rejection.")
                 return
 
-            self._showVerificationSummary(data)
+            if batch:
+                self._showBatchVerificationSummary(list(self.selectedPrescriptionIds), data)
+            else:
+                self._showVerificationSummary(data)
         except Exception as e:
             print(f"Failed to verify prescription: {e}")
             Dialogs.showErrorDialog("Verification Error", f"Failed: {str(e)}")
@@ -176,18 +196,22 @@ class VerificationController:
     def _submitVerification(self, data):
         """Submits the verification to database"""
         try:
-            success = VerificationModel.verifyPrescription(
-                prescription_id=self.selectedPrescriptionId,
-                pharmacist_id=self.pharmacistId,
-                decision=data['decision'],
-                lot_number=data['lot_number'] if data['decision'] == 'Approve' else None,
-                quantity=int(data['quantity']) if data['decision'] == 'Approve' and data['quantity'] else None,
-                expiry_date=data['expiry_date'] if data['decision'] == 'Approve' else None,
-                reason=data['reason'] if data['reason'] else None
-            )
-
-            if success:
-                self._createNotificationRecord(data['decision'])
+            # Verification and the doctor's notification are committed together
+            with UnitOfWork() as unit:
+                success = VerificationModel.verifyPrescription(
+                    prescription_id=self.selectedPrescriptionId,
+                    pharmacist_id=self.pharmacistId,
+                    decision=data['decision'],
+                    lot_number=data['lot_number'] if data['decision'] == 'Approve' else None,
+                    quantity=int(data['quantity']) if data['decision'] == 'Approve' and data['quantity'] else None,
+                    expiry_date=data['expiry_date'] if data['decision'] == 'Approve' else None,
+                    reason=data['reason'] if data['reason'] else None
+                )
+
+                if success and not self._createNotificationRecord(data['decision']):
+                    unit.rollback()
+
+            if success and unit.committed:
                 print(f"✓ Prescription {self.selectedPrescriptionId} verified successfully!")
                 Dialogs.showSuccessDialog("Success", "Prescription verified successfully!")
                 self.verificationWindow.clearForm()
@@ -198,39 +222,68 @@ class VerificationController:
             print(f"Failed to submit verification: {e}")
             Dialogs.showErrorDialog("Verification Error", f"Failed: {str(e)}")
 
+    def _submitBatchVerification(self, prescription_ids, data):
+        """Submits one decision for all selected prescriptions in a single transaction"""
+        try:
+            approve = data['decision'] == 'Approve'
+            result = VerificationModel.verifyPrescriptions(
+                prescription_ids=prescription_ids,
+                pharmacist_id=self.pharmacistId,
+                decision=data['decision'],
+                lot_number=data['lot_number'] if approve else None,
+                quantity=int(data['quantity']) if approve and data['quantity'] else None,
+                expiry_date=data['expiry_date'] if approve else None,
+                reason=data['reason'] if data['reason'] else None,
+                verified_by=self.userInfo
+            )
+
+            if result is None:
+                Dialogs.showErrorDialog("Verification Error", "Failed to submit batch verification. No changes were saved.")
+                return
+
+            verified, skipped = result
+            message = f"{len(verified)} prescriptions verified successfully!"
+            if skipped:
+                message += f"\n{len(skipped)} were no longer pending and were skipped."
+            Dialogs.showSuccessDialog("Success", message)
+
+            self.selectedPrescriptionIds = []
+            self.verificationWindow.clearForm()
+            self.loadPendingPrescriptions()
+        except Exception as e:
+            print(f"Failed to submit batch verification: {e}")
+            Dialogs.showErrorDialog("Verification Error", f"Failed: {str(e)}")
+
     def _createNotificationRecord(self, decision):
-        """Creates notification for the doctor"""
+        """Creates notification for the doctor. Returns False if it could not be created"""
         try:
             doctor_id = self.selectedPrescriptionData.get('doctor_id')
             if not doctor_id:
-                return
+                return True
 
             patient_name = f"{self.selectedPrescriptionData.get('patient_first_name', '')} {self.selectedPrescriptionData.get('patient_last_name', '')}"
             medication = f"{self.selectedPrescriptionData.get('brand_name', '')} ({self.selectedPrescriptionData.get('generic_name', '')})"
 
-            decision_map = {
-                "Approve": ("Approved", "Info"),
-                "Request Modification": ("Modification Requested", "Attention"),
-                "Reject": ("Rejected", "Urgent")
-            }
-
-            status_text, notification_type = decision_map.get(decision, ("Updated", "Info"))
+            _, status_text, notification_type = VerificationModel.DECISIONS.get(decision, (None, "Updated", "Info"))
 
             title = f"Prescription {status_text}"
             message = f"Prescription for {patient_name} - {medication} has been {status_text.lower()} by {self.userInfo}"
 
-            VerificationModel.createNotification(
+            if not VerificationModel.createNotification(
                 user_id=doctor_id,
                 related_table='prescription_verification',
                 related_id=self.selectedPrescriptionId,
                 title=title,
                 message=message,
                 notification_type=notification_type
-            )
+            ):
+                return False
 
             print(f"✓ Notification created for doctor")
+            return True
         except Exception as e:
             print(f"Failed to create notification: {e}")
+            return False
 
     def _showVerificationSummary(self, data):
         """Displays the verification summary popup"""
@@ -263,13 +316,38 @@ class VerificationController:
         except Exception as e:
             print(f"Failed to show summary: {e}")
 
+    def _showBatchVerificationSummary(self, prescription_ids, data):
+        """Displays the summary popup for a batch verification"""
+        try:
+            popup = VerificationSummaryPopup("Batch Verification Summary")
+            approve = data['decision'] == 'Approve'
+
+            popup.setSummaryData(
+                prescription_id=f"{len(prescription_ids)} selected",
+                patient_name="Multiple (see pending list)",
+                medication_name="Multiple (see pending list)",
+                prescribed_by="Multiple",
+                lot_number=data['lot_number'] if approve else 'N/A',
+                quantity=f"{data['quantity']} units each" if approve and data['quantity'] else 'N/A',
+                expiry_date=data['expiry_date'] if approve else 'N/A',
+                decision=data['decision'],
+                reason=data['reason'] or "N/A"
+            )
+
+            popup.submitButton.clicked.connect(
+                lambda: (self._submitBatchVerification(prescription_ids, data), popup.close())
+            )
+            popup.show()
+        except Exception as e:
+            print(f"Failed to show batch summary: {e}")
+
     def navigateToDashboard(self):
         """Navigate to Pharmacist Dashboard"""
         try:
             if self.verificationWindow:
                 self.verificationWindow.close()
             from Controller.Pharmacist.PharmacistDashboardController import PharmacistDashboardController
-            PharmacistDashboardController().openDashboard()
+            WindowRegistry.open(PharmacistDashboardController, "openDashboard")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -279,7 +357,7 @@ class VerificationController:
             if self.verificationWindow:
                 self.verificationWindow.close()
             from Controller.Pharmacist.PharmacistNotificationsController import PharmacistNotificationsController
-            PharmacistNotificationsController().openNotificationsWindow()
+            WindowRegistry.open(PharmacistNotificationsController, "openNotificationsWindow")
         except Exception as e:
             print(f"Failed to navigate: {e}")
 
@@ -289,12 +367,6 @@ class VerificationController:
             SessionManager.clear()
             if self.verificationWindow:
                 self.verificationWindow.close()
-            from Controller.Login.LoginController import LoginController
-            from Model.Authentication.LoginModel import LoginModel
-            from View.LoginGUI import Login
-            loginModel = LoginModel()
-            loginView = Login()
-            self.loginController = LoginController(loginModel, loginView)
-            loginView.show()
+            self.loginController = WindowRegistry.showLogin()
         except Exception as e:
             print(f"Failed to logout: {e}")
\ No newline at end of file
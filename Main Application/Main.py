@@ -1,14 +1,19 @@
+import atexit
 import sys
 from PyQt6.QtWidgets import QApplication
 from Model.Authentication.LoginModel import LoginModel
 from View.LoginGUI import Login
 from Controller.Login.LoginController import LoginController
+from Utilities.AssetRegistry import AssetRegistry
+from Utilities.QueryInstrumentation import QueryStats
 
 # =====================================================
 # ENTRY POINT to "MEDISYNC" Medicine Monitoring System
 # =====================================================
 
 app = QApplication(sys.argv)
+atexit.register(QueryStats.writeSnapshot)  # Save query statistics for QueryStatsTask on exit
+AssetRegistry.preload()  # Decode shared images once, before the first window is built
 loginView = Login()
 loginModel = LoginModel()
 loginController = LoginController(loginModel, loginView)
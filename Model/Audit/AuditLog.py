@@ -0,0 +1,255 @@
+import atexit
+import glob
+import gzip
+import json
+import os
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+
+class AuditLog:
+    """
+    Append-only, machine-readable audit trail (JSON Lines).
+
+    AuditLog.write() only puts the record on a bounded queue; a background writer thread
+    appends queued records in batches and fsyncs once per batch (group commit), so audit
+    writes stay off the GUI thread and the clinical transaction.
+
+    Records go to Logs/audit/audit_YYYYMMDD_NNN.jsonl. A segment is rotated when the day
+    changes or it grows past MAX_SEGMENT_BYTES; rotated segments are gzip-compressed.
+    Every record is also indexed by (prescription_id, day) in Logs/audit/audit_index.sqlite,
+    so find() only opens the segments that hold matching records.
+    """
+
+    LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "Logs", "audit")
+    INDEX_PATH = os.path.join(LOG_DIR, "audit_index.sqlite")
+
+    MAX_SEGMENT_BYTES = 10 * 1024 * 1024
+    QUEUE_SIZE = 10000
+    BATCH_SIZE = 500        # Records written per group commit at most
+    FLUSH_INTERVAL = 0.5    # Seconds a batch waits for more records
+    ENQUEUE_TIMEOUT = 0.5   # Seconds write() waits on a full queue before writing inline
+
+    _queue = queue.Queue(maxsize=QUEUE_SIZE)
+    _lock = threading.RLock()       # Guards the open segment (writer thread vs inline writes)
+    _startLock = threading.Lock()
+    _thread = None
+
+    _file = None
+    _segment = None                 # Stem of the open segment, e.g. audit_20261019_000
+    _segmentDay = None
+    _segmentLines = 0
+    _index = None
+
+    # ======================================================
+    # WRITING
+    # ======================================================
+
+    @classmethod
+    def write(cls, event, **fields):
+        """
+        Queues one audit record, e.g.
+            AuditLog.write("medication_administration", prescription_id=12, nurse_id=3, status="Administered")
+        Never raises; returns False if the record could not be logged.
+        """
+        try:
+            record = {"ts": datetime.now().isoformat(timespec="seconds"), "event": event, **fields}
+            cls._ensureWriter()
+            try:
+                cls._queue.put(record, timeout=cls.ENQUEUE_TIMEOUT)
+            except queue.Full:
+                # Writer can't keep up: write this one inline rather than drop it
+                cls._writeBatch([record])
+            return True
+        except Exception as e:
+            print(f"Error in AuditLog.write: {e}")
+            return False
+
+    @classmethod
+    def flush(cls, timeout=5.0):
+        """Waits until every queued record is on disk (or `timeout` seconds pass)"""
+        if cls._thread is None:
+            return True
+        done = threading.Event()
+        threading.Thread(target=lambda: (cls._queue.join(), done.set()), daemon=True).start()
+        return done.wait(timeout)
+
+    @classmethod
+    def _ensureWriter(cls):
+        if cls._thread is not None:
+            return
+        with cls._startLock:
+            if cls._thread is None:
+                thread = threading.Thread(target=cls._run, name="AuditLogWriter", daemon=True)
+                thread.start()
+                cls._thread = thread
+                atexit.register(cls.flush)
+
+    @classmethod
+    def _run(cls):
+        """Writer thread: waits for a record, collects a batch, then writes it with one fsync"""
+        while True:
+            batch = [cls._queue.get()]
+            try:
+                deadline = datetime.now().timestamp() + cls.FLUSH_INTERVAL
+                while len(batch) < cls.BATCH_SIZE:
+                    remaining = deadline - datetime.now().timestamp()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(cls._queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                cls._writeBatch(batch)
+            except Exception as e:
+                print(f"Error in AuditLog writer: {e}")
+            finally:
+                for _ in batch:
+                    cls._queue.task_done()
+
+    @classmethod
+    def _writeBatch(cls, records):
+        with cls._lock:
+            entries = []
+            for record in records:
+                line = json.dumps(record, default=str, ensure_ascii=False) + "\n"
+                cls._openSegment(record["ts"][:10].replace("-", ""), len(line.encode("utf-8")))
+                cls._file.write(line)
+                cls._segmentLines += 1
+                entries.append((record.get("prescription_id"), record["ts"][:10], cls._segment,
+                                 cls._segmentLines))
+
+            cls._file.flush()
+            os.fsync(cls._file.fileno())
+
+            cls._index.executemany(
+                "INSERT INTO entries (prescription_id, day, segment, line) VALUES (?, ?, ?, ?)", entries
+            )
+            cls._index.commit()
+
+    # ======================================================
+    # SEGMENTS & ROTATION
+    # ======================================================
+
+    @classmethod
+    def _openSegment(cls, day, incoming_bytes):
+        """Makes sure the open segment is for `day` and has room for `incoming_bytes`"""
+        if cls._index is None:
+            os.makedirs(cls.LOG_DIR, exist_ok=True)
+            cls._index = sqlite3.connect(cls.INDEX_PATH, check_same_thread=False)
+            cls._index.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    prescription_id INTEGER, day TEXT, segment TEXT, line INTEGER
+                )
+            """)
+            cls._index.execute("CREATE INDEX IF NOT EXISTS idx_entries_rx ON entries (prescription_id)")
+            cls._index.execute("CREATE INDEX IF NOT EXISTS idx_entries_day ON entries (day)")
+            cls._index.commit()
+
+        if cls._file is not None:
+            if cls._segmentDay == day and cls._file.tell() + incoming_bytes <= cls.MAX_SEGMENT_BYTES:
+                return
+            cls._rotate()
+
+        # Continue today's last uncompressed segment, or start the next one
+        existing = sorted(glob.glob(os.path.join(cls.LOG_DIR, f"audit_{day}_*.jsonl*")))
+        sequence = 0
+        if existing:
+            last = os.path.basename(existing[-1])
+            sequence = int(last.split("_")[2].split(".")[0])
+            if last.endswith(".gz"):
+                sequence += 1
+
+        cls._segment = f"audit_{day}_{sequence:03d}"
+        cls._segmentDay = day
+        path = os.path.join(cls.LOG_DIR, f"{cls._segment}.jsonl")
+        cls._segmentLines = 0
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                cls._segmentLines = sum(1 for _ in file)
+        cls._file = open(path, "a", encoding="utf-8")
+
+        if cls._file.tell() + incoming_bytes > cls.MAX_SEGMENT_BYTES and cls._segmentLines:
+            cls._rotate()
+            cls._openSegment(day, incoming_bytes)
+
+    @classmethod
+    def _rotate(cls):
+        """Closes the open segment and compresses it"""
+        path = cls._file.name
+        cls._file.close()
+        cls._file = None
+        try:
+            with open(path, "rb") as source, gzip.open(f"{path}.gz", "wb") as target:
+                target.writelines(source)
+            os.remove(path)
+        except OSError as e:
+            print(f"Error compressing audit segment {path}: {e}")
+
+    # ======================================================
+    # QUERYING
+    # ======================================================
+
+    @classmethod
+    def find(cls, prescription_id=None, day=None, event=None):
+        """
+        Returns audit records (oldest first) for a prescription and/or a day (YYYY-MM-DD),
+        optionally limited to one event type. Pending records are flushed first.
+        """
+        cls.flush()
+        conditions, params = [], []
+        if prescription_id is not None:
+            conditions.append("prescription_id = ?")
+            params.append(int(prescription_id))
+        if day is not None:
+            conditions.append("day = ?")
+            params.append(str(day))
+        if not conditions:
+            raise ValueError("find() needs a prescription_id or a day")
+
+        if not os.path.exists(cls.INDEX_PATH):
+            return []
+        with cls._lock:
+            index = sqlite3.connect(cls.INDEX_PATH)
+            try:
+                rows = index.execute(
+                    f"SELECT segment, line FROM entries WHERE {' AND '.join(conditions)} ORDER BY segment, line",
+                    params
+                ).fetchall()
+            finally:
+                index.close()
+
+        wanted = {}
+        for segment, line in rows:
+            wanted.setdefault(segment, set()).add(line)
+
+        records = []
+        for segment in sorted(wanted):
+            for record in cls._readLines(segment, wanted[segment]):
+                if event is None or record.get("event") == event:
+                    records.append(record)
+        return records
+
+    @classmethod
+    def _readLines(cls, segment, lines):
+        """Yields the records at the given 1-based line numbers of a (possibly compressed) segment"""
+        path = os.path.join(cls.LOG_DIR, f"{segment}.jsonl")
+        if os.path.exists(path):
+            opener = open
+        elif os.path.exists(f"{path}.gz"):
+            path, opener = f"{path}.gz", gzip.open
+        else:
+            return
+
+        last = max(lines)
+        with opener(path, "rt", encoding="utf-8") as file:
+            for number, text in enumerate(file, start=1):
+                if number in lines:
+                    try:
+                        yield json.loads(text)
+                    except ValueError:
+                        print(f"Skipping unreadable audit record {segment}:{number}")
+                if number >= last:
+                    break
@@ -0,0 +1,54 @@
+from Utilities.ConcurrentLoader import ConcurrentLoader
+from Utilities.DatabaseConnection import onPrimary
+from Model.Cache.TableVersions import TableVersions
+
+class DashboardSections:
+    """
+    The data sections of a dashboard (one per KPI card or table), refreshed independently.
+
+    Each section is name -> (loader, source tables). A section whose tables are all tracked
+    by TableVersions is only re-queried when one of their versions moved; a section
+    that depends on the clock (due doses, today's activity) or on untracked tables
+    (notifications, rollups) has None and is re-queried on every refresh.
+
+    load() runs every loader (replica-routed methods may read a replica), so the first
+    refresh() re-queries everything. Versioned sections are re-queried on the primary,
+    where the versions are read, so their data is never older than the versions it is
+    kept under (see ReportCache.getReport).
+    """
+
+    def __init__(self, sections):
+        self.sections = sections
+        self.data = {}
+        self._versions = None       # table -> version the versioned sections are current at
+
+    def load(self):
+        """Loads every section concurrently and returns {name: data}"""
+        self.data = ConcurrentLoader.run({name: loader for name, (loader, _) in self.sections.items()})
+        self._versions = None
+        return self.data
+
+    def refresh(self):
+        """Re-queries the stale sections and returns {name: data} for those whose data changed"""
+        versions = TableVersions.getVersions(TableVersions.TABLES)
+        current = dict(zip(TableVersions.TABLES, versions)) if versions is not None else None
+
+        stale = {}
+        for name, (loader, tables) in self.sections.items():
+            if tables is None:
+                stale[name] = loader
+            elif current is None or self._versions is None \
+                    or any(current[table] != self._versions[table] for table in tables):
+                stale[name] = lambda loader=loader: self._onPrimary(loader)
+
+        results = ConcurrentLoader.run(stale)
+        self._versions = current
+        changed = {name: value for name, value in results.items() if value != self.data.get(name)}
+        self.data.update(changed)
+        return changed
+
+    @staticmethod
+    def _onPrimary(loader):
+        # Routing is per thread, so this runs on the loader's worker thread
+        with onPrimary():
+            return loader()
@@ -0,0 +1,198 @@
+import time
+from collections import Counter
+from Model.Tables.DoctorTables import DoctorTables
+from Utilities.DatabaseConnection import onPrimary
+
+class FormularyIndex:
+    """
+    Process-wide in-memory index of the medicines table.
+
+    The formulary is small and rarely changes, so it is loaded once and searched in memory:
+      - a trie over every word of brand_name / generic_name for prefix matching
+      - trigram sets for substring and typo-tolerant (fuzzy) matching
+      - attribute filters on is_controlled and formulation
+
+    The table's version (row count + checksum) is re-read at most every
+    VERSION_CHECK_INTERVAL seconds and the index is rebuilt only when it changed.
+    """
+
+    VERSION_CHECK_INTERVAL = 60  # seconds
+
+    # Minimum Dice similarity between trigram sets for a fuzzy match
+    FUZZY_THRESHOLD = 0.35
+
+    _medicines = []      # rows ordered by brand_name (as DoctorTables.getAllMedicines)
+    _byId = {}           # medicine_id -> row
+    _order = {}          # medicine_id -> position in _medicines
+    _trie = {}           # char -> node; node["$"] = set of medicine_ids under it
+    _names = []          # [(medicine_id, lowercase name, trigram set)]
+    _trigrams = {}       # trigram -> set of indexes into _names
+    _version = None
+    _lastChecked = 0.0
+
+    # -----------------------------------------------------------
+    # LOADING
+    # -----------------------------------------------------------
+
+    @classmethod
+    def isLoaded(cls):
+        return cls._version is not None
+
+    @classmethod
+    def refresh(cls, force=False):
+        """
+        Re-checks the medicines table version (throttled unless `force`) and rebuilds
+        the index if it changed. Returns True if the index is usable.
+        """
+        now = time.monotonic()
+        if not force and cls.isLoaded() and now - cls._lastChecked < cls.VERSION_CHECK_INTERVAL:
+            return True
+
+        version = DoctorTables.getFormularyVersion()
+        cls._lastChecked = now
+        if version is None:
+            return cls.isLoaded()
+        if version == cls._version:
+            return True
+
+        # At least as new as the version just read, whichever replica served that
+        with onPrimary():
+            medicines = DoctorTables.getAllMedicines()
+        if not isinstance(medicines, list):
+            return cls.isLoaded()
+
+        cls._build(medicines)
+        cls._version = version
+        print(f"✓ Formulary index loaded: {len(medicines)} medicines")
+        return True
+
+    @classmethod
+    def invalidate(cls):
+        """Forces a version check on the next lookup"""
+        cls._lastChecked = 0.0
+
+    @classmethod
+    def _build(cls, medicines):
+        byId, order, trie, names, trigrams = {}, {}, {}, [], {}
+
+        for position, med in enumerate(medicines):
+            medicine_id = med.get('medicine_id')
+            byId[medicine_id] = med
+            order[medicine_id] = position
+
+            for field in ('brand_name', 'generic_name'):
+                name = (med.get(field) or '').lower().strip()
+                if not name:
+                    continue
+
+                # Trie: every word, plus the whole name so multi-word prefixes match
+                for word in set(name.split()) | {name}:
+                    node = trie
+                    for char in word:
+                        node = node.setdefault(char, {"$": set()})
+                        node["$"].add(medicine_id)
+
+                nameTrigrams = cls._makeTrigrams(name)
+                index = len(names)
+                names.append((medicine_id, name, nameTrigrams))
+                for trigram in nameTrigrams:
+                    trigrams.setdefault(trigram, set()).add(index)
+
+        cls._medicines, cls._byId, cls._order = medicines, byId, order
+        cls._trie, cls._names, cls._trigrams = trie, names, trigrams
+
+    @staticmethod
+    def _makeTrigrams(text):
+        padded = f"  {text} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    # -----------------------------------------------------------
+    # LOOKUPS
+    # -----------------------------------------------------------
+
+    @classmethod
+    def getAll(cls, is_controlled=None, formulation=None):
+        """All medicines (ordered by brand name), optionally filtered"""
+        if not cls.refresh():
+            return cls._filter(DoctorTables.getAllMedicines() or [], is_controlled, formulation)
+        return cls._filter(cls._medicines, is_controlled, formulation)
+
+    @classmethod
+    def getMedicine(cls, medicine_id):
+        """Single medicine row by id, or None"""
+        cls.refresh()
+        return cls._byId.get(int(medicine_id)) if str(medicine_id).isdigit() else None
+
+    @classmethod
+    def search(cls, query, is_controlled=None, formulation=None, fuzzy=True, limit=None):
+        """
+        Searches brand and generic names. Results are ranked:
+          1. word-prefix matches (trie)
+          2. substring matches (same results the old LIKE '%query%' returned)
+          3. typo-tolerant matches by trigram similarity (when `fuzzy`)
+        Within each group medicines keep brand-name order.
+        """
+        query = (query or '').lower().strip()
+        if not query:
+            return cls.getAll(is_controlled, formulation)[:limit]
+
+        if not cls.refresh():
+            results = DoctorTables.searchMedicines(query) or []
+            return cls._filter(results, is_controlled, formulation)[:limit]
+
+        prefixIds = cls._prefixMatches(query)
+        substringIds = cls._substringMatches(query) - prefixIds
+        ranked = sorted(prefixIds, key=cls._order.get) + sorted(substringIds, key=cls._order.get)
+
+        if fuzzy:
+            seen = prefixIds | substringIds
+            ranked += [mid for mid in cls._fuzzyMatches(query) if mid not in seen]
+
+        results = cls._filter([cls._byId[mid] for mid in ranked], is_controlled, formulation)
+        return results[:limit] if limit else results
+
+    @classmethod
+    def _prefixMatches(cls, query):
+        node = cls._trie
+        for char in query:
+            node = node.get(char)
+            if node is None:
+                return set()
+        return set(node["$"])
+
+    @classmethod
+    def _substringMatches(cls, query):
+        queryTrigrams = {query[i:i + 3] for i in range(len(query) - 2)}
+        if queryTrigrams:
+            # Only names containing every trigram of the query can contain the query
+            candidates = set.intersection(*(cls._trigrams.get(t, set()) for t in queryTrigrams))
+        else:
+            candidates = range(len(cls._names))
+        return {cls._names[i][0] for i in candidates if query in cls._names[i][1]}
+
+    @classmethod
+    def _fuzzyMatches(cls, query):
+        """Medicine ids whose brand/generic name is similar to `query`, best first"""
+        queryTrigrams = cls._makeTrigrams(query)
+        shared = Counter()
+        for trigram in queryTrigrams:
+            for index in cls._trigrams.get(trigram, ()):
+                shared[index] += 1
+
+        scores = {}
+        for index, count in shared.items():
+            medicine_id, _, nameTrigrams = cls._names[index]
+            score = 2.0 * count / (len(queryTrigrams) + len(nameTrigrams))
+            if score >= cls.FUZZY_THRESHOLD and score > scores.get(medicine_id, 0.0):
+                scores[medicine_id] = score
+
+        return sorted(scores, key=lambda mid: (-scores[mid], cls._order[mid]))
+
+    @staticmethod
+    def _filter(medicines, is_controlled, formulation):
+        if is_controlled is not None:
+            medicines = [m for m in medicines if bool(m.get('is_controlled')) == bool(is_controlled)]
+        if formulation:
+            formulation = formulation.lower()
+            medicines = [m for m in medicines if (m.get('formulation') or '').lower() == formulation]
+        return medicines
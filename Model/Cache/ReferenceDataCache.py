@@ -0,0 +1,76 @@
+from Utilities.DatabaseConnection import onPrimary
+from Model.Transactions.ReportsModel import ReportsModel
+from Model.Transactions.PatientModel import PatientsModel
+from Model.Cache.TableVersions import TableVersions
+
+class ReferenceDataCache:
+    """
+    Process-wide cache of the doctor, nurse and patient lists used by dropdowns.
+
+    Each list remembers the version of its source table (TableVersions). Asking for lists
+    costs one read of table_versions for all their tables together; a list is only
+    refetched when its table's version changed or it was explicitly invalidated. Loaders
+    return None when the query failed; such results are served as [] but never cached.
+    """
+
+    # list name -> (source table, loader)
+    LISTS = {
+        "patients": ("patients", ReportsModel.getPatientsList),
+        "doctors": ("users", PatientsModel.getDoctorsList),
+        "nurses": ("users", PatientsModel.getNursesList),
+    }
+
+    # list name -> {"version": int, "data": list}
+    _entries = {}
+
+    @classmethod
+    def getLists(cls, *names):
+        """
+        Returns the requested lists (in order) as a tuple, e.g.
+            patients, doctors, nurses = ReferenceDataCache.getLists("patients", "doctors", "nurses")
+        """
+        tables = tuple(dict.fromkeys(cls.LISTS[name][0] for name in names))
+        versions = TableVersions.getVersions(tables)
+        versions = dict(zip(tables, versions)) if versions else {}
+
+        results = []
+        for name in names:
+            table, loader = cls.LISTS[name]
+            version = versions.get(table)
+            entry = cls._entries.get(name)
+
+            if entry is not None and version is not None and entry["version"] == version:
+                results.append(entry["data"])
+                continue
+
+            # Loaded from the primary, like the versions (see ReportCache.getReport)
+            with onPrimary():
+                data = loader()
+            if data is not None and version is not None:
+                cls._entries[name] = {"version": version, "data": data}
+            else:
+                # A failed load (None) or one whose version is unavailable is not kept,
+                # so the next call tries again
+                cls._entries.pop(name, None)
+            results.append(data or [])
+
+        return tuple(results)
+
+    @classmethod
+    def getPatients(cls):
+        return cls.getLists("patients")[0]
+
+    @classmethod
+    def getDoctors(cls):
+        return cls.getLists("doctors")[0]
+
+    @classmethod
+    def getNurses(cls):
+        return cls.getLists("nurses")[0]
+
+    @classmethod
+    def invalidate(cls, table=None):
+        """Drops cached lists sourced from `table` (all lists if None)"""
+        for name, (source, _) in cls.LISTS.items():
+            if table is None or source == table:
+                cls._entries.pop(name, None)
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from Utilities.DatabaseConnection import onPrimary
+from Model.Cache.TableVersions import TableVersions
+
+class ReportCache:
+    """
+    Process-wide cache of generated report results.
+
+    Entries are keyed by (report_type, from_date, to_date, patient_id, doctor_id, nurse_id)
+    and evicted least-recently-used once MAX_ENTRIES is exceeded. Each entry remembers the
+    versions of its source tables (TableVersions); a cached result is only served while
+    they are unchanged, so any write to a source table, from any workstation, invalidates it.
+    Results are loaded from the primary, where the versions are read.
+    """
+
+    MAX_ENTRIES = 20
+
+    # Tables each report reads from
+    SOURCE_TABLES = {
+        "Prescription Records": ("prescriptions", "patients", "medicines", "users"),
+        "Medication Preparation Records": ("medicine_preparation", "prescriptions", "patients", "medicines"),
+        "Medication Verification Records": ("prescription_verification", "prescriptions", "patients",
+                                            "medicines", "users"),
+        "Nurse Administration Log": ("medication_administration", "prescriptions", "patients",
+                                     "medicines", "users"),
+        "Missed Administrations": ("medication_administration", "prescriptions", "patients",
+                                   "medicines", "users"),
+        "Controlled Substances Activity": ("prescriptions", "prescription_verification", "patients",
+                                           "medicines", "users"),
+    }
+
+    # key -> {"versions": tuple, "data": list, "extras": dict}
+    _entries = OrderedDict()
+
+    @staticmethod
+    def makeKey(report_type, from_date, to_date, patient_id, doctor_id, nurse_id):
+        """Builds the cache key for a report request"""
+        return report_type, from_date, to_date, patient_id, doctor_id, nurse_id
+
+    @classmethod
+    def getReport(cls, key, loader):
+        """
+        Returns the report rows for `key`, calling `loader()` only when there is no
+        cached result or its source tables have changed since it was cached.
+        A loader returns None when its query failed; that is passed on, not cached.
+        """
+        tables = cls.SOURCE_TABLES.get(key[0])
+        versions = TableVersions.getVersions(tables) if tables else None
+
+        entry = cls._entries.get(key)
+        if entry is not None and versions is not None and entry["versions"] == versions:
+            cls._entries.move_to_end(key)
+            return entry["data"]
+
+        # The versions come from the primary, so the data must too: rows from a lagging
+        # replica would be cached under versions that already count newer writes
+        with onPrimary():
+            data = loader()
+
+        # A failed load (None) is never cached; without versions the result cannot be
+        # validated later, so it isn't kept either
+        if data is None or versions is None:
+            cls._entries.pop(key, None)
+            return data
+
+        cls._entries[key] = {"versions": versions, "data": data, "extras": {}}
+        cls._entries.move_to_end(key)
+        while len(cls._entries) > cls.MAX_ENTRIES:
+            cls._entries.popitem(last=False)
+        return data
+
+    @classmethod
+    def getExtra(cls, key, name, builder):
+        """
+        Memoizes a value derived from a cached report (e.g. summary statistics).
+        Falls back to calling `builder()` when the report is not cached.
+        """
+        entry = cls._entries.get(key)
+        if entry is None:
+            return builder()
+        if name not in entry["extras"]:
+            entry["extras"][name] = builder()
+        return entry["extras"][name]
+
+    @classmethod
+    def clear(cls):
+        """Drops every cached report"""
+        cls._entries.clear()
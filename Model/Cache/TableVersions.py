@@ -0,0 +1,63 @@
+from Utilities.DatabaseConnection import getConnection
+from Utilities.StatementRegistry import Statement
+
+class TableVersions:
+    """
+    Change counters for the tables that cached datasets are built from (table_versions).
+
+    Every write path bumps the counters of the tables it changed on its own connection,
+    right before it commits, so the bump commits or rolls back with the write. A cache on
+    any workstation remembers the versions it was built at; comparing them with
+    getVersions() reads a few primary-key rows instead of re-running its queries or
+    scanning the source tables.
+
+    Writes made outside the application (e.g. formulary updates in SQL) must bump the
+    table themselves: UPDATE table_versions SET version = version + 1 WHERE table_name = ...
+    """
+
+    TABLES = ("users", "patients", "medicines", "prescriptions", "prescription_verification",
+              "medicine_preparation", "medication_administration")
+
+    VERSIONS = Statement("TableVersions.getVersions", """
+        SELECT table_name, version FROM table_versions
+    """)
+
+    _bumpStatements = {}    # tuple of tables -> Statement
+
+    @staticmethod
+    def _bumpStatement(tables):
+        statement = TableVersions._bumpStatements.get(tables)
+        if statement is None:
+            statement = TableVersions._bumpStatements[tables] = Statement(
+                f"TableVersions.bump[{','.join(tables)}]",
+                "INSERT INTO table_versions (table_name, version) VALUES "
+                + ", ".join(["(%s, 1)"] * len(tables))
+                + " ON DUPLICATE KEY UPDATE version = version + 1"
+            )
+        return statement
+
+    @staticmethod
+    def bump(conn, *tables):
+        """
+        Increments the versions of `tables` in the caller's transaction (one statement).
+        Tables are locked in name order so concurrent writers cannot deadlock on them.
+        Errors propagate: the caller rolls its write back, since a write that commits
+        without moving its versions would leave every cache built on it stale.
+        """
+        tables = tuple(sorted(set(tables)))
+        TableVersions._bumpStatement(tables).execute(conn, tables)
+
+    @staticmethod
+    def getVersions(tables):
+        """
+        Returns the current versions of `tables` as a tuple (0 for a table never written),
+        or None if they could not be read. Equal tuples mean the tables have not changed.
+        """
+        try:
+            conn = getConnection()
+            versions = dict(TableVersions.VERSIONS.fetchAll(conn))
+            conn.close()
+            return tuple(versions.get(table, 0) for table in tables)
+        except Exception as e:
+            print(f"Error in getVersions: {e}")
+            return None
@@ -1,18 +1,34 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 
 class AdminKPIs:
     """
     KPI count methods for Admin.
     """
 
+    ACTIVE_USERS = Statement("AdminKPIs.activeUsersCount", "SELECT COUNT(*) FROM users WHERE status = 'Active'")
+    ACTIVE_PATIENTS = Statement("AdminKPIs.activePatientsCount", "SELECT COUNT(*) FROM patients WHERE status = 'Active'")
+    ACTIVE_PRESCRIPTIONS = Statement("AdminKPIs.activePrescriptionsCount",
+                                     "SELECT COUNT(*) FROM prescriptions WHERE status = 'Active'")
+    PENDING_PRESCRIPTIONS = Statement("AdminKPIs.pendingPrescriptionsCount",
+                                      "SELECT COUNT(*) FROM prescriptions WHERE status = 'Pending Verification'")
+    MISSED_MEDICATIONS = Statement("AdminKPIs.missedMedicationsCount", """
+        SELECT COUNT(*)
+        FROM medication_administration ma
+        JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        WHERE ma.status = 'Missed'
+          AND pr.status = 'Active'
+          AND p.status = 'Active'
+          AND DATE(ma.administration_time) = CURDATE()
+    """)
+
     @staticmethod
+    @readFromReplica(30)
     def activeUsersCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM users WHERE status = 'Active'")
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = AdminKPIs.ACTIVE_USERS.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -20,13 +36,11 @@ class AdminKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def activePatientsCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM patients WHERE status = 'Active'")
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = AdminKPIs.ACTIVE_PATIENTS.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -34,13 +48,11 @@ class AdminKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def activePrescriptionsCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM prescriptions WHERE status = 'Active'")
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = AdminKPIs.ACTIVE_PRESCRIPTIONS.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -48,13 +60,11 @@ class AdminKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def pendingPrescriptionsCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM prescriptions WHERE status = 'Pending Verification'")
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = AdminKPIs.PENDING_PRESCRIPTIONS.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -62,23 +72,11 @@ class AdminKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def missedMedicationsCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            query = """
-                SELECT COUNT(*)
-                FROM medication_administration ma
-                JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
-                JOIN patients p ON pr.patient_id = p.patient_id
-                WHERE ma.status = 'Missed'
-                  AND pr.status = 'Active'
-                  AND p.status = 'Active'
-                  AND DATE(ma.administration_time) = CURDATE()
-            """
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = AdminKPIs.MISSED_MEDICATIONS.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -91,6 +89,7 @@ class AdminKPIDetails:
     """
 
     @staticmethod
+    @readFromReplica(30)
     def get_details(kpi_key: str):
         """Fetch details based on KPI key"""
         details_map = {
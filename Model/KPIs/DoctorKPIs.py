@@ -1,12 +1,27 @@
 from Model.SessionManager import SessionManager
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 
 class DoctorKPIs:
     """
     Contains all KPI-related methods for a Doctor user.
     """
 
+    ACTIVE_PATIENTS = Statement("DoctorKPIs.activePatientsCount", """
+        SELECT COUNT(*) FROM patients
+        WHERE doctor_id = %s AND status = 'Active'
+    """)
+    ACTIVE_PRESCRIPTIONS = Statement("DoctorKPIs.activePrescriptionsCount", """
+        SELECT COUNT(*) FROM prescriptions
+        WHERE doctor_id = %s AND status = 'Active'
+    """)
+    URGENT_CASES = Statement("DoctorKPIs.urgentCasesCount", """
+        SELECT COUNT(*) FROM notifications
+        WHERE user_id = %s AND type = 'Urgent'
+    """)
+
     @staticmethod
+    @readFromReplica(30)
     def activePatientsCount():
         """
         Returns the count of active patients assigned to the logged-in doctor.
@@ -17,18 +32,12 @@ class DoctorKPIs:
             return 0
 
         conn = getConnection()
-        cursor = conn.cursor()
-        query = """
-            SELECT COUNT(*) FROM patients
-            WHERE doctor_id = %s AND status = 'Active'
-        """
-        cursor.execute(query, (doctorId,))
-        count = cursor.fetchone()[0]
-        cursor.close()
+        count = DoctorKPIs.ACTIVE_PATIENTS.fetchValue(conn, (doctorId,), default=0)
         conn.close()
         return count
 
     @staticmethod
+    @readFromReplica(30)
     def activePrescriptionsCount():
         """
         Returns the count of active prescriptions for this doctor.
@@ -39,18 +48,12 @@ class DoctorKPIs:
             return 0
 
         conn = getConnection()
-        cursor = conn.cursor()
-        query = """
-            SELECT COUNT(*) FROM prescriptions
-            WHERE doctor_id = %s AND status = 'Active'
-        """
-        cursor.execute(query, (doctorId,))
-        count = cursor.fetchone()[0]
-        cursor.close()
+        count = DoctorKPIs.ACTIVE_PRESCRIPTIONS.fetchValue(conn, (doctorId,), default=0)
         conn.close()
         return count
 
     @staticmethod
+    @readFromReplica(30)
     def urgentCasesCount():
         """
         Returns the count of urgent notifications or prescriptions for this doctor.
@@ -61,14 +64,7 @@ class DoctorKPIs:
             return 0
 
         conn = getConnection()
-        cursor = conn.cursor()
-        query = """
-            SELECT COUNT(*) FROM notifications
-            WHERE user_id = %s AND type = 'Urgent'
-        """
-        cursor.execute(query, (doctorId,))
-        count = cursor.fetchone()[0]
-        cursor.close()
+        count = DoctorKPIs.URGENT_CASES.fetchValue(conn, (doctorId,), default=0)
         conn.close()
         return count
 
@@ -78,6 +74,7 @@ class DoctorKPIDetails:
     """
 
     @staticmethod
+    @readFromReplica(30)
     def get_details(kpi_key: str):
         """Fetch details based on KPI key"""
         details_map = {
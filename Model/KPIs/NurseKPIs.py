@@ -1,4 +1,5 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 from Model.SessionManager import SessionManager
 
 class NurseKPIs:
@@ -6,7 +7,30 @@ class NurseKPIs:
     KPI count methods for Nurse
     """
 
+    ASSIGNED_PATIENTS = Statement("NurseKPIs.assignedPatientsCount",
+                                  "SELECT COUNT(*) FROM patients WHERE nurse_id = %s AND status = 'Active'")
+    DUE_MEDICATIONS = Statement("NurseKPIs.dueMedicationsCount", """
+        SELECT COUNT(*) 
+        FROM prescriptions pr
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicine_preparation mp ON pr.prescription_id = mp.prescription_id
+        WHERE p.nurse_id = %s
+          AND p.status = 'Active'
+          AND pr.status = 'Active'
+          AND pr.duration_start <= CURDATE()
+          AND pr.duration_end >= CURDATE()
+          AND mp.status = 'Prepared'
+    """)
+    # Today's missed count is kept current in the daily rollup by the write path
+    URGENT_MEDICATIONS = Statement("NurseKPIs.urgentMedicationsCount", """
+        SELECT COALESCE(SUM(missed_count), 0)
+        FROM daily_administration_rollup
+        WHERE nurse_id = %s
+          AND rollup_date = CURDATE()
+    """)
+
     @staticmethod
+    @readFromReplica(30)
     def assignedPatientsCount():
         try:
             nurse_id = SessionManager.getUserId()
@@ -14,13 +38,7 @@ class NurseKPIs:
                 return 0
 
             conn = getConnection()
-            cursor = conn.cursor()
-
-            query = "SELECT COUNT(*) FROM patients WHERE nurse_id = %s AND status = 'Active'"
-            cursor.execute(query, (nurse_id,))
-            count = cursor.fetchone()[0]
-
-            cursor.close()
+            count = NurseKPIs.ASSIGNED_PATIENTS.fetchValue(conn, (nurse_id,), default=0)
             conn.close()
             return count
         except Exception as e:
@@ -28,6 +46,7 @@ class NurseKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def dueMedicationsCount():
         """
         Counts due medications for the nurse today
@@ -38,25 +57,7 @@ class NurseKPIs:
                 return 0
 
             conn = getConnection()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT COUNT(*) 
-                FROM prescriptions pr
-                JOIN patients p ON pr.patient_id = p.patient_id
-                JOIN medicine_preparation mp ON pr.prescription_id = mp.prescription_id
-                WHERE p.nurse_id = %s
-                  AND p.status = 'Active'
-                  AND pr.status = 'Active'
-                  AND pr.duration_start <= CURDATE()
-                  AND pr.duration_end >= CURDATE()
-                  AND mp.status = 'Prepared'
-            """
-
-            cursor.execute(query, (nurse_id,))
-            count = cursor.fetchone()[0]
-
-            cursor.close()
+            count = NurseKPIs.DUE_MEDICATIONS.fetchValue(conn, (nurse_id,), default=0)
             conn.close()
             return count
 
@@ -65,6 +66,7 @@ class NurseKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def urgentMedicationsCount():
         try:
             nurse_id = SessionManager.getUserId()
@@ -72,20 +74,7 @@ class NurseKPIs:
                 return 0
 
             conn = getConnection()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT COUNT(*) FROM medication_administration ma
-                JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
-                JOIN patients p ON pr.patient_id = p.patient_id
-                WHERE ma.nurse_id = %s
-                  AND ma.status = 'Missed'
-                  AND DATE(ma.administration_time) = CURDATE()
-            """
-            cursor.execute(query, (nurse_id,))
-            count = cursor.fetchone()[0]
-
-            cursor.close()
+            count = int(NurseKPIs.URGENT_MEDICATIONS.fetchValue(conn, (nurse_id,), default=0))
             conn.close()
             return count
         except Exception as e:
@@ -98,6 +87,7 @@ class NurseKPIDetails:
     """
 
     @staticmethod
+    @readFromReplica(30)
     def get_details(kpi_key: str):
         details_map = {
             "assigned_patients": NurseKPIDetails._assigned_patients,
@@ -1,19 +1,27 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 
 class PharmacistKPIs:
     """
     KPI count methods for Pharmacist
     """
 
+    ACTIVE_PRESCRIPTIONS = Statement("PharmacistKPIs.activePrescriptionsCount",
+                                     "SELECT COUNT(*) FROM prescriptions WHERE status = 'Active'")
+    PENDING_VERIFICATION = Statement("PharmacistKPIs.pendingVerificationCount",
+                                     "SELECT COUNT(*) FROM prescriptions WHERE status = 'Pending Verification'")
+    CONTROLLED_SUBSTANCES = Statement("PharmacistKPIs.controlledSubstancesCount", """
+        SELECT COUNT(*) FROM prescriptions pr
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        WHERE m.is_controlled = TRUE AND pr.status = 'Active'
+    """)
+
     @staticmethod
+    @readFromReplica(30)
     def activePrescriptionsCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            query = "SELECT COUNT(*) FROM prescriptions WHERE status = 'Active'"
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = PharmacistKPIs.ACTIVE_PRESCRIPTIONS.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -21,14 +29,11 @@ class PharmacistKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def pendingVerificationCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            query = "SELECT COUNT(*) FROM prescriptions WHERE status = 'Pending Verification'"
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = PharmacistKPIs.PENDING_VERIFICATION.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -36,14 +41,11 @@ class PharmacistKPIs:
             return 0
 
     @staticmethod
+    @readFromReplica(30)
     def controlledSubstancesCount():
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-            query = "SELECT COUNT(*) FROM prescriptions pr JOIN medicines m ON pr.medicine_id = m.medicine_id WHERE m.is_controlled = TRUE AND pr.status = 'Active'"
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            cursor.close()
+            count = PharmacistKPIs.CONTROLLED_SUBSTANCES.fetchValue(conn, default=0)
             conn.close()
             return count
         except Exception as e:
@@ -54,6 +56,7 @@ class PharmacistKPIDetails:
     """Detailed records for Pharmacist KPIs"""
 
     @staticmethod
+    @readFromReplica(30)
     def get_details(kpi_key: str):
         details_map = {
             "active_prescriptions": PharmacistKPIDetails._active_prescriptions,
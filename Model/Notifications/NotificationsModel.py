@@ -1,4 +1,5 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 from datetime import datetime
 
 class NotificationsModel:
@@ -6,7 +7,66 @@ class NotificationsModel:
     Model for handling notifications
     """
 
+    USER_FEED = Statement("NotificationsModel.getAllNotifications", """
+        SELECT
+            notification_id,
+            title,
+            message,
+            type AS priority,
+            created_at
+        FROM notifications
+        WHERE user_id = %s
+          AND created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
+        ORDER BY created_at DESC
+    """)
+    ADMIN_FEED = Statement("NotificationsModel.getAllNotificationsForAdmin", """
+        SELECT
+            n.notification_id,
+            n.title,
+            n.message,
+            n.type AS priority,
+            n.created_at,
+            CONCAT(u.first_name, ' ', u.last_name) AS user_name,
+            u.role
+        FROM notifications n
+        JOIN users u ON n.user_id = u.user_id
+        WHERE n.created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
+        ORDER BY n.created_at DESC
+    """)
+    USER_FEED_BY_PRIORITY = Statement("NotificationsModel.getNotificationsByPriority", """
+        SELECT
+            notification_id,
+            title,
+            message,
+            type AS priority,
+            created_at
+        FROM notifications
+        WHERE user_id = %s
+          AND type = %s
+          AND created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
+        ORDER BY created_at DESC
+    """)
+    SEARCH = Statement("NotificationsModel.searchNotifications", """
+        SELECT
+            notification_id,
+            title,
+            message,
+            type AS priority,
+            created_at
+        FROM notifications
+        WHERE user_id = %s
+          AND (title LIKE %s OR message LIKE %s)
+          AND created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
+        ORDER BY created_at DESC
+    """)
+    CREATE = Statement("NotificationsModel.createNotification", """
+        INSERT INTO notifications
+        (user_id, related_table, related_id, title, message, type)
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """)
+
     @staticmethod
+    @readFromReplica(10)
     def getAllNotifications(user_id: int):
         """
         Fetch all notifications for a user from the past 30 days.
@@ -14,28 +74,11 @@ class NotificationsModel:
         """
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT
-                    notification_id,
-                    title,
-                    message,
-                    type AS priority,
-                    created_at
-                FROM notifications
-                WHERE user_id = %s
-                  AND created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
-                ORDER BY created_at DESC
-            """
-
-            cursor.execute(query, (user_id,))
-            records = cursor.fetchall()
+            records = NotificationsModel.USER_FEED.fetchAll(conn, (user_id,), dictionary=True)
 
             for record in records:
                 record['time'] = NotificationsModel._formatTimeAgo(record.get('created_at'))
 
-            cursor.close()
             conn.close()
             return records
 
@@ -44,6 +87,7 @@ class NotificationsModel:
             return []
 
     @staticmethod
+    @readFromReplica(10)
     def getAllNotificationsForAdmin():
         """
         Fetches ALL notifications across ALL users from the past 30 days.
@@ -52,30 +96,11 @@ class NotificationsModel:
         """
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT
-                    n.notification_id,
-                    n.title,
-                    n.message,
-                    n.type AS priority,
-                    n.created_at,
-                    CONCAT(u.first_name, ' ', u.last_name) AS user_name,
-                    u.role
-                FROM notifications n
-                JOIN users u ON n.user_id = u.user_id
-                WHERE n.created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
-                ORDER BY n.created_at DESC
-            """
-
-            cursor.execute(query)
-            records = cursor.fetchall()
+            records = NotificationsModel.ADMIN_FEED.fetchAll(conn, dictionary=True)
 
             for record in records:
                 record['time'] = NotificationsModel._formatTimeAgo(record.get('created_at'))
 
-            cursor.close()
             conn.close()
             return records
 
@@ -84,6 +109,7 @@ class NotificationsModel:
             return []
 
     @staticmethod
+    @readFromReplica(10)
     def getNotificationsByPriority(user_id: int, priority: str):
         """
         Get notifications filtered by priority from the past 30 days.
@@ -91,29 +117,11 @@ class NotificationsModel:
         """
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT
-                    notification_id,
-                    title,
-                    message,
-                    type AS priority,
-                    created_at
-                FROM notifications
-                WHERE user_id = %s
-                  AND type = %s
-                  AND created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
-                ORDER BY created_at DESC
-            """
-
-            cursor.execute(query, (user_id, priority))
-            records = cursor.fetchall()
+            records = NotificationsModel.USER_FEED_BY_PRIORITY.fetchAll(conn, (user_id, priority), dictionary=True)
 
             for record in records:
                 record['time'] = NotificationsModel._formatTimeAgo(record.get('created_at'))
 
-            cursor.close()
             conn.close()
             return records
 
@@ -122,6 +130,7 @@ class NotificationsModel:
             return []
 
     @staticmethod
+    @readFromReplica(10)
     def searchNotifications(user_id: int, query: str):
         """
         Search notifications by title or message from the past 30 days.
@@ -129,30 +138,12 @@ class NotificationsModel:
         """
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            sql_query = """
-                SELECT
-                    notification_id,
-                    title,
-                    message,
-                    type AS priority,
-                    created_at
-                FROM notifications
-                WHERE user_id = %s
-                  AND (title LIKE %s OR message LIKE %s)
-                  AND created_at BETWEEN DATE_SUB(NOW(), INTERVAL 30 DAY) AND NOW()
-                ORDER BY created_at DESC
-            """
-
             search_term = f"%{query}%"
-            cursor.execute(sql_query, (user_id, search_term, search_term))
-            records = cursor.fetchall()
+            records = NotificationsModel.SEARCH.fetchAll(conn, (user_id, search_term, search_term), dictionary=True)
 
             for record in records:
                 record['time'] = NotificationsModel._formatTimeAgo(record.get('created_at'))
 
-            cursor.close()
             conn.close()
             return records
 
@@ -169,22 +160,13 @@ class NotificationsModel:
         """
         try:
             conn = getConnection()
-            cursor = conn.cursor()
-
-            query = """
-                INSERT INTO notifications
-                (user_id, related_table, related_id, title, message, type)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-
-            cursor.execute(
-                query,
+            cursor = NotificationsModel.CREATE.execute(
+                conn,
                 (user_id, related_table, related_id, title, message, priority)
             )
             conn.commit()
 
             notification_id = cursor.lastrowid
-            cursor.close()
             conn.close()
 
             return True, notification_id
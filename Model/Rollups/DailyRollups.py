@@ -0,0 +1,234 @@
+from Utilities.DatabaseConnection import getConnection
+
+class DailyRollups:
+    """
+    Maintains the daily summary tables (daily_administration_rollup,
+    daily_verification_rollup, daily_controlled_dispensing_rollup).
+
+    The record* methods are called from the write paths with the caller's
+    cursor so the rollup moves in the same transaction as the clinical record;
+    their errors propagate so the caller rolls both back together.
+    The rebuild* methods recompute whole days and are used by the nightly task.
+    """
+
+    # ======================================================
+    # INCREMENTAL UPDATES (called from write paths)
+    # ======================================================
+
+    @staticmethod
+    def recordAdministration(cursor, prescription_id, nurse_id, rollup_date, status):
+        """
+        Adds one administration event to the day's nurse/patient/medication counters.
+        """
+        administered = 1 if status == 'Administered' else 0
+        missed = 1 if status == 'Missed' else 0
+
+        query = """
+            INSERT INTO daily_administration_rollup
+            (rollup_date, nurse_id, patient_id, medicine_id, administered_count, missed_count)
+            SELECT %s, %s, pr.patient_id, pr.medicine_id, %s, %s
+            FROM prescriptions pr
+            WHERE pr.prescription_id = %s
+            ON DUPLICATE KEY UPDATE
+                administered_count = administered_count + VALUES(administered_count),
+                missed_count = missed_count + VALUES(missed_count)
+        """
+        cursor.execute(query, (rollup_date, nurse_id, administered, missed, prescription_id))
+
+    @staticmethod
+    def recordAdministrations(cursor, administrations, nurse_id, rollup_date):
+        """
+        Batch form of recordAdministration for a ward round.
+        `administrations` is a list of (prescription_id, status).
+        """
+        if not administrations:
+            return
+
+        query = """
+            INSERT INTO daily_administration_rollup
+            (rollup_date, nurse_id, patient_id, medicine_id, administered_count, missed_count)
+            SELECT %s, %s, pr.patient_id, pr.medicine_id, %s, %s
+            FROM prescriptions pr
+            WHERE pr.prescription_id = %s
+            ON DUPLICATE KEY UPDATE
+                administered_count = administered_count + VALUES(administered_count),
+                missed_count = missed_count + VALUES(missed_count)
+        """
+        cursor.executemany(query, [
+            (rollup_date, nurse_id, 1 if status == 'Administered' else 0, 1 if status == 'Missed' else 0,
+             prescription_id)
+            for prescription_id, status in administrations
+        ])
+
+    @staticmethod
+    def recordVerification(cursor, prescription_id, pharmacist_id, decision, quantity):
+        """
+        Adds one verification decision to the pharmacist's daily counters and,
+        for approved controlled substances, to the controlled dispensing rollup.
+        """
+        counts = {
+            "Approve": (1, 0, 0),
+            "Request Modification": (0, 1, 0),
+            "Reject": (0, 0, 1)
+        }.get(decision)
+        if not counts:
+            raise ValueError(f"Unknown verification decision: {decision}")
+
+        verification_query = """
+            INSERT INTO daily_verification_rollup
+            (rollup_date, pharmacist_id, approved_count, modification_count, rejected_count)
+            VALUES (CURDATE(), %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                approved_count = approved_count + VALUES(approved_count),
+                modification_count = modification_count + VALUES(modification_count),
+                rejected_count = rejected_count + VALUES(rejected_count)
+        """
+        cursor.execute(verification_query, (pharmacist_id, *counts))
+
+        if decision == "Approve":
+            controlled_query = """
+                INSERT INTO daily_controlled_dispensing_rollup
+                (rollup_date, medicine_id, doctor_id, dispensed_count, quantity_dispensed)
+                SELECT CURDATE(), pr.medicine_id, pr.doctor_id, 1, %s
+                FROM prescriptions pr
+                JOIN medicines m ON pr.medicine_id = m.medicine_id
+                WHERE pr.prescription_id = %s
+                  AND m.is_controlled = TRUE
+                ON DUPLICATE KEY UPDATE
+                    dispensed_count = dispensed_count + 1,
+                    quantity_dispensed = quantity_dispensed + VALUES(quantity_dispensed)
+            """
+            cursor.execute(controlled_query, (quantity or 0, prescription_id))
+
+    @staticmethod
+    def recordVerifications(cursor, prescription_ids, pharmacist_id, decision, quantity):
+        """
+        Batch form of recordVerification for one decision applied to many prescriptions:
+        one counter upsert plus one grouped controlled dispensing upsert.
+        """
+        if not prescription_ids:
+            return
+        counts = {
+            "Approve": (1, 0, 0),
+            "Request Modification": (0, 1, 0),
+            "Reject": (0, 0, 1)
+        }.get(decision)
+        if not counts:
+            raise ValueError(f"Unknown verification decision: {decision}")
+
+        verification_query = """
+            INSERT INTO daily_verification_rollup
+            (rollup_date, pharmacist_id, approved_count, modification_count, rejected_count)
+            VALUES (CURDATE(), %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                approved_count = approved_count + VALUES(approved_count),
+                modification_count = modification_count + VALUES(modification_count),
+                rejected_count = rejected_count + VALUES(rejected_count)
+        """
+        cursor.execute(verification_query, (pharmacist_id, *(c * len(prescription_ids) for c in counts)))
+
+        if decision == "Approve":
+            placeholders = ", ".join(["%s"] * len(prescription_ids))
+            controlled_query = f"""
+                INSERT INTO daily_controlled_dispensing_rollup
+                (rollup_date, medicine_id, doctor_id, dispensed_count, quantity_dispensed)
+                SELECT CURDATE(), pr.medicine_id, pr.doctor_id, COUNT(*), COUNT(*) * %s
+                FROM prescriptions pr
+                JOIN medicines m ON pr.medicine_id = m.medicine_id
+                WHERE pr.prescription_id IN ({placeholders})
+                  AND m.is_controlled = TRUE
+                GROUP BY pr.medicine_id, pr.doctor_id
+                ON DUPLICATE KEY UPDATE
+                    dispensed_count = dispensed_count + VALUES(dispensed_count),
+                    quantity_dispensed = quantity_dispensed + VALUES(quantity_dispensed)
+            """
+            cursor.execute(controlled_query, (quantity or 0, *prescription_ids))
+
+    # ======================================================
+    # FULL REBUILDS (nightly job / backfill)
+    # ======================================================
+
+    @staticmethod
+    def rebuildRange(from_date, to_date):
+        """
+        Recomputes every rollup table for the inclusive date range from the source tables.
+        Returns True on success.
+        """
+        conn = None
+        try:
+            conn = getConnection()
+            cursor = conn.cursor()
+
+            for table in ("daily_administration_rollup",
+                          "daily_verification_rollup",
+                          "daily_controlled_dispensing_rollup"):
+                cursor.execute(f"DELETE FROM {table} WHERE rollup_date BETWEEN %s AND %s",
+                               (from_date, to_date))
+
+            administration_query = """
+                INSERT INTO daily_administration_rollup
+                (rollup_date, nurse_id, patient_id, medicine_id, administered_count, missed_count)
+                SELECT
+                    DATE(ma.administration_time),
+                    ma.nurse_id,
+                    pr.patient_id,
+                    pr.medicine_id,
+                    SUM(ma.status = 'Administered'),
+                    SUM(ma.status = 'Missed')
+                FROM medication_administration ma
+                JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
+                WHERE ma.administration_time >= %s
+                  AND ma.administration_time < DATE_ADD(%s, INTERVAL 1 DAY)
+                GROUP BY DATE(ma.administration_time), ma.nurse_id, pr.patient_id, pr.medicine_id
+            """
+            cursor.execute(administration_query, (from_date, to_date))
+
+            verification_query = """
+                INSERT INTO daily_verification_rollup
+                (rollup_date, pharmacist_id, approved_count, modification_count, rejected_count)
+                SELECT
+                    DATE(pv.verified_at),
+                    pv.pharmacist_id,
+                    SUM(pv.decision = 'Approve'),
+                    SUM(pv.decision = 'Request Modification'),
+                    SUM(pv.decision = 'Reject')
+                FROM prescription_verification pv
+                WHERE pv.pharmacist_id IS NOT NULL
+                  AND pv.decision IS NOT NULL
+                  AND pv.verified_at >= %s
+                  AND pv.verified_at < DATE_ADD(%s, INTERVAL 1 DAY)
+                GROUP BY DATE(pv.verified_at), pv.pharmacist_id
+            """
+            cursor.execute(verification_query, (from_date, to_date))
+
+            controlled_query = """
+                INSERT INTO daily_controlled_dispensing_rollup
+                (rollup_date, medicine_id, doctor_id, dispensed_count, quantity_dispensed)
+                SELECT
+                    DATE(pv.verified_at),
+                    pr.medicine_id,
+                    pr.doctor_id,
+                    COUNT(*),
+                    COALESCE(SUM(pv.quantity_dispensed), 0)
+                FROM prescription_verification pv
+                JOIN prescriptions pr ON pv.prescription_id = pr.prescription_id
+                JOIN medicines m ON pr.medicine_id = m.medicine_id
+                WHERE m.is_controlled = TRUE
+                  AND pv.decision = 'Approve'
+                  AND pv.verified_at >= %s
+                  AND pv.verified_at < DATE_ADD(%s, INTERVAL 1 DAY)
+                GROUP BY DATE(pv.verified_at), pr.medicine_id, pr.doctor_id
+            """
+            cursor.execute(controlled_query, (from_date, to_date))
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+            return True
+
+        except Exception as e:
+            print(f"Error in DailyRollups.rebuildRange: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
+            return False
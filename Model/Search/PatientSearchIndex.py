@@ -0,0 +1,174 @@
+import re
+from Utilities.DatabaseConnection import getConnection
+
+class PatientSearchIndex:
+    """
+    Maintains and queries the patient_search_keys table.
+
+    Each patient is stored as normalized tokens (lower-cased name words, room number
+    parts, patient ID) keyed by (token, patient_id), so every search term is an index
+    range scan instead of OR'ed '%q%' LIKEs over the whole patients table:
+      - all-digit terms are exact lookups (patient ID or room number)
+      - other terms match as token prefixes ("smi" -> "smith")
+    A patient must match every term; results are ranked by how exactly they matched.
+    """
+
+    # Maximum number of terms taken from one query
+    MAX_TERMS = 5
+
+    # Rank contributed by one term, depending on how it matched
+    RANK_ID = 4
+    RANK_ROOM = 3
+    RANK_EXACT_NAME = 2
+    RANK_PREFIX = 1
+
+    _WORD = re.compile(r"[a-z0-9]+")
+
+    # ======================================================
+    # TOKENIZING
+    # ======================================================
+
+    @staticmethod
+    def tokenizeQuery(query):
+        """Lower-cased alphanumeric terms of a search query"""
+        return PatientSearchIndex._WORD.findall((query or "").lower())[:PatientSearchIndex.MAX_TERMS]
+
+    @staticmethod
+    def makeKeys(patient_id, first_name, last_name, room_number):
+        """Returns the set of (token, kind) rows for one patient"""
+        keys = {(str(patient_id), 'id')}
+
+        for name in (first_name, last_name):
+            words = PatientSearchIndex._WORD.findall((name or "").lower())
+            keys.update((word, 'name') for word in words)
+            if len(words) > 1:
+                keys.add(("".join(words), 'name'))  # "O'Brien" also matches "obrien"
+
+        parts = PatientSearchIndex._WORD.findall((room_number or "").lower())
+        keys.update((part, 'room') for part in parts)
+        if len(parts) > 1:
+            keys.add(("".join(parts), 'room'))  # "ICU-101" also matches "icu101"
+
+        return keys
+
+    # ======================================================
+    # MAINTENANCE
+    # ======================================================
+
+    @staticmethod
+    def indexPatient(cursor, patient_id, first_name, last_name, room_number):
+        """
+        Replaces one patient's search keys. Called from the patient write paths with the
+        caller's cursor so the keys change in the same transaction as the patient row;
+        errors propagate so the caller rolls the patient write back with them.
+        """
+        cursor.execute("DELETE FROM patient_search_keys WHERE patient_id = %s", (patient_id,))
+        cursor.executemany(
+            "INSERT IGNORE INTO patient_search_keys (token, patient_id, kind) VALUES (%s, %s, %s)",
+            [(token, patient_id, kind)
+             for token, kind in PatientSearchIndex.makeKeys(patient_id, first_name, last_name, room_number)]
+        )
+
+    @staticmethod
+    def indexMissing(cursor, from_id=0):
+        """
+        Adds search keys for patients (with patient_id >= from_id) that have none yet.
+        Used after batched inserts, where individual patient ids are not known; errors
+        propagate so the caller rolls the batch back.
+        """
+        cursor.execute("""
+            SELECT p.patient_id, p.patient_first_name, p.patient_last_name, p.room_number
+            FROM patients p
+            LEFT JOIN patient_search_keys k ON k.patient_id = p.patient_id
+            WHERE p.patient_id >= %s AND k.patient_id IS NULL
+        """, (from_id,))
+        rows = [(token, patient_id, kind)
+                for patient_id, first_name, last_name, room_number in cursor.fetchall()
+                for token, kind in PatientSearchIndex.makeKeys(patient_id, first_name, last_name, room_number)]
+        if rows:
+            cursor.executemany(
+                "INSERT IGNORE INTO patient_search_keys (token, patient_id, kind) VALUES (%s, %s, %s)", rows
+            )
+
+    @staticmethod
+    def rebuildAll(batch_size=5000):
+        """Recomputes the search keys of every patient. Returns the number of patients indexed."""
+        try:
+            conn = getConnection()
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT patient_id, patient_first_name, patient_last_name, room_number FROM patients")
+            patients = cursor.fetchall()
+
+            cursor.execute("DELETE FROM patient_search_keys")
+            insert = "INSERT IGNORE INTO patient_search_keys (token, patient_id, kind) VALUES (%s, %s, %s)"
+            batch = []
+            for patient_id, first_name, last_name, room_number in patients:
+                batch.extend((token, patient_id, kind) for token, kind
+                             in PatientSearchIndex.makeKeys(patient_id, first_name, last_name, room_number))
+                if len(batch) >= batch_size:
+                    cursor.executemany(insert, batch)
+                    batch = []
+            if batch:
+                cursor.executemany(insert, batch)
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+            return len(patients)
+        except Exception as e:
+            print(f"Error in PatientSearchIndex.rebuildAll: {e}")
+            return None
+
+    # ======================================================
+    # QUERYING
+    # ======================================================
+
+    @staticmethod
+    def buildMatch(query, alias="p"):
+        """
+        Builds the JOIN that restricts `alias` (a patients alias) to patients matching
+        every term of `query` and exposes their rank as s.search_rank.
+
+        Returns (join_sql, params), or None when the query has no searchable terms.
+        Place join_sql right after the FROM/JOIN of the patients table; its params come
+        before the params of any later WHERE clause.
+        """
+        terms = PatientSearchIndex.tokenizeQuery(query)
+        if not terms:
+            return None
+
+        parts, params = [], []
+        for term in terms:
+            if term.isdigit():
+                # Equality path: patient ID or room number
+                parts.append(f"""
+                    SELECT patient_id,
+                           MAX(CASE kind WHEN 'id' THEN {PatientSearchIndex.RANK_ID}
+                                         ELSE {PatientSearchIndex.RANK_ROOM} END) AS score
+                    FROM patient_search_keys
+                    WHERE token = %s AND kind IN ('id', 'room')
+                    GROUP BY patient_id
+                """)
+                params.append(term)
+            else:
+                # Prefix path: served by the (token, patient_id) primary key
+                parts.append(f"""
+                    SELECT patient_id,
+                           MAX(CASE WHEN token = %s THEN {PatientSearchIndex.RANK_EXACT_NAME}
+                                    ELSE {PatientSearchIndex.RANK_PREFIX} END) AS score
+                    FROM patient_search_keys
+                    WHERE token LIKE %s
+                    GROUP BY patient_id
+                """)
+                params.extend([term, f"{term}%"])
+
+        join_sql = f"""
+            JOIN (
+                SELECT patient_id, SUM(score) AS search_rank
+                FROM ({" UNION ALL ".join(parts)}) term_matches
+                GROUP BY patient_id
+                HAVING COUNT(*) = {len(terms)}
+            ) s ON s.patient_id = {alias}.patient_id
+        """
+        return join_sql, params
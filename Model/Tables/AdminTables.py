@@ -1,40 +1,38 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 
 class AdminTables:
     """
     Contains table data retrieval methods for Admin dashboard.
     """
 
+    TODAYS_ACTIVITY = Statement("AdminTables.getTodaysActivitySummary", """
+        SELECT
+            n.notification_id,
+            n.title,
+            n.message,
+            n.type,
+            n.related_table,
+            n.related_id,
+            n.created_at,
+            CONCAT(u.first_name, ' ', u.last_name) AS user_name,
+            u.role
+        FROM notifications n
+        JOIN users u ON n.user_id = u.user_id
+        WHERE DATE(n.created_at) = CURDATE()
+        ORDER BY n.created_at DESC
+    """)
+
     @staticmethod
+    @readFromReplica(30)
     def getTodaysActivitySummary():
         """
         Returns today's activity summary.
         """
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT 
-                    n.notification_id,
-                    n.title,
-                    n.message,
-                    n.type,
-                    n.related_table,
-                    n.related_id,
-                    n.created_at,
-                    CONCAT(u.first_name, ' ', u.last_name) AS user_name,
-                    u.role
-                FROM notifications n
-                JOIN users u ON n.user_id = u.user_id
-                WHERE DATE(n.created_at) = CURDATE()
-                ORDER BY n.created_at DESC
-            """
-
-            cursor.execute(query)
-            records = cursor.fetchall()
+            records = AdminTables.TODAYS_ACTIVITY.fetchAll(conn, dictionary=True)
 
-            cursor.close()
             conn.close()
             return records
         except Exception as e:
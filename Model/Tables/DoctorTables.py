@@ -1,12 +1,36 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 from Model.SessionManager import SessionManager
+from Model.Search.PatientSearchIndex import PatientSearchIndex
 
 class DoctorTables:
     """
     Contains all Table-related methods for Doctor user
     """
 
+    PENDING_PRESCRIPTIONS = Statement("DoctorTables.getPendingPrescriptions", """
+        SELECT
+            pr.prescription_id,
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient_name,
+            m.brand_name AS medicine_brand,
+            pr.dosage,
+            pr.frequency,
+            CONCAT(
+                DATE_FORMAT(pr.duration_start, '%Y-%m-%d'),
+                ' → ',
+                DATE_FORMAT(pr.duration_end, '%Y-%m-%d')
+            ) AS duration,
+            pr.status AS prescription_status
+        FROM prescriptions pr
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        WHERE pr.doctor_id = %s
+          AND pr.status = 'Pending Verification'
+        ORDER BY pr.duration_start DESC
+    """)
+
     @staticmethod
+    @readFromReplica(30)
     def getPatientHistory():
         """
         Returns patient history records for the logged-in doctor.
@@ -59,32 +83,7 @@ class DoctorTables:
                 return []
 
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT 
-                    pr.prescription_id,
-                    CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient_name,
-                    m.brand_name AS medicine_brand,
-                    pr.dosage,
-                    pr.frequency,
-                    CONCAT(
-                        DATE_FORMAT(pr.duration_start, '%Y-%m-%d'), 
-                        ' → ', 
-                        DATE_FORMAT(pr.duration_end, '%Y-%m-%d')
-                    ) AS duration,
-                    pr.status AS prescription_status
-                FROM prescriptions pr
-                JOIN patients p ON pr.patient_id = p.patient_id
-                JOIN medicines m ON pr.medicine_id = m.medicine_id
-                WHERE pr.doctor_id = %s 
-                  AND pr.status = 'Pending Verification'
-                ORDER BY pr.duration_start DESC
-            """
-
-            cursor.execute(query, (user_id,))
-            records = cursor.fetchall()
-            cursor.close()
+            records = DoctorTables.PENDING_PRESCRIPTIONS.fetchAll(conn, (user_id,), dictionary=True)
             conn.close()
             return records
 
@@ -128,37 +127,38 @@ class DoctorTables:
     @staticmethod
     def searchPatientsByDoctor(query):
         """
-        Search doctor's patients by name or ID
+        Search doctor's patients by name, room or ID (via patient_search_keys), best matches first
         """
         try:
             doctor_id = SessionManager.getUserId()
             if not doctor_id:
                 return []
 
+            match = PatientSearchIndex.buildMatch(query)
+            if match is None:
+                return []
+            match_sql, match_params = match
+
             conn = getConnection()
             cursor = conn.cursor(dictionary=True)
 
-            search_term = f"%{query}%"
-            query_str = """
+            query_str = f"""
                     SELECT DISTINCT
                         p.patient_id,
                         p.patient_first_name,
                         p.patient_last_name,
                         p.date_of_birth,
-                        p.sex
+                        p.sex,
+                        s.search_rank
                     FROM patients p
+                    {match_sql}
                     JOIN prescriptions pr ON p.patient_id = pr.patient_id
                     WHERE pr.doctor_id = %s
                       AND p.status = 'Active'
-                      AND (
-                          p.patient_first_name LIKE %s OR
-                          p.patient_last_name LIKE %s OR
-                          CAST(p.patient_id AS CHAR) LIKE %s
-                      )
-                    ORDER BY p.patient_last_name, p.patient_first_name
+                    ORDER BY s.search_rank DESC, p.patient_last_name, p.patient_first_name
                 """
 
-            cursor.execute(query_str, (doctor_id, search_term, search_term, search_term))
+            cursor.execute(query_str, (*match_params, doctor_id))
             results = cursor.fetchall()
             cursor.close()
             conn.close()
@@ -168,6 +168,7 @@ class DoctorTables:
             return []
 
     @staticmethod
+    @readFromReplica(60)
     def searchMedicines(query):
         """Search medicines by brand or generic name"""
         try:
@@ -200,6 +201,7 @@ class DoctorTables:
             return []
 
     @staticmethod
+    @readFromReplica(60)
     def getAllMedicines():
         """Get all medicines"""
         try:
@@ -228,6 +230,35 @@ class DoctorTables:
             print(f"Error in getAllMedicines: {e}")
             return []
 
+    @staticmethod
+    @readFromReplica(60)
+    def getFormularyVersion():
+        """
+        Returns (row count, checksum) of the medicines table, or None on error.
+        Changes whenever a medicine is added, removed, or edited.
+        """
+        try:
+            conn = getConnection()
+            cursor = conn.cursor()
+
+            query = """
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(CRC32(CONCAT_WS('|', medicine_id, generic_name, brand_name,
+                                                 formulation, strength, is_controlled))), 0)
+                FROM medicines
+            """
+
+            cursor.execute(query)
+            count, checksum = cursor.fetchone()
+            cursor.close()
+            conn.close()
+            return int(count), int(checksum)
+
+        except Exception as e:
+            print(f"Error in getFormularyVersion: {e}")
+            return None
+
     @staticmethod
     def searchPrescriptionsByDoctor(doctor_id, query):
         """Search prescriptions by patient name or prescription ID"""
@@ -1,11 +1,96 @@
 from Utilities.DatabaseConnection import getConnection
+from Utilities.StatementRegistry import Statement
 from Model.SessionManager import SessionManager
+from Model.Search.PatientSearchIndex import PatientSearchIndex
 
 class NurseTables:
     """
     Table data retrieval methods for Nurse
     """
 
+    COMPLETED_TODAY = Statement("NurseTables.getCompletedMedicationsToday", """
+        SELECT
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient_name,
+            COALESCE(m.generic_name, m.brand_name, 'Unknown Medication') AS medication,
+            pr.dosage,
+            ma.administration_time,
+            ma.patient_assessment,
+            ma.status
+        FROM medication_administration ma
+        JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        WHERE ma.nurse_id = %s
+          AND DATE(ma.administration_time) = CURDATE()
+          AND ma.status IN ('Administered','Missed')
+        ORDER BY ma.administration_time DESC
+    """)
+    PREPARATION_STATUS = Statement("NurseTables.getMedicationPreparationStatus", """
+        SELECT
+            mp.preparation_id,
+            pr.prescription_id,
+            p.patient_first_name,
+            p.patient_last_name,
+            m.brand_name,
+            pr.dosage,
+            mp.status,
+            pr.frequency
+        FROM medicine_preparation mp
+        JOIN prescriptions pr ON mp.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        WHERE p.nurse_id = %s
+          AND p.status = 'Active'
+          AND pr.status = 'Active'
+          AND pr.duration_start <= CURDATE()
+          AND pr.duration_end >= CURDATE()
+          AND (
+            mp.status = 'To be Prepared'
+            OR (
+              mp.status = 'Prepared'
+            )
+          )
+        ORDER BY
+            CASE mp.status
+                WHEN 'To be Prepared' THEN 1
+                WHEN 'Prepared' THEN 2
+            END,
+            pr.created_at DESC
+    """)
+    DUE_DOSES = Statement("NurseTables.getDueDoses", """
+        SELECT
+            pr.doctor_id,
+            pr.prescription_id,
+            pr.patient_id,
+            p.patient_first_name,
+            p.patient_last_name,
+            p.room_number,
+            m.medicine_id,
+            m.brand_name,
+            m.generic_name,
+            pr.dosage,
+            pr.frequency,
+            pr.duration_start,
+            pr.duration_end,
+            pr.special_instructions,
+            CONCAT(u.first_name, ' ', u.last_name) AS prescribed_by,
+            pv.medication_lot_number,
+            pv.expiry_date
+        FROM patients p
+        JOIN prescriptions pr ON p.patient_id = pr.patient_id
+        JOIN medicine_preparation mp ON pr.prescription_id = mp.prescription_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        JOIN users u ON pr.doctor_id = u.user_id
+        LEFT JOIN prescription_verification pv ON pr.prescription_id = pv.prescription_id
+        WHERE p.nurse_id = %s
+          AND p.status = 'Active'
+          AND pr.status = 'Active'
+          AND pr.duration_start <= CURDATE()
+          AND pr.duration_end >= CURDATE()
+          AND mp.status = 'Prepared'
+        ORDER BY p.room_number, p.patient_last_name, pr.created_at DESC
+    """)
+
     @staticmethod
     def getCompletedMedicationsToday():
         """
@@ -17,35 +102,13 @@ class NurseTables:
                 return []
 
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT 
-                    CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient_name,
-                    COALESCE(m.generic_name, m.brand_name, 'Unknown Medication') AS medication,
-                    pr.dosage,
-                    ma.administration_time,
-                    ma.patient_assessment,
-                    ma.status
-                FROM medication_administration ma
-                JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
-                JOIN patients p ON pr.patient_id = p.patient_id
-                JOIN medicines m ON pr.medicine_id = m.medicine_id
-                WHERE ma.nurse_id = %s
-                  AND DATE(ma.administration_time) = CURDATE()
-                  AND ma.status IN ('Administered','Missed')
-                ORDER BY ma.administration_time DESC
-            """
-
-            cursor.execute(query, (nurse_id,))
-            records = cursor.fetchall()
+            records = NurseTables.COMPLETED_TODAY.fetchAll(conn, (nurse_id,), dictionary=True)
 
             # Format time for better display (optional, but consistent with other modules)
             for record in records:
                 if record['administration_time']:
                     record['administration_time'] = record['administration_time'].strftime('%Y-%m-%d %H:%M:%S')
 
-            cursor.close()
             conn.close()
             return records
 
@@ -61,45 +124,8 @@ class NurseTables:
                 return []
 
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                        SELECT 
-                            mp.preparation_id,
-                            pr.prescription_id,
-                            p.patient_first_name,
-                            p.patient_last_name,
-                            m.brand_name,
-                            pr.dosage,
-                            mp.status,
-                            pr.frequency
-                        FROM medicine_preparation mp
-                        JOIN prescriptions pr ON mp.prescription_id = pr.prescription_id
-                        JOIN patients p ON pr.patient_id = p.patient_id
-                        JOIN medicines m ON pr.medicine_id = m.medicine_id
-                        WHERE p.nurse_id = %s
-                          AND p.status = 'Active'
-                          AND pr.status = 'Active'
-                          AND pr.duration_start <= CURDATE()
-                          AND pr.duration_end >= CURDATE()
-                          AND (
-                            mp.status = 'To be Prepared'
-                            OR (
-                              mp.status = 'Prepared'
-                            )
-                          )
-                        ORDER BY 
-                            CASE mp.status 
-                                WHEN 'To be Prepared' THEN 1 
-                                WHEN 'Prepared' THEN 2 
-                            END,
-                            pr.created_at DESC
-                    """
-
-            cursor.execute(query, (nurse_id,))
-            records = cursor.fetchall()
+            records = NurseTables.PREPARATION_STATUS.fetchAll(conn, (nurse_id,), dictionary=True)
 
-            cursor.close()
             conn.close()
             return records
         except Exception as e:
@@ -164,10 +190,15 @@ class NurseTables:
             if not nurse_id:
                 return []
 
+            match = PatientSearchIndex.buildMatch(query)
+            if match is None:
+                return []
+            match_sql, match_params = match
+
             conn = getConnection()
             cursor = conn.cursor(dictionary=True)
 
-            sql_query = """
+            sql_query = f"""
                 SELECT DISTINCT
                     p.patient_id,
                     p.patient_first_name,
@@ -177,8 +208,10 @@ class NurseTables:
                     p.room_number,
                     p.diagnosis,
                     m.generic_name,
-                    m.brand_name
+                    m.brand_name,
+                    s.search_rank
                 FROM patients p
+                {match_sql}
                 JOIN prescriptions pr ON p.patient_id = pr.patient_id
                 JOIN medicine_preparation mp ON pr.prescription_id = mp.prescription_id
                 JOIN medicines m ON pr.medicine_id = m.medicine_id
@@ -195,17 +228,10 @@ class NurseTables:
                         AND ma.status = 'Administered'
                         AND DATE(ma.administration_time) = CURDATE()
                   )
-                  AND (
-                      p.patient_first_name LIKE %s 
-                      OR p.patient_last_name LIKE %s 
-                      OR p.room_number LIKE %s
-                      OR CAST(p.patient_id AS CHAR) LIKE %s
-                  )
-                ORDER BY p.room_number, p.patient_last_name
+                ORDER BY s.search_rank DESC, p.room_number, p.patient_last_name
             """
 
-            search_term = f"%{query}%"
-            cursor.execute(sql_query, (nurse_id, search_term, search_term, search_term, search_term))
+            cursor.execute(sql_query, (*match_params, nurse_id))
             records = cursor.fetchall()
 
             cursor.close()
@@ -215,6 +241,27 @@ class NurseTables:
             print(f"Error in searchAssignedPatients: {e}")
             return []
 
+    @staticmethod
+    def getDueDoses():
+        """
+        Returns every prepared dose for the nurse's active patients in one query
+        (one row per prescription, same fields as getActivePrescriptionsForPatient
+        plus the patient's name and room). Used to record a ward round in one batch.
+        """
+        try:
+            nurse_id = SessionManager.getUserId()
+            if not nurse_id:
+                return []
+
+            conn = getConnection()
+            records = NurseTables.DUE_DOSES.fetchAll(conn, (nurse_id,), dictionary=True)
+
+            conn.close()
+            return records
+        except Exception as e:
+            print(f"Error in getDueDoses: {e}")
+            return []
+
     @staticmethod
     def getActivePrescriptionsForPatient(patient_id,generic_name, brand_name):
         """
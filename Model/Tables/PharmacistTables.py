@@ -1,38 +1,66 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
+from Model.Cache.TableVersions import TableVersions
 
 class PharmacistTables:
     """
     Table data retrieval methods for Pharmacist
     """
 
+    EXPIRING_MEDICATIONS = Statement("PharmacistTables.getExpiringMedications", """
+        SELECT
+            pv.verification_id,
+            pr.prescription_id,
+            p.patient_first_name,
+            p.patient_last_name,
+            m.brand_name,
+            m.generic_name,
+            pv.quantity_dispensed,
+            pv.expiry_date,
+            DATEDIFF(pv.expiry_date, CURDATE()) AS days_until_expiry
+        FROM prescription_verification pv
+        JOIN prescriptions pr ON pv.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        WHERE pv.expiry_date > CURDATE()
+          AND pv.expiry_date <= DATE_ADD(CURDATE(), INTERVAL %s DAY)
+          AND pr.status = 'Active'
+        ORDER BY pv.expiry_date ASC
+    """)
+    MEDICATIONS_TO_PREPARE = Statement("PharmacistTables.getMedicationsToPrepare", """
+        SELECT
+            mp.preparation_id,
+            pr.prescription_id,
+            p.patient_first_name,
+            p.patient_last_name,
+            m.brand_name,
+            m.generic_name,
+            pr.dosage,
+            pr.frequency,
+            mp.quantity_prepared,
+            mp.status,
+            (SELECT MAX(ma.administration_time)
+             FROM medication_administration ma
+             WHERE ma.prescription_id = pr.prescription_id
+            ) AS last_admin_time
+        FROM medicine_preparation mp
+        JOIN prescriptions pr ON mp.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        WHERE pr.status = 'Active'
+          AND p.status = 'Active'
+          AND pr.duration_start <= CURDATE()
+          AND pr.duration_end >= CURDATE()
+          AND mp.status = 'To be Prepared'
+        ORDER BY pr.created_at DESC
+    """)
+
     @staticmethod
+    @readFromReplica(300)
     def getExpiringMedications(days=365):
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                    SELECT 
-                        pv.verification_id,
-                        pr.prescription_id,
-                        p.patient_first_name,
-                        p.patient_last_name,
-                        m.brand_name,
-                        m.generic_name,
-                        pv.quantity_dispensed,
-                        pv.expiry_date,
-                        DATEDIFF(pv.expiry_date, CURDATE()) AS days_until_expiry
-                    FROM prescription_verification pv
-                    JOIN prescriptions pr ON pv.prescription_id = pr.prescription_id
-                    JOIN patients p ON pr.patient_id = p.patient_id
-                    JOIN medicines m ON pr.medicine_id = m.medicine_id
-                    WHERE pv.expiry_date > CURDATE()
-                      AND pv.expiry_date <= DATE_ADD(CURDATE(), INTERVAL %s DAY)
-                      AND pr.status = 'Active'
-                    ORDER BY pv.expiry_date ASC
-                """
-            cursor.execute(query, (days,))
-            records = cursor.fetchall()
-            cursor.close()
+            records = PharmacistTables.EXPIRING_MEDICATIONS.fetchAll(conn, (days,), dictionary=True)
             conn.close()
             return records
         except Exception as e:
@@ -49,37 +77,7 @@ class PharmacistTables:
         """
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                SELECT 
-                    mp.preparation_id,
-                    pr.prescription_id,
-                    p.patient_first_name,
-                    p.patient_last_name,
-                    m.brand_name,
-                    m.generic_name,
-                    pr.dosage,
-                    pr.frequency,
-                    mp.quantity_prepared,
-                    mp.status,
-                    (SELECT MAX(ma.administration_time)
-                     FROM medication_administration ma
-                     WHERE ma.prescription_id = pr.prescription_id
-                    ) AS last_admin_time
-                FROM medicine_preparation mp
-                JOIN prescriptions pr ON mp.prescription_id = pr.prescription_id
-                JOIN patients p ON pr.patient_id = p.patient_id
-                JOIN medicines m ON pr.medicine_id = m.medicine_id
-                WHERE pr.status = 'Active'
-                  AND p.status = 'Active'
-                  AND pr.duration_start <= CURDATE()
-                  AND pr.duration_end >= CURDATE()
-                  AND mp.status = 'To be Prepared'
-                ORDER BY pr.created_at DESC
-            """
-            cursor.execute(query)
-            records = cursor.fetchall()
-            cursor.close()
+            records = PharmacistTables.MEDICATIONS_TO_PREPARE.fetchAll(conn, dictionary=True)
             conn.close()
 
             # Filter records based on 30-minute preparation window
@@ -132,6 +130,7 @@ class PharmacistTables:
 
     @staticmethod
     def markMedicationAsPrepared(preparation_id):
+        conn = None
         try:
             conn = getConnection()
             cursor = conn.cursor()
@@ -141,11 +140,66 @@ class PharmacistTables:
                 WHERE preparation_id = %s AND status = 'To be Prepared'
             """
             cursor.execute(query, (preparation_id,))
-            conn.commit()
             success = cursor.rowcount > 0
+            if success:
+                TableVersions.bump(conn, "medicine_preparation")
+            conn.commit()
             cursor.close()
             conn.close()
             return success
         except Exception as e:
             print(f"Error in markMedicationAsPrepared: {e}")
-            return False
\ No newline at end of file
+            if conn:
+                conn.rollback()
+                conn.close()
+            return False
+
+    @staticmethod
+    def markMedicationsAsPrepared(preparation_ids):
+        """
+        Marks several preparations as Prepared with one UPDATE ... WHERE preparation_id IN (...).
+        Returns {preparation_id: outcome} where outcome is 'Prepared', 'Already processed'
+        or 'Not found'; None if the transaction failed (nothing was changed).
+        """
+        conn = None
+        try:
+            ids = [int(pid) for pid in dict.fromkeys(preparation_ids)]
+            if not ids:
+                return {}
+
+            conn = getConnection()
+            cursor = conn.cursor()
+            placeholders = ", ".join(["%s"] * len(ids))
+
+            # Lock the rows first so the outcomes reported match what the UPDATE changed
+            cursor.execute(f"""
+                SELECT preparation_id, status
+                FROM medicine_preparation
+                WHERE preparation_id IN ({placeholders})
+                FOR UPDATE
+            """, ids)
+            current = dict(cursor.fetchall())
+
+            cursor.execute(f"""
+                UPDATE medicine_preparation 
+                SET status = 'Prepared'
+                WHERE preparation_id IN ({placeholders}) AND status = 'To be Prepared'
+            """, ids)
+            if cursor.rowcount > 0:
+                TableVersions.bump(conn, "medicine_preparation")
+            conn.commit()
+            cursor.close()
+            conn.close()
+
+            return {
+                pid: 'Not found' if pid not in current
+                else 'Prepared' if current[pid] == 'To be Prepared'
+                else 'Already processed'
+                for pid in ids
+            }
+        except Exception as e:
+            print(f"Error in markMedicationsAsPrepared: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
+            return None
\ No newline at end of file
@@ -0,0 +1,28 @@
+from Model.Audit.AuditLog import AuditLog
+import argparse
+import json
+import sys
+
+def show_audit_records(prescription_id=None, day=None, event=None):
+    """
+    Prints the audit records of a prescription and/or a day, one JSON object per line:
+        python -m Model.Tasks.AuditLogTask --prescription 42
+        python -m Model.Tasks.AuditLogTask --date 2026-10-19 --event medication_administration
+    """
+    records = AuditLog.find(prescription_id=prescription_id, day=day, event=event)
+    for record in records:
+        print(json.dumps(record, ensure_ascii=False))
+    print(f"[AuditLogTask] {len(records)} records.", file=sys.stderr)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Look up audit log records.")
+    parser.add_argument("--prescription", type=int, default=None, help="prescription_id")
+    parser.add_argument("--date", default=None, help="Day as YYYY-MM-DD")
+    parser.add_argument("--event", default=None, help="Only this event type")
+    args = parser.parse_args()
+    if args.prescription is None and args.date is None:
+        parser.error("give --prescription and/or --date")
+
+    sys.exit(0 if show_audit_records(args.prescription, args.date, args.event) else 1)
@@ -0,0 +1,28 @@
+from Model.Rollups.DailyRollups import DailyRollups
+from datetime import date, timedelta
+import sys
+
+def rebuild_daily_rollups(days_back=1):
+    """
+    Recomputes the daily rollup tables for today and the previous `days_back` days.
+    The write paths keep today's counters current; this reconciles them with
+    the source tables (e.g. after a re-verification) and backfills history.
+
+    Safe to run repeatedly (idempotent). Intended for a nightly scheduler:
+        python -m Model.Tasks.DailyRollupTask            (yesterday + today)
+        python -m Model.Tasks.DailyRollupTask 365        (backfill one year)
+    """
+    to_date = date.today()
+    from_date = to_date - timedelta(days=days_back)
+
+    if DailyRollups.rebuildRange(from_date, to_date):
+        print(f"[DailyRollupTask] Rebuilt rollups from {from_date} to {to_date}.")
+        return True
+
+    print(f"[DailyRollupTask] Failed to rebuild rollups from {from_date} to {to_date}.")
+    return False
+
+
+if __name__ == "__main__":
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    sys.exit(0 if rebuild_daily_rollups(days) else 1)
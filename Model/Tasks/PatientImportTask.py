@@ -0,0 +1,44 @@
+from Model.Transactions.PatientImportModel import PatientImportModel
+import argparse
+import os
+import sys
+
+def import_patients(csv_path, added_by=None, dry_run=False, chunk_size=PatientImportModel.CHUNK_SIZE,
+                    report_path=None):
+    """
+    Bulk-imports patient admissions from a CSV file and writes an error report
+    for rejected rows (default: <file>_errors.csv next to the input).
+
+        python -m Model.Tasks.PatientImportTask admissions.csv --added-by 1
+        python -m Model.Tasks.PatientImportTask admissions.csv --dry-run
+    """
+    try:
+        result = PatientImportModel.importPatients(csv_path, added_by=added_by, dry_run=dry_run,
+                                                   chunk_size=chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"[PatientImportTask] Cannot read {csv_path}: {e}")
+        return False
+
+    mode = "Dry run" if result['dry_run'] else "Import"
+    print(f"[PatientImportTask] {mode}: {result['imported']}/{result['total']} rows "
+          f"{'valid' if result['dry_run'] else 'imported'}, {result['failed']} rejected, "
+          f"{result['seconds']:.2f} s ({result['rows_per_second']:.0f} rows/s)")
+
+    if result['errors']:
+        report_path = report_path or f"{os.path.splitext(csv_path)[0]}_errors.csv"
+        PatientImportModel.writeErrorReport(result['errors'], report_path)
+        print(f"[PatientImportTask] Error report written to {report_path}")
+
+    return result['failed'] == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import patient admissions from CSV.")
+    parser.add_argument("csv_path")
+    parser.add_argument("--added-by", type=int, default=None, help="user_id recorded as added_by")
+    parser.add_argument("--dry-run", action="store_true", help="Validate only and report throughput")
+    parser.add_argument("--chunk-size", type=int, default=PatientImportModel.CHUNK_SIZE)
+    parser.add_argument("--report", default=None, help="Error report path")
+    args = parser.parse_args()
+
+    sys.exit(0 if import_patients(args.csv_path, args.added_by, args.dry_run, args.chunk_size, args.report) else 1)
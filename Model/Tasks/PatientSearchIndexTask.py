@@ -0,0 +1,22 @@
+from Model.Search.PatientSearchIndex import PatientSearchIndex
+import sys
+
+def rebuild_patient_search_index():
+    """
+    Recomputes patient_search_keys for every patient. The patient write paths keep
+    the keys current; run this once after creating the table (to index existing
+    patients) and whenever patients were changed outside the application:
+        python -m Model.Tasks.PatientSearchIndexTask
+    """
+    count = PatientSearchIndex.rebuildAll()
+
+    if count is not None:
+        print(f"[PatientSearchIndexTask] Indexed {count} patients.")
+        return True
+
+    print("[PatientSearchIndexTask] Failed to rebuild the patient search index.")
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if rebuild_patient_search_index() else 1)
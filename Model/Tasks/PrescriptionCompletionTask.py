@@ -1,5 +1,6 @@
 from Utilities.DatabaseConnection import getConnection
 from Model.Notifications.NotificationsModel import NotificationsModel
+from Model.Cache.TableVersions import TableVersions
 from datetime import date
 
 def complete_expired_prescriptions():
@@ -81,6 +82,8 @@ def complete_expired_prescriptions():
                     print(
                         f"[PrescriptionCompletionTask] Failed to notify doctor {doctor_id} about completed prescription #{prescription_id}")
 
+        if updated_count:
+            TableVersions.bump(conn, "prescriptions")
         conn.commit()
         print(f"[PrescriptionCompletionTask] Successfully completed {updated_count} expired prescription(s).")
 
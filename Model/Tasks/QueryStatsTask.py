@@ -0,0 +1,42 @@
+from Utilities.QueryInstrumentation import QueryStats
+import argparse
+import json
+import os
+import sys
+
+def show_query_stats(limit=25, slow=0):
+    """
+    Prints the query statistics saved by the last application run (hot statements
+    first) and, with --slow N, the N most recent slow-query log entries:
+        python -m Model.Tasks.QueryStatsTask
+        python -m Model.Tasks.QueryStatsTask --limit 10 --slow 20
+    """
+    if not os.path.exists(QueryStats.SNAPSHOT_PATH):
+        print(f"[QueryStatsTask] No statistics yet ({QueryStats.SNAPSHOT_PATH} not found).")
+        return False
+
+    with open(QueryStats.SNAPSHOT_PATH, encoding="utf-8") as file:
+        snapshot = json.load(file)
+
+    print(f"[QueryStatsTask] Statistics written {snapshot['written_at']} "
+          f"(slow threshold {snapshot['slow_query_ms']:.0f} ms)\n")
+    print(QueryStats.report(snapshot["statements"], limit))
+
+    if slow and os.path.exists(QueryStats.SLOW_LOG_PATH):
+        with open(QueryStats.SLOW_LOG_PATH, encoding="utf-8") as file:
+            recent = file.readlines()[-slow:]
+        print(f"\nLast {len(recent)} slow queries:")
+        for line in recent:
+            entry = json.loads(line)
+            print(f"  {entry['ts']}  {entry['ms']:>9.1f} ms  {entry['caller']}  {entry['fingerprint'][:100]}")
+
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show SQL statement statistics from the last run.")
+    parser.add_argument("--limit", type=int, default=25, help="Number of statements to show")
+    parser.add_argument("--slow", type=int, default=0, help="Also show the last N slow queries")
+    args = parser.parse_args()
+
+    sys.exit(0 if show_query_stats(args.limit, args.slow) else 1)
@@ -0,0 +1,41 @@
+from Model.Transactions.UserImportModel import UserImportModel
+import argparse
+import os
+import sys
+
+def import_users(roster_path, dry_run=False, chunk_size=UserImportModel.CHUNK_SIZE, report_path=None):
+    """
+    Provisions staff accounts from a roster (CSV or JSON) and writes an error report
+    for rejected rows (default: <file>_errors.csv next to the input).
+
+        python -m Model.Tasks.UserImportTask roster.csv
+        python -m Model.Tasks.UserImportTask roster.json --dry-run
+    """
+    try:
+        result = UserImportModel.importUsers(roster_path, dry_run=dry_run, chunk_size=chunk_size)
+    except Exception as e:
+        print(f"[UserImportTask] Import of {roster_path} failed: {e}")
+        return False
+
+    mode = "Dry run" if result['dry_run'] else "Import"
+    print(f"[UserImportTask] {mode}: {result['imported']}/{result['total']} users "
+          f"{'valid' if result['dry_run'] else 'created'}, {result['failed']} rejected, "
+          f"{result['seconds']:.2f} s ({result['rows_per_second']:.0f} rows/s)")
+
+    if result['errors']:
+        report_path = report_path or f"{os.path.splitext(roster_path)[0]}_errors.csv"
+        UserImportModel.writeErrorReport(result['errors'], report_path)
+        print(f"[UserImportTask] Error report written to {report_path}")
+
+    return result['failed'] == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-provision staff accounts from a CSV or JSON roster.")
+    parser.add_argument("roster_path")
+    parser.add_argument("--dry-run", action="store_true", help="Validate and check conflicts only")
+    parser.add_argument("--chunk-size", type=int, default=UserImportModel.CHUNK_SIZE)
+    parser.add_argument("--report", default=None, help="Error report path")
+    args = parser.parse_args()
+
+    sys.exit(0 if import_users(args.roster_path, args.dry_run, args.chunk_size, args.report) else 1)
@@ -1,13 +1,24 @@
 from Utilities.DatabaseConnection import getConnection
 from Model.SessionManager import SessionManager
+from Model.Rollups.DailyRollups import DailyRollups
+from Model.Cache.TableVersions import TableVersions
+from Model.Audit.AuditLog import AuditLog
 from datetime import datetime, date
-import os
 
 class AdministrationModel:
     """
     Handles medication administration records for nurses.
     """
 
+    # Hours between doses; a dose later than this after the previous one counts as missed
+    FREQUENCY_INTERVALS = {
+        "Once a day": 24,
+        "Twice a day": 12,
+        "Three times a day": 8,
+        "Every 6 hours": 6,
+        "Every 8 hours": 8
+    }
+
     @staticmethod
     def recordMedicationAdministration(prescription_id, administration_time, patient_assessment, adverse_reactions,
                                        remarks=None, status='Administered'):
@@ -17,6 +28,7 @@ class AdministrationModel:
         back to 'To be Prepared' for the next dose cycle.
         """
 
+        conn = None
         try:
             nurse_id = SessionManager.getUserId()
             if not nurse_id:
@@ -56,6 +68,10 @@ class AdministrationModel:
             """
             cursor.execute(reset_query, (prescription_id,))
 
+            # Keep today's administration rollup in step with the new record
+            DailyRollups.recordAdministration(cursor, prescription_id, nurse_id, today, status)
+            TableVersions.bump(conn, "medication_administration", "medicine_preparation")
+
             conn.commit()
 
             cursor.close()
@@ -68,6 +84,7 @@ class AdministrationModel:
             print(f"Error in recordMedicationAdministration: {e}")
             if conn:
                 conn.rollback()
+                conn.close()
             return False
 
     @staticmethod
@@ -107,36 +124,171 @@ class AdministrationModel:
         Calculates if administration is on time or missed based on frequency.
         """
         try:
-            frequency_intervals = {
-                "Once a day": 24,
-                "Twice a day": 12,
-                "Three times a day": 8,
-                "Every 6 hours": 6,
-                "Every 8 hours": 8
-            }
-
-            interval_hours = frequency_intervals.get(frequency)
-            if not interval_hours:
+            if frequency not in AdministrationModel.FREQUENCY_INTERVALS:
                 return 'Administered'  # Default if frequency unknown
 
             last_admin = AdministrationModel.getLastAdministrationTime(prescription_id)
-            if not last_admin:
-                return 'Administered'  # First administration
+            return AdministrationModel._statusSince(frequency, last_admin, datetime.now())
+
+        except Exception as e:
+            print(f"Error in calculateAdministrationStatus: {e}")
+            return 'Administered'
+
+    @staticmethod
+    def _statusSince(frequency, last_admin, now):
+        """'Missed' if the dose is later than the frequency allows after last_admin"""
+        interval_hours = AdministrationModel.FREQUENCY_INTERVALS.get(frequency)
+        if not interval_hours or not last_admin:
+            return 'Administered'  # Unknown frequency or first administration
+
+        # If current time exceeds interval, it's missed (late)
+        hours_since_last = (now - last_admin).total_seconds() / 3600
+        return 'Missed' if hours_since_last > interval_hours else 'Administered'
+
+    @staticmethod
+    def recordWardRound(doses, administration_time, nurse_name="", remarks=None):
+        """
+        Records a whole ward round (one dose per prescription in `doses`, as returned by
+        NurseTables.getDueDoses, each with its own 'patient_assessment' and
+        'adverse_reactions') in a single transaction: one locking read of the doses still
+        due, one lookup of the previous administration times, executemany inserts, one
+        preparation reset, batched rollups and executemany doctor notifications. The audit
+        entries are then written in one append. Doses no longer due (administered or reset
+        since the round was loaded) are skipped.
+
+        Returns (recorded, skipped): recorded is the list of (prescription_id, status),
+        skipped the prescription ids not recorded. None if the transaction failed.
+        """
+        conn = None
+        try:
+            nurse_id = SessionManager.getUserId()
+            if not nurse_id:
+                print("Error: Nurse ID not found")
+                return None
+
+            doses = list({dose['prescription_id']: dose for dose in doses}.values())
+            if not doses:
+                return [], []
+            if not all(dose.get('patient_assessment') for dose in doses):
+                print("Error: Every dose of a ward round needs a patient assessment")
+                return None
+
+            conn = getConnection()
+            cursor = conn.cursor()
+
+            today = date.today()
+            admin_datetime = f"{today} {administration_time}"
+            requested = [dose['prescription_id'] for dose in doses]
+            placeholders = ", ".join(["%s"] * len(requested))
+
+            # Lock the doses that are still due (as in NurseTables.getDueDoses) so none is recorded twice
+            cursor.execute(f"""
+                SELECT pr.prescription_id
+                FROM prescriptions pr
+                JOIN patients p ON pr.patient_id = p.patient_id
+                JOIN medicine_preparation mp ON pr.prescription_id = mp.prescription_id
+                WHERE pr.prescription_id IN ({placeholders})
+                  AND p.nurse_id = %s
+                  AND p.status = 'Active'
+                  AND pr.status = 'Active'
+                  AND pr.duration_start <= CURDATE()
+                  AND pr.duration_end >= CURDATE()
+                  AND mp.status = 'Prepared'
+                FOR UPDATE
+            """, (*requested, nurse_id))
+            due = {row[0] for row in cursor.fetchall()}
+
+            skipped = [pid for pid in requested if pid not in due]
+            doses = [dose for dose in doses if dose['prescription_id'] in due]
+            if not doses:
+                conn.rollback()
+                cursor.close()
+                conn.close()
+                return [], skipped
+
+            prescription_ids = [dose['prescription_id'] for dose in doses]
+            placeholders = ", ".join(["%s"] * len(prescription_ids))
+
+            # Previous administration of every dose in one query (for on-time / missed status)
+            cursor.execute(f"""
+                SELECT prescription_id, MAX(administration_time)
+                FROM medication_administration
+                WHERE prescription_id IN ({placeholders})
+                GROUP BY prescription_id
+            """, prescription_ids)
+            last_times = dict(cursor.fetchall())
 
-            # Calculate time difference
             now = datetime.now()
-            time_diff = now - last_admin
-            hours_since_last = time_diff.total_seconds() / 3600
+            statuses = {
+                dose['prescription_id']:
+                    AdministrationModel._statusSince(dose.get('frequency'), last_times.get(dose['prescription_id']), now)
+                for dose in doses
+            }
+            recorded = list(statuses.items())
 
-            # If current time exceeds interval, it's missed (late)
-            if hours_since_last > interval_hours:
-                return 'Missed'
-            else:
-                return 'Administered'
+            cursor.executemany("""
+                INSERT INTO medication_administration 
+                (prescription_id, nurse_id, administration_time, patient_assessment, 
+                 adverse_reactions, remarks, status)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """, [(dose['prescription_id'], nurse_id, admin_datetime, dose['patient_assessment'],
+                   dose.get('adverse_reactions') or "None", remarks, statuses[dose['prescription_id']])
+                  for dose in doses])
+
+            # Reset every preparation to 'To be Prepared' for the next dose
+            cursor.execute(f"""
+                UPDATE medicine_preparation 
+                SET status = 'To be Prepared'
+                WHERE prescription_id IN ({placeholders})
+                  AND status = 'Prepared'
+            """, prescription_ids)
+
+            DailyRollups.recordAdministrations(cursor, recorded, nurse_id, today)
+
+            notifications = [
+                (dose['doctor_id'], 'medication_administration', dose['prescription_id'],
+                 f"Medication {'Administered' if statuses[dose['prescription_id']] == 'Administered' else 'Missed (Late)'}",
+                 f"{dose.get('patient_first_name', '')} {dose.get('patient_last_name', '')} - "
+                 f"{dose.get('generic_name', '')} administered by {nurse_name}",
+                 'Info' if statuses[dose['prescription_id']] == 'Administered' else 'Attention')
+                for dose in doses if dose.get('doctor_id')
+            ]
+            if notifications:
+                cursor.executemany("""
+                    INSERT INTO notifications
+                    (user_id, related_table, related_id, title, message, type)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                """, notifications)
+
+            TableVersions.bump(conn, "medication_administration", "medicine_preparation")
+            conn.commit()
+            cursor.close()
+            conn.close()
+
+            AdministrationModel.writeAuditLogs([{
+                'prescription_id': dose['prescription_id'],
+                'patient_name': f"{dose.get('patient_first_name', '')} {dose.get('patient_last_name', '')}",
+                'medication': f"{dose.get('brand_name', '')} ({dose.get('generic_name', '')})",
+                'dosage': dose.get('dosage', ''),
+                'frequency': dose.get('frequency', ''),
+                'administration_time': administration_time,
+                'patient_assessment': dose['patient_assessment'],
+                'adverse_reactions': dose.get('adverse_reactions') or "None",
+                'status': statuses[dose['prescription_id']],
+                'nurse_name': nurse_name,
+                'nurse_id': nurse_id,
+                'remarks': remarks
+            } for dose in doses])
+
+            print(f"Ward round recorded: {len(recorded)} doses, {len(skipped)} skipped")
+            return recorded, skipped
 
         except Exception as e:
-            print(f"Error in calculateAdministrationStatus: {e}")
-            return 'Administered'
+            print(f"Error in recordWardRound: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
+            return None
 
     @staticmethod
     def createNotification(user_id, related_table, related_id, title, message, notification_type):
@@ -171,45 +323,15 @@ class AdministrationModel:
     @staticmethod
     def writeAuditLog(admin_data):
         """
-        Writes administration record to temporary audit log file.
+        Queues an administration record for the audit log (written in the background).
         """
-        try:
-            # Create audit log directory if it doesn't exist
-            log_dir = "Logs"
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-
-            # Create log file with current date
-            log_filename = f"{log_dir}/medication_admin_{datetime.now().strftime('%Y%m%d')}.txt"
-
-            # Format log entry
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            log_entry = f"""
-{'='*80}
-MEDICATION ADMINISTRATION AUDIT LOG
-{'='*80}
-Timestamp: {timestamp}
-Prescription ID: {admin_data.get('prescription_id', 'N/A')}
-Patient: {admin_data.get('patient_name', 'N/A')}
-Medication: {admin_data.get('medication', 'N/A')}
-Dosage: {admin_data.get('dosage', 'N/A')}
-Frequency: {admin_data.get('frequency', 'N/A')}
-Administration Time: {admin_data.get('administration_time', 'N/A')}
-Patient Assessment: {admin_data.get('patient_assessment', 'N/A')}
-Adverse Reactions: {admin_data.get('adverse_reactions', 'None')}
-Status: {admin_data.get('status', 'Administered')}
-Administered By: {admin_data.get('nurse_name', 'N/A')} (ID: {admin_data.get('nurse_id', 'N/A')})
-Remarks: {admin_data.get('remarks', 'None')}
-{'='*80}
-
-"""
-            # Append to log file
-            with open(log_filename, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-
-            print(f"✓ Audit log written to {log_filename}")
-            return True
+        return AdministrationModel.writeAuditLogs([admin_data])
 
-        except Exception as e:
-            print(f"Error writing audit log: {e}")
-            return False
\ No newline at end of file
+    @staticmethod
+    def writeAuditLogs(entries):
+        """
+        Queues several administration records for the audit log.
+        """
+        queued = all([AuditLog.write("medication_administration", **entry) for entry in entries])
+        print(f"✓ {len(entries)} audit records queued")
+        return queued
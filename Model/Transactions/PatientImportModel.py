@@ -0,0 +1,240 @@
+import csv
+import time
+from datetime import date
+from Utilities.DatabaseConnection import getConnection
+from Model.Transactions.PatientModel import PatientsModel
+from Model.Search.PatientSearchIndex import PatientSearchIndex
+from Model.Cache.TableVersions import TableVersions
+
+class PatientImportModel:
+    """
+    Bulk admission import from CSV (facility onboarding, legacy migrations).
+
+    The file is streamed in chunks of CHUNK_SIZE rows. Each chunk is normalized and
+    validated with the same rules as the patient forms (PatientsModel.validatePatientData),
+    doctors/nurses are resolved from one lookup table loaded up front, and valid rows are
+    written with one executemany INSERT per chunk in their own transaction. Rows that fail
+    are collected into an error report instead of stopping the import.
+
+    Expected columns (header row required):
+        first_name, last_name, date_of_birth, sex, emergency_contact_name,
+        emergency_person_relationship, emergency_contact_number, room_number,
+        admission_date, diagnosis, doctor, nurse
+    Dates are YYYY-MM-DD; sex is Male/Female (or M/F); doctor and nurse are a full
+    name ("First Last") or license number.
+    """
+
+    CHUNK_SIZE = 1000
+
+    COLUMNS = (
+        "first_name", "last_name", "date_of_birth", "sex", "emergency_contact_name",
+        "emergency_person_relationship", "emergency_contact_number", "room_number",
+        "admission_date", "diagnosis", "doctor", "nurse"
+    )
+
+    SEX_VALUES = {"male": "Male", "m": "Male", "female": "Female", "f": "Female"}
+
+    INSERT_QUERY = """
+        INSERT INTO patients (patient_first_name, patient_last_name, date_of_birth, sex,
+                              emergency_contact_name, emergency_person_relationship, emergency_contact_number,
+                              room_number, admission_date, diagnosis, doctor_id, nurse_id, added_by, status)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'Active')
+    """
+
+    # ======================================================
+    # STAFF RESOLUTION
+    # ======================================================
+
+    @staticmethod
+    def loadStaffLookup():
+        """
+        Loads active doctors and nurses once. Returns {role: {key: user_id or None}}, where
+        keys are lower-cased full names and license numbers; None marks an ambiguous name.
+        """
+        lookup = {"Doctor": {}, "Nurse": {}}
+        try:
+            conn = getConnection()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("""
+                SELECT user_id, role, first_name, last_name, license_number
+                FROM users
+                WHERE role IN ('Doctor', 'Nurse') AND status = 'Active'
+            """)
+            for user in cursor.fetchall():
+                keys = lookup[user['role']]
+                name = f"{user['first_name']} {user['last_name']}".strip().lower()
+                keys[name] = None if name in keys else user['user_id']
+                if user.get('license_number'):
+                    keys[user['license_number'].strip().lower()] = user['user_id']
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"Error in loadStaffLookup: {e}")
+        return lookup
+
+    # ======================================================
+    # PARSING & VALIDATION
+    # ======================================================
+
+    @staticmethod
+    def _parseDate(value):
+        try:
+            return date.fromisoformat((value or "").strip())
+        except ValueError:
+            return None
+
+    @staticmethod
+    def prepareRow(row, staff):
+        """
+        Normalizes one CSV row into registerPatient fields.
+        Returns (data, error); error is None when the row can be inserted.
+        """
+        def text(column):
+            return (row.get(column) or "").strip()
+
+        data = {
+            'first_name': text('first_name'),
+            'last_name': text('last_name'),
+            'date_of_birth': PatientImportModel._parseDate(row.get('date_of_birth')),
+            'sex': PatientImportModel.SEX_VALUES.get(text('sex').lower()),
+            'emergency_contact_name': text('emergency_contact_name') or None,
+            'emergency_person_relationship': text('emergency_person_relationship'),
+            'emergency_contact_number': text('emergency_contact_number') or None,
+            'room_number': text('room_number'),
+            'admission_date': PatientImportModel._parseDate(row.get('admission_date')),
+            'diagnosis': text('diagnosis'),
+            'doctor_id': staff["Doctor"].get(text('doctor').lower()),
+            'nurse_id': staff["Nurse"].get(text('nurse').lower()),
+        }
+
+        # Import-only checks: the form widgets guarantee these, a CSV does not
+        if data['date_of_birth'] is None:
+            return data, "Invalid date_of_birth (expected YYYY-MM-DD)."
+        if data['admission_date'] is None:
+            return data, "Invalid admission_date (expected YYYY-MM-DD)."
+        if text('sex') and not data['sex']:
+            return data, "Invalid sex (expected Male or Female)."
+        if not data['emergency_person_relationship']:
+            return data, "Emergency contact relationship required."
+        if text('doctor') and not data['doctor_id']:
+            return data, f"Doctor '{text('doctor')}' not found, inactive, or ambiguous (use license number)."
+        if text('nurse') and not data['nurse_id']:
+            return data, f"Nurse '{text('nurse')}' not found, inactive, or ambiguous (use license number)."
+
+        return data, PatientsModel.validatePatientData(data)
+
+    @staticmethod
+    def _readChunks(csv_path, chunk_size):
+        """Yields lists of (line_number, row) without loading the whole file"""
+        with open(csv_path, newline="", encoding="utf-8-sig") as file:
+            reader = csv.DictReader(file)
+            missing = [c for c in PatientImportModel.COLUMNS if c not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+            chunk = []
+            for row in reader:
+                chunk.append((reader.line_num, row))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+    # ======================================================
+    # IMPORT
+    # ======================================================
+
+    @staticmethod
+    def _insertChunk(rows, added_by):
+        """Inserts one chunk in a single transaction. Returns (success, error message)."""
+        conn = None
+        try:
+            conn = getConnection()
+            cursor = conn.cursor()
+
+            # Batched inserts don't return each id; every new id is above the current maximum
+            cursor.execute("SELECT COALESCE(MAX(patient_id), 0) + 1 FROM patients")
+            first_id = cursor.fetchone()[0]
+
+            cursor.executemany(PatientImportModel.INSERT_QUERY, [
+                (d['first_name'], d['last_name'], d['date_of_birth'], d['sex'],
+                 d['emergency_contact_name'], d['emergency_person_relationship'], d['emergency_contact_number'],
+                 d['room_number'], d['admission_date'], d['diagnosis'], d['doctor_id'], d['nurse_id'],
+                 added_by)
+                for d in rows
+            ])
+            PatientSearchIndex.indexMissing(cursor, first_id)
+            TableVersions.bump(conn, "patients")
+            conn.commit()
+            cursor.close()
+            conn.close()
+            return True, None
+        except Exception as e:
+            print(f"Error in PatientImportModel._insertChunk: {e}")
+            if conn is not None:
+                try:
+                    conn.rollback()
+                    conn.close()
+                except Exception:
+                    pass
+            return False, str(e)
+
+    @staticmethod
+    def importPatients(csv_path, added_by=None, dry_run=False, chunk_size=CHUNK_SIZE):
+        """
+        Imports admissions from `csv_path`.
+
+        With dry_run, rows are parsed, validated and resolved but nothing is written,
+        which gives the pipeline's throughput without touching the database.
+
+        Returns a dict: total, imported, failed, seconds, rows_per_second, dry_run,
+        and errors (list of {'line', 'error', 'row'}).
+        """
+        started = time.perf_counter()
+        staff = PatientImportModel.loadStaffLookup()
+        total, imported, errors = 0, 0, []
+
+        for chunk in PatientImportModel._readChunks(csv_path, chunk_size):
+            total += len(chunk)
+            valid = []
+            for line, row in chunk:
+                data, error = PatientImportModel.prepareRow(row, staff)
+                if error:
+                    errors.append({'line': line, 'error': error, 'row': row})
+                else:
+                    valid.append((line, row, data))
+
+            if not valid:
+                continue
+            if dry_run:
+                imported += len(valid)
+                continue
+
+            success, message = PatientImportModel._insertChunk([d for _, _, d in valid], added_by)
+            if success:
+                imported += len(valid)
+            else:
+                errors.extend({'line': line, 'error': f"Chunk rolled back: {message}", 'row': row}
+                              for line, row, _ in valid)
+
+        seconds = time.perf_counter() - started
+        return {
+            'total': total,
+            'imported': imported,
+            'failed': len(errors),
+            'seconds': seconds,
+            'rows_per_second': total / seconds if seconds > 0 else 0.0,
+            'dry_run': dry_run,
+            'errors': sorted(errors, key=lambda e: e['line']),
+        }
+
+    @staticmethod
+    def writeErrorReport(errors, report_path):
+        """Writes failed rows as CSV: line, error, then the original columns"""
+        with open(report_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("line", "error") + PatientImportModel.COLUMNS)
+            for error in errors:
+                writer.writerow([error['line'], error['error']] +
+                                [error['row'].get(column, "") for column in PatientImportModel.COLUMNS])
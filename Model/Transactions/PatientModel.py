@@ -1,5 +1,7 @@
 from Utilities.DatabaseConnection import getConnection
 from Model.SessionManager import SessionManager
+from Model.Search.PatientSearchIndex import PatientSearchIndex
+from Model.Cache.TableVersions import TableVersions
 
 class PatientsModel:
     """
@@ -33,23 +35,28 @@ class PatientsModel:
 
     @staticmethod
     def searchPatients(query):
+        """Search by name, room number or patient ID (via patient_search_keys), best matches first"""
         try:
+            match = PatientSearchIndex.buildMatch(query)
+            if match is None:
+                return []
+            match_sql, match_params = match
+
             conn = getConnection()
             cursor = conn.cursor(dictionary=True)
-            sql = """
+            sql = f"""
                 SELECT p.patient_id, p.patient_first_name, p.patient_last_name, p.sex, p.room_number,
                        p.diagnosis, p.status, p.admission_date, p.date_of_birth,
                        p.emergency_contact_name, p.emergency_person_relationship, p.emergency_contact_number,
                        CONCAT(d.first_name, ' ', d.last_name) AS doctor_name, d.user_id AS doctor_id,
                        CONCAT(n.first_name, ' ', n.last_name) AS nurse_name, n.user_id AS nurse_id
                 FROM patients p
+                {match_sql}
                 LEFT JOIN users d ON p.doctor_id = d.user_id
                 LEFT JOIN users n ON p.nurse_id = n.user_id
-                WHERE p.patient_first_name LIKE %s OR p.patient_last_name LIKE %s OR p.room_number LIKE %s
-                ORDER BY p.admission_date DESC
+                ORDER BY s.search_rank DESC, p.admission_date DESC
             """
-            term = f"%{query}%"
-            cursor.execute(sql, (term, term, term))
+            cursor.execute(sql, match_params)
             records = cursor.fetchall()
             cursor.close()
             conn.close()
@@ -83,9 +90,32 @@ class PatientsModel:
             print(f"Error in getPatientById: {e}")
             return None
 
+    @staticmethod
+    def validatePatientData(data):
+        """
+        Validates patient fields (shared by the patient forms and the bulk importer).
+        Returns an error message, or None if the data is valid.
+        """
+        if not data['first_name'] or not data['last_name']:
+            return "First and last name required."
+        if not data['sex']:
+            return "Select sex."
+        if not data['room_number']:
+            return "Room number required."
+        if not data['diagnosis']:
+            return "Diagnosis required."
+        if not data['doctor_id']:
+            return "Select doctor."
+        if not data['nurse_id']:
+            return "Select nurse."
+        if 'status' in data and not data['status']:
+            return "Select status."
+        return None
+
     @staticmethod
     def registerPatient(**kwargs):
         """Register a new patient (no notifications for now)"""
+        conn = None
         try:
             added_by = SessionManager.getUser().get('user_id')
             conn = getConnection()
@@ -103,17 +133,24 @@ class PatientsModel:
                 added_by
             )
             cursor.execute(query, params)
-            conn.commit()
             patient_id = cursor.lastrowid
+            PatientSearchIndex.indexPatient(cursor, patient_id, kwargs['first_name'],
+                                            kwargs['last_name'], kwargs['room_number'])
+            TableVersions.bump(conn, "patients")
+            conn.commit()
             cursor.close()
             conn.close()
             return patient_id
         except Exception as e:
             print(f"Error in registerPatient: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
             return None
 
     @staticmethod
     def updatePatient(patient_id, **kwargs):
+        conn = None
         try:
             conn = getConnection()
             cursor = conn.cursor()
@@ -130,17 +167,24 @@ class PatientsModel:
                 kwargs['status'], patient_id
             )
             cursor.execute(query, params)
-            conn.commit()
             affected = cursor.rowcount
+            PatientSearchIndex.indexPatient(cursor, patient_id, kwargs['first_name'],
+                                            kwargs['last_name'], kwargs['room_number'])
+            TableVersions.bump(conn, "patients")
+            conn.commit()
             cursor.close()
             conn.close()
             return affected > 0
         except Exception as e:
             print(f"Error in updatePatient: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
             return False
 
     @staticmethod
     def getDoctorsList():
+        """Returns the active doctors for dropdowns, or None if they could not be read"""
         try:
             conn = getConnection()
             cursor = conn.cursor(dictionary=True)
@@ -155,10 +199,11 @@ class PatientsModel:
             return records
         except Exception as e:
             print(f"Error in getDoctorsList: {e}")
-            return []
+            return None
 
     @staticmethod
     def getNursesList():
+        """Returns the active nurses for dropdowns, or None if they could not be read"""
         try:
             conn = getConnection()
             cursor = conn.cursor(dictionary=True)
@@ -173,4 +218,4 @@ class PatientsModel:
             return records
         except Exception as e:
             print(f"Error in getNursesList: {e}")
-            return []
\ No newline at end of file
+            return None
\ No newline at end of file
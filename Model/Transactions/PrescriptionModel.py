@@ -1,11 +1,27 @@
 from Utilities.DatabaseConnection import getConnection
+from Utilities.StatementRegistry import Statement
 from Model.SessionManager import SessionManager
+from Model.Cache.TableVersions import TableVersions
 
 class PrescriptionModel:
     """
     Handles prescription creation and updates
     """
 
+    # A NULL parameter keeps the column's current value, so every partial update is one statement
+    UPDATE = Statement("PrescriptionModel.updatePrescription", """
+        UPDATE prescriptions
+        SET dosage = COALESCE(%s, dosage),
+            duration_start = COALESCE(%s, duration_start),
+            duration_end = COALESCE(%s, duration_end),
+            frequency = COALESCE(%s, frequency),
+            special_instructions = COALESCE(%s, special_instructions),
+            medicine_id = COALESCE(%s, medicine_id),
+            status = 'Pending Verification',
+            updated_at = NOW()
+        WHERE prescription_id = %s
+    """)
+
     @staticmethod
     def createPrescription(patient_id, medicine_id, dosage, duration_start, duration_end,
                            frequency, special_instructions=None):
@@ -46,6 +62,7 @@ class PrescriptionModel:
 
             cursor.execute(verification_query, (prescription_id,))
 
+            TableVersions.bump(conn, "prescriptions", "prescription_verification")
             conn.commit()
             cursor.close()
             conn.close()
@@ -67,49 +84,17 @@ class PrescriptionModel:
         Only provided fields are updated.
         """
         try:
-            conn = getConnection()
-            cursor = conn.cursor()
-
-            # Build dynamic SQL for non-None fields
-            fields = []
-            values = []
-
-            if dosage is not None:
-                fields.append("dosage=%s")
-                values.append(dosage)
-            if duration_start is not None:
-                fields.append("duration_start=%s")
-                values.append(duration_start)
-            if duration_end is not None:
-                fields.append("duration_end=%s")
-                values.append(duration_end)
-            if frequency is not None:
-                fields.append("frequency=%s")
-                values.append(frequency)
-            if special_instructions is not None:
-                fields.append("special_instructions=%s")
-                values.append(special_instructions)
-            if medicine_id is not None:
-                fields.append("medicine_id=%s")
-                values.append(medicine_id)
-
-            if not fields:
-                cursor.close()
-                conn.close()
+            values = (dosage, duration_start, duration_end, frequency, special_instructions, medicine_id)
+            if all(value is None for value in values):
                 return False
 
-            # Reset status to Pending Verification when updated
-            fields.append("status='Pending Verification'")
-            fields.append("updated_at=NOW()")
-
-            values.append(prescription_id)
-            query = f"UPDATE prescriptions SET {', '.join(fields)} WHERE prescription_id=%s"
-
-            cursor.execute(query, tuple(values))
+            conn = getConnection()
+            # Updating resets status to Pending Verification
+            cursor = PrescriptionModel.UPDATE.execute(conn, values + (prescription_id,))
+            TableVersions.bump(conn, "prescriptions")
             conn.commit()
 
             success = cursor.rowcount > 0
-            cursor.close()
             conn.close()
 
             print(f"✓ Prescription {prescription_id} updated")
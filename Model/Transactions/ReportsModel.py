@@ -1,302 +1,339 @@
-from Utilities.DatabaseConnection import getConnection
+from Utilities.DatabaseConnection import getConnection, readFromReplica
+from Utilities.StatementRegistry import Statement
 
 class ReportsModel:
     """
     Model for generating reports in MEDISYNC
     """
 
+    # Report statements take every filter; an unused filter is passed as NULL
+    # (see _filters), so each report is one prepared statement.
+    PRESCRIPTION_RECORDS = Statement("ReportsModel.getPrescriptionRecords", """
+        SELECT
+            pr.prescription_id AS id,
+            DATE(pr.created_at) AS date,
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
+            CONCAT(m.generic_name, ' (', m.brand_name, ')') AS medication,
+            pr.dosage,
+            pr.frequency,
+            CONCAT(u.first_name, ' ', u.last_name) AS prescribed_by,
+            pr.status
+        FROM prescriptions pr
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        JOIN users u ON pr.doctor_id = u.user_id
+        WHERE (%s IS NULL OR DATE(pr.created_at) >= %s)
+          AND (%s IS NULL OR DATE(pr.created_at) <= %s)
+          AND (%s IS NULL OR pr.patient_id = %s)
+          AND (%s IS NULL OR pr.doctor_id = %s)
+        ORDER BY pr.created_at DESC
+    """)
+    PREPARATION_RECORDS = Statement("ReportsModel.getMedicationPreparationRecords", """
+        SELECT
+            mp.preparation_id AS prep_id,
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
+            m.generic_name AS medication,
+            mp.quantity_prepared AS quantity,
+            mp.status
+        FROM medicine_preparation mp
+        JOIN prescriptions pr ON mp.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        WHERE mp.lot_number IS NOT NULL
+          AND (%s IS NULL OR DATE(pr.created_at) >= %s)
+          AND (%s IS NULL OR DATE(pr.created_at) <= %s)
+          AND (%s IS NULL OR pr.patient_id = %s)
+        ORDER BY mp.preparation_id DESC
+    """)
+    VERIFICATION_RECORDS = Statement("ReportsModel.getMedicationVerificationRecords", """
+        SELECT
+            pv.verification_id,
+            DATE(pv.verified_at) AS verified_at,
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
+            m.generic_name AS medication,
+            pv.medication_lot_number AS lot_number,
+            pv.quantity_dispensed AS qty_dispensed,
+            DATE(pv.expiry_date) AS expiry,
+            CONCAT(u.first_name, ' ', u.last_name) AS pharmacist,
+            pv.decision
+        FROM prescription_verification pv
+        JOIN prescriptions pr ON pv.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        JOIN users u ON pv.pharmacist_id = u.user_id
+        WHERE (%s IS NULL OR DATE(pv.verified_at) >= %s)
+          AND (%s IS NULL OR DATE(pv.verified_at) <= %s)
+          AND (%s IS NULL OR pr.patient_id = %s)
+        ORDER BY pv.verified_at DESC
+    """)
+    ADMINISTRATION_LOG = Statement("ReportsModel.getNurseAdministrationLog", """
+        SELECT
+            ma.administration_id AS admin_id,
+            ma.administration_time AS time,
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
+            m.generic_name AS medication,
+            pr.dosage,
+            ma.patient_assessment AS assessment,
+            ma.adverse_reactions,
+            CONCAT(u.first_name, ' ', u.last_name) AS nurse,
+            ma.status,
+            ma.remarks
+        FROM medication_administration ma
+        JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        JOIN users u ON ma.nurse_id = u.user_id
+        WHERE (%s IS NULL OR DATE(ma.administration_time) >= %s)
+          AND (%s IS NULL OR DATE(ma.administration_time) <= %s)
+          AND (%s IS NULL OR pr.patient_id = %s)
+          AND (%s IS NULL OR ma.nurse_id = %s)
+        ORDER BY ma.administration_time DESC
+    """)
+    MISSED_ADMINISTRATIONS = Statement("ReportsModel.getMissedAdministrations", """
+        SELECT
+            ma.administration_id,
+            ma.administration_time AS scheduled_time,
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
+            IFNULL(p.room_number, 'N/A') AS room,
+            m.generic_name AS medication,
+            pr.dosage,
+            CONCAT(u.first_name, ' ', u.last_name) AS nurse,
+            ma.status,
+            ma.remarks
+        FROM medication_administration ma
+        JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        JOIN users u ON ma.nurse_id = u.user_id
+        WHERE ma.status = 'Missed'
+          AND (%s IS NULL OR pr.patient_id = %s)
+          AND (%s IS NULL OR ma.nurse_id = %s)
+        ORDER BY ma.administration_time DESC
+    """)
+    CONTROLLED_ACTIVITY = Statement("ReportsModel.getControlledSubstancesActivity", """
+        SELECT
+            pr.prescription_id AS id,
+            DATE(pr.created_at) AS date,
+            m.generic_name AS medication,
+            IFNULL(m.brand_name, 'N/A') AS brand,
+            CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
+            pr.dosage,
+            pr.frequency,
+            CONCAT(d.first_name, ' ', d.last_name) AS prescribed_by,
+            IFNULL(pv.quantity_dispensed, 'Pending') AS qty_dispensed,
+            IFNULL(CONCAT(ph.first_name, ' ', ph.last_name), 'Not Verified') AS pharmacist,
+            pr.status
+        FROM prescriptions pr
+        JOIN medicines m ON pr.medicine_id = m.medicine_id
+        JOIN patients p ON pr.patient_id = p.patient_id
+        JOIN users d ON pr.doctor_id = d.user_id
+        LEFT JOIN prescription_verification pv ON pr.prescription_id = pv.prescription_id
+        LEFT JOIN users ph ON pv.pharmacist_id = ph.user_id
+        WHERE m.is_controlled = TRUE
+          AND (%s IS NULL OR DATE(pr.created_at) >= %s)
+          AND (%s IS NULL OR DATE(pr.created_at) <= %s)
+          AND (%s IS NULL OR pr.doctor_id = %s)
+        ORDER BY pr.created_at DESC
+    """)
+    ADMINISTRATION_SUMMARY = Statement("ReportsModel.getAdministrationSummary", """
+        SELECT
+            CONCAT(u.first_name, ' ', u.last_name) AS nurse,
+            SUM(r.administered_count) AS administered,
+            SUM(r.missed_count) AS missed
+        FROM daily_administration_rollup r
+        JOIN users u ON r.nurse_id = u.user_id
+        WHERE (%s IS NULL OR r.rollup_date >= %s)
+          AND (%s IS NULL OR r.rollup_date <= %s)
+          AND (%s IS NULL OR r.patient_id = %s)
+          AND (%s IS NULL OR r.nurse_id = %s)
+        GROUP BY r.nurse_id, u.first_name, u.last_name
+        ORDER BY missed DESC, administered DESC
+    """)
+    VERIFICATION_SUMMARY = Statement("ReportsModel.getVerificationSummary", """
+        SELECT
+            CONCAT(u.first_name, ' ', u.last_name) AS pharmacist,
+            SUM(r.approved_count) AS approved,
+            SUM(r.modification_count) AS modification_requested,
+            SUM(r.rejected_count) AS rejected
+        FROM daily_verification_rollup r
+        JOIN users u ON r.pharmacist_id = u.user_id
+        WHERE (%s IS NULL OR r.rollup_date >= %s)
+          AND (%s IS NULL OR r.rollup_date <= %s)
+        GROUP BY r.pharmacist_id, u.first_name, u.last_name
+        ORDER BY approved DESC
+    """)
+    CONTROLLED_DISPENSING_SUMMARY = Statement("ReportsModel.getControlledDispensingSummary", """
+        SELECT
+            m.generic_name AS medication,
+            SUM(r.dispensed_count) AS dispensed,
+            SUM(r.quantity_dispensed) AS quantity
+        FROM daily_controlled_dispensing_rollup r
+        JOIN medicines m ON r.medicine_id = m.medicine_id
+        WHERE (%s IS NULL OR r.rollup_date >= %s)
+          AND (%s IS NULL OR r.rollup_date <= %s)
+          AND (%s IS NULL OR r.doctor_id = %s)
+        GROUP BY r.medicine_id, m.generic_name
+        ORDER BY quantity DESC
+    """)
+    PATIENTS_LIST = Statement("ReportsModel.getPatientsList", """
+        SELECT
+            patient_id,
+            CONCAT(patient_first_name, ' ', patient_last_name) AS name
+        FROM patients
+        WHERE status = 'Active'
+        ORDER BY patient_first_name, patient_last_name
+    """)
+
+    # The report generators below return None when their query failed, so a failure is
+    # never mistaken for (or cached as) an empty report
+
     @staticmethod
+    def _filters(*values):
+        """Parameters for (%s IS NULL OR ... %s) filters: each value twice, unset values as NULL"""
+        params = []
+        for value in values:
+            params += [value or None] * 2
+        return params
+
+    @staticmethod
+    @readFromReplica(300)
     def getPrescriptionRecords(from_date=None, to_date=None, patient_id=None, doctor_id=None):
         """Prescription Records Report - Matches prescriptions table schema"""
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                    SELECT 
-                        pr.prescription_id AS id,
-                        DATE(pr.created_at) AS date,
-                        CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
-                        CONCAT(m.generic_name, ' (', m.brand_name, ')') AS medication,
-                        pr.dosage,
-                        pr.frequency,
-                        CONCAT(u.first_name, ' ', u.last_name) AS prescribed_by,
-                        pr.status
-                    FROM prescriptions pr
-                    JOIN patients p ON pr.patient_id = p.patient_id
-                    JOIN medicines m ON pr.medicine_id = m.medicine_id
-                    JOIN users u ON pr.doctor_id = u.user_id
-                    WHERE 1=1
-                """
-            params = []
-            if from_date:
-                query += " AND DATE(pr.created_at) >= %s"
-                params.append(from_date)
-            if to_date:
-                query += " AND DATE(pr.created_at) <= %s"
-                params.append(to_date)
-            if patient_id:
-                query += " AND pr.patient_id = %s"
-                params.append(patient_id)
-            if doctor_id:
-                query += " AND pr.doctor_id = %s"
-                params.append(doctor_id)
-            query += " ORDER BY pr.created_at DESC"
-
-            cursor.execute(query, params)
-            records = cursor.fetchall()
-            cursor.close()
+            records = ReportsModel.PRESCRIPTION_RECORDS.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date, patient_id, doctor_id), dictionary=True)
             conn.close()
             return records
         except Exception as e:
             print(f"Error getPrescriptionRecords: {e}")
-            return []
+            return None
 
     @staticmethod
+    @readFromReplica(300)
     def getMedicationPreparationRecords(from_date=None, to_date=None, patient_id=None):
         """Medication Preparation Records - Matches medicine_preparation table schema"""
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                    SELECT 
-                        mp.preparation_id AS prep_id,
-                        CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
-                        m.generic_name AS medication,
-                        mp.quantity_prepared AS quantity,
-                        mp.status
-                    FROM medicine_preparation mp
-                    JOIN prescriptions pr ON mp.prescription_id = pr.prescription_id
-                    JOIN patients p ON pr.patient_id = p.patient_id
-                    JOIN medicines m ON pr.medicine_id = m.medicine_id
-                    WHERE mp.lot_number IS NOT NULL
-                """
-            params = []
-            if from_date:
-                query += " AND DATE(pr.created_at) >= %s"
-                params.append(from_date)
-            if to_date:
-                query += " AND DATE(pr.created_at) <= %s"
-                params.append(to_date)
-            if patient_id:
-                query += " AND pr.patient_id = %s"
-                params.append(patient_id)
-            query += " ORDER BY mp.preparation_id DESC"
-
-            cursor.execute(query, params)
-            records = cursor.fetchall()
-            cursor.close()
+            records = ReportsModel.PREPARATION_RECORDS.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date, patient_id), dictionary=True)
             conn.close()
             return records
         except Exception as e:
             print(f"Error getMedicationPreparationRecords: {e}")
-            return []
+            return None
 
     @staticmethod
+    @readFromReplica(300)
     def getMedicationVerificationRecords(from_date=None, to_date=None, patient_id=None):
         """Medication Verification Records - Matches prescription_verification table schema"""
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                    SELECT 
-                        pv.verification_id,
-                        DATE(pv.verified_at) AS verified_at,
-                        CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
-                        m.generic_name AS medication,
-                        pv.medication_lot_number AS lot_number,
-                        pv.quantity_dispensed AS qty_dispensed,
-                        DATE(pv.expiry_date) AS expiry,
-                        CONCAT(u.first_name, ' ', u.last_name) AS pharmacist,
-                        pv.decision
-                    FROM prescription_verification pv
-                    JOIN prescriptions pr ON pv.prescription_id = pr.prescription_id
-                    JOIN patients p ON pr.patient_id = p.patient_id
-                    JOIN medicines m ON pr.medicine_id = m.medicine_id
-                    JOIN users u ON pv.pharmacist_id = u.user_id
-                    WHERE 1=1
-                """
-            params = []
-            if from_date:
-                query += " AND DATE(pv.verified_at) >= %s"
-                params.append(from_date)
-            if to_date:
-                query += " AND DATE(pv.verified_at) <= %s"
-                params.append(to_date)
-            if patient_id:
-                query += " AND pr.patient_id = %s"
-                params.append(patient_id)
-            query += " ORDER BY pv.verified_at DESC"
-
-            cursor.execute(query, params)
-            records = cursor.fetchall()
-            cursor.close()
+            records = ReportsModel.VERIFICATION_RECORDS.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date, patient_id), dictionary=True)
             conn.close()
             return records
         except Exception as e:
             print(f"Error getMedicationVerificationRecords: {e}")
-            return []
+            return None
 
     @staticmethod
+    @readFromReplica(300)
     def getNurseAdministrationLog(from_date=None, to_date=None, patient_id=None, nurse_id=None):
         """Nurse Administration Log - Matches medication_administration table schema"""
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                    SELECT 
-                        ma.administration_id AS admin_id,
-                        ma.administration_time AS time,
-                        CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
-                        m.generic_name AS medication,
-                        pr.dosage,
-                        ma.patient_assessment AS assessment,
-                        ma.adverse_reactions,
-                        CONCAT(u.first_name, ' ', u.last_name) AS nurse,
-                        ma.status,
-                        ma.remarks
-                    FROM medication_administration ma
-                    JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
-                    JOIN patients p ON pr.patient_id = p.patient_id
-                    JOIN medicines m ON pr.medicine_id = m.medicine_id
-                    JOIN users u ON ma.nurse_id = u.user_id
-                    WHERE 1=1
-                """
-            params = []
-            if from_date:
-                query += " AND DATE(ma.administration_time) >= %s"
-                params.append(from_date)
-            if to_date:
-                query += " AND DATE(ma.administration_time) <= %s"
-                params.append(to_date)
-            if patient_id:
-                query += " AND pr.patient_id = %s"
-                params.append(patient_id)
-            if nurse_id:
-                query += " AND ma.nurse_id = %s"
-                params.append(nurse_id)
-            query += " ORDER BY ma.administration_time DESC"
-
-            cursor.execute(query, params)
-            records = cursor.fetchall()
-            cursor.close()
+            records = ReportsModel.ADMINISTRATION_LOG.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date, patient_id, nurse_id), dictionary=True)
             conn.close()
             return records
         except Exception as e:
             print(f"Error getNurseAdministrationLog: {e}")
-            return []
+            return None
 
     @staticmethod
+    @readFromReplica(300)
     def getMissedAdministrations(patient_id=None, nurse_id=None):
         """Retrieves all medication administrations marked as 'Missed'"""
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-
-            query = """
-                SELECT 
-                    ma.administration_id,
-                    ma.administration_time AS scheduled_time,
-                    CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
-                    IFNULL(p.room_number, 'N/A') AS room,
-                    m.generic_name AS medication,
-                    pr.dosage,
-                    CONCAT(u.first_name, ' ', u.last_name) AS nurse,
-                    ma.status,
-                    ma.remarks
-                FROM medication_administration ma
-                JOIN prescriptions pr ON ma.prescription_id = pr.prescription_id
-                JOIN patients p ON pr.patient_id = p.patient_id
-                JOIN medicines m ON pr.medicine_id = m.medicine_id
-                JOIN users u ON ma.nurse_id = u.user_id
-                WHERE ma.status = 'Missed'
-            """
-            params = []
+            records = ReportsModel.MISSED_ADMINISTRATIONS.fetchAll(
+                conn, ReportsModel._filters(patient_id, nurse_id), dictionary=True)
+            conn.close()
+            return records
+        except Exception as e:
+            print(f"Error in getMissedAdministrations: {e}")
+            return None
 
-            if patient_id:
-                query += " AND pr.patient_id = %s"
-                params.append(patient_id)
-            if nurse_id:
-                query += " AND ma.nurse_id = %s"
-                params.append(nurse_id)
+    @staticmethod
+    @readFromReplica(300)
+    def getControlledSubstancesActivity(from_date=None, to_date=None, doctor_id=None):
+        """Controlled Substances Activity - Prescriptions with is_controlled = TRUE"""
+        try:
+            conn = getConnection()
+            records = ReportsModel.CONTROLLED_ACTIVITY.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date, doctor_id), dictionary=True)
+            conn.close()
+            return records
+        except Exception as e:
+            print(f"Error getControlledSubstancesActivity: {e}")
+            return None
 
-            query += " ORDER BY ma.administration_time DESC"
+    # ======================================================
+    # ROLLUP SUMMARIES (read from the daily_*_rollup tables)
+    # ======================================================
 
-            cursor.execute(query, params)
-            records = cursor.fetchall()
-            cursor.close()
+    @staticmethod
+    @readFromReplica(300)
+    def getAdministrationSummary(from_date=None, to_date=None, patient_id=None, nurse_id=None):
+        """Administered/missed totals per nurse for a date range, from daily_administration_rollup"""
+        try:
+            conn = getConnection()
+            records = ReportsModel.ADMINISTRATION_SUMMARY.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date, patient_id, nurse_id), dictionary=True)
             conn.close()
             return records
         except Exception as e:
-            print(f"Error in getMissedAdministrations: {e}")
+            print(f"Error getAdministrationSummary: {e}")
             return []
 
     @staticmethod
-    def getControlledSubstancesActivity(from_date=None, to_date=None, doctor_id=None):
-        """Controlled Substances Activity - Prescriptions with is_controlled = TRUE"""
+    @readFromReplica(300)
+    def getVerificationSummary(from_date=None, to_date=None):
+        """Verification decisions per pharmacist for a date range, from daily_verification_rollup"""
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                    SELECT 
-                        pr.prescription_id AS id,
-                        DATE(pr.created_at) AS date,
-                        m.generic_name AS medication,
-                        IFNULL(m.brand_name, 'N/A') AS brand,
-                        CONCAT(p.patient_first_name, ' ', p.patient_last_name) AS patient,
-                        pr.dosage,
-                        pr.frequency,
-                        CONCAT(d.first_name, ' ', d.last_name) AS prescribed_by,
-                        IFNULL(pv.quantity_dispensed, 'Pending') AS qty_dispensed,
-                        IFNULL(CONCAT(ph.first_name, ' ', ph.last_name), 'Not Verified') AS pharmacist,
-                        pr.status
-                    FROM prescriptions pr
-                    JOIN medicines m ON pr.medicine_id = m.medicine_id
-                    JOIN patients p ON pr.patient_id = p.patient_id
-                    JOIN users d ON pr.doctor_id = d.user_id
-                    LEFT JOIN prescription_verification pv ON pr.prescription_id = pv.prescription_id
-                    LEFT JOIN users ph ON pv.pharmacist_id = ph.user_id
-                    WHERE m.is_controlled = TRUE
-                """
-            params = []
-            if from_date:
-                query += " AND DATE(pr.created_at) >= %s"
-                params.append(from_date)
-            if to_date:
-                query += " AND DATE(pr.created_at) <= %s"
-                params.append(to_date)
-            if doctor_id:
-                query += " AND pr.doctor_id = %s"
-                params.append(doctor_id)
-            query += " ORDER BY pr.created_at DESC"
+            records = ReportsModel.VERIFICATION_SUMMARY.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date), dictionary=True)
+            conn.close()
+            return records
+        except Exception as e:
+            print(f"Error getVerificationSummary: {e}")
+            return []
 
-            cursor.execute(query, params)
-            records = cursor.fetchall()
-            cursor.close()
+    @staticmethod
+    @readFromReplica(300)
+    def getControlledDispensingSummary(from_date=None, to_date=None, doctor_id=None):
+        """Controlled substance dispensing totals per medication, from daily_controlled_dispensing_rollup"""
+        try:
+            conn = getConnection()
+            records = ReportsModel.CONTROLLED_DISPENSING_SUMMARY.fetchAll(
+                conn, ReportsModel._filters(from_date, to_date, doctor_id), dictionary=True)
             conn.close()
             return records
         except Exception as e:
-            print(f"Error getControlledSubstancesActivity: {e}")
+            print(f"Error getControlledDispensingSummary: {e}")
             return []
 
     @staticmethod
+    @readFromReplica(300)
     def getPatientsList():
-        """Returns list of active patients for dropdowns"""
+        """Returns list of active patients for dropdowns, or None if it could not be read"""
         try:
             conn = getConnection()
-            cursor = conn.cursor(dictionary=True)
-            query = """
-                SELECT 
-                    patient_id, 
-                    CONCAT(patient_first_name, ' ', patient_last_name) AS name
-                FROM patients
-                WHERE status = 'Active'
-                ORDER BY patient_first_name, patient_last_name
-            """
-            cursor.execute(query)
-            records = cursor.fetchall()
-            cursor.close()
+            records = ReportsModel.PATIENTS_LIST.fetchAll(conn, dictionary=True)
             conn.close()
             return records
         except Exception as e:
             print(f"Error in getPatientsList: {e}")
-            return []
\ No newline at end of file
+            return None
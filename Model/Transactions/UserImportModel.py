@@ -0,0 +1,225 @@
+import csv
+import json
+import os
+import time
+from Utilities.DatabaseConnection import getConnection
+from Model.Transactions.UserModel import UserModel
+from Model.Cache.TableVersions import TableVersions
+
+class UserImportModel:
+    """
+    Batch staff provisioning from a roster file (CSV with a header row, or a JSON list of objects).
+
+    All rows are validated with UserModel.validateUserData, then every username in the
+    roster is checked for conflicts with one set query per chunk (instead of one
+    usernameExists round trip per user). Valid rows are inserted with one executemany per
+    chunk, and their welcome notifications with one INSERT ... SELECT, in the same transaction.
+
+    Fields: username, password, first_name, last_name, email, contact, role, license_number
+    """
+
+    CHUNK_SIZE = 500
+
+    COLUMNS = ("username", "password", "first_name", "last_name", "email", "contact", "role", "license_number")
+    REQUIRED_COLUMNS = ("username", "password", "first_name", "last_name", "email", "role")
+
+    ROLES = {"doctor": "Doctor", "nurse": "Nurse", "pharmacist": "Pharmacist", "admin": "Admin"}
+
+    INSERT_QUERY = """
+        INSERT INTO users (username, password, first_name, last_name, email_address,
+                           contact_number, role, license_number, status)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Active')
+    """
+
+    # ======================================================
+    # READING
+    # ======================================================
+
+    @staticmethod
+    def readRoster(path):
+        """Returns a list of (line or position, row dict) from a CSV or JSON roster"""
+        if os.path.splitext(path)[1].lower() == ".json":
+            with open(path, encoding="utf-8") as file:
+                records = json.load(file)
+            if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+                raise ValueError("JSON roster must be a list of objects")
+            rows = [(index, record) for index, record in enumerate(records, start=1)]
+            fields = set().union(*(record.keys() for record in records)) if records else set()
+        else:
+            with open(path, newline="", encoding="utf-8-sig") as file:
+                reader = csv.DictReader(file)
+                rows = [(reader.line_num, row) for row in reader]
+                fields = set(reader.fieldnames or [])
+
+        missing = [c for c in UserImportModel.REQUIRED_COLUMNS if rows and c not in fields]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        return rows
+
+    # ======================================================
+    # VALIDATION
+    # ======================================================
+
+    @staticmethod
+    def prepareRow(row):
+        """Normalizes one roster row into addUser fields. Returns (data, error)."""
+        def text(column):
+            value = row.get(column)
+            return "" if value is None else str(value).strip()
+
+        data = {
+            'username': text('username'),
+            'password': "" if row.get('password') is None else str(row['password']),
+            'first_name': text('first_name'),
+            'last_name': text('last_name'),
+            'email': text('email'),
+            'contact': text('contact') or None,
+            'role': UserImportModel.ROLES.get(text('role').lower()),
+            'license_number': text('license_number') or None,
+        }
+
+        if text('role') and not data['role']:
+            return data, f"Invalid role '{text('role')}' (expected Doctor, Nurse, Pharmacist or Admin)."
+        return data, UserModel.validateUserData(data, is_new=True)
+
+    @staticmethod
+    def existingUsernames(usernames, chunk_size=CHUNK_SIZE):
+        """
+        Returns the subset of `usernames` already present in users, using one
+        IN (...) query per chunk. Raises on database errors so an import never
+        proceeds with an unchecked roster.
+        """
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return set()
+
+        conn = getConnection()
+        cursor = conn.cursor()
+        existing = set()
+        try:
+            for start in range(0, len(usernames), chunk_size):
+                chunk = usernames[start:start + chunk_size]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(f"SELECT username FROM users WHERE username IN ({placeholders})", chunk)
+                existing.update(username.lower() for (username,) in cursor.fetchall())
+        finally:
+            cursor.close()
+            conn.close()
+        return existing
+
+    # ======================================================
+    # IMPORT
+    # ======================================================
+
+    @staticmethod
+    def _insertChunk(rows):
+        """Inserts one chunk of users plus their welcome notifications in one transaction"""
+        conn = None
+        try:
+            conn = getConnection()
+            cursor = conn.cursor()
+            cursor.executemany(UserImportModel.INSERT_QUERY, [
+                (d['username'], d['password'], d['first_name'], d['last_name'], d['email'],
+                 d['contact'], d['role'], d['license_number'])
+                for d in rows
+            ])
+
+            placeholders = ", ".join(["%s"] * len(rows))
+            cursor.execute(f"""
+                INSERT INTO notifications (user_id, related_table, related_id, title, message, type)
+                SELECT user_id, 'users', user_id, 'Welcome to MEDISYNC!',
+                       CONCAT('Hello ', TRIM(CONCAT(first_name, ' ', last_name)),
+                              ', your account has been created successfully. ',
+                              'You can now log in with username: ', username, '.'),
+                       'Info'
+                FROM users
+                WHERE username IN ({placeholders})
+            """, [d['username'] for d in rows])
+
+            TableVersions.bump(conn, "users")
+            conn.commit()
+            cursor.close()
+            conn.close()
+            return True, None
+        except Exception as e:
+            print(f"Error in UserImportModel._insertChunk: {e}")
+            if conn is not None:
+                try:
+                    conn.rollback()
+                    conn.close()
+                except Exception:
+                    pass
+            return False, str(e)
+
+    @staticmethod
+    def importUsers(path, dry_run=False, chunk_size=CHUNK_SIZE):
+        """
+        Provisions every valid user in the roster at `path`.
+
+        Rows fail on validation errors, duplicate usernames within the roster, or
+        usernames that already exist. With dry_run nothing is written (the conflict
+        check still runs).
+
+        Returns a dict: total, imported, failed, seconds, rows_per_second, dry_run,
+        and errors (list of {'line', 'error', 'row'}).
+        """
+        started = time.perf_counter()
+        rows = UserImportModel.readRoster(path)
+        errors, valid, seen = [], [], set()
+
+        for line, row in rows:
+            data, error = UserImportModel.prepareRow(row)
+            if not error:
+                key = data['username'].lower()
+                if key in seen:
+                    error = f"Duplicate username '{data['username']}' in roster."
+                seen.add(key)
+            if error:
+                errors.append({'line': line, 'error': error, 'row': row})
+            else:
+                valid.append((line, row, data))
+
+        # Usernames are compared case-insensitively, as the default MySQL collation does
+        existing = UserImportModel.existingUsernames([d['username'] for _, _, d in valid], chunk_size)
+        pending = []
+        for line, row, data in valid:
+            if data['username'].lower() in existing:
+                errors.append({'line': line, 'error': "Username already exists", 'row': row})
+            else:
+                pending.append((line, row, data))
+
+        imported = 0
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            if dry_run:
+                imported += len(chunk)
+                continue
+
+            success, message = UserImportModel._insertChunk([d for _, _, d in chunk])
+            if success:
+                imported += len(chunk)
+            else:
+                errors.extend({'line': line, 'error': f"Chunk rolled back: {message}", 'row': row}
+                              for line, row, _ in chunk)
+
+        seconds = time.perf_counter() - started
+        return {
+            'total': len(rows),
+            'imported': imported,
+            'failed': len(errors),
+            'seconds': seconds,
+            'rows_per_second': len(rows) / seconds if seconds > 0 else 0.0,
+            'dry_run': dry_run,
+            'errors': sorted(errors, key=lambda e: e['line']),
+        }
+
+    @staticmethod
+    def writeErrorReport(errors, report_path):
+        """Writes failed rows as CSV: line, error, then the roster fields (passwords omitted)"""
+        columns = tuple(c for c in UserImportModel.COLUMNS if c != "password")
+        with open(report_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("line", "error") + columns)
+            for error in errors:
+                writer.writerow([error['line'], error['error']] +
+                                [error['row'].get(column, "") for column in columns])
@@ -1,4 +1,6 @@
 from Utilities.DatabaseConnection import getConnection
+from Model.Cache.TableVersions import TableVersions
+import re
 
 class UserModel:
     """
@@ -68,8 +70,42 @@ class UserModel:
             print(f"Error in getUserById: {e}")
             return None
 
+    @staticmethod
+    def validateUserData(data, is_new=True):
+        """
+        Validates user fields (shared by the Add/Edit user forms and the bulk importer).
+        Returns an error message, or None if the data is valid.
+        """
+        if not data['username']:
+            return "Username is required."
+        if len(data['username']) < 3:
+            return "Username must be at least 3 characters long."
+        if not data['first_name'] or not data['last_name']:
+            return "First name and last name are required."
+        if not data['email']:
+            return "Email address is required."
+        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', data['email']):
+            return "Please enter a valid email address."
+        if not data['role']:
+            return "Please select a user role."
+        if data['contact'] and not re.match(r'^[\d\s\-]+$', data['contact']):
+            return "Contact number contains invalid characters."
+        if is_new:
+            if not data['password']:
+                return "Password is required for new users."
+            if len(data['password']) < 6:
+                return "Password must be at least 6 characters long."
+        else:
+            if data['password'] and len(data['password']) < 6:
+                return "New password must be at least 6 characters long."
+        if not is_new and not data.get('status'):
+            return "Please select user status (Active/Inactive)."
+
+        return None
+
     @staticmethod
     def addUser(username, password, first_name, last_name, email, contact, role, license_number):
+        conn = None
         try:
             if UserModel.usernameExists(username):
                 return False, "Username already exists", None
@@ -81,6 +117,7 @@ class UserModel:
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Active')
             """
             cursor.execute(query, (username, password, first_name, last_name, email, contact, role, license_number))
+            TableVersions.bump(conn, "users")
             conn.commit()
             user_id = cursor.lastrowid
             cursor.close()
@@ -88,10 +125,14 @@ class UserModel:
             return True, "User added successfully", user_id
         except Exception as e:
             print(f"Error in addUser: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
             return False, f"Error adding user: {str(e)}", None
 
     @staticmethod
     def updateUser(user_id, username, first_name, last_name, email, contact, role, license_number, status, password=None):
+        conn = None
         try:
             existing = UserModel.getUserByUsername(username)
             if existing and existing['user_id'] != user_id:
@@ -113,6 +154,7 @@ class UserModel:
                 """
                 params = (username, first_name, last_name, email, contact, role, license_number, status, user_id)
             cursor.execute(query, params)
+            TableVersions.bump(conn, "users")
             conn.commit()
             affected = cursor.rowcount
             cursor.close()
@@ -120,6 +162,9 @@ class UserModel:
             return (True, "User updated") if affected > 0 else (False, "User not found")
         except Exception as e:
             print(f"Error in updateUser: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
             return False, f"Error updating: {str(e)}"
 
     @staticmethod
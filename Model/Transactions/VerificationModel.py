@@ -1,10 +1,19 @@
 from Utilities.DatabaseConnection import getConnection
+from Model.Rollups.DailyRollups import DailyRollups
+from Model.Cache.TableVersions import TableVersions
 
 class VerificationModel:
     """
     Handles prescription verification transactions
     """
 
+    # decision -> (new prescription status, notification status text, notification type)
+    DECISIONS = {
+        "Approve": ("Active", "Approved", "Info"),
+        "Request Modification": ("Modification Requested", "Modification Requested", "Attention"),
+        "Reject": ("Rejected", "Rejected", "Urgent")
+    }
+
     @staticmethod
     def getPendingPrescriptions():
         """Returns all prescriptions pending verification"""
@@ -127,13 +136,7 @@ class VerificationModel:
             cursor = conn.cursor()
 
             # Map decision to prescription status
-            status_map = {
-                "Approve": "Active",
-                "Request Modification": "Modification Requested",
-                "Reject": "Rejected"
-            }
-
-            new_prescription_status = status_map.get(decision)
+            new_prescription_status = VerificationModel.DECISIONS.get(decision, (None,))[0]
             if not new_prescription_status:
                 print(f"Invalid decision: {decision}")
                 return False
@@ -186,6 +189,10 @@ class VerificationModel:
                     cursor.execute(insert_prep_query, (prescription_id, quantity, lot_number))
                     print(f"✓ Medicine preparation record created for prescription {prescription_id}")
 
+            # Keep today's verification and controlled dispensing rollups in step
+            DailyRollups.recordVerification(cursor, prescription_id, pharmacist_id, decision, quantity)
+            TableVersions.bump(conn, "prescription_verification", "prescriptions", "medicine_preparation")
+
             conn.commit()
             cursor.close()
             conn.close()
@@ -199,6 +206,124 @@ class VerificationModel:
                 conn.rollback()
             return False
 
+    @staticmethod
+    def verifyPrescriptions(prescription_ids, pharmacist_id, decision, lot_number,
+                            quantity, expiry_date, reason=None, verified_by=""):
+        """
+        Applies one decision to many prescriptions in a single transaction: one locking
+        read, executemany verification updates, one status update, one bulk
+        medicine_preparation insert (approvals), batched rollups and bulk doctor notifications.
+        Prescriptions no longer pending (e.g. verified meanwhile by someone else) are skipped.
+
+        Returns (verified_ids, skipped_ids), or None if the transaction failed.
+        """
+        conn = None
+        try:
+            decision_info = VerificationModel.DECISIONS.get(decision)
+            if not decision_info:
+                print(f"Invalid decision: {decision}")
+                return None
+            new_prescription_status, status_text, notification_type = decision_info
+
+            requested = [int(pid) for pid in dict.fromkeys(prescription_ids)]
+            if not requested:
+                return [], []
+
+            conn = getConnection()
+            cursor = conn.cursor(dictionary=True)
+            placeholders = ", ".join(["%s"] * len(requested))
+
+            # Lock the still-pending rows so concurrent verifications can't double-process them
+            cursor.execute(f"""
+                SELECT
+                    pr.prescription_id,
+                    pr.doctor_id,
+                    p.patient_first_name,
+                    p.patient_last_name,
+                    m.brand_name,
+                    m.generic_name
+                FROM prescriptions pr
+                JOIN patients p ON pr.patient_id = p.patient_id
+                JOIN medicines m ON pr.medicine_id = m.medicine_id
+                WHERE pr.prescription_id IN ({placeholders})
+                  AND pr.status = 'Pending Verification'
+                FOR UPDATE
+            """, requested)
+            rows = cursor.fetchall()
+
+            verified = [row['prescription_id'] for row in rows]
+            verified_set = set(verified)
+            skipped = [pid for pid in requested if pid not in verified_set]
+            if not verified:
+                conn.rollback()
+                cursor.close()
+                conn.close()
+                return [], skipped
+
+            cursor.executemany("""
+                UPDATE prescription_verification
+                SET pharmacist_id = %s,
+                    medication_lot_number = %s,
+                    quantity_dispensed = %s,
+                    expiry_date = %s,
+                    decision = %s,
+                    reason = %s,
+                    verified_at = NOW()
+                WHERE prescription_id = %s
+            """, [(pharmacist_id, lot_number, quantity, expiry_date, decision, reason, pid) for pid in verified])
+
+            verified_placeholders = ", ".join(["%s"] * len(verified))
+            cursor.execute(f"""
+                UPDATE prescriptions
+                SET status = %s, updated_at = NOW()
+                WHERE prescription_id IN ({verified_placeholders})
+            """, (new_prescription_status, *verified))
+
+            if decision == "Approve":
+                cursor.execute(f"""
+                    INSERT INTO medicine_preparation
+                    (prescription_id, quantity_prepared, lot_number, status)
+                    SELECT pr.prescription_id, %s, %s, 'To be Prepared'
+                    FROM prescriptions pr
+                    WHERE pr.prescription_id IN ({verified_placeholders})
+                      AND NOT EXISTS (
+                          SELECT 1 FROM medicine_preparation mp
+                          WHERE mp.prescription_id = pr.prescription_id
+                      )
+                """, (quantity, lot_number, *verified))
+
+            DailyRollups.recordVerifications(cursor, verified, pharmacist_id, decision, quantity)
+
+            notifications = [
+                (row['doctor_id'], 'prescription_verification', row['prescription_id'],
+                 f"Prescription {status_text}",
+                 f"Prescription for {row['patient_first_name']} {row['patient_last_name']} - "
+                 f"{row['brand_name']} ({row['generic_name']}) has been {status_text.lower()} by {verified_by}",
+                 notification_type)
+                for row in rows if row['doctor_id']
+            ]
+            if notifications:
+                cursor.executemany("""
+                    INSERT INTO notifications
+                    (user_id, related_table, related_id, title, message, type)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                """, notifications)
+
+            TableVersions.bump(conn, "prescription_verification", "prescriptions", "medicine_preparation")
+            conn.commit()
+            cursor.close()
+            conn.close()
+
+            print(f"✓ {len(verified)} prescriptions verified: {decision} → Status: {new_prescription_status}")
+            return verified, skipped
+
+        except Exception as e:
+            print(f"Error in verifyPrescriptions: {e}")
+            if conn:
+                conn.rollback()
+                conn.close()
+            return None
+
     @staticmethod
     def createNotification(user_id, related_table, related_id, title, message, notification_type):
         """Creates a notification record"""
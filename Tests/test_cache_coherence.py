@@ -0,0 +1,134 @@
+"""
+Cached datasets must never be stored under table versions newer than their rows.
+
+A lagging read replica is simulated with two SQLite files: the "primary" holds a write
+the "replica" has not received yet. ConnectionPool.acquire and ReplicaRouter.connect
+are pointed at them, so @readFromReplica methods really read the stale copy.
+
+    python -m unittest discover -s Tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from Utilities.DatabaseConfig import DatabaseConfig
+from Utilities.SQLiteBackend import SQLiteBackend
+from Utilities.ConnectionPool import ConnectionPool
+from Utilities.ReplicaRouter import ReplicaRouter
+from Model.Cache.TableVersions import TableVersions
+from Model.Cache.ReportCache import ReportCache
+from Model.Cache.ReferenceDataCache import ReferenceDataCache
+from Model.Transactions.ReportsModel import ReportsModel
+from Model.Transactions.UserModel import UserModel
+
+
+class LaggingReplicaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.primary = os.path.join(self.directory, "primary.db")
+        self.replica = os.path.join(self.directory, "replica.db")
+
+        for path in (self.primary, self.replica):
+            self._seed(path)
+        self._addPatient(self.primary, "Ben")     # not replicated yet
+
+        environment = mock.patch.dict(os.environ, {"MEDISYNC_DB_BACKEND": "mysql",
+                                                   "MEDISYNC_DB_REPLICAS": "replica1"})
+        environment.start()
+        self.addCleanup(environment.stop)
+        DatabaseConfig.reload()
+        self.addCleanup(DatabaseConfig.reload)
+
+        for patcher in (
+            mock.patch.object(ConnectionPool, "acquire", lambda *args: SQLiteBackend.connect(self.primary)),
+            mock.patch.object(ReplicaRouter, "connect", lambda max_lag: SQLiteBackend.connect(self.replica)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        ReportCache.clear()
+        ReferenceDataCache.invalidate()
+        self.addCleanup(ReportCache.clear)
+        self.addCleanup(ReferenceDataCache.invalidate)
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    @staticmethod
+    def _seed(path):
+        conn = SQLiteBackend.connect(path)
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO users (user_id, first_name, last_name, role, username, password, status)
+            VALUES (1, 'Dana', 'Cruz', 'Doctor', 'dcruz', 'x', 'Active')
+        """)
+        conn.commit()
+        conn.close()
+        LaggingReplicaTest._addPatient(path, "Ana")
+
+    @staticmethod
+    def _addPatient(path, first_name):
+        conn = SQLiteBackend.connect(path)
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO patients (patient_first_name, patient_last_name, date_of_birth, sex,
+                                  emergency_person_relationship, admission_date, doctor_id, nurse_id,
+                                  added_by, status)
+            VALUES (%s, 'Reyes', '1970-01-01', 'Female', 'Spouse', '2026-01-01 08:00:00', 1, 1, 1, 'Active')
+        """, (first_name,))
+        TableVersions.bump(conn, "patients")
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _names(rows):
+        return sorted(row["name"] for row in rows)
+
+    def test_replica_lags(self):
+        """The setup really serves @readFromReplica methods from the stale copy"""
+        self.assertEqual(self._names(ReportsModel.getPatientsList()), ["Ana Reyes"])
+
+    def test_report_cache_loads_from_primary(self):
+        key = ReportCache.makeKey("Prescription Records", None, None, None, None, None)
+        rows = ReportCache.getReport(key, ReportsModel.getPatientsList)
+        self.assertEqual(self._names(rows), ["Ana Reyes", "Ben Reyes"])
+
+        # Served from the cache while nothing changes
+        self.assertEqual(self._names(ReportCache.getReport(key, lambda: [])), ["Ana Reyes", "Ben Reyes"])
+
+    def test_failed_report_is_not_cached(self):
+        key = ReportCache.makeKey("Prescription Records", None, None, None, None, None)
+        self.assertIsNone(ReportCache.getReport(key, lambda: None))
+
+        rows = ReportCache.getReport(key, ReportsModel.getPatientsList)
+        self.assertEqual(self._names(rows), ["Ana Reyes", "Ben Reyes"])
+
+    def test_reference_lists_load_from_primary(self):
+        self.assertEqual(self._names(ReferenceDataCache.getPatients()), ["Ana Reyes", "Ben Reyes"])
+
+    def test_failed_reference_load_is_not_cached(self):
+        with mock.patch.dict(ReferenceDataCache.LISTS, {"patients": ("patients", lambda: None)}):
+            self.assertEqual(ReferenceDataCache.getPatients(), [])
+        # Nothing changed in patients, yet the next call queries again instead of serving []
+        self.assertEqual(self._names(ReferenceDataCache.getPatients()), ["Ana Reyes", "Ben Reyes"])
+
+    def test_failed_bump_rolls_back_write(self):
+        """A write whose versions cannot move must not commit (caches would never see it)"""
+        conn = SQLiteBackend.connect(self.primary)
+        conn.cursor().execute("DROP TABLE table_versions")
+        conn.commit()
+        conn.close()
+
+        success, _ = UserModel.updateUser(1, "dcruz", "Dana", "Santos", None, None, "Doctor", None, "Active")
+        self.assertFalse(success)
+
+        conn = SQLiteBackend.connect(self.primary)
+        cursor = conn.cursor()
+        cursor.execute("SELECT last_name FROM users WHERE user_id = 1")
+        self.assertEqual(cursor.fetchone()[0], "Cruz")
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
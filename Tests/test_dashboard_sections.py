@@ -0,0 +1,72 @@
+"""
+Returning to a dashboard re-queries only the sections whose source tables changed.
+
+    python -m unittest discover -s Tests
+"""
+import unittest
+from unittest import mock
+
+from Model.Cache.TableVersions import TableVersions
+from Model.Cache.DashboardSections import DashboardSections
+
+
+class DashboardSectionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.versions = {table: 1 for table in TableVersions.TABLES}
+        patcher = mock.patch.object(TableVersions, "getVersions",
+                                    lambda tables: tuple(self.versions[table] for table in tables))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.rows = {"patients": 3, "prescriptions": 5, "missed": 0}
+        self.calls = []
+        self.sections = DashboardSections({
+            "patients": (lambda: self._load("patients"), ("patients",)),
+            "prescriptions": (lambda: self._load("prescriptions"), ("prescriptions", "medicines")),
+            "missed": (lambda: self._load("missed"), None),
+        })
+
+    def _load(self, name):
+        self.calls.append(name)
+        return self.rows[name]
+
+    def test_first_refresh_requeries_everything(self):
+        self.sections.load()
+        self.calls.clear()
+        self.assertEqual(self.sections.refresh(), {})
+        self.assertEqual(sorted(self.calls), ["missed", "patients", "prescriptions"])
+
+    def test_unchanged_tables_are_not_requeried(self):
+        self.sections.load()
+        self.sections.refresh()
+        self.calls.clear()
+
+        self.assertEqual(self.sections.refresh(), {})
+        self.assertEqual(self.calls, ["missed"])
+
+    def test_only_changed_sections_are_returned(self):
+        self.sections.load()
+        self.sections.refresh()
+        self.calls.clear()
+
+        self.versions["medicines"] += 1
+        self.rows["prescriptions"] = 6
+        self.rows["patients"] = 4       # not bumped: still served as loaded
+
+        self.assertEqual(self.sections.refresh(), {"prescriptions": 6})
+        self.assertEqual(sorted(self.calls), ["missed", "prescriptions"])
+        self.assertEqual(self.sections.data["patients"], 3)
+
+    def test_unreadable_versions_requery_everything(self):
+        self.sections.load()
+        self.sections.refresh()
+        self.calls.clear()
+
+        with mock.patch.object(TableVersions, "getVersions", lambda tables: None):
+            self.sections.refresh()
+        self.assertEqual(sorted(self.calls), ["missed", "patients", "prescriptions"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+A ward round records each patient's own assessment and reactions, and only the doses
+that are still due when it is saved.
+
+    python -m unittest discover -s Tests
+"""
+import unittest
+
+from test_write_rollback import ClinicalDatabaseTest
+from Model.Tables.NurseTables import NurseTables
+from Model.Transactions.AdministrationModel import AdministrationModel
+
+
+class WardRoundTest(ClinicalDatabaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._execute(
+            """INSERT INTO patients (patient_id, patient_first_name, patient_last_name, date_of_birth, sex,
+                                     emergency_person_relationship, admission_date, doctor_id, nurse_id,
+                                     added_by, status)
+               VALUES (2, 'Ben', 'Tan', '1980-01-01', 'Male', 'Sibling', '2026-01-01 08:00:00', 1, 2, 1, 'Active')""",
+            """INSERT INTO prescriptions (prescription_id, patient_id, doctor_id, medicine_id, dosage,
+                                          duration_start, duration_end, frequency, status)
+               VALUES (2, 2, 1, 1, '2 tabs', '2026-01-01', '2099-12-31', 'Once a day', 'Active')""",
+            """INSERT INTO medicine_preparation (prescription_id, quantity_prepared, status)
+               VALUES (2, 1, 'Prepared')""",
+        )
+        self.doses = {dose['prescription_id']: dose for dose in NurseTables.getDueDoses()}
+        self.assertEqual(sorted(self.doses), [1, 2])
+
+    def _round(self, assessments):
+        doses = [dict(self.doses[pid], patient_assessment=assessment, adverse_reactions=reactions)
+                 for pid, (assessment, reactions) in assessments.items()]
+        return AdministrationModel.recordWardRound(doses, "09:00:00", nurse_name="Noel Lim")
+
+    def _charted(self):
+        """prescription_id -> (assessment, reactions) charted for it"""
+        return {pid: (
+            self._value(f"SELECT patient_assessment FROM medication_administration WHERE prescription_id = {pid}"),
+            self._value(f"SELECT adverse_reactions FROM medication_administration WHERE prescription_id = {pid}"),
+        ) for pid in (1, 2)}
+
+    def test_each_dose_keeps_its_own_assessment(self):
+        recorded, skipped = self._round({1: ("Drowsy", "Rash"), 2: ("Active", "None")})
+
+        self.assertEqual(sorted(pid for pid, _ in recorded), [1, 2])
+        self.assertEqual(skipped, [])
+        self.assertEqual(self._charted(), {1: ("Drowsy", "Rash"), 2: ("Active", "None")})
+
+    def test_dose_administered_meanwhile_is_skipped(self):
+        # Recorded from the single-dose screen after the round was loaded
+        self.assertTrue(AdministrationModel.recordMedicationAdministration(1, "08:55:00", "Active", "None"))
+
+        recorded, skipped = self._round({1: ("Drowsy", "None"), 2: ("Active", "None")})
+
+        self.assertEqual([pid for pid, _ in recorded], [2])
+        self.assertEqual(skipped, [1])
+        self.assertEqual(self._value("SELECT COUNT(*) FROM medication_administration WHERE prescription_id = 1"), 1)
+
+    def test_missing_assessment_records_nothing(self):
+        self.assertIsNone(self._round({1: ("Drowsy", "None"), 2: (None, "None")}))
+        self.assertEqual(self._value("SELECT COUNT(*) FROM medication_administration"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
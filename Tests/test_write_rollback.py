@@ -0,0 +1,109 @@
+"""
+Bookkeeping written alongside a clinical record (daily rollups, search keys, table versions) commits
+or rolls back with it: when it fails, the record is not written either.
+
+    python -m unittest discover -s Tests
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from Utilities.DatabaseConfig import DatabaseConfig
+from Utilities.SQLiteBackend import SQLiteBackend
+from Model.SessionManager import SessionManager
+from Model.Transactions.AdministrationModel import AdministrationModel
+from Model.Transactions.PatientModel import PatientsModel
+
+
+class ClinicalDatabaseTest(unittest.TestCase):
+    """A SQLite database with one doctor, one nurse (logged in) and one prepared dose due"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "medisync.db")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+        environment = mock.patch.dict(os.environ, {"MEDISYNC_DB_BACKEND": "sqlite",
+                                                   "MEDISYNC_SQLITE_PATH": self.path})
+        environment.start()
+        self.addCleanup(environment.stop)
+        DatabaseConfig.reload()
+        self.addCleanup(DatabaseConfig.reload)
+
+        self._execute(
+            """INSERT INTO users (user_id, first_name, last_name, role, username, password, status)
+               VALUES (1, 'Dana', 'Cruz', 'Doctor', 'dcruz', 'x', 'Active'),
+                      (2, 'Noel', 'Lim', 'Nurse', 'nlim', 'x', 'Active')""",
+            """INSERT INTO patients (patient_id, patient_first_name, patient_last_name, date_of_birth, sex,
+                                     emergency_person_relationship, admission_date, doctor_id, nurse_id,
+                                     added_by, status)
+               VALUES (1, 'Ana', 'Reyes', '1970-01-01', 'Female', 'Spouse', '2026-01-01 08:00:00', 1, 2, 1, 'Active')""",
+            """INSERT INTO medicines (medicine_id, generic_name, brand_name, formulation, strength)
+               VALUES (1, 'Paracetamol', 'Biogesic', 'Tablet', '500 mg')""",
+            """INSERT INTO prescriptions (prescription_id, patient_id, doctor_id, medicine_id, dosage,
+                                          duration_start, duration_end, frequency, status)
+               VALUES (1, 1, 1, 1, '1 tab', '2026-01-01', '2099-12-31', 'Once a day', 'Active')""",
+            """INSERT INTO medicine_preparation (prescription_id, quantity_prepared, status)
+               VALUES (1, 1, 'Prepared')""",
+        )
+
+        SessionManager.setUser({"user_id": 2, "first_name": "Noel", "last_name": "Lim", "role": "Nurse"})
+        self.addCleanup(SessionManager.clear)
+
+    def _execute(self, *statements):
+        conn = SQLiteBackend.connect(self.path)
+        cursor = conn.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        conn.commit()
+        conn.close()
+
+    def _value(self, query):
+        conn = SQLiteBackend.connect(self.path)
+        cursor = conn.cursor()
+        cursor.execute(query)
+        value = cursor.fetchone()[0]
+        conn.close()
+        return value
+
+
+class WriteRollbackTest(ClinicalDatabaseTest):
+
+    def _administer(self):
+        return AdministrationModel.recordMedicationAdministration(1, "09:00:00", "Stable", "None")
+
+    def test_administration_commits_with_its_rollup(self):
+        self.assertTrue(self._administer())
+        self.assertEqual(self._value("SELECT COUNT(*) FROM medication_administration"), 1)
+        self.assertEqual(self._value("SELECT administered_count FROM daily_administration_rollup"), 1)
+
+    def test_failed_rollup_rolls_administration_back(self):
+        self._execute("DROP TABLE daily_administration_rollup")
+
+        self.assertFalse(self._administer())
+        self.assertEqual(self._value("SELECT COUNT(*) FROM medication_administration"), 0)
+        self.assertEqual(self._value("SELECT status FROM medicine_preparation"), "Prepared")
+
+    def test_failed_reindex_rolls_patient_update_back(self):
+        self._execute(
+            "INSERT INTO patient_search_keys (token, patient_id, kind) VALUES ('reyes', 1, 'name')",
+            # The old keys are deleted, then inserting the new ones fails
+            """CREATE TRIGGER reject_search_keys BEFORE INSERT ON patient_search_keys
+               BEGIN SELECT RAISE(ABORT, 'search keys unavailable'); END""",
+        )
+
+        updated = PatientsModel.updatePatient(
+            1, first_name="Ana", last_name="Santos", date_of_birth="1970-01-01", sex="Female",
+            emergency_contact_name=None, emergency_person_relationship="Spouse", emergency_contact_number=None,
+            room_number=None, admission_date="2026-01-01 08:00:00", diagnosis=None, doctor_id=1, nurse_id=2,
+            status="Active"
+        )
+        self.assertFalse(updated)
+        self.assertEqual(self._value("SELECT patient_last_name FROM patients"), "Reyes")
+        self.assertEqual(self._value("SELECT COUNT(*) FROM patient_search_keys WHERE patient_id = 1"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
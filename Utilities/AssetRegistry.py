@@ -0,0 +1,141 @@
+import os
+from functools import lru_cache
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QGuiApplication, QPixmap, QPixmapCache
+
+class AssetRegistry:
+    """
+    Process-wide registry for decoded images and generated stylesheets.
+
+    Every window is rebuilt on navigation, and each rebuild used to read and decode the
+    same PNGs from ImageResources. Pixmaps are now decoded once (optionally pre-scaled to
+    the size they are displayed at) and kept in QPixmapCache; stylesheet strings that
+    Designer builds from parameters are cached as well.
+    """
+
+    IMAGE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ImageResources")
+
+    # Large enough to hold every image in ImageResources at its display sizes (KB)
+    CACHE_LIMIT_KB = 64 * 1024
+
+    # Sizes the shared Designer assets are always displayed at: menu icons (createMenuOption /
+    # createClickedOption, 20x20), KPI icons (createKPI, 60x60) and the window background
+    DISPLAY_SIZES = {
+        "Icon1BGRemoved.png": [(20, 20), (60, 60)],
+        "Icon2BGRemoved.png": [(60, 60)],
+        "Icon3BGRemoved.png": [(60, 60)],
+        "Icon4BGRemoved.png": [(20, 20)],
+        "Icon5BGRemoved.png": [(20, 20), (60, 60)],
+        "Icon6BGRemoved.png": [(20, 20)],
+        "Icon7BGRemoved.png": [(20, 20), (60, 60)],
+        "Icon8BGRemoved.png": [(20, 20)],
+        "Icon10BGRemoved.png": [(60, 60)],
+        "Icon12BGRemoved.png": [(20, 20)],
+        "Icon13BGRemoved.png": [(60, 60)],
+        "Icon14BGRemoved.png": [(20, 20), (60, 60)],
+        "MEDISYNCBackground.png": [(1500, 800)],
+    }
+
+    _configured = False
+
+    # -----------------------------------------------------------
+    # IMAGES
+    # -----------------------------------------------------------
+
+    @staticmethod
+    def resolvePath(imageFilePath):
+        """
+        Returns an absolute path for an image. Paths written relative to the
+        'Main Application' folder (../ImageResources/...) are resolved against the
+        project's ImageResources directory when they don't exist from the current directory.
+        """
+        if os.path.exists(imageFilePath):
+            return os.path.abspath(imageFilePath)
+        candidate = os.path.join(AssetRegistry.IMAGE_DIRECTORY, os.path.basename(imageFilePath))
+        return candidate if os.path.exists(candidate) else imageFilePath
+
+    @classmethod
+    def _configure(cls):
+        if not cls._configured:
+            QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), cls.CACHE_LIMIT_KB))
+            cls._configured = True
+
+    @classmethod
+    def getPixmap(cls, imageFilePath, width=None, height=None):
+        """
+        Returns the decoded pixmap for an image, scaled to (width, height) when given.
+        Decoding and scaling happen once per path and size; later calls hit QPixmapCache.
+        A null QPixmap is returned if the file cannot be loaded.
+        """
+        cls._configure()
+        path = cls.resolvePath(imageFilePath)
+        key = f"{path}@{width}x{height}" if width and height else path
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        if width and height:
+            pixmap = cls.getPixmap(path)
+            if not pixmap.isNull():
+                # Scale for the screen's pixel density so HiDPI displays stay sharp
+                screen = QGuiApplication.primaryScreen()
+                ratio = screen.devicePixelRatio() if screen else 1.0
+                pixmap = pixmap.scaled(int(width * ratio), int(height * ratio),
+                                       Qt.AspectRatioMode.IgnoreAspectRatio,
+                                       Qt.TransformationMode.SmoothTransformation)
+                pixmap.setDevicePixelRatio(ratio)
+        else:
+            pixmap = QPixmap(path)
+
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @classmethod
+    def preload(cls, sizes=None):
+        """
+        Decodes every PNG in ImageResources up front (call once after QApplication exists).
+
+        Parameters:
+            sizes (dict): Optional {file name: [(width, height), ...]} of display sizes to pre-scale.
+        """
+        sizes = sizes or cls.DISPLAY_SIZES
+        try:
+            for fileName in os.listdir(cls.IMAGE_DIRECTORY):
+                if not fileName.lower().endswith(".png"):
+                    continue
+                path = os.path.join(cls.IMAGE_DIRECTORY, fileName)
+                cls.getPixmap(path)
+                for width, height in sizes.get(fileName, ()):
+                    cls.getPixmap(path, width, height)
+        except Exception as e:
+            print(f"Asset preload failed: {e}")
+
+    # -----------------------------------------------------------
+    # STYLESHEETS
+    # -----------------------------------------------------------
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def labelStyle(color, fontWeight, fontSize):
+        """Stylesheet for Designer.createLabel"""
+        return f"""
+            QLabel {{
+                color: {color};
+                font-weight: {fontWeight};
+                font-family: 'Lato';
+                font-size: {fontSize}px;
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def menuFrameStyle(backgroundColor):
+        """Stylesheet for a menu option frame in a given state color"""
+        return f"""
+            QFrame {{
+                background-color: {backgroundColor};
+                border-radius: 20px;
+            }}
+        """
@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from Utilities.DatabaseConfig import DatabaseConfig
+
+class ConcurrentLoader:
+    """
+    Runs independent read-only model calls at the same time, each on its own pooled
+    connection, so loading a dashboard takes as long as its slowest query instead of
+    the sum of all of them.
+
+    mysql.connector releases the GIL while it waits on the server, so a few worker
+    threads over ConnectionPool overlap the round trips as well as an async driver would.
+    Workers are capped at pool_size (DatabaseConfig) so every query gets an idle pooled
+    connection. The functions must not touch widgets.
+
+    Usage:
+        results = ConcurrentLoader.run({
+            'activeUsers': lambda: self._safeKPI(AdminKPIs.activeUsersCount),
+            'todaysActivity': lambda: self._safeTable(AdminTables.getTodaysActivitySummary),
+        })
+    """
+
+    _lock = threading.Lock()
+    _executor = None
+
+    @classmethod
+    def run(cls, tasks, onLoaded=None):
+        """
+        Calls every function in `tasks` (name -> function) concurrently and returns
+        {name: result}. `onLoaded(name, result)` is called on the calling thread as each
+        one finishes. An exception raised by a function is re-raised here.
+        """
+        executor = cls._getExecutor()
+        if executor is None or len(tasks) < 2:
+            results = {}
+            for name, function in tasks.items():
+                results[name] = function()
+                if onLoaded:
+                    onLoaded(name, results[name])
+            return results
+
+        futures = {executor.submit(function): name for name, function in tasks.items()}
+        results = {}
+        for future in as_completed(futures):
+            name = futures[future]
+            results[name] = future.result()
+            if onLoaded:
+                onLoaded(name, results[name])
+        return {name: results[name] for name in tasks}
+
+    @classmethod
+    def _getExecutor(cls):
+        """The shared worker pool, or None when pooling is off (pool_size 0)"""
+        with cls._lock:
+            if cls._executor is None:
+                workers = DatabaseConfig.get()["pool_size"]
+                if workers < 1:
+                    return None
+                cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="MediSyncLoader")
+            return cls._executor
@@ -0,0 +1,122 @@
+import atexit
+import threading
+import time
+from Utilities.DatabaseConfig import DatabaseConfig
+
+class PooledConnection:
+    """
+    A MySQL connection lent out by ConnectionPool. close() gives it back to the pool
+    instead of disconnecting, so the statements prepared on it (see
+    Utilities/StatementRegistry.py) stay allocated for the next borrower.
+    """
+
+    def __init__(self, raw, key):
+        self._raw = raw
+        self.key = key              # (host, port)
+        self.prepared = {}          # statement name -> prepared cursor holding its handle
+        self.idleSince = None
+        self.lent = True
+
+    def preparedCursor(self, statement):
+        """The cursor `statement` is prepared on for this connection (prepared on first use)"""
+        cursor = self.prepared.get(statement.name)
+        if cursor is None:
+            cursor = self.prepared[statement.name] = self._raw.cursor(prepared=True)
+        return cursor
+
+    def rollback(self):
+        # Error handlers may roll back after close(); by then the pool has rolled the
+        # connection back itself and may have lent it to someone else
+        if self.lent:
+            self._raw.rollback()
+
+    def close(self):
+        if self.lent:
+            self.lent = False
+            ConnectionPool.release(self)
+
+    def disconnect(self):
+        """Closes the server connection (and with it its prepared statements)"""
+        self.prepared.clear()
+        try:
+            self._raw.close()
+        except Exception:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class ConnectionPool:
+    """
+    Idle MySQL connections kept per host, up to pool_size each (DatabaseConfig).
+
+    A returned connection is rolled back first: that ends the read snapshot a SELECT
+    opened (autocommit is off), discards anything its borrower left uncommitted, and
+    weeds out connections that broke while lent. Connections idle for longer than
+    pool_idle_timeout are closed instead of reused.
+    """
+
+    _lock = threading.Lock()
+    _idle = {}   # (host, port) -> [PooledConnection], most recently returned last
+
+    @classmethod
+    def acquire(cls, host=None, port=None):
+        """Returns a pooled connection to the primary (or the given host)"""
+        settings = DatabaseConfig.get()
+        arguments = DatabaseConfig.connectArguments(host, port)
+        key = (arguments["host"], arguments["port"])
+
+        now = time.monotonic()
+        pooled, stale = None, []
+        with cls._lock:
+            idle = cls._idle.get(key, [])
+            while idle and pooled is None:
+                candidate = idle.pop()
+                if now - candidate.idleSince < settings["pool_idle_timeout"]:
+                    candidate.lent = True
+                    pooled = candidate
+                else:
+                    stale.append(candidate)
+        for connection in stale:
+            connection.disconnect()
+        if pooled is not None:
+            return pooled
+
+        import mysql.connector
+        return PooledConnection(mysql.connector.connect(**arguments), key)
+
+    @classmethod
+    def release(cls, pooled):
+        try:
+            pooled._raw.rollback()
+        except Exception:
+            pooled.disconnect()
+            return
+
+        with cls._lock:
+            idle = cls._idle.setdefault(pooled.key, [])
+            if len(idle) < DatabaseConfig.get()["pool_size"]:
+                pooled.idleSince = time.monotonic()
+                idle.append(pooled)
+                return
+        pooled.disconnect()
+
+    @classmethod
+    def closeAll(cls):
+        """Disconnects every idle connection"""
+        with cls._lock:
+            connections = [pooled for idle in cls._idle.values() for pooled in idle]
+            cls._idle.clear()
+        for pooled in connections:
+            pooled.disconnect()
+
+    @classmethod
+    def status(cls):
+        """Idle connections and prepared statements per host (for diagnostics)"""
+        with cls._lock:
+            return {f"{host}:{port}": {"idle": len(idle), "prepared": sum(len(p.prepared) for p in idle)}
+                    for (host, port), idle in cls._idle.items()}
+
+
+atexit.register(ConnectionPool.closeAll)
@@ -0,0 +1,131 @@
+import configparser
+import os
+
+class DatabaseConfig:
+    """
+    Database connection settings, read once per process.
+
+    Settings come from database.ini in the project root (or the file named by
+    MEDISYNC_DB_CONFIG); environment variables override single values:
+
+        MEDISYNC_DB_BACKEND       mysql | sqlite
+        MEDISYNC_DB_HOST, MEDISYNC_DB_PORT, MEDISYNC_DB_USER, MEDISYNC_DB_PASSWORD,
+        MEDISYNC_DB_NAME, MEDISYNC_DB_CONNECT_TIMEOUT
+        MEDISYNC_DB_POOL_SIZE     idle connections kept per host (0 disables pooling)
+        MEDISYNC_DB_REPLICAS      comma-separated host[:port] list of read replicas
+        MEDISYNC_SQLITE_PATH      SQLite database file (":memory:" by default)
+
+    See database.example.ini for the file format.
+    """
+
+    CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "database.ini")
+
+    DEFAULTS = {
+        "backend": "mysql",
+        "host": "localhost",
+        "port": 3306,
+        "user": "root",
+        "password": "",
+        "database": "projectmedisync_luntayao",
+        "connect_timeout": 10,
+        "pool_size": 5,
+        "pool_idle_timeout": 300.0,   # seconds an idle pooled connection may be reused
+        "replicas": [],
+        "lag_check_interval": 5.0,    # seconds a replica's measured lag is trusted
+        "failure_cooldown": 30.0,     # seconds a replica that failed to connect is skipped
+        "sqlite_path": ":memory:",
+    }
+
+    # setting -> environment variable
+    ENVIRONMENT = {
+        "backend": "MEDISYNC_DB_BACKEND",
+        "host": "MEDISYNC_DB_HOST",
+        "port": "MEDISYNC_DB_PORT",
+        "user": "MEDISYNC_DB_USER",
+        "password": "MEDISYNC_DB_PASSWORD",
+        "database": "MEDISYNC_DB_NAME",
+        "connect_timeout": "MEDISYNC_DB_CONNECT_TIMEOUT",
+        "pool_size": "MEDISYNC_DB_POOL_SIZE",
+        "replicas": "MEDISYNC_DB_REPLICAS",
+        "sqlite_path": "MEDISYNC_SQLITE_PATH",
+    }
+
+    _settings = None
+
+    @classmethod
+    def get(cls):
+        """Returns the settings dict (loaded on first use)"""
+        if cls._settings is None:
+            cls._settings = cls.load()
+        return cls._settings
+
+    @classmethod
+    def reload(cls):
+        cls._settings = None
+        return cls.get()
+
+    @classmethod
+    def load(cls, path=None):
+        """Reads the config file (if present) and applies environment overrides"""
+        settings = dict(cls.DEFAULTS)
+        path = path or os.environ.get("MEDISYNC_DB_CONFIG", cls.CONFIG_PATH)
+
+        parser = configparser.ConfigParser()
+        if os.path.exists(path):
+            try:
+                parser.read(path, encoding="utf-8")
+            except configparser.Error as e:
+                print(f"Error reading database config {path}: {e}")
+
+        if parser.has_section("database"):
+            for key in ("backend", "host", "port", "user", "password", "database", "connect_timeout",
+                        "pool_size", "pool_idle_timeout"):
+                if parser.has_option("database", key):
+                    settings[key] = parser.get("database", key)
+        if parser.has_section("replicas"):
+            for key in ("hosts", "lag_check_interval", "failure_cooldown"):
+                if parser.has_option("replicas", key):
+                    settings["replicas" if key == "hosts" else key] = parser.get("replicas", key)
+        if parser.has_option("sqlite", "path"):
+            settings["sqlite_path"] = parser.get("sqlite", "path")
+
+        for key, variable in cls.ENVIRONMENT.items():
+            if os.environ.get(variable) is not None:
+                settings[key] = os.environ[variable]
+
+        settings["backend"] = str(settings["backend"]).strip().lower()
+        settings["port"] = int(settings["port"])
+        settings["connect_timeout"] = int(settings["connect_timeout"])
+        settings["pool_size"] = int(settings["pool_size"])
+        settings["pool_idle_timeout"] = float(settings["pool_idle_timeout"])
+        settings["lag_check_interval"] = float(settings["lag_check_interval"])
+        settings["failure_cooldown"] = float(settings["failure_cooldown"])
+        settings["replicas"] = cls.parseHosts(settings["replicas"], settings["port"])
+        return settings
+
+    @staticmethod
+    def parseHosts(value, default_port):
+        """'db1:3307, db2' -> [('db1', 3307), ('db2', default_port)]"""
+        if isinstance(value, list):
+            return value
+        hosts = []
+        for entry in str(value or "").split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            host, _, port = entry.partition(":")
+            hosts.append((host.strip(), int(port) if port.strip() else default_port))
+        return hosts
+
+    @classmethod
+    def connectArguments(cls, host=None, port=None):
+        """mysql.connector.connect() keyword arguments for the primary (or the given host)"""
+        settings = cls.get()
+        return {
+            "host": host or settings["host"],
+            "port": port or settings["port"],
+            "user": settings["user"],
+            "password": settings["password"],
+            "database": settings["database"],
+            "connection_timeout": settings["connect_timeout"],
+        }
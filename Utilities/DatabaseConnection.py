@@ -1,12 +1,77 @@
-import mysql.connector
+import contextlib
+import functools
+import threading
+from Utilities.DatabaseConfig import DatabaseConfig
+from Utilities.QueryInstrumentation import instrumentConnection
+from Utilities.UnitOfWork import UnitOfWork
+
+# Connection settings (host, credentials, backend, replicas) come from DatabaseConfig:
+# database.ini in the project root plus MEDISYNC_DB_* environment overrides.
+# Backend "mysql" (default) or "sqlite" (local stand-in, see Utilities/SQLiteBackend.py).
+
+_routing = threading.local()
+
+def readFromReplica(max_lag):
+    """
+    Marks a read-only model method as safe to serve from a read replica that is at most
+    `max_lag` seconds behind the primary. Connections opened while it runs go to a replica
+    (see Utilities/ReplicaRouter.py), or to the primary when none qualifies.
+    Nested calls keep the strictest tolerance. Place it below @staticmethod.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            previous = getattr(_routing, "max_lag", None)
+            _routing.max_lag = max_lag if previous is None else min(previous, max_lag)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _routing.max_lag = previous
+        wrapper.replica_max_lag = max_lag
+        return wrapper
+    return decorator
+
+@contextlib.contextmanager
+def onPrimary():
+    """
+    Sends every connection opened inside the block to the primary, even from
+    @readFromReplica methods. Caches use it to load data that must be at least as new
+    as the TableVersions they read from the primary just before.
+    """
+    previous = getattr(_routing, "primary", False)
+    _routing.primary = True
+    try:
+        yield
+    finally:
+        _routing.primary = previous
 
 def getConnection():
     """
-    Returns a new connection to the database.
+    Returns a connection to the database: the open UnitOfWork's connection when there is
+    one (see Utilities/UnitOfWork.py), a read replica inside a @readFromReplica method
+    (when replicas are configured and outside onPrimary()), the primary otherwise. MySQL
+    connections come from ConnectionPool; close() hands them back.
+    Statements run on it are timed by QueryStats (see Utilities/QueryInstrumentation.py).
     """
-    return mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="",
-        database="projectmedisync_luntayao"
-    )
\ No newline at end of file
+    unit = UnitOfWork.current()
+    if unit is not None:
+        return unit.proxy()
+
+    settings = DatabaseConfig.get()
+    max_lag = getattr(_routing, "max_lag", None)
+    if max_lag is not None and settings["replicas"] and settings["backend"] != "sqlite" \
+            and not getattr(_routing, "primary", False):
+        from Utilities.ReplicaRouter import ReplicaRouter
+        connection = ReplicaRouter.connect(max_lag)
+        if connection is not None:
+            return instrumentConnection(lambda: connection)
+    return getPrimaryConnection()
+
+def getPrimaryConnection():
+    """Returns a connection to the primary database, ignoring replicas and any open UnitOfWork"""
+    if DatabaseConfig.get()["backend"] == "sqlite":
+        from Utilities.SQLiteBackend import SQLiteBackend
+        return instrumentConnection(SQLiteBackend.connect)
+
+    from Utilities.ConnectionPool import ConnectionPool
+    return instrumentConnection(ConnectionPool.acquire)
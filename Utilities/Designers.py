@@ -1,10 +1,11 @@
 from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, QPoint, Qt, QDate
-from PyQt6.QtGui import QFont, QPixmap, QColor
+from PyQt6.QtGui import QFont, QColor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton,
     QFrame, QGraphicsDropShadowEffect, QVBoxLayout, QTableWidget,
     QHeaderView, QComboBox, QDateEdit, QTextEdit, QPlainTextEdit, QTableWidgetItem, QAbstractItemView
 )
+from Utilities.AssetRegistry import AssetRegistry
 class Designer:
     """
     The Designer class provides reusable UI builder utilities
@@ -55,15 +56,8 @@ class Designer:
         """
         label = QLabel(text) if parent == "N/A" else QLabel(text, parent)
 
-        # Apply styling using CSS
-        label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-weight: {fontWeight};
-                font-family: 'Lato';
-                font-size: {fontSize}px;
-            }}
-        """)
+        # Apply styling using CSS (cached per color/weight/size)
+        label.setStyleSheet(AssetRegistry.labelStyle(color, fontWeight, fontSize))
 
         # Apply fallback QFont to ensure 'Lato' loads
         label.setFont(QFont("Lato", fontSize))
@@ -319,14 +313,17 @@ class Designer:
     # -----------------------------------------------------------
 
     @staticmethod
-    def setImage(parent, imageFilePath):
+    def setImage(parent, imageFilePath, width=None, height=None):
         """
         Loads an image into a QLabel. The image automatically scales
-        to fit its geometry.
+        to fit its geometry. Images come from the shared AssetRegistry,
+        so each file is only read and decoded once per process.
 
         Parameters:
             parent (QWidget): Parent widget.
             imageFilePath (str): Path to the PNG/JPG file.
+            width (int): Display width, to pre-scale the cached image (optional).
+            height (int): Display height, to pre-scale the cached image (optional).
 
         Returns:
             QLabel: The image container.
@@ -334,7 +331,7 @@ class Designer:
         image = QLabel(parent)
         image.setScaledContents(True)
 
-        pixmap = QPixmap(imageFilePath)
+        pixmap = AssetRegistry.getPixmap(imageFilePath, width, height)
         if pixmap.isNull():
             print(f"IMAGE FAILED TO LOAD: {imageFilePath}")
         else:
@@ -354,7 +351,7 @@ class Designer:
         Returns:
             QLabel: The background image widget.
         """
-        background = Designer.setImage(parent, "../ImageResources/MEDISYNCBackground.png")
+        background = Designer.setImage(parent, "../ImageResources/MEDISYNCBackground.png", 1500, 800)
         background.setGeometry(0, 0, 1500, 800)
         return background
 
@@ -387,17 +384,12 @@ class Designer:
             QFrame: Styled clickable menu option.
         """
         frame = QFrame(parent)
-        frame.setStyleSheet("""
-            QFrame {
-                background-color: #0cc0df;  /* Base active color */
-                border-radius: 20px;
-            }
-        """)
+        frame.setStyleSheet(AssetRegistry.menuFrameStyle("#0cc0df"))  # Base active color
         frame.resize(width, 40)
 
         # Add label and icon
         Designer.createLabel(name, frame, "#185777", 700, 14).setGeometry(60, 10, 90, 20)
-        Designer.setImage(frame, imageFilePath).setGeometry(25, 10, 20, 20)
+        Designer.setImage(frame, imageFilePath, 20, 20).setGeometry(25, 10, 20, 20)
 
         return frame
 
@@ -420,55 +412,30 @@ class Designer:
         hoverColor = "#a3e2f5"
         pressedColor = "#8dd9ed"
 
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {baseColor};
-                border-radius: 20px;
-            }}
-        """)
+        frame.setStyleSheet(AssetRegistry.menuFrameStyle(baseColor))
         frame.resize(width, 40)
 
         # Add label and icon
         Designer.createLabel(name, frame, "#185777", 700, 14).setGeometry(60, 10, 90, 20)
-        Designer.setImage(frame, imageFilePath).setGeometry(25, 10, 20, 20)
+        Designer.setImage(frame, imageFilePath, 20, 20).setGeometry(25, 10, 20, 20)
 
         # -----------------------
         # Hover / Click Events
         # -----------------------
         def enterEvent(event):
-            frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {hoverColor};
-                    border-radius: 20px;
-                }}
-            """)
+            frame.setStyleSheet(AssetRegistry.menuFrameStyle(hoverColor))
             super(QFrame, frame).enterEvent(event)
 
         def leaveEvent(event):
-            frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {baseColor};
-                    border-radius: 20px;
-                }}
-            """)
+            frame.setStyleSheet(AssetRegistry.menuFrameStyle(baseColor))
             super(QFrame, frame).leaveEvent(event)
 
         def mousePressEvent(event):
-            frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {pressedColor};
-                    border-radius: 20px;
-                }}
-            """)
+            frame.setStyleSheet(AssetRegistry.menuFrameStyle(pressedColor))
             super(QFrame, frame).mousePressEvent(event)
 
         def mouseReleaseEvent(event):
-            frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {hoverColor};
-                    border-radius: 20px;
-                }}
-            """)
+            frame.setStyleSheet(AssetRegistry.menuFrameStyle(hoverColor))
             super(QFrame, frame).mouseReleaseEvent(event)
 
         # Assign events safely
@@ -514,10 +481,11 @@ class Designer:
         frame.setGraphicsEffect(baseShadow)
 
         # KPI Icon
-        Designer.setImage(frame, iconPath).setGeometry(40, 50, 60, 60)
+        Designer.setImage(frame, iconPath, 60, 60).setGeometry(40, 50, 60, 60)
 
-        # KPI Number
-        Designer.createLabel(numberText, frame, "#1a1a1a", 700, 35).setGeometry(130, 60, 100, 50)
+        # KPI Number (kept on the card so the value can be updated in place)
+        frame.numberLabel = Designer.createLabel(numberText, frame, "#1a1a1a", 700, 35)
+        frame.numberLabel.setGeometry(130, 60, 100, 50)
 
         # KPI Description
         Designer.createLabel(labelText, frame, "#333333", 400, 16).setGeometry(50, 125, 180, 40)
@@ -618,27 +586,34 @@ class Designer:
         layout.addWidget(table)
 
         # Populate table
-        if data:
-            table.setRowCount(len(data))
+        Designer.populateTable(table, columnNames, columnMap, data)
 
-            for rowIndex, row in enumerate(data):
-                for colIndex, colName in enumerate(columnNames):
+        return table, card
 
-                    if columnMap and colName in columnMap:
-                        mapper = columnMap[colName]
+    @staticmethod
+    def populateTable(table, columnNames, columnMap=None, data=None):
+        """
+        Fills a table created by createTableCard with `data` (list of row dicts),
+        replacing any rows it had. columnMap maps column names to row keys or callables.
+        """
+        table.setRowCount(len(data) if data else 0)
 
-                        if callable(mapper):
-                            value = str(mapper(row))
-                        else:
-                            value = str(row.get(mapper, ""))
-                    else:
-                        # Try direct column name
-                        value = str(row.get(colName, ""))
+        for rowIndex, row in enumerate(data or []):
+            for colIndex, colName in enumerate(columnNames):
 
-                    item = QTableWidgetItem(value)
-                    table.setItem(rowIndex, colIndex, item)
+                if columnMap and colName in columnMap:
+                    mapper = columnMap[colName]
 
-        return table, card
+                    if callable(mapper):
+                        value = str(mapper(row))
+                    else:
+                        value = str(row.get(mapper, ""))
+                else:
+                    # Try direct column name
+                    value = str(row.get(colName, ""))
+
+                item = QTableWidgetItem(value)
+                table.setItem(rowIndex, colIndex, item)
 
     @staticmethod
     def createStandardTable(columnNames):
@@ -0,0 +1,43 @@
+import importlib
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported the first time one of its
+    attributes is used. Keeps heavy, rarely-needed modules (matplotlib, role
+    controllers) off the login screen's startup path.
+    """
+
+    def __init__(self, moduleName: str):
+        self._moduleName = moduleName
+        self._module = None
+
+    def load(self):
+        """Imports the module (once) and returns it"""
+        if self._module is None:
+            self._module = importlib.import_module(self._moduleName)
+        return self._module
+
+    def isLoaded(self):
+        return self._module is not None
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._moduleName} ({state})>"
+
+
+def lazyImport(moduleName: str) -> LazyModule:
+    """
+    Returns a deferred module reference, e.g.
+
+        plt = lazyImport("matplotlib.pyplot")   # nothing imported yet
+        plt.figure(...)                          # imported here, on first use
+    """
+    return LazyModule(moduleName)
+
+
+def importAttribute(moduleName: str, attributeName: str):
+    """Imports `moduleName` now and returns one attribute from it (e.g. a controller class)"""
+    return getattr(importlib.import_module(moduleName), attributeName)
@@ -0,0 +1,168 @@
+import time
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+class _SearchSignals(QObject):
+    finished = pyqtSignal(int, str, list)
+    failed = pyqtSignal(int, str)
+
+
+class _SearchWorker(QRunnable):
+    """Runs one search query on the thread pool"""
+
+    def __init__(self, generation, query, fetch):
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.fetch = fetch
+        self.signals = _SearchSignals()
+
+    def run(self):
+        try:
+            rows = self.fetch(self.query) or []
+            self.signals.finished.emit(self.generation, self.query, list(rows))
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+
+
+class LiveSearch(QObject):
+    """
+    Type-ahead search for a QLineEdit.
+
+    Keystrokes are debounced; the query then runs on a worker thread so the GUI never
+    blocks on MySQL. Each dispatch gets a generation number and only the newest one's
+    results are shown: queued searches that were superseded are cancelled, and results
+    from ones already running are dropped when they arrive.
+
+    When `fields` is given and the query extends the last query that came back from
+    the database (e.g. "smi" -> "smit"), the cached rows are narrowed locally instead of
+    querying again. `fields` must list the columns the SQL matches with LIKE '%q%', so the
+    local filter returns the same rows.
+
+    Usage:
+        self.userSearch = LiveSearch(w.searchInput, self._fetchUsers, self._populateUsersTable,
+                                     fields=("username", "first_name", "last_name", "role"))
+    """
+
+    DEFAULT_DELAY_MS = 250
+
+    # Cached rows older than this are not narrowed (seconds)
+    CACHE_MAX_AGE = 30
+
+    def __init__(self, lineEdit, fetch, onResults, fields=None, onError=None,
+                 delay=DEFAULT_DELAY_MS, threaded=True):
+        """
+        Parameters:
+            lineEdit (QLineEdit): Search box to watch.
+            fetch (callable): fetch(query) -> list of row dicts. Runs off the GUI thread
+                              when `threaded`, so it must not touch widgets.
+            onResults (callable): onResults(rows), called on the GUI thread.
+            fields (tuple): Row keys the query matches against (enables local narrowing).
+            onError (callable): onError(message), called on the GUI thread.
+            delay (int): Debounce delay in milliseconds.
+            threaded (bool): False for in-memory fetches that are cheaper than a thread hop.
+        """
+        super().__init__(lineEdit)
+        self.lineEdit = lineEdit
+        self.fetch = fetch
+        self.onResults = onResults
+        self.onError = onError
+        self.fields = tuple(fields) if fields else None
+        self.threaded = threaded
+
+        self._generation = 0
+        self._pending = {}           # generation -> queued/running worker
+        self._cachedQuery = None
+        self._cachedRows = []
+        self._cachedAt = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._dispatch)
+
+        lineEdit.textChanged.connect(lambda _: self._timer.start())
+
+    # -----------------------------------------------------------
+    # PUBLIC
+    # -----------------------------------------------------------
+
+    def searchNow(self):
+        """Runs the current query immediately (e.g. on Enter), narrowing locally when possible"""
+        self._timer.stop()
+        self._dispatch()
+
+    def refresh(self):
+        """Re-queries the database for the current text, ignoring cached rows"""
+        self.invalidate()
+        self.searchNow()
+
+    def invalidate(self):
+        """Forgets cached rows so the next search goes to the database"""
+        self._cachedQuery = None
+        self._cachedRows = []
+
+    # -----------------------------------------------------------
+    # DISPATCH
+    # -----------------------------------------------------------
+
+    def _dispatch(self):
+        query = self.lineEdit.text().strip()
+        self._generation += 1
+        generation = self._generation
+        self._cancelPending()
+
+        if self._canNarrow(query):
+            needle = query.lower()
+            rows = [row for row in self._cachedRows if self._matches(row, needle)]
+            self.onResults(rows)
+            return
+
+        if not self.threaded:
+            try:
+                self._onFinished(generation, query, list(self.fetch(query) or []))
+            except Exception as e:
+                self._onFailed(generation, str(e))
+            return
+
+        worker = _SearchWorker(generation, query, self.fetch)
+        worker.signals.finished.connect(self._onFinished)
+        worker.signals.failed.connect(self._onFailed)
+        self._pending[generation] = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancelPending(self):
+        """Removes superseded searches that have not started yet"""
+        pool = QThreadPool.globalInstance()
+        for generation, worker in list(self._pending.items()):
+            if pool.tryTake(worker):
+                del self._pending[generation]
+
+    def _canNarrow(self, query):
+        return (self.fields is not None
+                and self._cachedQuery
+                and query.lower().startswith(self._cachedQuery.lower())
+                and time.monotonic() - self._cachedAt < self.CACHE_MAX_AGE)
+
+    def _matches(self, row, needle):
+        return any(needle in str(row.get(field) or '').lower() for field in self.fields)
+
+    # -----------------------------------------------------------
+    # RESULTS (GUI thread)
+    # -----------------------------------------------------------
+
+    def _onFinished(self, generation, query, rows):
+        self._pending.pop(generation, None)
+        if generation != self._generation:
+            return  # superseded by a newer query
+
+        self._cachedQuery, self._cachedRows, self._cachedAt = query, rows, time.monotonic()
+        self.onResults(rows)
+
+    def _onFailed(self, generation, message):
+        self._pending.pop(generation, None)
+        if generation != self._generation:
+            return
+        if self.onError:
+            self.onError(message)
+        else:
+            print(f"Live search failed: {message}")
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+
+# Database utility modules skipped when attributing a statement to the model method that ran it
+UTILITY_FILES = ("QueryInstrumentation.py", "DatabaseConnection.py", "ReplicaRouter.py",
+                 "ConnectionPool.py", "StatementRegistry.py", "UnitOfWork.py")
+
+class QueryStats:
+    """
+    Process-wide statistics of every SQL statement run through getConnection().
+
+    Statements are grouped by fingerprint (whitespace collapsed, literals replaced with ?,
+    IN (...) lists folded). For each fingerprint it keeps call count, total/max latency,
+    a latency histogram, rows returned and the model methods that ran it. Connection
+    setup is tracked the same way under the "<connect>" fingerprint.
+
+    Statements slower than SLOW_QUERY_MS are appended to Logs/slow_queries.jsonl. The
+    application entry point registers writeSnapshot to save Logs/query_stats.json at exit
+    (read by Model/Tasks/QueryStatsTask); tests, benchmarks and tasks don't write it.
+
+    Environment: MEDISYNC_QUERY_STATS=0 disables instrumentation,
+                 MEDISYNC_SLOW_QUERY_MS sets the slow-query threshold (default 200).
+    """
+
+    ENABLED = os.environ.get("MEDISYNC_QUERY_STATS", "1") != "0"
+    SLOW_QUERY_MS = float(os.environ.get("MEDISYNC_SLOW_QUERY_MS", "200"))
+
+    LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Logs")
+    SLOW_LOG_PATH = os.path.join(LOG_DIR, "slow_queries.jsonl")
+    SNAPSHOT_PATH = os.path.join(LOG_DIR, "query_stats.json")
+
+    # Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    CONNECT = "<connect>"
+
+    _lock = threading.Lock()
+    _stats = {}   # fingerprint id -> stats dict
+
+    _STRINGS = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+    _NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+    _IN_LISTS = re.compile(r"\bIN\s*\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)", re.IGNORECASE)
+    _SPACES = re.compile(r"\s+")
+
+    # ======================================================
+    # RECORDING
+    # ======================================================
+
+    @classmethod
+    def fingerprint(cls, sql):
+        """Normalized statement text used to group executions of the same query"""
+        text = cls._STRINGS.sub("?", sql or "")
+        text = cls._NUMBERS.sub("?", text)
+        text = cls._SPACES.sub(" ", text).strip()
+        return cls._IN_LISTS.sub("IN (...)", text)
+
+    @classmethod
+    def record(cls, sql, caller, elapsed_ms, rows=None, batch=1):
+        """Adds one execution to the statistics (and to the slow-query log if slow)"""
+        normalized = sql if sql == cls.CONNECT else cls.fingerprint(sql)
+        key = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+        bucket = next((i for i, bound in enumerate(cls.BUCKETS_MS) if elapsed_ms <= bound), len(cls.BUCKETS_MS))
+
+        with cls._lock:
+            entry = cls._stats.get(key)
+            if entry is None:
+                entry = cls._stats[key] = {
+                    "fingerprint": normalized, "calls": 0, "total_ms": 0.0, "max_ms": 0.0,
+                    "rows": 0, "batched_rows": 0, "histogram": [0] * (len(cls.BUCKETS_MS) + 1), "callers": {}
+                }
+            entry["calls"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["rows"] += rows or 0
+            entry["batched_rows"] += batch if batch > 1 else 0
+            entry["histogram"][bucket] += 1
+            entry["callers"][caller] = entry["callers"].get(caller, 0) + 1
+
+        if elapsed_ms >= cls.SLOW_QUERY_MS and sql != cls.CONNECT:
+            cls._logSlow(key, normalized, caller, elapsed_ms, rows)
+
+    @classmethod
+    def _logSlow(cls, key, normalized, caller, elapsed_ms, rows):
+        try:
+            line = json.dumps({
+                "ts": datetime.now().isoformat(timespec="seconds"), "id": key, "caller": caller,
+                "ms": round(elapsed_ms, 2), "rows": rows, "fingerprint": normalized
+            }, ensure_ascii=False)
+            with cls._lock:
+                os.makedirs(cls.LOG_DIR, exist_ok=True)
+                with open(cls.SLOW_LOG_PATH, "a", encoding="utf-8") as file:
+                    file.write(line + "\n")
+        except Exception as e:
+            print(f"Error writing slow-query log: {e}")
+
+    @staticmethod
+    def caller():
+        """'Class.method' of the nearest frame outside the database utilities"""
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename.endswith(UTILITY_FILES):
+            frame = frame.f_back
+        if frame is None:
+            return "unknown"
+        code = frame.f_code
+        return getattr(code, "co_qualname", None) or \
+            f"{os.path.splitext(os.path.basename(code.co_filename))[0]}.{code.co_name}"
+
+    # ======================================================
+    # REPORTING
+    # ======================================================
+
+    @classmethod
+    def snapshot(cls):
+        """Returns a copy of the statistics, slowest total time first"""
+        with cls._lock:
+            entries = [dict(entry, id=key, callers=dict(entry["callers"]), histogram=list(entry["histogram"]))
+                       for key, entry in cls._stats.items()]
+        return sorted(entries, key=lambda e: e["total_ms"], reverse=True)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._stats.clear()
+
+    @classmethod
+    def percentile(cls, entry, fraction):
+        """Approximate latency percentile (bucket upper bound, ms) from an entry's histogram"""
+        target = entry["calls"] * fraction
+        seen = 0
+        for index, count in enumerate(entry["histogram"]):
+            seen += count
+            if count and seen >= target:
+                return cls.BUCKETS_MS[index] if index < len(cls.BUCKETS_MS) else entry["max_ms"]
+        return entry["max_ms"]
+
+    @classmethod
+    def report(cls, entries=None, limit=25):
+        """Formats statistics as a plain-text table (hot statements first)"""
+        entries = cls.snapshot() if entries is None else entries
+        lines = [f"{'id':<12} {'calls':>7} {'total ms':>10} {'avg ms':>8} {'p95 ms':>8} {'max ms':>8} "
+                 f"{'rows':>8}  caller / statement"]
+        for entry in entries[:limit]:
+            top_caller = max(entry["callers"], key=entry["callers"].get) if entry["callers"] else "-"
+            lines.append(
+                f"{entry['id']:<12} {entry['calls']:>7} {entry['total_ms']:>10.1f} "
+                f"{entry['total_ms'] / max(entry['calls'], 1):>8.2f} {cls.percentile(entry, 0.95):>8.0f} "
+                f"{entry['max_ms']:>8.1f} {entry['rows']:>8}  {top_caller}"
+            )
+            lines.append(f"{'':<12} {entry['fingerprint'][:140]}")
+        return "\n".join(lines)
+
+    @classmethod
+    def writeSnapshot(cls, path=None):
+        """Writes the statistics to Logs/query_stats.json (registered at exit by Main.py)"""
+        entries = cls.snapshot()
+        if not entries:
+            return False
+        try:
+            path = path or cls.SNAPSHOT_PATH
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"written_at": datetime.now().isoformat(timespec="seconds"),
+                           "slow_query_ms": cls.SLOW_QUERY_MS, "statements": entries}, file, indent=1)
+            return True
+        except Exception as e:
+            print(f"Error writing query stats: {e}")
+            return False
+
+
+class InstrumentedCursor:
+    """
+    Cursor wrapper that times each statement. A statement's time runs from execute()
+    until the next statement or close(), so it includes fetching its rows.
+    """
+
+    def __init__(self, cursor, caller):
+        self._cursor = cursor
+        self._caller = caller
+        self._pending = None   # [sql, started, rows, batch]
+
+    def _finish(self):
+        if self._pending is not None:
+            sql, started, rows, batch = self._pending
+            self._pending = None
+            QueryStats.record(sql, self._caller, (time.perf_counter() - started) * 1000, rows, batch)
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        self._finish()
+        self._caller = QueryStats.caller()
+        self._pending = [operation, time.perf_counter(), 0, 1]
+        return self._cursor.execute(operation, params, *args, **kwargs)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        self._finish()
+        self._caller = QueryStats.caller()
+        seq_params = list(seq_params)
+        self._pending = [operation, time.perf_counter(), 0, len(seq_params)]
+        return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None and self._pending is not None:
+            self._pending[2] += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        if self._pending is not None:
+            self._pending[2] += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if self._pending is not None:
+            self._pending[2] += len(rows)
+        self._finish()
+        return rows
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """Connection wrapper whose cursors are instrumented; everything else is passed through."""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs), QueryStats.caller())
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+def instrumentConnection(connect):
+    """
+    Opens a connection with `connect()` and, unless disabled, records how long that
+    took and returns it wrapped so every statement on it is measured.
+    """
+    if not QueryStats.ENABLED:
+        return connect()
+    started = time.perf_counter()
+    connection = connect()
+    QueryStats.record(QueryStats.CONNECT, QueryStats.caller(), (time.perf_counter() - started) * 1000)
+    return InstrumentedConnection(connection)
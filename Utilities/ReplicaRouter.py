@@ -0,0 +1,90 @@
+import itertools
+import threading
+import time
+from Utilities.ConnectionPool import ConnectionPool
+from Utilities.DatabaseConfig import DatabaseConfig
+
+class ReplicaRouter:
+    """
+    Picks a read replica for read-only model methods.
+
+    Replicas are tried round-robin. One that fails to connect is skipped for
+    failure_cooldown seconds (failover to the next). A replica is only used when its
+    replication lag (SHOW REPLICA STATUS, re-measured at most every lag_check_interval
+    seconds) is within the calling method's tolerance. When no replica qualifies,
+    connect() returns None and the caller uses the primary.
+    """
+
+    _lock = threading.Lock()
+    _counter = itertools.count()
+    _downUntil = {}     # (host, port) -> time.monotonic() it may be retried
+    _lag = {}           # (host, port) -> (measured at, seconds behind or None)
+
+    @classmethod
+    def connect(cls, max_lag):
+        """Returns an open connection to a suitable replica, or None"""
+        settings = DatabaseConfig.get()
+        replicas = settings["replicas"]
+        if not replicas:
+            return None
+
+        start = next(cls._counter)
+        now = time.monotonic()
+        for offset in range(len(replicas)):
+            replica = replicas[(start + offset) % len(replicas)]
+            if cls._downUntil.get(replica, 0) > now:
+                continue
+            measured_at, lag = cls._lag.get(replica, (None, None))
+            if measured_at is not None and now - measured_at < settings["lag_check_interval"] \
+                    and (lag is None or lag > max_lag):
+                continue
+
+            try:
+                connection = ConnectionPool.acquire(*replica)
+            except Exception as e:
+                print(f"Replica {replica[0]}:{replica[1]} unavailable, skipping for "
+                      f"{settings['failure_cooldown']:.0f}s: {e}")
+                with cls._lock:
+                    cls._downUntil[replica] = now + settings["failure_cooldown"]
+                continue
+
+            if measured_at is None or now - measured_at >= settings["lag_check_interval"]:
+                lag = cls._measureLag(connection)
+                with cls._lock:
+                    cls._lag[replica] = (now, lag)
+            if lag is not None and lag <= max_lag:
+                return connection
+            connection.close()
+        return None
+
+    @staticmethod
+    def _measureLag(connection):
+        """
+        Seconds the replica is behind its source. None when the host reports no replication
+        status (it is not a replica) or replication is broken, so the host is skipped.
+        """
+        cursor = connection.cursor(dictionary=True)
+        try:
+            for statement, column in (("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+                                      ("SHOW SLAVE STATUS", "Seconds_Behind_Master")):
+                try:
+                    cursor.execute(statement)
+                    status = cursor.fetchone()
+                except Exception:
+                    continue
+                if status is None:
+                    return None
+                return status.get(column)
+            return None
+        finally:
+            cursor.close()
+
+    @classmethod
+    def status(cls):
+        """Per replica: whether it is skipped and its last measured lag (for diagnostics)"""
+        now = time.monotonic()
+        return [{
+            "host": f"{host}:{port}",
+            "down": cls._downUntil.get((host, port), 0) > now,
+            "lag": cls._lag.get((host, port), (None, None))[1],
+        } for host, port in DatabaseConfig.get()["replicas"]]
@@ -0,0 +1,457 @@
+import calendar
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+class SQLiteBackend:
+    """
+    SQLite stand-in for the MySQL database, for tests, benchmarks and offline work.
+
+    Selected with MEDISYNC_DB_BACKEND=sqlite (see Utilities/DatabaseConnection.py).
+    The database file comes from DatabaseConfig ([sqlite] path or MEDISYNC_SQLITE_PATH);
+    the default ":memory:" keeps one in-memory database for the whole process. A new
+    database gets the tables from projectmedisync_database_schema.sql, translated to SQLite.
+
+    Connections and cursors behave like mysql.connector's as far as the models use them:
+    %s / %(name)s parameters, cursor(dictionary=True), buffered results, lastrowid and
+    rowcount, DATE/DATETIME columns returned as date/datetime. Statements are translated
+    once (cached) and the MySQL functions the models call (NOW, CURDATE, CONCAT, CONCAT_WS,
+    DATEDIFF, DATE_ADD/DATE_SUB with INTERVAL, DATE_FORMAT, CRC32, ...) are registered
+    as SQL functions.
+
+    Not emulated: MySQL's case-insensitive string equality (LIKE is case-insensitive),
+    row locking (FOR UPDATE is dropped; SQLite locks the whole database on write).
+    """
+
+    SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "projectmedisync_database_schema.sql")
+    MEMORY = ":memory:"
+
+    _lock = threading.RLock()
+    _shared = None          # The process's in-memory database connection
+    _initialized = set()    # Database files whose schema has been checked
+
+    # ======================================================
+    # CONNECTIONS
+    # ======================================================
+
+    @classmethod
+    def connect(cls, path=None):
+        """Returns a mysql.connector-like connection to the SQLite database at `path`"""
+        if path is None:
+            from Utilities.DatabaseConfig import DatabaseConfig
+            path = DatabaseConfig.get()["sqlite_path"] or cls.MEMORY
+        with cls._lock:
+            if path == cls.MEMORY:
+                if cls._shared is None:
+                    cls._shared = cls._open(cls.MEMORY)
+                    cls.createSchema(cls._shared)
+                return SQLiteConnection(cls._shared, shared=True)
+
+            raw = cls._open(path)
+            if path not in cls._initialized:
+                if raw.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'users'").fetchone()[0] == 0:
+                    cls.createSchema(raw)
+                cls._initialized.add(path)
+            return SQLiteConnection(raw)
+
+    @classmethod
+    def reset(cls):
+        """Discards the in-memory database (the next connect() starts from an empty schema)"""
+        with cls._lock:
+            if cls._shared is not None:
+                cls._shared.close()
+                cls._shared = None
+
+    @classmethod
+    def _open(cls, path):
+        raw = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False,
+                              isolation_level="DEFERRED", timeout=30)
+        raw.execute("PRAGMA foreign_keys = ON")
+        if path != cls.MEMORY:
+            raw.execute("PRAGMA journal_mode = WAL")
+        for name, arguments, function in MySQLFunctions.FUNCTIONS:
+            raw.create_function(name, arguments, function, deterministic=name not in ("NOW", "CURDATE", "CURTIME"))
+        return raw
+
+    # ======================================================
+    # SCHEMA
+    # ======================================================
+
+    @classmethod
+    def createSchema(cls, raw, schema_path=None):
+        """Creates the application tables from the MySQL schema file"""
+        with open(schema_path or cls.SCHEMA_PATH, encoding="utf-8") as file:
+            raw.executescript(cls.translateSchema(file.read()))
+        raw.commit()
+
+    @staticmethod
+    def translateSchema(mysql_schema):
+        """Translates the MySQL DDL in projectmedisync_database_schema.sql into an SQLite script"""
+        text = re.sub(r"--[^\n]*", "", mysql_schema)
+        statements = []
+
+        for statement in text.split(";"):
+            statement = statement.strip()
+            match = re.match(r"CREATE\s+TABLE\s+(\w+)\s*\((.*)\)$", statement, re.IGNORECASE | re.DOTALL)
+            if not match:
+                continue    # CREATE DATABASE / USE
+            table, body = match.groups()
+
+            # Secondary indexes are separate statements in SQLite
+            indexes = re.findall(r"^\s*(?:UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\),?\s*$", body,
+                                 re.IGNORECASE | re.MULTILINE)
+            body = re.sub(r"^\s*(?:UNIQUE\s+)?(?:INDEX|KEY)\s+\w+\s*\([^)]*\),?\s*$\n?", "", body,
+                          flags=re.IGNORECASE | re.MULTILINE)
+
+            body = re.sub(r"\bINT\s+UNSIGNED\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b", "INTEGER PRIMARY KEY AUTOINCREMENT",
+                          body, flags=re.IGNORECASE)
+            body = re.sub(r"\b(?:INT|TINYINT|SMALLINT|BIGINT)\s+UNSIGNED\b", "INTEGER", body, flags=re.IGNORECASE)
+            body = re.sub(r"(\w+)\s+ENUM\s*\(([^)]*)\)", lambda m: f"{m[1]} TEXT CHECK ({m[1]} IN ({' '.join(m[2].split())}))",
+                          body, flags=re.IGNORECASE)
+            auto_update = re.findall(r"^\s*(\w+)[^\n]*ON\s+UPDATE\s+CURRENT_TIMESTAMP", body,
+                                     re.IGNORECASE | re.MULTILINE)
+            body = re.sub(r"\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP", "", body, flags=re.IGNORECASE)
+            body = re.sub(r"DEFAULT\s+CURRENT_TIMESTAMP", "DEFAULT (datetime('now', 'localtime'))", body,
+                          flags=re.IGNORECASE)
+            body = re.sub(r",(\s*)$", r"\1", body.rstrip())
+
+            statements.append(f"CREATE TABLE {table} ({body}\n)")
+            statements.extend(f"CREATE INDEX {name} ON {table} ({columns})" for name, columns in indexes)
+            statements.extend(f"""CREATE TRIGGER trg_{table}_{column} AFTER UPDATE ON {table}
+                FOR EACH ROW WHEN NEW.{column} IS OLD.{column}
+                BEGIN
+                    UPDATE {table} SET {column} = datetime('now', 'localtime') WHERE rowid = NEW.rowid;
+                END""" for column in auto_update)
+
+        return ";\n".join(statements) + ";\n"
+
+    # ======================================================
+    # STATEMENTS
+    # ======================================================
+
+    _LITERALS = re.compile(r"('(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\")")
+    _UNITS = r"(MICROSECOND|SECOND|MINUTE|HOUR|DAY|WEEK|MONTH|QUARTER|YEAR)"
+    _CODE_RULES = (
+        (re.compile(r"%\((\w+)\)s"), r":\1"),
+        (re.compile(r"%s"), "?"),
+        (re.compile(r"%%"), "%"),
+        (re.compile(r"\bINSERT\s+IGNORE\b", re.I), "INSERT OR IGNORE"),
+        (re.compile(r"\bFOR\s+UPDATE\b|\bLOCK\s+IN\s+SHARE\s+MODE\b", re.I), ""),
+        (re.compile(r"\bTRUNCATE\s+TABLE\s+(\w+)", re.I), r"DELETE FROM \1"),
+        (re.compile(r"\bSET\s+FOREIGN_KEY_CHECKS\s*=\s*0\b", re.I), "PRAGMA foreign_keys = OFF"),
+        (re.compile(r"\bSET\s+FOREIGN_KEY_CHECKS\s*=\s*1\b", re.I), "PRAGMA foreign_keys = ON"),
+        (re.compile(r"\bSET\s+UNIQUE_CHECKS\s*=\s*\d\b", re.I), "SELECT 1"),
+        (re.compile(r"\bINTERVAL\s+(\?|:\w+|-?\d+)\s+" + _UNITS + r"\b", re.I), r"\1, '\2'"),
+        (re.compile(r"\bIF\s*\(", re.I), "iif("),
+        (re.compile(r"\bAS\s+(?:UNSIGNED|SIGNED)(?:\s+INTEGER)?\b", re.I), "AS INTEGER"),
+        # (SELECT ...) UNION ALL (SELECT ...): SQLite only allows bare SELECTs in a compound
+        (re.compile(r"(^\s*|\bUNION(?:\s+ALL)?\s*)\(\s*SELECT\b", re.I), r"\1SELECT * FROM (SELECT"),
+    )
+    _SEPARATOR = re.compile(r"\s+SEPARATOR\s+('(?:[^']|'')*')", re.I)
+    _ON_DUPLICATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.I)
+    _VALUES_REFERENCE = re.compile(r"\bVALUES\s*\(\s*(\w+)\s*\)", re.I)
+
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def translate(cls, sql):
+        """Translates one MySQL statement (with %s parameters) into SQLite SQL"""
+        sql = cls._SEPARATOR.sub(r", \1", sql)
+        parts = cls._LITERALS.split(sql)
+        for index in range(0, len(parts), 2):           # code between string literals
+            for pattern, replacement in cls._CODE_RULES:
+                parts[index] = pattern.sub(replacement, parts[index])
+        for index in range(1, len(parts), 2):           # MySQL strings may be double-quoted
+            if parts[index].startswith('"'):
+                parts[index] = "'" + parts[index][1:-1].replace("'", "''").replace('\\"', '"') + "'"
+        sql = "".join(parts)
+
+        duplicate = cls._ON_DUPLICATE.search(sql)
+        if duplicate:
+            update = cls._VALUES_REFERENCE.sub(r"excluded.\1", sql[duplicate.end():])
+            sql = sql[:duplicate.start()] + "ON CONFLICT DO UPDATE SET" + update
+        return sql
+
+
+class SQLiteConnection:
+    """mysql.connector-style connection over an sqlite3 connection"""
+
+    def __init__(self, raw, shared=False):
+        self._raw = raw
+        self._shared = shared
+        self._closed = False
+
+    def cursor(self, dictionary=False, **kwargs):
+        return SQLiteCursor(self._raw, dictionary)
+
+    def preparedCursor(self, statement):
+        # sqlite3 keeps its own cache of compiled statements per connection
+        return SQLiteCursor(self._raw)
+
+    def commit(self):
+        self._raw.commit()
+
+    def rollback(self):
+        self._raw.rollback()
+
+    def start_transaction(self, **kwargs):
+        self._raw.execute("BEGIN")
+
+    def is_connected(self):
+        return not self._closed
+
+    @property
+    def in_transaction(self):
+        return self._raw.in_transaction
+
+    def close(self):
+        # The in-memory database lives as long as the process; other "connections" share it
+        if not self._closed and not self._shared:
+            self._raw.close()
+        self._closed = True
+
+
+class SQLiteCursor:
+    """
+    mysql.connector-style buffered cursor: results are read completely on execute(),
+    rows are tuples or (dictionary=True) dicts keyed by column name.
+    """
+
+    def __init__(self, raw, dictionary=False):
+        self._raw = raw
+        self._dictionary = dictionary
+        self._rows = []
+        self._position = 0
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        sql = SQLiteBackend.translate(operation)
+        with SQLiteBackend._lock:
+            cursor = self._raw.execute(sql, self._parameters(params))
+            self._store(cursor)
+        return None
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        sql = SQLiteBackend.translate(operation)
+        with SQLiteBackend._lock:
+            cursor = self._raw.executemany(sql, [self._parameters(p) for p in seq_params])
+            self._store(cursor)
+        return None
+
+    @staticmethod
+    def _parameters(params):
+        if params is None:
+            return ()
+        if isinstance(params, dict):
+            return params
+        return tuple(params)
+
+    def _store(self, cursor):
+        self.description = cursor.description
+        self._rows = cursor.fetchall() if cursor.description else []
+        self._position = 0
+        self.rowcount = len(self._rows) if cursor.description else cursor.rowcount
+        self.lastrowid = cursor.lastrowid
+        if self._rows:
+            # Date expressions (MAX(administration_time), DATE(...)) come back as text; MySQL returns objects
+            self._rows = [tuple(MySQLFunctions.temporal(value) for value in row) for row in self._rows]
+        if self._dictionary and self.description:
+            names = [column[0] for column in self.description]
+            self._rows = [dict(zip(names, row)) for row in self._rows]
+
+    @property
+    def column_names(self):
+        return tuple(column[0] for column in self.description or ())
+
+    def fetchone(self):
+        if self._position >= len(self._rows):
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return row
+
+    def fetchmany(self, size=1):
+        rows = self._rows[self._position:self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._position:]
+        self._position = len(self._rows)
+        return rows
+
+    def close(self):
+        self._rows = []
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+
+class MySQLFunctions:
+    """Python implementations of the MySQL functions used by the models"""
+
+    # MySQL DATE_FORMAT specifier -> value
+    _FORMATS = {
+        "Y": lambda v: f"{v.year:04d}", "y": lambda v: f"{v.year % 100:02d}",
+        "m": lambda v: f"{v.month:02d}", "c": lambda v: str(v.month),
+        "d": lambda v: f"{v.day:02d}", "e": lambda v: str(v.day),
+        "H": lambda v: f"{v.hour:02d}", "k": lambda v: str(v.hour),
+        "h": lambda v: v.strftime("%I"), "I": lambda v: v.strftime("%I"), "l": lambda v: str(int(v.strftime("%I"))),
+        "i": lambda v: f"{v.minute:02d}", "s": lambda v: f"{v.second:02d}", "S": lambda v: f"{v.second:02d}",
+        "p": lambda v: v.strftime("%p"), "M": lambda v: v.strftime("%B"), "b": lambda v: v.strftime("%b"),
+        "W": lambda v: v.strftime("%A"), "a": lambda v: v.strftime("%a"), "T": lambda v: v.strftime("%H:%M:%S"),
+    }
+
+    @staticmethod
+    def parse(value):
+        """date/datetime from a stored value ('YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS[.ffffff]')"""
+        if value is None or isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return value
+        text = str(value).strip()
+        try:
+            return date.fromisoformat(text) if len(text) == 10 else datetime.fromisoformat(text)
+        except ValueError:
+            return None
+
+    _TEMPORAL = re.compile(r"\d{4}-\d\d-\d\d(?: \d\d:\d\d:\d\d(?:\.\d{1,6})?)?")
+
+    @staticmethod
+    def temporal(value):
+        """Turns ISO date/datetime text into date/datetime; other values are returned unchanged"""
+        if isinstance(value, str) and MySQLFunctions._TEMPORAL.fullmatch(value):
+            return MySQLFunctions.parse(value) or value
+        return value
+
+    @staticmethod
+    def format(value):
+        if isinstance(value, datetime):
+            return value.isoformat(sep=" ", timespec="seconds")
+        return value.isoformat()
+
+    @staticmethod
+    def now():
+        return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+    @staticmethod
+    def curdate():
+        return date.today().isoformat()
+
+    @staticmethod
+    def curtime():
+        return datetime.now().strftime("%H:%M:%S")
+
+    @staticmethod
+    def concat(*values):
+        if any(value is None for value in values):
+            return None
+        return "".join(MySQLFunctions._text(value) for value in values)
+
+    @staticmethod
+    def concatWs(separator, *values):
+        if separator is None:
+            return None
+        return str(separator).join(MySQLFunctions._text(value) for value in values if value is not None)
+
+    @staticmethod
+    def _text(value):
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    @staticmethod
+    def datediff(first, second):
+        first, second = MySQLFunctions.parse(first), MySQLFunctions.parse(second)
+        if first is None or second is None:
+            return None
+        first = first.date() if isinstance(first, datetime) else first
+        second = second.date() if isinstance(second, datetime) else second
+        return (first - second).days
+
+    @staticmethod
+    def dateAdd(value, amount, unit, sign=1):
+        value = MySQLFunctions.parse(value)
+        if value is None or amount is None:
+            return None
+        amount, unit = int(amount) * sign, unit.upper()
+        if unit in ("MONTH", "QUARTER", "YEAR"):
+            months = amount * {"MONTH": 1, "QUARTER": 3, "YEAR": 12}[unit]
+            year, month = divmod(value.month - 1 + months, 12)
+            year += value.year
+            day = min(value.day, calendar.monthrange(year, month + 1)[1])
+            return MySQLFunctions.format(value.replace(year=year, month=month + 1, day=day))
+
+        delta = {"MICROSECOND": timedelta(microseconds=amount), "SECOND": timedelta(seconds=amount),
+                 "MINUTE": timedelta(minutes=amount), "HOUR": timedelta(hours=amount),
+                 "DAY": timedelta(days=amount), "WEEK": timedelta(weeks=amount)}[unit]
+        if not isinstance(value, datetime) and unit not in ("DAY", "WEEK"):
+            value = datetime.combine(value, datetime.min.time())
+        return MySQLFunctions.format(value + delta)
+
+    @staticmethod
+    def dateSub(value, amount, unit):
+        return MySQLFunctions.dateAdd(value, amount, unit, sign=-1)
+
+    @staticmethod
+    def dateFormat(value, mysql_format):
+        value = MySQLFunctions.parse(value)
+        if value is None or mysql_format is None:
+            return None
+        if not isinstance(value, datetime):
+            value = datetime.combine(value, datetime.min.time())
+        return re.sub(r"%(.)", lambda m: MySQLFunctions._FORMATS.get(m[1], lambda v: m[1])(value), mysql_format)
+
+    @staticmethod
+    def crc32(value):
+        if value is None:
+            return None
+        return zlib.crc32(MySQLFunctions._text(value).encode("utf-8"))
+
+    @staticmethod
+    def greatest(*values):
+        return None if any(v is None for v in values) else max(values)
+
+    @staticmethod
+    def least(*values):
+        return None if any(v is None for v in values) else min(values)
+
+    @staticmethod
+    def part(attribute):
+        def extract(value):
+            value = MySQLFunctions.parse(value)
+            return getattr(value, attribute, None) if value is not None else None
+        return extract
+
+
+MySQLFunctions.FUNCTIONS = (
+    ("NOW", 0, MySQLFunctions.now),
+    ("CURDATE", 0, MySQLFunctions.curdate),
+    ("CURTIME", 0, MySQLFunctions.curtime),
+    ("CONCAT", -1, MySQLFunctions.concat),
+    ("CONCAT_WS", -1, MySQLFunctions.concatWs),
+    ("DATEDIFF", 2, MySQLFunctions.datediff),
+    ("DATE_ADD", 3, MySQLFunctions.dateAdd),
+    ("DATE_SUB", 3, MySQLFunctions.dateSub),
+    ("DATE_FORMAT", 2, MySQLFunctions.dateFormat),
+    ("CRC32", 1, MySQLFunctions.crc32),
+    ("GREATEST", -1, MySQLFunctions.greatest),
+    ("LEAST", -1, MySQLFunctions.least),
+    ("YEAR", 1, MySQLFunctions.part("year")),
+    ("MONTH", 1, MySQLFunctions.part("month")),
+    ("DAY", 1, MySQLFunctions.part("day")),
+    ("HOUR", 1, MySQLFunctions.part("hour")),
+    ("MINUTE", 1, MySQLFunctions.part("minute")),
+)
+
+# Dates and datetimes are stored as ISO text and read back as date/datetime objects, as with MySQL
+sqlite3.register_adapter(date, MySQLFunctions.format)
+sqlite3.register_adapter(datetime, MySQLFunctions.format)
+sqlite3.register_converter("DATE", lambda value: MySQLFunctions.parse(value.decode()))
+sqlite3.register_converter("DATETIME", lambda value: MySQLFunctions.parse(value.decode()))
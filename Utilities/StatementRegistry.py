@@ -0,0 +1,83 @@
+import threading
+import time
+from Utilities.QueryInstrumentation import QueryStats
+
+class StatementRegistry:
+    """
+    Every Statement defined by the models, by name. Names must be unique; they key the
+    per-connection cache of prepared statement handles.
+    """
+
+    _lock = threading.Lock()
+    _statements = {}
+
+    @classmethod
+    def register(cls, statement):
+        with cls._lock:
+            existing = cls._statements.get(statement.name)
+            if existing is not None and existing.sql != statement.sql:
+                raise ValueError(f"Statement {statement.name} is already defined with different SQL")
+            cls._statements[statement.name] = statement
+
+    @classmethod
+    def get(cls, name):
+        return cls._statements.get(name)
+
+    @classmethod
+    def all(cls):
+        with cls._lock:
+            return sorted(cls._statements.values(), key=lambda statement: statement.name)
+
+
+class Statement:
+    """
+    A query defined once, as a constant of its model, and run as a server-side prepared
+    statement. On pooled MySQL connections (Utilities/ConnectionPool.py) the statement is
+    prepared the first time a connection runs it and the handle is reused afterwards, so
+    repeat executions skip parsing and planning.
+
+    Parameters are positional %s placeholders. Literal percent signs are written as-is
+    (no %% escaping), and the SQL must not vary between calls: optional filters are
+    written as (%s IS NULL OR column = %s) and the value passed twice.
+
+    Executions are recorded in QueryStats like any other statement.
+    """
+
+    def __init__(self, name, sql):
+        self.name = name
+        self.sql = sql
+        StatementRegistry.register(self)
+
+    def fetchAll(self, conn, params=(), dictionary=False):
+        """Runs the statement and returns all rows (tuples, or dicts keyed by column name)"""
+        return self._run(conn, params, dictionary)[0]
+
+    def fetchOne(self, conn, params=(), dictionary=False):
+        """Runs the statement and returns its first row, or None"""
+        rows = self._run(conn, params, dictionary)[0]
+        return rows[0] if rows else None
+
+    def fetchValue(self, conn, params=(), default=None):
+        """Runs the statement and returns the first column of its first row (e.g. a COUNT)"""
+        rows = self._run(conn, params, False)[0]
+        return rows[0][0] if rows and rows[0][0] is not None else default
+
+    def execute(self, conn, params=()):
+        """Runs a write statement and returns the cursor (for rowcount / lastrowid)"""
+        return self._run(conn, params, False)[1]
+
+    def _run(self, conn, params, dictionary):
+        cursor = conn.preparedCursor(self)
+        started = time.perf_counter()
+        cursor.execute(self.sql, tuple(params))
+        # Read the whole result so the handle can be executed again on this connection
+        rows = cursor.fetchall() if cursor.description else []
+        if dictionary and rows:
+            names = cursor.column_names
+            rows = [dict(zip(names, row)) for row in rows]
+        if QueryStats.ENABLED:
+            QueryStats.record(self.sql, QueryStats.caller(), (time.perf_counter() - started) * 1000, len(rows))
+        return rows, cursor
+
+    def __repr__(self):
+        return f"Statement({self.name!r})"
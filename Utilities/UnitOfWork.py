@@ -0,0 +1,103 @@
+import threading
+
+_active = threading.local()
+
+class UnitConnection:
+    """
+    What getConnection() returns inside a UnitOfWork: the unit's connection, with the
+    transaction calls a model method makes taken over by the unit. commit() and close()
+    do nothing (the unit commits and releases once at the end); rollback() fails the
+    whole unit.
+    """
+
+    def __init__(self, unit):
+        self._unit = unit
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+    def start_transaction(self, **kwargs):
+        pass
+
+    def rollback(self):
+        self._unit.rollback()
+
+    def __getattr__(self, name):
+        return getattr(self._unit.connection, name)
+
+
+class UnitOfWork:
+    """
+    Runs several model calls as one transaction on one primary connection:
+
+        with UnitOfWork() as unit:
+            prescription_id = PrescriptionModel.createPrescription(...)
+            if not PrescriptionModel.createNotification(...):
+                unit.rollback()
+        if unit.committed:
+            ...
+
+    Every getConnection() on this thread inside the block returns the unit's connection
+    (never a replica, so reads see the unit's own writes). The unit commits once on
+    leaving the block, or rolls everything back when the block raises or any model
+    call rolled back. A unit opened inside another joins the outer one.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.committed = False
+        self.failed = False
+        self._outer = None
+
+    @staticmethod
+    def current():
+        """The unit open on this thread, or None"""
+        return getattr(_active, "unit", None)
+
+    def __enter__(self):
+        outer = UnitOfWork.current()
+        if outer is not None:
+            self._outer = outer
+            return outer
+
+        from Utilities.DatabaseConnection import getPrimaryConnection
+        self.connection = getPrimaryConnection()
+        _active.unit = self
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self._outer is not None:
+            if exc_type is not None:
+                self._outer.failed = True
+            self._outer = None
+            return False
+
+        _active.unit = None
+        try:
+            if exc_type is None and not self.failed:
+                self.connection.commit()
+                self.committed = True
+            else:
+                self.rollback()
+        except Exception as e:
+            print(f"Error in UnitOfWork: {e}")
+            self.rollback()
+        finally:
+            self.connection.close()
+            self.connection = None
+        return False
+
+    def rollback(self):
+        """Discards everything written in the unit so far; the unit will not commit"""
+        self.failed = True
+        if self.connection is not None:
+            try:
+                self.connection.rollback()
+            except Exception as e:
+                print(f"Error in UnitOfWork rollback: {e}")
+
+    def proxy(self):
+        return UnitConnection(self)
@@ -0,0 +1,91 @@
+from PyQt6.QtWidgets import QWidget
+
+class WindowRegistry:
+    """
+    Per-session registry of screen controllers.
+
+    Navigating used to close the current window and construct a brand-new controller
+    and window for the next screen, re-querying everything and rebuilding every widget.
+    The registry keeps one controller (and its window) alive per screen for the whole
+    session: the first visit builds it, later visits call the controller's `reopen()`,
+    which refreshes only its data sections and shows the existing window again.
+
+    Logging out discards every kept screen, so nothing survives into the next session.
+    """
+
+    # controller class name -> controller instance
+    _controllers = {}
+    _loginController = None
+
+    @classmethod
+    def open(cls, controllerClass, openMethod):
+        """
+        Shows the screen managed by `controllerClass`.
+
+        Parameters:
+            controllerClass (type): Controller class of the screen (e.g. AdminUsersController).
+            openMethod (str): Name of the controller method that builds and shows its window.
+
+        Returns:
+            The (possibly reused) controller instance.
+        """
+        key = controllerClass.__name__
+        controller = cls._controllers.get(key)
+
+        if controller is not None:
+            try:
+                controller.reopen()
+                return controller
+            except Exception as e:
+                print(f"Failed to reopen {key}, rebuilding: {e}")
+                cls._discard(controller)
+
+        controller = controllerClass()
+        getattr(controller, openMethod)()
+        cls._controllers[key] = controller
+        return controller
+
+    @classmethod
+    def clear(cls):
+        """Closes and releases every kept screen (end of session)"""
+        for controller in cls._controllers.values():
+            cls._discard(controller)
+        cls._controllers.clear()
+
+    @classmethod
+    def showLogin(cls):
+        """
+        Ends the session's screens and shows a fresh login window.
+        Returns the new LoginController.
+        """
+        cls.clear()
+
+        from Controller.Login.LoginController import LoginController
+        from Model.Authentication.LoginModel import LoginModel
+        from View.LoginGUI import Login
+
+        previous = cls._loginController
+        loginModel = LoginModel()
+        loginView = Login()
+        cls._loginController = LoginController(loginModel, loginView)
+        loginView.show()
+
+        if previous is not None:
+            cls._deleteWidget(previous.view)
+        return cls._loginController
+
+    @classmethod
+    def _discard(cls, controller):
+        """Closes and schedules deletion of every window/popup a controller holds"""
+        for value in list(vars(controller).values()):
+            if isinstance(value, QWidget):
+                cls._deleteWidget(value)
+
+    @staticmethod
+    def _deleteWidget(widget):
+        try:
+            widget.close()
+            widget.deleteLater()
+        except RuntimeError:
+            # Underlying Qt object was already deleted
+            pass
@@ -105,6 +105,11 @@ class AdminDashboardWindow(QWidget):
             card.mousePressEvent = lambda e, l=label: self._showKPIDetails(l)
             self.kpi_cards.append(card)
 
+    def setKPIValue(self, kpi_label: str, value):
+        """Update one KPI card in place"""
+        self.kpi_values[kpi_label] = value
+        self.kpi_cards[list(self.kpi_values).index(kpi_label)].numberLabel.setText(str(value))
+
     def _showKPIDetails(self, kpi_label: str):
         """Show detailed records when KPI card is clicked"""
         from Model.KPIs.AdminKPIs import AdminKPIDetails
@@ -116,17 +121,23 @@ class AdminDashboardWindow(QWidget):
 
     def _createActivityTable(self):
         """Display today's activity log"""
-        columns = ["Activity ID", "Time", "User", "Role", "Type", "Action", "Related"]
-        column_map = {
+        self.activityColumns = ["Activity ID", "Time", "User", "Role", "Type", "Action", "Related"]
+        self.activityColumnMap = {
             "Activity ID": "notification_id", "Time": "created_at", "User": "user_name",
             "Role": "role", "Type": "type", "Action": "title", "Related": "related_info"
         }
 
         self.activityTable, self.activityCard = Designer.createTableCard(
             self, labelText="Today's Activity Summary", fontSize=22,
-            columnNames=columns, columnMap=column_map,
+            columnNames=self.activityColumns, columnMap=self.activityColumnMap,
             cardWidth=1420, cardHeight=445, tableWidth=1380, tableHeight=350,
             x=40, y=325, data=self.todaysActivityData
         )
         header = self.activityTable.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
\ No newline at end of file
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+
+    def setActivityData(self, todaysActivityData):
+        """Replace the rows of the activity table in place"""
+        self.todaysActivityData = todaysActivityData
+        Designer.populateTable(self.activityTable, self.activityColumns,
+                               self.activityColumnMap, todaysActivityData)
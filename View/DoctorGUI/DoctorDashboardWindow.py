@@ -84,6 +84,11 @@ class DoctorDashboardWindow(QWidget):
             card.mousePressEvent = lambda e, l=label: self._showKPIDetails(l)
             self.kpi_cards.append(card)
 
+    def setKPIValue(self, kpi_label: str, value):
+        """Update one KPI card in place"""
+        self.kpi_values[kpi_label] = value
+        self.kpi_cards[list(self.kpi_values).index(kpi_label)].numberLabel.setText(str(value))
+
     def _showKPIDetails(self, kpi_label: str):
         """Show detailed records when KPI card is clicked"""
         from Model.KPIs.DoctorKPIs import DoctorKPIDetails
@@ -95,8 +100,8 @@ class DoctorDashboardWindow(QWidget):
 
     def _createPatientHistoryTable(self, dataHistory):
         """Display patient history"""
-        columns = ["Patient", "DOB", "Sex", "Admission Date", "Diagnosis", "Prescriptions"]
-        column_map = {
+        self.patientHistoryColumns = ["Patient", "DOB", "Sex", "Admission Date", "Diagnosis", "Prescriptions"]
+        self.patientHistoryColumnMap = {
             "Patient": "patient_name", "DOB": "date_of_birth", "Sex": "sex",
             "Admission Date": "admission_date", "Diagnosis": "diagnosis",
             "Prescriptions": "prescriptions"
@@ -104,7 +109,7 @@ class DoctorDashboardWindow(QWidget):
 
         self.patientHistoryTable, self.patientHistoryCard = Designer.createTableCard(
             self, labelText="Patient History", fontSize=22,
-            columnNames=columns, columnMap=column_map,
+            columnNames=self.patientHistoryColumns, columnMap=self.patientHistoryColumnMap,
             cardWidth=775, cardHeight=400, tableWidth=735, tableHeight=315,
             x=50, y=345, data=dataHistory
         )
@@ -113,8 +118,8 @@ class DoctorDashboardWindow(QWidget):
 
     def _createPendingPrescriptionsTable(self,dataPending):
         """Display pending prescriptions"""
-        columns = ["ID", "Patient", "Brand", "Dosage", "Frequency", "Duration", "Status"]
-        column_map = {
+        self.pendingPrescriptionsColumns = ["ID", "Patient", "Brand", "Dosage", "Frequency", "Duration", "Status"]
+        self.pendingPrescriptionsColumnMap = {
             "ID": "prescription_id", "Patient": "patient_name", "Brand": "medicine_brand",
             "Dosage": "dosage", "Frequency": "frequency", "Duration": "duration",
             "Status": "prescription_status"
@@ -122,9 +127,19 @@ class DoctorDashboardWindow(QWidget):
 
         self.pendingPrescriptionsTable, self.pendingPrescriptionsCard = Designer.createTableCard(
             self, labelText="Pending Prescriptions", fontSize=22,
-            columnNames=columns, columnMap=column_map,
+            columnNames=self.pendingPrescriptionsColumns, columnMap=self.pendingPrescriptionsColumnMap,
             cardWidth=580, cardHeight=635, tableWidth=540, tableHeight=540,
             x=875, y=110, data=dataPending
         )
         header = self.pendingPrescriptionsTable.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
\ No newline at end of file
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+
+    def setPatientHistoryData(self, dataHistory):
+        """Replace the rows of the patient history table in place"""
+        Designer.populateTable(self.patientHistoryTable, self.patientHistoryColumns,
+                               self.patientHistoryColumnMap, dataHistory)
+
+    def setPendingPrescriptionsData(self, dataPending):
+        """Replace the rows of the pending prescriptions table in place"""
+        Designer.populateTable(self.pendingPrescriptionsTable, self.pendingPrescriptionsColumns,
+                               self.pendingPrescriptionsColumnMap, dataPending)
@@ -1,7 +1,8 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QTransform
+from PyQt6.QtGui import QTransform
 from PyQt6.QtWidgets import QWidget, QStackedWidget, QLabel, QFrame
 from Utilities.Designers import Designer
+from Utilities.AssetRegistry import AssetRegistry
 
 class PrescriptionWindow(QWidget):
     """
@@ -88,7 +89,7 @@ class PrescriptionWindow(QWidget):
         self.navigationArrow = QLabel(self.mainCard)
         self.navigationArrow.setGeometry(1390, 20, 40, 40)
         self.navigationArrow.setScaledContents(True)
-        self.arrowPixmap = QPixmap("../ImageResources/Icon9BGRemoved.png")
+        self.arrowPixmap = AssetRegistry.getPixmap("../ImageResources/Icon9BGRemoved.png")
         self.navigationArrow.setPixmap(self.arrowPixmap)
         self.navigationArrow.setCursor(Qt.CursorShape.PointingHandCursor)
 
@@ -1,5 +1,6 @@
 from PyQt6.QtCore import Qt, QTime
-from PyQt6.QtWidgets import QWidget, QStackedWidget, QFrame, QButtonGroup, QRadioButton, QTimeEdit, QHeaderView
+from PyQt6.QtWidgets import QWidget, QStackedWidget, QFrame, QButtonGroup, QRadioButton, QTimeEdit, QHeaderView, \
+    QAbstractItemView, QTableWidgetItem
 from Utilities.Designers import Designer
 
 class AdministrationWindow(QWidget):
@@ -33,9 +34,11 @@ class AdministrationWindow(QWidget):
         # Create views
         self.patientSelectionView = self._createPatientSelectionView()
         self.recordingView = self._createRecordingView()
+        self.wardRoundView = self._createWardRoundView()
 
         self.stackedWidget.addWidget(self.patientSelectionView)
         self.stackedWidget.addWidget(self.recordingView)
+        self.stackedWidget.addWidget(self.wardRoundView)
 
     def _createTopBar(self):
         """Creates the top navigation bar"""
@@ -89,8 +92,9 @@ class AdministrationWindow(QWidget):
 
         patientsLabel = Designer.createLabel("Assigned Patients", mainCard, "#1a1a1a", 700, 18)
         patientsLabel.setGeometry(50, 105, 250, 25)
-        patientsSubLabel = Designer.createLabel("Select patient.", mainCard, "#333333", 400, 12)
-        patientsSubLabel.setGeometry(50, 135, 250, 20)
+        patientsSubLabel = Designer.createLabel("Select patient, or several (Ctrl/Shift) for a ward round.", mainCard,
+                                                "#333333", 400, 12)
+        patientsSubLabel.setGeometry(50, 135, 400, 20)
 
         self.patientSearch = Designer.createInputField(mainCard, "white", "#333333", 400, 14, 15, 2, "#185777")
         self.patientSearch.setGeometry(1100, 120, 180, 35)
@@ -106,6 +110,12 @@ class AdministrationWindow(QWidget):
         header = self.patientsTable.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.patientsTable.setGeometry(50, 170, 1360, 425)
+        self.patientsTable.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+
+        self.selectAllButton = Designer.createSecondaryButton("Select All", mainCard, "#e7f9fc", "#1a1a1a", 700, 13, 15,
+                                                              2, "#185777")
+        self.selectAllButton.setGeometry(560, 625, 100, 35)
+        self.selectAllButton.clicked.connect(self.patientsTable.selectAll)
 
         self.nextButton = Designer.createPrimaryButton("Next", mainCard, "#0cc0df", "#1a1a1a", 700, 13, 15)
         self.nextButton.setGeometry(680, 625, 100, 35)
@@ -341,6 +351,45 @@ class AdministrationWindow(QWidget):
 
         return view
 
+    def _createWardRoundView(self):
+        """Creates the Ward Round view: one row per dose, each with its own assessment and reactions"""
+        view = QWidget()
+        view.setStyleSheet("background-color: transparent;")
+
+        mainCard = Designer.createRoundedCard(view, 1460, 680)
+        mainCard.move(20, 0)
+
+        titleLabel = Designer.createLabel("Ward Round", mainCard, "#1a1a1a", 700, 24)
+        titleLabel.setGeometry(50, 30, 400, 30)
+        subtitleLabel = Designer.createLabel("Assess each patient and note any adverse reactions (blank = none).",
+                                             mainCard, "#333333", 400, 13)
+        subtitleLabel.setGeometry(50, 65, 600, 20)
+
+        Designer.createLabel("Time:", mainCard, "#1a1a1a", 600, 13).setGeometry(1150, 40, 60, 20)
+        self.roundTimeInput = QTimeEdit(mainCard)
+        self.roundTimeInput.setGeometry(1210, 35, 130, 30)
+        self.roundTimeInput.setDisplayFormat("hh:mm AP")
+        self.roundTimeInput.setReadOnly(True)
+        self.roundTimeInput.setStyleSheet(self.timeAutoInput.styleSheet())
+
+        self.roundTable = Designer.createStandardTable([
+            "Room", "Patient", "Medication", "Dosage", "Assessment", "Adverse Reactions"
+        ])
+        self.roundTable.setParent(mainCard)
+        self.roundTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.roundTable.verticalHeader().setDefaultSectionSize(44)
+        self.roundTable.setGeometry(50, 110, 1360, 485)
+
+        self.roundRecordButton = Designer.createPrimaryButton("Record", mainCard, "#0cc0df", "#1a1a1a", 700, 13, 15)
+        self.roundRecordButton.setGeometry(620, 625, 110, 35)
+
+        self.roundBackButton = Designer.createSecondaryButton("Back", mainCard, "#e7f9fc", "#1a1a1a", 700, 13, 15, 2,
+                                                              "#185777")
+        self.roundBackButton.setGeometry(750, 625, 110, 35)
+        self.roundBackButton.clicked.connect(lambda: self.stackedWidget.setCurrentIndex(0))
+
+        return view
+
     def loadPrescriptionDetails(self, prescription_data, patient_data):
         """Loads prescription and patient details"""
         self.prescriptionIdValue.setText(str(prescription_data.get('prescription_id', '')))
@@ -360,6 +409,49 @@ class AdministrationWindow(QWidget):
         instructions = prescription_data.get('special_instructions', 'No special instructions')
         self.instructionsText.setText(instructions or 'No special instructions')
 
+    def getSelectedRows(self):
+        """Returns the indexes of all selected patient rows, in table order"""
+        return sorted(index.row() for index in self.patientsTable.selectionModel().selectedRows())
+
+    def loadRoundDoses(self, doses):
+        """Lists the doses of a ward round, each with an empty assessment and reactions field"""
+        self.roundTimeInput.setTime(QTime.currentTime())
+        self.roundTable.setRowCount(len(doses))
+
+        for row, dose in enumerate(doses):
+            values = [
+                dose.get('room_number') or '-',
+                f"{dose.get('patient_first_name', '')} {dose.get('patient_last_name', '')}",
+                f"{dose.get('brand_name', '')} ({dose.get('generic_name', '')})",
+                dose.get('dosage', '')
+            ]
+            for column, value in enumerate(values):
+                self.roundTable.setItem(row, column, QTableWidgetItem(str(value)))
+
+            assessment = Designer.createComboBox(None, fontSize=12)
+            assessment.addItems(["Select", "Active", "Drowsy", "Sleeping", "Confused"])
+            self.roundTable.setCellWidget(row, 4, assessment)
+
+            reactions = Designer.createInputField(None, "white", "#333333", 400, 12, 10, 2, "#185777")
+            reactions.setPlaceholderText("None")
+            self.roundTable.setCellWidget(row, 5, reactions)
+
+    def getRoundAdministrationData(self):
+        """Returns the round's time and, per row, the assessment (None if not selected) and reactions"""
+        rows = []
+        for row in range(self.roundTable.rowCount()):
+            assessment = self.roundTable.cellWidget(row, 4).currentText()
+            reactions = self.roundTable.cellWidget(row, 5).text().strip()
+            rows.append({
+                'patient_assessment': assessment if assessment != "Select" else None,
+                'adverse_reactions': reactions or "None"
+            })
+
+        return {
+            'administration_time': self.roundTimeInput.time().toString('HH:mm:ss'),
+            'doses': rows
+        }
+
     def getAdministrationData(self):
         """Returns all administration form data"""
         assessment_map = {1: "Active", 2: "Drowsy", 3: "Sleeping", 4: "Confused"}
@@ -409,6 +501,8 @@ class AdministrationWindow(QWidget):
         self.otherInput.clear()
         self.otherInput.setEnabled(False)
 
+        self.roundTable.setRowCount(0)
+
     def resetToPatientSelection(self):
         """Resets to patient selection view"""
         self.stackedWidget.setCurrentIndex(0)
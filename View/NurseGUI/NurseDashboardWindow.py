@@ -93,6 +93,11 @@ class NurseDashboardWindow(QWidget):
             card.mousePressEvent = lambda e, l=label: self._showKPIDetails(l)
             self.kpi_cards.append(card)
 
+    def setKPIValue(self, kpi_label: str, value):
+        """Update one KPI card in place"""
+        self.kpi_values[kpi_label] = value
+        self.kpi_cards[list(self.kpi_values).index(kpi_label)].numberLabel.setText(str(value))
+
     def _showKPIDetails(self, kpi_label: str):
         """Show detailed records when KPI card is clicked"""
         from Model.KPIs.NurseKPIs import NurseKPIDetails
@@ -104,11 +109,11 @@ class NurseDashboardWindow(QWidget):
 
     def _createCompletedMedicationsTable(self):
         """Display completed medications table"""
-        columns = [
+        self.completedColumns = [
             "Patient Name", "Medication",
             "Dosage", "Time", "Assessment", "Status"
         ]
-        column_map = {
+        self.completedColumnMap = {
             "Patient Name": "patient_name",
             "Medication": "medication",
             "Dosage": "dosage",
@@ -119,7 +124,7 @@ class NurseDashboardWindow(QWidget):
 
         self.completedTable, self.completedCard = Designer.createTableCard(
             self, labelText="Completed Medications Today", fontSize=22,
-            columnNames=columns, columnMap=column_map,
+            columnNames=self.completedColumns, columnMap=self.completedColumnMap,
             cardWidth=815, cardHeight=400, tableWidth=770, tableHeight=305,
             x=45, y=345, data=self.completedMedicationsData
         )
@@ -157,6 +162,17 @@ class NurseDashboardWindow(QWidget):
 
         self.scrollArea.setWidget(self.scrollWidget)
 
+    def setCompletedMedicationsData(self, completedMedicationsData):
+        """Replace the rows of the completed medications table in place"""
+        self.completedMedicationsData = completedMedicationsData
+        Designer.populateTable(self.completedTable, self.completedColumns,
+                               self.completedColumnMap, completedMedicationsData)
+
+    def setPreparationStatusData(self, preparationStatusData):
+        """Rebuild the preparation status cards from new data"""
+        self.preparationStatusData = preparationStatusData
+        self._loadPreparationStatusCards()
+
     def _loadPreparationStatusCards(self):
         while self.scrollLayout.count():
             child = self.scrollLayout.takeAt(0)
@@ -1,5 +1,5 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QWidget, QScrollArea, QVBoxLayout
+from PyQt6.QtWidgets import QWidget, QScrollArea, QVBoxLayout, QCheckBox
 from Utilities.Designers import Designer
 
 class PharmacistDashboardWindow(QWidget):
@@ -74,17 +74,21 @@ class PharmacistDashboardWindow(QWidget):
             "../ImageResources/Icon7BGRemoved.png",
             "../ImageResources/Icon10BGRemoved.png"
         ]
-        labels = ["Active Prescriptions", "Pending Verification", "Controlled Substances"]
+        self.kpi_labels = ["Active Prescriptions", "Pending Verification", "Controlled Substances"]
         values = [activePrescriptionsKpi, pendingKpi, controlledKpi]
 
         self.kpi_cards = []
-        for i, (icon, label, value) in enumerate(zip(icons, labels, values)):
+        for i, (icon, label, value) in enumerate(zip(icons, self.kpi_labels, values)):
             card = Designer.createKPI(self, icon, str(value), label,
                                       x=x_start + gap * i, y=y_pos)
             card.setCursor(Qt.CursorShape.PointingHandCursor)
             card.mousePressEvent = lambda e, l=label: self._showKPIDetails(l)
             self.kpi_cards.append(card)
 
+    def setKPIValue(self, kpi_label: str, value):
+        """Update one KPI card in place"""
+        self.kpi_cards[self.kpi_labels.index(kpi_label)].numberLabel.setText(str(value))
+
     def _showKPIDetails(self, kpi_label: str):
         """Show detailed records when KPI card is clicked"""
         from Model.KPIs.PharmacistKPIs import PharmacistKPIDetails
@@ -97,12 +101,12 @@ class PharmacistDashboardWindow(QWidget):
 
     def _createExpiringTable(self, expiringData):
         """Creates the Expiring Soon table"""
-        columns = [
+        self.expiringColumns = [
             "Prescription ID", "Patient Name", "Medication",
             "Quantity", "Expiry Date", "Days Until Expiry"
         ]
 
-        column_map = {
+        self.expiringColumnMap = {
             "Prescription ID": "prescription_id",
             "Patient Name": "patient_name",
             "Medication": "medication",
@@ -115,8 +119,8 @@ class PharmacistDashboardWindow(QWidget):
             self,
             labelText="Medications Expiry",
             fontSize=22,
-            columnNames=columns,
-            columnMap=column_map,
+            columnNames=self.expiringColumns,
+            columnMap=self.expiringColumnMap,
             cardWidth=775,
             cardHeight=400,
             tableWidth=735,
@@ -126,6 +130,11 @@ class PharmacistDashboardWindow(QWidget):
             data=expiringData
         )
 
+    def setExpiringData(self, expiringData):
+        """Replace the rows of the Expiring Soon table in place"""
+        Designer.populateTable(self.expiringTable, self.expiringColumns,
+                               self.expiringColumnMap, expiringData)
+
     def _createMedicationsPrepareCard(self, medicationsData):
         """Creates the Medications To Prepare scrollable card"""
         self.prepareMedicationsCard = Designer.createRoundedCard(self, 580, 635)
@@ -137,6 +146,16 @@ class PharmacistDashboardWindow(QWidget):
         )
         prepareTitleLabel.setGeometry(35, 25, 300, 30)
 
+        self.selectAllCheck = QCheckBox("All", self.prepareMedicationsCard)
+        self.selectAllCheck.setGeometry(335, 30, 55, 25)
+        self.selectAllCheck.setStyleSheet("QCheckBox {color: #1a1a1a; font-weight: 600; font-size: 12px;}")
+        self.selectAllCheck.toggled.connect(self._setAllSelected)
+
+        self.prepareSelectedButton = Designer.createPrimaryButton(
+            "Prepare Selected", self.prepareMedicationsCard, "#0cc0df", "#1a1a1a", 700, 12, 15
+        )
+        self.prepareSelectedButton.setGeometry(400, 25, 145, 35)
+
         self.scrollArea = QScrollArea(self.prepareMedicationsCard)
         self.scrollArea.setGeometry(35, 70, 510, 545)
         self.scrollArea.setWidgetResizable(True)
@@ -155,6 +174,10 @@ class PharmacistDashboardWindow(QWidget):
         self.scrollLayout.setSpacing(15)
         self.scrollLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
+        # preparation_id -> card, so the board can be updated without rebuilding it
+        self.medicationCards = {}
+        self.emptyStateLabel = None
+
         self.displayMedicationCards(medicationsData)
         self.scrollArea.setWidget(self.scrollWidget)
 
@@ -164,6 +187,8 @@ class PharmacistDashboardWindow(QWidget):
             item = self.scrollLayout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self.medicationCards = {}
+        self.emptyStateLabel = None
 
         if not medicationsData:
             self._displayEmptyState()
@@ -171,8 +196,61 @@ class PharmacistDashboardWindow(QWidget):
 
         for med in medicationsData:
             card = self._createMedicationCard(med)
+            self.medicationCards[med.get('preparation_id')] = card
             self.scrollLayout.addWidget(card)
 
+    def updateMedicationCards(self, medicationsData):
+        """
+        Brings the board in line with `medicationsData` in one repaint: removes cards no
+        longer listed, adds new ones in list order, and keeps (and their selection) the rest.
+        Returns the newly added cards.
+        """
+        wanted = [med.get('preparation_id') for med in medicationsData]
+        self.scrollWidget.setUpdatesEnabled(False)
+        try:
+            self.removeMedicationCards(set(self.medicationCards) - set(wanted))
+
+            added = []
+            for index, med in enumerate(medicationsData):
+                if med.get('preparation_id') not in self.medicationCards:
+                    card = self._createMedicationCard(med)
+                    self.medicationCards[med.get('preparation_id')] = card
+                    self.scrollLayout.insertWidget(index, card)
+                    added.append(card)
+
+            if self.medicationCards and self.emptyStateLabel:
+                self.scrollLayout.removeWidget(self.emptyStateLabel)
+                self.emptyStateLabel.deleteLater()
+                self.emptyStateLabel = None
+            return added
+        finally:
+            self.scrollWidget.setUpdatesEnabled(True)
+
+    def removeMedicationCards(self, preparationIds):
+        """Removes the given cards in one pass and shows the empty state if none remain"""
+        self.scrollWidget.setUpdatesEnabled(False)
+        try:
+            for preparation_id in preparationIds:
+                card = self.medicationCards.pop(preparation_id, None)
+                if card is not None:
+                    self.scrollLayout.removeWidget(card)
+                    card.hide()
+                    card.deleteLater()
+
+            if not self.medicationCards and not self.emptyStateLabel:
+                self._displayEmptyState()
+        finally:
+            self.scrollWidget.setUpdatesEnabled(True)
+
+    def getSelectedPreparationIds(self):
+        """Returns the preparation IDs of all ticked cards, in board order"""
+        return [preparation_id for preparation_id, card in self.medicationCards.items()
+                if card.selectCheck.isChecked()]
+
+    def _setAllSelected(self, checked):
+        for card in self.medicationCards.values():
+            card.selectCheck.setChecked(checked)
+
     def _displayEmptyState(self):
         """Displays empty state message"""
         placeholder = Designer.createLabel(
@@ -182,6 +260,7 @@ class PharmacistDashboardWindow(QWidget):
         placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         placeholder.setStyleSheet("QLabel {background-color: transparent; border: none; padding: 100px 20px;}")
         self.scrollLayout.addWidget(placeholder)
+        self.emptyStateLabel = placeholder
 
     def _createMedicationCard(self, med):
         """Creates a single medication card"""
@@ -231,4 +310,8 @@ class PharmacistDashboardWindow(QWidget):
         )
         self.statusButton.setGeometry(330, 35, 120, 35)
 
+        card.selectCheck = QCheckBox("Select", card)
+        card.selectCheck.setGeometry(355, 78, 90, 22)
+        card.selectCheck.setStyleSheet("QCheckBox {color: #333333; font-size: 12px; border: none;}")
+
         return card
\ No newline at end of file
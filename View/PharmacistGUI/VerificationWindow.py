@@ -1,5 +1,5 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QWidget, QRadioButton, QButtonGroup, QFrame, QHeaderView
+from PyQt6.QtWidgets import QWidget, QRadioButton, QButtonGroup, QFrame, QHeaderView, QAbstractItemView
 from Utilities.Designers import Designer
 
 class PharmacistVerificationWindow(QWidget):
@@ -78,8 +78,9 @@ class PharmacistVerificationWindow(QWidget):
 
         pendingLabel = Designer.createLabel("Pending Prescriptions", self.mainCard, "#1a1a1a", 700, 18)
         pendingLabel.setGeometry(55, 110, 250, 25)
-        pendingSubLabel = Designer.createLabel("Select prescription to verify.", self.mainCard, "#333333", 400, 12)
-        pendingSubLabel.setGeometry(55, 140, 250, 20)
+        pendingSubLabel = Designer.createLabel("Select one or more (Ctrl/Shift) to verify.", self.mainCard, "#333333",
+                                               400, 12)
+        pendingSubLabel.setGeometry(55, 140, 280, 20)
 
         self.pendingSearch = Designer.createInputField(self.mainCard, "white", "#333333", 400, 14, 15, 2, "#185777")
         self.pendingSearch.setGeometry(345, 120, 200, 35)
@@ -95,6 +96,8 @@ class PharmacistVerificationWindow(QWidget):
         self.pendingTable.setParent(self.mainCard)
         self.pendingTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.pendingTable.setGeometry(50, 175, 620, 460)
+        # Several routine prescriptions can be verified together with the same batch details
+        self.pendingTable.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 
         batchLabel = Designer.createLabel("Batch Identification", self.mainCard, "#1a1a1a", 700, 18)
         batchLabel.setGeometry(730, 40, 250, 25)
@@ -238,6 +241,11 @@ class PharmacistVerificationWindow(QWidget):
             'reason': self.reasonsText.toPlainText().strip()
         }
 
+    def getSelectedPrescriptionIds(self):
+        """Returns the prescription IDs of all selected rows, in table order"""
+        rows = sorted(index.row() for index in self.pendingTable.selectionModel().selectedRows())
+        return [self.pendingTable.item(row, 0).text() for row in rows if self.pendingTable.item(row, 0)]
+
     def clearForm(self):
         """Clears all form fields"""
         self.lotInput.clear()
@@ -138,6 +138,7 @@ CREATE TABLE medicine_preparation (
     quantity_prepared INT UNSIGNED NOT NULL,
     lot_number VARCHAR(100) NULL,
     status ENUM('Prepared', 'To be Prepared') DEFAULT 'To be Prepared',
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     CONSTRAINT fk_prep_prescription
         FOREIGN KEY (prescription_id) REFERENCES prescriptions(prescription_id)
         ON DELETE CASCADE
@@ -157,4 +158,79 @@ CREATE TABLE notifications (
         FOREIGN KEY (user_id) REFERENCES users(user_id)
         ON DELETE CASCADE
         ON UPDATE CASCADE
-);
\ No newline at end of file
+);
+
+-- =====================================================
+-- DAILY ROLLUP TABLES
+-- Pre-aggregated per-day summaries maintained by the write paths
+-- (AdministrationModel, VerificationModel) and rebuilt nightly by
+-- Model/Tasks/DailyRollupTask.py. Reports and KPIs read date-range
+-- summaries from here instead of re-joining the full history.
+-- =====================================================
+
+CREATE TABLE daily_administration_rollup (
+    rollup_date DATE NOT NULL,
+    nurse_id INT UNSIGNED NOT NULL,
+    patient_id INT UNSIGNED NOT NULL,
+    medicine_id INT UNSIGNED NOT NULL,
+    administered_count INT UNSIGNED NOT NULL DEFAULT 0,
+    missed_count INT UNSIGNED NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (rollup_date, nurse_id, patient_id, medicine_id),
+    INDEX idx_admin_rollup_nurse (nurse_id, rollup_date),
+    INDEX idx_admin_rollup_patient (patient_id, rollup_date)
+);
+
+CREATE TABLE daily_verification_rollup (
+    rollup_date DATE NOT NULL,
+    pharmacist_id INT UNSIGNED NOT NULL,
+    approved_count INT UNSIGNED NOT NULL DEFAULT 0,
+    modification_count INT UNSIGNED NOT NULL DEFAULT 0,
+    rejected_count INT UNSIGNED NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (rollup_date, pharmacist_id)
+);
+
+CREATE TABLE daily_controlled_dispensing_rollup (
+    rollup_date DATE NOT NULL,
+    medicine_id INT UNSIGNED NOT NULL,
+    doctor_id INT UNSIGNED NOT NULL,
+    dispensed_count INT UNSIGNED NOT NULL DEFAULT 0,
+    quantity_dispensed INT UNSIGNED NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (rollup_date, medicine_id, doctor_id),
+    INDEX idx_controlled_rollup_doctor (doctor_id, rollup_date)
+);
+
+-- =====================================================
+-- PATIENT SEARCH KEYS
+-- Normalized search tokens per patient (lower-cased name words,
+-- room number parts, patient ID), maintained by PatientsModel and
+-- rebuilt by Model/Tasks/PatientSearchIndexTask.py. Patient searches
+-- use prefix/equality lookups on the primary key instead of '%q%' LIKEs.
+-- =====================================================
+
+CREATE TABLE patient_search_keys (
+    token VARCHAR(100) NOT NULL,
+    patient_id INT UNSIGNED NOT NULL,
+    kind ENUM('name', 'room', 'id') NOT NULL,
+    PRIMARY KEY (token, patient_id, kind),
+    INDEX idx_search_keys_patient (patient_id),
+    CONSTRAINT fk_search_keys_patient
+        FOREIGN KEY (patient_id) REFERENCES patients(patient_id)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+-- =====================================================
+-- TABLE VERSIONS
+-- One change counter per source table of the cached datasets, bumped
+-- in the same transaction by every write path (Model/Cache/TableVersions.py).
+-- Workstations compare these few rows to decide which caches to refresh.
+-- =====================================================
+
+CREATE TABLE table_versions (
+    table_name VARCHAR(64) NOT NULL PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);